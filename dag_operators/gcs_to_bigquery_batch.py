@@ -0,0 +1,175 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import typing
+
+from airflow.exceptions import AirflowException
+from airflow.models import BaseOperator
+from airflow.providers.google.cloud.hooks.bigquery import BigQueryHook
+from google.cloud import bigquery
+
+# Arguments of GCSToBigQueryOperator that can be given for the whole batch or
+# for a single load, and the load job configuration fields they set.
+LOAD_OPTIONS = {
+    "source_format": "sourceFormat",
+    "skip_leading_rows": "skipLeadingRows",
+    "write_disposition": "writeDisposition",
+    "create_disposition": "createDisposition",
+    "field_delimiter": "fieldDelimiter",
+    "quote_character": "quote",
+    "max_bad_records": "maxBadRecords",
+    "allow_quoted_newlines": "allowQuotedNewlines",
+    "allow_jagged_rows": "allowJaggedRows",
+    "ignore_unknown_values": "ignoreUnknownValues",
+    "encoding": "encoding",
+    "null_marker": "nullMarker",
+    "autodetect": "autodetect",
+}
+REQUIRED_LOAD_ARGS = ("source_objects", "destination_project_dataset_table")
+
+
+class GCSToBigQueryBatchOperator(BaseOperator):
+    """Loads several Cloud Storage objects into their BigQuery tables from one task.
+
+    Each item of `loads` takes the `source_objects`,
+    `destination_project_dataset_table` and `schema_fields` arguments of
+    `GCSToBigQueryOperator`, and may override any of the `LOAD_OPTIONS` given
+    to the operator itself. Up to `max_concurrent_loads` load jobs run at once.
+
+    Every load runs to completion even when others fail. The state, job ID and
+    row count of each table are logged and returned as the task's XCom value,
+    and the task fails afterwards if any of the loads did.
+    """
+
+    template_fields = ("bucket", "loads", "impersonation_chain")
+    ui_color = "#f0eee4"
+
+    def __init__(
+        self,
+        *,
+        bucket: str,
+        loads: typing.List[typing.Dict[str, typing.Any]],
+        source_format: str = "CSV",
+        skip_leading_rows: typing.Optional[int] = None,
+        write_disposition: str = "WRITE_EMPTY",
+        create_disposition: str = "CREATE_IF_NEEDED",
+        field_delimiter: typing.Optional[str] = None,
+        quote_character: typing.Optional[str] = None,
+        max_bad_records: typing.Optional[int] = None,
+        allow_quoted_newlines: typing.Optional[bool] = None,
+        allow_jagged_rows: typing.Optional[bool] = None,
+        ignore_unknown_values: typing.Optional[bool] = None,
+        encoding: typing.Optional[str] = None,
+        null_marker: typing.Optional[str] = None,
+        autodetect: typing.Optional[bool] = None,
+        max_concurrent_loads: int = 16,
+        gcp_conn_id: str = "google_cloud_default",
+        location: typing.Optional[str] = None,
+        impersonation_chain: typing.Optional[
+            typing.Union[str, typing.List[str]]
+        ] = None,
+        **kwargs,
+    ) -> None:
+        super().__init__(**kwargs)
+        for load in loads:
+            missing = [arg for arg in REQUIRED_LOAD_ARGS if not load.get(arg)]
+            if missing:
+                raise AirflowException(f"Load {load} is missing {missing}")
+        self.bucket = bucket
+        self.loads = loads
+        self.load_defaults = {
+            "source_format": source_format,
+            "skip_leading_rows": skip_leading_rows,
+            "write_disposition": write_disposition,
+            "create_disposition": create_disposition,
+            "field_delimiter": field_delimiter,
+            "quote_character": quote_character,
+            "max_bad_records": max_bad_records,
+            "allow_quoted_newlines": allow_quoted_newlines,
+            "allow_jagged_rows": allow_jagged_rows,
+            "ignore_unknown_values": ignore_unknown_values,
+            "encoding": encoding,
+            "null_marker": null_marker,
+            "autodetect": autodetect,
+        }
+        self.max_concurrent_loads = max_concurrent_loads
+        self.gcp_conn_id = gcp_conn_id
+        self.location = location
+        self.impersonation_chain = impersonation_chain
+
+    def execute(self, context: typing.Any) -> typing.Dict[str, typing.Dict]:
+        hook = BigQueryHook(
+            gcp_conn_id=self.gcp_conn_id,
+            location=self.location,
+            impersonation_chain=self.impersonation_chain,
+        )
+        client = hook.get_client(project_id=hook.project_id, location=self.location)
+        with concurrent.futures.ThreadPoolExecutor(self.max_concurrent_loads) as pool:
+            statuses = list(pool.map(lambda load: self._load(client, load), self.loads))
+
+        results = {
+            load["destination_project_dataset_table"]: status
+            for load, status in zip(self.loads, statuses)
+        }
+        failed = [table for table, status in results.items() if status["error"]]
+        self.log.info(
+            "Loaded %d of %d tables", len(results) - len(failed), len(results)
+        )
+        if failed:
+            raise AirflowException(f"Loading {len(failed)} table(s) failed: {failed}")
+        return results
+
+    def load_config(self, load: typing.Dict[str, typing.Any]) -> typing.Dict:
+        """Returns the BigQuery load job configuration of one item of `loads`."""
+        config = {}
+        for arg, field in LOAD_OPTIONS.items():
+            value = load.get(arg, self.load_defaults[arg])
+            if value is not None:
+                config[field] = value
+        if load.get("schema_fields"):
+            config["schema"] = {"fields": load["schema_fields"]}
+        return config
+
+    def _load(
+        self, client: bigquery.Client, load: typing.Dict[str, typing.Any]
+    ) -> typing.Dict[str, typing.Any]:
+        table = load["destination_project_dataset_table"]
+        uris = [f"gs://{self.bucket}/{name}" for name in load["source_objects"]]
+        status = {
+            "job_id": None,
+            "state": "PENDING",
+            "output_rows": None,
+            "error": None,
+        }
+        try:
+            job = client.load_table_from_uri(
+                uris,
+                table.replace(":", "."),
+                job_config=bigquery.LoadJobConfig.from_api_repr(
+                    {"load": self.load_config(load)}
+                ),
+                location=self.location,
+            )
+            status["job_id"] = job.job_id
+            job.result()
+            status["output_rows"] = job.output_rows
+            self.log.info(
+                "Loaded %s rows into %s (job %s)", job.output_rows, table, job.job_id
+            )
+        except Exception as error:  # Reported with the other tables' results
+            status["error"] = str(error)
+            self.log.error("Loading %s failed: %s", table, error)
+        status["state"] = "FAILED" if status["error"] else "DONE"
+        return status
@@ -23,6 +23,9 @@ import requests
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     pipeline_name: str,
@@ -152,9 +155,8 @@ def process_source_file(
     rename_headers_list: dict,
 ) -> None:
     logging.info(f"Opening batch file {source_file}")
-    with pd.read_csv(
+    chunks = iter_csv(
         source_file,  # path to main source file to load in batches
-        engine="python",
         encoding="utf-8",
         quotechar='"',  # string separator, typically double-quotes
         chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -164,20 +166,13 @@ def process_source_file(
         dtype=dtypes,
         keep_default_na=True,
         na_values=[" "],
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
+    )
+    with CsvChunkSink(target_file, sep="|") as sink:
+        for df in chunks:
             process_chunk(
                 df=df,
-                target_file_batch=target_file_batch,
-                target_file=target_file,
+                sink=sink,
                 destination_table=destination_table,
-                include_header=(chunk_number == 0),
-                truncate_file=(chunk_number == 0),
                 date_format_list=date_format_list,
                 int_cols_list=int_cols_list,
                 remove_newlines_cols_list=remove_newlines_cols_list,
@@ -189,11 +184,8 @@ def process_source_file(
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
+    sink: CsvChunkSink,
     destination_table: str,
-    include_header: bool,
-    truncate_file: bool,
     date_format_list: typing.List[str],
     int_cols_list: typing.List[str],
     remove_newlines_cols_list: typing.List[str],
@@ -201,7 +193,7 @@ def process_chunk(
     reorder_headers_list: typing.List[str],
     rename_headers_list: dict,
 ) -> None:
-    logging.info(f"Processing Batch {target_file_batch} started")
+    logging.info(f"Processing batch of {len(df)} rows")
     if destination_table == "311_service_requests":
         df = rename_headers(df=df, rename_headers_list=rename_headers_list)
         for col in remove_newlines_cols_list:
@@ -231,14 +223,7 @@ def process_chunk(
     else:
         logging.info("Pipeline Not Recognized.")
         return None
-    save_to_new_file(df=df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(
-        batch_file_path=target_file_batch,
-        target_file_path=target_file,
-        include_header=include_header,
-        truncate_target_file=truncate_file,
-    )
-    logging.info(f"Processing Batch {target_file_batch} completed")
+    sink.write(df)
 
 
 def rename_headers(df: pd.DataFrame, rename_headers_list: dict) -> pd.DataFrame:
@@ -261,11 +246,6 @@ def filter_null_rows(
     return df
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep)
-
-
 def download_file_http(
     source_url: str, source_file: pathlib.Path, continue_on_error: bool = False
 ) -> bool:
@@ -409,35 +389,6 @@ def create_table_schema(
     return schema
 
 
-def append_batch_file(
-    batch_file_path: str,
-    target_file_path: str,
-    include_header: bool,
-    truncate_target_file: bool,
-) -> None:
-    logging.info(
-        f"Appending file {batch_file_path} to file {target_file_path} with include_header={include_header} and truncate_target_file={truncate_target_file}"
-    )
-    with open(batch_file_path, "r") as data_file:
-        if truncate_target_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if not include_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} without header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with header"
-                )
-            target_file.write(data_file.read())
-            data_file.close()
-            target_file.close()
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
-
-
 def upload_file_to_gcs(
     file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
 ) -> None:
@@ -12,7 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import csv
 import json
 import logging
 import os
@@ -26,6 +25,10 @@ import requests
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
+from transform_runtime import metrics
+from transform_runtime.files import read_csv_chunks
+from transform_runtime.resources import chunk_sizer
+
 
 def main(
     source_url: str,
@@ -178,45 +181,26 @@ def process_source_file(
     state_code: str,
 ) -> None:
     logging.info(f"Opening source file {source_file}")
-    csv.field_size_limit(512 << 10)
-    csv.register_dialect("TabDialect", quotechar='"', delimiter=",", strict=True)
-    with open(source_file) as reader:
-        data = []
-        chunk_number = 1
-        for index, line in enumerate(csv.reader(reader, "TabDialect"), 0):
-            data.append(line)
-            if index % int(chunksize) == 0 and index > 0:
-                process_dataframe_chunk(
-                    data=data,
-                    input_headers=input_headers,
-                    target_file=target_file,
-                    chunk_number=chunk_number,
-                    data_dtypes=data_dtypes,
-                    geography=geography,
-                    rename_mappings_list=rename_mappings_list,
-                    concat_col_list=concat_col_list,
-                    input_csv_headers=input_csv_headers,
-                    output_csv_headers=output_csv_headers,
-                    group_id=group_id,
-                    state_code=state_code,
-                )
-                data = []
-                chunk_number += 1
-        if index % int(chunksize) != 0 and index > 0:
-            process_dataframe_chunk(
-                data=data,
-                input_headers=input_headers,
-                target_file=target_file,
-                chunk_number=chunk_number,
-                data_dtypes=data_dtypes,
-                geography=geography,
-                rename_mappings_list=rename_mappings_list,
-                concat_col_list=concat_col_list,
-                input_csv_headers=input_csv_headers,
-                output_csv_headers=output_csv_headers,
-                group_id=group_id,
-                state_code=state_code,
-            )
+    chunks = read_csv_chunks(
+        source_file,
+        names=input_headers,
+        chunksize=chunk_sizer(chunksize),
+        dtypes=data_dtypes,
+        header_rows=1,
+    )
+    for chunk_number, df in enumerate(chunks, 1):
+        process_dataframe_chunk(
+            df=df,
+            target_file=target_file,
+            chunk_number=chunk_number,
+            geography=geography,
+            rename_mappings_list=rename_mappings_list,
+            concat_col_list=concat_col_list,
+            input_csv_headers=input_csv_headers,
+            output_csv_headers=output_csv_headers,
+            group_id=group_id,
+            state_code=state_code,
+        )
     dfcolumns = list(target_df.columns)
     i = 0
     while i < (len(output_csv_headers)):
@@ -234,11 +218,9 @@ def process_source_file(
 
 
 def process_dataframe_chunk(
-    data: typing.List[str],
-    input_headers: typing.List[str],
+    df: pd.DataFrame,
     target_file: str,
     chunk_number: int,
-    data_dtypes: dict,
     geography: str,
     rename_mappings_list: dict,
     concat_col_list: typing.List[str],
@@ -247,7 +229,6 @@ def process_dataframe_chunk(
     group_id: str,
     state_code: str,
 ) -> None:
-    df = pd.DataFrame(data, columns=input_headers)
     target_file_batch = str(target_file).replace(
         ".csv", "-" + str(chunk_number) + ".csv"
     )
@@ -274,6 +255,7 @@ def set_df_datatypes(df: pd.DataFrame, data_dtypes: dict) -> pd.DataFrame:
     return df
 
 
+@metrics.timed("transform")
 def process_chunk(
     df: pd.DataFrame,
     chunk_number: int,
@@ -531,7 +513,6 @@ def extract_data_and_convert_to_df_state_level(
 
 def create_geo_id(df: pd.DataFrame, concat_col: str) -> pd.DataFrame:
     logging.info("Creating column geo_id...")
-    df = df.drop(0, axis=0)
     df["geo_id"] = ""
     for col in concat_col:
         df["geo_id"] = df["geo_id"] + df[col]
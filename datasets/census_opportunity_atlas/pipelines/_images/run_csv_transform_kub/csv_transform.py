@@ -23,6 +23,9 @@ import requests
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     source_url: str,
@@ -141,9 +144,8 @@ def process_source_file(
     rename_mappings: dict,
 ) -> None:
     logging.info(f"Opening source file {source_file}")
-    with pd.read_csv(
+    chunks = iter_csv(
         source_file,
-        engine="python",
         encoding="utf-8",
         quotechar='"',
         chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -152,55 +154,24 @@ def process_source_file(
         names=input_headers,
         keep_default_na=True,
         na_values=[" "],
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
+    )
+    with CsvChunkSink(target_file, sep="|", float_format="%.0f") as sink:
+        for df in chunks:
             process_chunk(
                 df=df,
-                target_file_batch=target_file_batch,
-                target_file=target_file,
-                skip_header=(not chunk_number == 0),
+                sink=sink,
                 rename_headers_list=rename_mappings,
             )
 
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
-    skip_header: bool,
+    sink: CsvChunkSink,
     rename_headers_list: list,
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
+    logging.info(f"Processing batch of {len(df)} rows")
     df = rename_headers(df, rename_headers_list)
-    save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
-    logging.info(f"Processing batch file {target_file_batch} completed")
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
+    sink.write(df)
 
 
 def download_file(source_url: str, source_file: pathlib.Path) -> None:
@@ -331,11 +302,6 @@ def create_table_schema(
     return schema
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, float_format="%.0f", index=False, sep=sep)
-
-
 def upload_file_to_gcs(
     file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
 ) -> None:
@@ -18,13 +18,14 @@ import logging
 import math
 import os
 import pathlib
-import subprocess
 import typing
 
 import pandas as pd
 import requests
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink
+
 
 def main(
     source_url: str,
@@ -49,14 +50,9 @@ def main(
     with pd.read_csv(
         source_file,
         chunksize=int(chunk_size),
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
+    ) as reader, CsvChunkSink(target_file, sep=",") as sink:
+        for chunk_number, df in enumerate(reader):
             logging.info(f"Processing batch {chunk_number}")
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
 
             logging.info(f"Transforming {source_file} ...")
 
@@ -103,17 +99,7 @@ def main(
                 ]
             ]
 
-            process_chunk(df, target_file_batch)
-
-            logging.info(f"Appending batch {chunk_number} to {target_file}")
-            if chunk_number == 0:
-                subprocess.run(["cp", target_file_batch, target_file])
-            else:
-                subprocess.check_call(f"sed -i '1d' {target_file_batch}", shell=True)
-                subprocess.check_call(
-                    f"cat {target_file_batch} >> {target_file}", shell=True
-                )
-            subprocess.run(["rm", target_file_batch])
+            process_chunk(df, sink)
 
     logging.info(
         f"Uploading output file to.. gs://{target_gcs_bucket}/{target_gcs_path}"
@@ -126,11 +112,11 @@ def main(
     )
 
 
-def process_chunk(df: pd.DataFrame, target_file_batch: str) -> None:
+def process_chunk(df: pd.DataFrame, sink: CsvChunkSink) -> None:
 
-    logging.info(f"Saving to output file.. {target_file_batch}")
+    logging.info(f"Saving to output file.. {sink.file_path}")
     try:
-        save_to_new_file(df, file_path=str(target_file_batch))
+        sink.write(df)
     except Exception as e:
         logging.error(f"Error saving output file: {e}.")
     logging.info("..Done!")
@@ -213,10 +199,6 @@ def filter_null_rows(df: pd.DataFrame) -> None:
     df = df[df.unique_key != ""]
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: pathlib.Path) -> None:
-    df.to_csv(file_path, index=False)
-
-
 def download_file(source_url: str, source_file: pathlib.Path) -> None:
     logging.info(f"Downloading {source_url} into {source_file}")
     r = requests.get(source_url, stream=True)
@@ -12,8 +12,6 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import datetime
-import gzip
 import json
 import logging
 import os
@@ -21,15 +19,33 @@ import pathlib
 import typing
 
 import pandas as pd
-import requests
-from google.api_core.exceptions import NotFound
-from google.cloud import bigquery, storage
+
+from transform_runtime import compression, metrics
+from transform_runtime.bq import (
+    create_dest_table,
+    create_table_schema,
+    load_data_from_gcs,
+)
+from transform_runtime.download import download_file
+from transform_runtime.formats import (
+    ChunkSink,
+    check_output_format,
+    chunk_sink,
+    output_file_path,
+    source_format,
+)
+from transform_runtime.gcs import gcs_uri, upload_file_to_gcs
+from transform_runtime.parsers import iter_csv
+from transform_runtime.transforms import (
+    add_metadata_cols,
+    rename_headers,
+    reorder_headers,
+)
 
 
 def main(
     source_url: str,
     source_zipfile: pathlib.Path,
-    source_file: pathlib.Path,
     target_file: pathlib.Path,
     pipeline_name: str,
     chunksize: str,
@@ -51,13 +67,13 @@ def main(
     table_clustering_field_list: typing.List[str],
     table_partition_field: str,
     table_partition_field_type: str,
+    output_format: str = "csv",
 ) -> None:
     logging.info(f"{pipeline_name} process started")
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
     execute_pipeline(
         source_url=source_url,
         source_zipfile=source_zipfile,
-        source_file=source_file,
         target_file=target_file,
         chunksize=chunksize,
         project_id=project_id,
@@ -78,6 +94,7 @@ def main(
         table_clustering_field_list=table_clustering_field_list,
         table_partition_field=table_partition_field,
         table_partition_field_type=table_partition_field_type,
+        output_format=output_format,
     )
     logging.info(f"{pipeline_name} process completed")
 
@@ -85,7 +102,6 @@ def main(
 def execute_pipeline(
     source_url: str,
     source_zipfile: pathlib.Path,
-    source_file: pathlib.Path,
     target_file: pathlib.Path,
     chunksize: str,
     project_id: str,
@@ -106,12 +122,18 @@ def execute_pipeline(
     table_clustering_field_list: typing.List[str],
     table_partition_field: str,
     table_partition_field_type: str,
+    output_format: str = "csv",
 ) -> None:
+    output_format = check_output_format(output_format)
+    target_file = output_file_path(target_file, output_format)
+    target_gcs_path = output_file_path(target_gcs_path, output_format)
+    output_schema = None
+    if output_format in ("parquet", "avro"):
+        output_schema = create_table_schema([], target_gcs_bucket, schema_path)
     download_file(source_url, source_zipfile)
-    gz_decompress(infile=source_zipfile, tofile=source_file, delete_zipfile=True)
     process_source_file(
         source_url=source_url,
-        source_file=source_file,
+        source_file=source_zipfile,
         target_file=target_file,
         chunksize=chunksize,
         input_headers=input_csv_headers,
@@ -120,6 +142,8 @@ def execute_pipeline(
         reorder_headers_list=reorder_headers_list,
         header_row_ordinal="0",
         field_separator=input_field_delimiter,
+        output_format=output_format,
+        output_schema=output_schema,
     )
     if os.path.exists(target_file):
         upload_file_to_gcs(
@@ -140,16 +164,17 @@ def execute_pipeline(
             table_partition_field_type=table_partition_field_type,
         )
         if table_exists:
-            load_data_to_bq(
+            load_data_from_gcs(
                 project_id=project_id,
                 dataset_id=dataset_id,
                 table_id=destination_table,
-                file_path=target_file,
+                source_uris=gcs_uri(target_gcs_bucket, target_gcs_path),
                 truncate_table=True,
                 field_delimiter="|",
+                source_format=source_format(output_format),
             )
             if remove_source_file == "Y":
-                os.remove(source_file)
+                os.remove(source_zipfile)
             else:
                 pass
             if delete_target_file == "Y":
@@ -165,15 +190,6 @@ def execute_pipeline(
         )
 
 
-def gz_decompress(infile: str, tofile: str, delete_zipfile: bool = False) -> None:
-    logging.info(f"Decompressing {infile}")
-    with open(infile, "rb") as inf, open(tofile, "w", encoding="utf8") as tof:
-        decom_str = gzip.decompress(inf.read()).decode("utf-8")
-        tof.write(decom_str)
-    if delete_zipfile:
-        os.remove(infile)
-
-
 def process_source_file(
     source_url: str,
     source_file: str,
@@ -185,313 +201,48 @@ def process_source_file(
     reorder_headers_list: typing.List[str],
     header_row_ordinal: str = "0",
     field_separator: str = ",",
+    output_format: str = "csv",
+    output_schema: typing.Optional[list] = None,
 ) -> None:
     logging.info(f"Opening source file {source_file}")
+    options = {
+        "quotechar": '"',
+        "sep": field_separator,  # data column separator, typically ","
+        "keep_default_na": True,
+        "na_values": [" "],
+    }
     if header_row_ordinal is None or header_row_ordinal == "None":
-        with pd.read_csv(
-            source_file,
-            engine="python",
-            encoding="utf-8",
-            quotechar='"',
-            chunksize=int(chunksize),  # size of batch data, in no. of records
-            sep=field_separator,  # data column separator, typically ","
-            names=input_headers,
-            dtype=data_dtypes,
-            keep_default_na=True,
-            na_values=[" "],
-        ) as reader:
-            for chunk_number, chunk in enumerate(reader):
-                target_file_batch = str(target_file).replace(
-                    ".csv", "-" + str(chunk_number) + ".csv"
-                )
-                df = pd.DataFrame()
-                df = pd.concat([df, chunk])
-                process_chunk(
-                    df=df,
-                    source_url=source_url,
-                    target_file_batch=target_file_batch,
-                    target_file=target_file,
-                    skip_header=(not chunk_number == 0),
-                    rename_headers_list=rename_headers_list,
-                    reorder_headers_list=reorder_headers_list,
-                )
+        options.update(names=input_headers, dtype=data_dtypes)
     else:
-        header = int(header_row_ordinal)
+        options["header"] = int(header_row_ordinal)
         if data_dtypes != "[]":
-            with pd.read_csv(
-                source_file,
-                engine="python",
-                encoding="utf-8",
-                quotechar='"',
-                chunksize=int(chunksize),  # size of batch data, in no. of records
-                sep=field_separator,  # data column separator, typically ","
-                header=header,  # use when the data file does not contain a header
-                dtype=data_dtypes,
-                keep_default_na=True,
-                na_values=[" "],
-            ) as reader:
-                for chunk_number, chunk in enumerate(reader):
-                    target_file_batch = str(target_file).replace(
-                        ".csv", "-" + str(chunk_number) + ".csv"
-                    )
-                    df = pd.DataFrame()
-                    df = pd.concat([df, chunk])
-                    process_chunk(
-                        df=df,
-                        source_url=source_url,
-                        target_file_batch=target_file_batch,
-                        target_file=target_file,
-                        skip_header=(not chunk_number == 0),
-                        rename_headers_list=rename_headers_list,
-                        reorder_headers_list=reorder_headers_list,
-                    )
-        else:
-            with pd.read_csv(
-                source_file,
-                engine="python",
-                encoding="utf-8",
-                quotechar='"',
-                chunksize=int(chunksize),  # size of batch data, in no. of records
-                sep=field_separator,  # data column separator, typically ","
-                header=header,  # use when the data file does not contain a header
-                keep_default_na=True,
-                na_values=[" "],
-            ) as reader:
-                for chunk_number, chunk in enumerate(reader):
-                    target_file_batch = str(target_file).replace(
-                        ".csv", "-" + str(chunk_number) + ".csv"
-                    )
-                    df = pd.DataFrame()
-                    df = pd.concat([df, chunk])
-                    process_chunk(
-                        df=df,
-                        source_url=source_url,
-                        target_file_batch=target_file_batch,
-                        target_file=target_file,
-                        skip_header=(not chunk_number == 0),
-                        rename_headers_list=rename_headers_list,
-                        reorder_headers_list=reorder_headers_list,
-                    )
+            options["dtype"] = data_dtypes
+    with compression.open_text(source_file) as source, chunk_sink(
+        target_file, output_format, output_schema
+    ) as sink:
+        # size of batch data, in no. of records
+        for chunk in iter_csv(source, int(chunksize), **options):
+            process_chunk(
+                df=chunk,
+                source_url=source_url,
+                sink=sink,
+                rename_headers_list=rename_headers_list,
+                reorder_headers_list=reorder_headers_list,
+            )
 
 
+@metrics.timed("transform")
 def process_chunk(
     df: pd.DataFrame,
     source_url: str,
-    target_file_batch: str,
-    target_file: str,
-    skip_header: bool,
+    sink: ChunkSink,
     rename_headers_list: dict,
     reorder_headers_list: typing.List[str],
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
     df = rename_headers(df, rename_headers_list)
     df = reorder_headers(df, reorder_headers_list)
     df = add_metadata_cols(df, source_url)
-    save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
-    logging.info(f"Processing batch file {target_file_batch} completed")
-
-
-def load_data_to_bq(
-    project_id: str,
-    dataset_id: str,
-    table_id: str,
-    file_path: str,
-    truncate_table: bool,
-    field_delimiter: str = "|",
-) -> None:
-    logging.info(
-        f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} started"
-    )
-    client = bigquery.Client(project=project_id)
-    table_ref = client.dataset(dataset_id).table(table_id)
-    job_config = bigquery.LoadJobConfig()
-    job_config.source_format = bigquery.SourceFormat.CSV
-    job_config.field_delimiter = field_delimiter
-    if truncate_table:
-        job_config.write_disposition = "WRITE_TRUNCATE"
-    else:
-        job_config.write_disposition = "WRITE_APPEND"
-    job_config.skip_leading_rows = 1  # ignore the header
-    job_config.autodetect = False
-    with open(file_path, "rb") as source_file:
-        job = client.load_table_from_file(source_file, table_ref, job_config=job_config)
-    job.result()
-    logging.info(
-        f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} completed"
-    )
-
-
-def create_dest_table(
-    project_id: str,
-    dataset_id: str,
-    table_id: str,
-    schema_filepath: list,
-    bucket_name: str,
-    drop_table: bool = False,
-    table_clustering_field_list: typing.List[str] = [],
-    table_description: str = "",
-    table_partition_field: str = "",
-    table_partition_field_type: str = "",
-) -> bool:
-    table_ref = f"{project_id}.{dataset_id}.{table_id}"
-    logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
-    client = bigquery.Client()
-    table_exists = False
-    try:
-        table = client.get_table(table_ref)
-        table_exists_id = table.table_id
-        logging.info(f"Table {table_exists_id} currently exists.")
-        if drop_table:
-            logging.info("Dropping existing table")
-            client.delete_table(table)
-            table = None
-    except NotFound:
-        table = None
-    if not table:
-        logging.info(
-            (
-                f"Table {table_ref} currently does not exist.  Attempting to create table."
-            )
-        )
-        if check_gcs_file_exists(schema_filepath, bucket_name):
-            schema = create_table_schema([], bucket_name, schema_filepath)
-            table = bigquery.Table(table_ref, schema=schema)
-            table.description = table_description
-            if table_clustering_field_list:
-                logging.info(
-                    f"Creating cluster on table ({table_clustering_field_list})"
-                )
-                table.clustering_fields = table_clustering_field_list
-            if table_partition_field:
-                logging.info(
-                    f"Creating partition on table ({table_partition_field}, {table_partition_field_type})"
-                )
-                table.partitioning_type = table_partition_field_type
-                table.time_partitioning.field = table_partition_field
-            client.create_table(table)
-            print(f"Table {table_ref} was created".format(table_id))
-            table_exists = True
-        else:
-            file_name = os.path.split(schema_filepath)[1]
-            file_path = os.path.split(schema_filepath)[0]
-            logging.info(
-                f"Error: Unable to create table {table_ref} because schema file {file_name} does not exist in location {file_path} in bucket {bucket_name}"
-            )
-            table_exists = False
-    else:
-        table_exists = True
-    return table_exists
-
-
-def check_gcs_file_exists(file_path: str, bucket_name: str) -> bool:
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(bucket_name)
-    exists = storage.Blob(bucket=bucket, name=file_path).exists(storage_client)
-    return exists
-
-
-def create_table_schema(
-    schema_structure: list, bucket_name: str = "", schema_filepath: str = ""
-) -> list:
-    logging.info(f"Defining table schema... {bucket_name} ... {schema_filepath}")
-    schema = []
-    if not (schema_filepath):
-        schema_struct = schema_structure
-    else:
-        storage_client = storage.Client()
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(schema_filepath)
-        schema_struct = json.loads(blob.download_as_string(client=None))
-    for schema_field in schema_struct:
-        fld_name = schema_field["name"]
-        fld_type = schema_field["type"]
-        try:
-            fld_descr = schema_field["description"]
-        except KeyError:
-            fld_descr = ""
-        fld_mode = schema_field["mode"]
-        schema.append(
-            bigquery.SchemaField(
-                name=fld_name, field_type=fld_type, mode=fld_mode, description=fld_descr
-            )
-        )
-    return schema
-
-
-def rename_headers(df: pd.DataFrame, rename_mappings: dict) -> pd.DataFrame:
-    logging.info("Renaming Headers")
-    return df.rename(columns=rename_mappings)
-
-
-def reorder_headers(
-    df: pd.DataFrame, output_headers_list: typing.List[str]
-) -> pd.DataFrame:
-    logging.info("Re-ordering Headers")
-    return df[output_headers_list]
-
-
-def add_metadata_cols(df: pd.DataFrame, source_url: str) -> pd.DataFrame:
-    logging.info("Adding metadata columns")
-    df["source_url"] = source_url
-    df["etl_timestamp"] = pd.to_datetime(
-        datetime.datetime.now(), format="%Y-%m-%d %H:%M:%S", infer_datetime_format=True
-    )
-    return df
-
-
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
-
-
-def download_file(source_url: str, source_file: pathlib.Path) -> None:
-    logging.info(f"Downloading {source_url} into {source_file}")
-    r = requests.get(source_url, stream=True)
-    if r.status_code == 200:
-        with open(source_file, "wb") as f:
-            for chunk in r:
-                f.write(chunk)
-    else:
-        logging.error(f"Couldn't download {source_url}: {r.text}")
-
-
-def upload_file_to_gcs(
-    file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
-) -> None:
-    if os.path.exists(file_path):
-        logging.info(
-            f"Uploading output file to gs://{target_gcs_bucket}/{target_gcs_path}"
-        )
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(target_gcs_bucket)
-        blob = bucket.blob(target_gcs_path)
-        blob.upload_from_filename(file_path)
-    else:
-        logging.info(
-            f"Cannot upload file to gs://{target_gcs_bucket}/{target_gcs_path} as it does not exist."
-        )
+    sink.write(df)
 
 
 if __name__ == "__main__":
@@ -500,7 +251,6 @@ if __name__ == "__main__":
     main(
         source_url=os.environ["SOURCE_URL"],
         source_zipfile=pathlib.Path(os.environ["SOURCE_ZIPFILE"]).expanduser(),
-        source_file=pathlib.Path(os.environ["SOURCE_FILE"]).expanduser(),
         target_file=pathlib.Path(os.environ["TARGET_FILE"]).expanduser(),
         pipeline_name=os.environ["PIPELINE_NAME"],
         chunksize=os.environ["CHUNKSIZE"],
@@ -524,4 +274,5 @@ if __name__ == "__main__":
         ),
         table_partition_field=os.environ.get("TABLE_PARTITION_FIELD", ""),
         table_partition_field_type=os.environ.get("TABLE_PARTITION_FIELD_TYPE", ""),
+        output_format=os.environ.get("OUTPUT_FORMAT", "csv"),
     )
@@ -25,6 +25,9 @@ import requests
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     source_url: str,
@@ -158,9 +161,8 @@ def process_source_file(
 ) -> None:
     logging.info(f"Opening source file {source_file}")
     if header_row_ordinal is None or header_row_ordinal == "None":
-        with pd.read_csv(
+        chunks = iter_csv(
             source_file,
-            engine="python",
             encoding="utf-8",
             quotechar='"',
             chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -169,27 +171,20 @@ def process_source_file(
             dtype=data_dtypes,
             keep_default_na=True,
             na_values=[" "],
-        ) as reader:
-            for chunk_number, chunk in enumerate(reader):
-                target_file_batch = str(target_file).replace(
-                    ".csv", "-" + str(chunk_number) + ".csv"
-                )
-                df = pd.DataFrame()
-                df = pd.concat([df, chunk])
+        )
+        with CsvChunkSink(target_file, sep="|") as sink:
+            for df in chunks:
                 process_chunk(
                     df=df,
                     source_url=source_url,
-                    target_file_batch=target_file_batch,
-                    target_file=target_file,
-                    skip_header=(not chunk_number == 0),
+                    sink=sink,
                     rename_headers_list=rename_headers_list,
                 )
     else:
         header = int(header_row_ordinal)
         if data_dtypes != "[]":
-            with pd.read_csv(
+            chunks = iter_csv(
                 source_file,
-                engine="python",
                 encoding="utf-8",
                 quotechar='"',
                 chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -198,25 +193,18 @@ def process_source_file(
                 dtype=data_dtypes,
                 keep_default_na=True,
                 na_values=[" "],
-            ) as reader:
-                for chunk_number, chunk in enumerate(reader):
-                    target_file_batch = str(target_file).replace(
-                        ".csv", "-" + str(chunk_number) + ".csv"
-                    )
-                    df = pd.DataFrame()
-                    df = pd.concat([df, chunk])
+            )
+            with CsvChunkSink(target_file, sep="|") as sink:
+                for df in chunks:
                     process_chunk(
                         df=df,
                         source_url=source_url,
-                        target_file_batch=target_file_batch,
-                        target_file=target_file,
-                        skip_header=(not chunk_number == 0),
+                        sink=sink,
                         rename_headers_list=rename_headers_list,
                     )
         else:
-            with pd.read_csv(
+            chunks = iter_csv(
                 source_file,
-                engine="python",
                 encoding="utf-8",
                 quotechar='"',
                 chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -224,19 +212,13 @@ def process_source_file(
                 header=header,  # use when the data file does not contain a header
                 keep_default_na=True,
                 na_values=[" "],
-            ) as reader:
-                for chunk_number, chunk in enumerate(reader):
-                    target_file_batch = str(target_file).replace(
-                        ".csv", "-" + str(chunk_number) + ".csv"
-                    )
-                    df = pd.DataFrame()
-                    df = pd.concat([df, chunk])
+            )
+            with CsvChunkSink(target_file, sep="|") as sink:
+                for df in chunks:
                     process_chunk(
                         df=df,
                         source_url=source_url,
-                        target_file_batch=target_file_batch,
-                        target_file=target_file,
-                        skip_header=(not chunk_number == 0),
+                        sink=sink,
                         rename_headers_list=rename_headers_list,
                     )
 
@@ -244,17 +226,13 @@ def process_source_file(
 def process_chunk(
     df: pd.DataFrame,
     source_url: str,
-    target_file_batch: str,
-    target_file: str,
-    skip_header: bool,
+    sink: CsvChunkSink,
     rename_headers_list: typing.List[str],
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
+    logging.info(f"Processing batch of {len(df)} rows")
     df = rename_headers(df, rename_headers_list)
     df = add_metadata_cols(df, source_url)
-    save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
-    logging.info(f"Processing batch file {target_file_batch} completed")
+    sink.write(df)
 
 
 def load_data_to_bq(
@@ -384,32 +362,6 @@ def add_metadata_cols(df: pd.DataFrame, source_url: str) -> pd.DataFrame:
     return df
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
-
-
 def download_file(source_url: str, source_file: pathlib.Path) -> None:
     logging.info(f"Downloading {source_url} into {source_file}")
     r = requests.get(source_url, stream=True)
@@ -12,16 +12,23 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import csv
 import datetime
+import gzip
 import json
 import logging
 import os
 import pathlib
 import typing
 
+import pg_archive
 from google.cloud import storage
-from pgdumplib import dump, load
+
+UPLOAD_THREADS = 8
+# Fast enough to keep up with the parser while still shrinking the text
+# tables to a fraction of their size.
+GZIP_LEVEL = 5
 
 
 def main(
@@ -32,6 +39,7 @@ def main(
     tables: typing.List[str],
     target_gcs_bucket: str,
     target_gcs_folder: str,
+    num_of_workers: int,
 ) -> None:
     logging.info(
         f"EMBL EBI ChEMBL Dataset pipeline process started for table(s) -  {tables} at "
@@ -40,13 +48,31 @@ def main(
     logging.info(f"Creating '{output_folder}' folder.")
     pathlib.Path(output_folder).mkdir(parents=True, exist_ok=True)
     download_blob(source_gcs_bucket, source_gcs_object, source_file)
-    logging.info(f"Reading {source_file}")
-    dump_data = load(source_file)
-    write_table_to_csv(dump_data, tables, output_folder)
-    for file in os.listdir(output_folder):
-        full_path = f"{output_folder}/{file}"
-        target_gcs_path = f"{target_gcs_folder}/{file}"
-        upload_file_to_gcs(full_path, target_gcs_bucket, target_gcs_path)
+    logging.info(f"Reading the table of contents of {source_file}")
+    archive = pg_archive.Archive(str(source_file))
+    bucket = storage.Client().bucket(target_gcs_bucket)
+    workers = concurrent.futures.ProcessPoolExecutor(num_of_workers)
+    uploaders = concurrent.futures.ThreadPoolExecutor(UPLOAD_THREADS)
+    with workers, uploaders:
+        extracting = {
+            workers.submit(write_table_to_csv, archive, table, output_folder): table
+            for table in largest_first(archive, tables)
+        }
+        uploading = []
+        for idx, future in enumerate(concurrent.futures.as_completed(extracting)):
+            output_file = future.result()
+            logging.info(
+                f"\t\t\t{idx+1} out of {len(tables)} tables extracted: "
+                f"{extracting[future]}"
+            )
+            target_gcs_path = f"{target_gcs_folder}/{os.path.basename(output_file)}"
+            uploading.append(
+                uploaders.submit(
+                    upload_file_to_gcs, output_file, bucket, target_gcs_path
+                )
+            )
+        for future in concurrent.futures.as_completed(uploading):
+            future.result()
     logging.info(
         f"EMBL EBI ChEMBL Dataset pipeline process completed for table(s) -  {tables} at "
         + str(datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S"))
@@ -67,33 +93,55 @@ def download_blob(
     logging.info("Downloading Completed.")
 
 
+def largest_first(
+    archive: pg_archive.Archive, tables: typing.List[str]
+) -> typing.List[str]:
+    """Orders tables by the size of their data, so the longest extractions start first."""
+    sizes = archive.data_sizes()
+    return sorted(
+        tables,
+        key=lambda table: sizes.get(archive.table_data("public", table).dump_id, 0),
+        reverse=True,
+    )
+
+
 def write_table_to_csv(
-    dump_data: dump.Dump, tables: typing.List[str], output_folder: pathlib.Path
-) -> None:
-    length = len(tables)
-    for idx, table in enumerate(tables):
-        output_file = f"{output_folder}/{table}_data_output.csv"
-        logging.info(f"\t\t\t{idx+1} out of {length} tables.")
-        logging.info(f"Writing {table} - table to {output_file} file")
-        with open(output_file, "w") as fb:
-            writer = csv.writer(
-                fb, delimiter=",", quotechar='"', quoting=csv.QUOTE_MINIMAL
-            )
-            for line in dump_data.table_data("public", table):
-                writer.writerow(line)
+    archive: pg_archive.Archive, table: str, output_folder: pathlib.Path
+) -> str:
+    """Streams the COPY data of a table to a gzipped CSV file with a header row."""
+    output_file = f"{output_folder}/{table}_data_output.csv.gz"
+    logging.info(f"Writing {table} - table to {output_file} file")
+    entry = archive.table_data("public", table)
+    with gzip.open(output_file, "wt", compresslevel=GZIP_LEVEL, newline="") as fb:
+        writer = csv.writer(
+            fb,
+            delimiter=",",
+            quotechar='"',
+            quoting=csv.QUOTE_MINIMAL,
+            lineterminator="\n",
+        )
+        writer.writerow(entry.columns)
+        for line in archive.copy_lines(entry):
+            # Rows without nulls or characters that need quoting are already
+            # valid CSV once their tabs become commas.
+            if "," in line or '"' in line or "\\N" in line:
+                writer.writerow(
+                    [None if value == "\\N" else value for value in line.split("\t")]
+                )
+            else:
+                fb.write(line.replace("\t", ",") + "\n")
+    return output_file
 
 
 def upload_file_to_gcs(
-    source_file: str, target_gcs_bucket: str, target_gcs_path: str
+    source_file: str, bucket: storage.Bucket, target_gcs_path: str
 ) -> None:
     logging.info(
-        f"Uploading output file {source_file} to gs://{target_gcs_bucket}/{target_gcs_path}"
+        f"Uploading output file {source_file} to gs://{bucket.name}/{target_gcs_path}"
     )
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(target_gcs_bucket)
-    blob = bucket.blob(target_gcs_path)
-    blob.upload_from_filename(source_file)
-    logging.info("Successfully uploaded file to gcs bucket.")
+    bucket.blob(target_gcs_path).upload_from_filename(source_file)
+    os.remove(source_file)
+    logging.info(f"Successfully uploaded {target_gcs_path} to gcs bucket.")
 
 
 if __name__ == "__main__":
@@ -106,4 +154,5 @@ if __name__ == "__main__":
         tables=json.loads(os.environ.get("TABLES", "[]")),
         target_gcs_bucket=os.environ.get("TARGET_GCS_BUCKET", ""),
         target_gcs_folder=os.environ.get("TARGET_GCS_FOLDER", ""),
+        num_of_workers=int(os.environ.get("NUM_OF_WORKERS", os.cpu_count() or 1)),
     )
@@ -0,0 +1,228 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import io
+import re
+import typing
+import zlib
+
+MAGIC = b"PGDMP"
+# Archive versions written by pg_dump 9.0 and later.
+MIN_VERSION = (1, 12, 0)
+MAX_VERSION = (1, 16, 0)
+COMPRESSION_NONE = 0
+COMPRESSION_GZIP = 1
+BLOCK_DATA = 1
+OFFSET_POS_SET = 2
+OFFSET_NO_DATA = 3
+TABLE_DATA = "TABLE DATA"
+
+COPY_COLUMNS = re.compile(r"^COPY\s+\S+\s+\((.*)\)\s+FROM stdin;", re.DOTALL)
+ENCODING = re.compile(r"^.*=\s+'(.*)'")
+
+
+class Entry(typing.NamedTuple):
+    dump_id: int
+    tag: str
+    desc: str
+    defn: str
+    copy_stmt: str
+    namespace: str
+    data_state: int
+    offset: int
+
+    @property
+    def columns(self) -> typing.List[str]:
+        """The column names of a TABLE DATA entry, in COPY order."""
+        match = COPY_COLUMNS.match(self.copy_stmt)
+        if not match:
+            return []
+        return [column.strip().strip('"') for column in match.group(1).split(",")]
+
+
+class Archive:
+    """The table of contents of a custom-format (`pg_dump -Fc`) archive.
+
+    Unlike `pgdumplib.load`, reading an archive only parses its header and
+    table of contents. Table data is decompressed when `copy_lines` is
+    iterated, one block at a time, so tables can be read independently and
+    from several processes at once.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        with open(path, "rb") as handle:
+            reader = _Reader(handle)
+            self.version, self.compression = reader.read_header()
+            self.entries = reader.read_entries(self.version)
+        self.encoding = "UTF8"
+        for entry in self.entries:
+            if entry.desc == "ENCODING" and ENCODING.match(entry.defn):
+                self.encoding = ENCODING.match(entry.defn).group(1)
+        self.int_size = reader.int_size
+
+    def table_data(self, namespace: str, table: str) -> Entry:
+        for entry in self.entries:
+            if (
+                entry.desc == TABLE_DATA
+                and entry.namespace == namespace
+                and entry.tag == table
+            ):
+                return entry
+        raise KeyError(f"{namespace}.{table} has no data in {self.path}")
+
+    def data_sizes(self) -> typing.Dict[int, int]:
+        """Returns the stored size in bytes of each entry's data block."""
+        entries = sorted(
+            (entry for entry in self.entries if entry.data_state == OFFSET_POS_SET),
+            key=lambda entry: entry.offset,
+        )
+        with open(self.path, "rb") as handle:
+            end = handle.seek(0, io.SEEK_END)
+        offsets = [entry.offset for entry in entries] + [end]
+        return {
+            entry.dump_id: offsets[idx + 1] - entry.offset
+            for idx, entry in enumerate(entries)
+        }
+
+    def copy_lines(self, entry: Entry) -> typing.Iterator[str]:
+        """Yields the COPY text lines of a TABLE DATA entry, without newlines."""
+        if entry.data_state == OFFSET_NO_DATA:
+            return
+        if entry.data_state != OFFSET_POS_SET:
+            raise ValueError(
+                f"{self.path} does not record where the data of {entry.tag} starts;"
+                " dump it to a file rather than a pipe"
+            )
+        with open(self.path, "rb") as handle:
+            handle.seek(entry.offset)
+            reader = _Reader(handle, self.int_size)
+            block_type, dump_id = reader.read_byte(), reader.read_int()
+            if block_type != BLOCK_DATA or dump_id != entry.dump_id:
+                raise ValueError(
+                    f"Expected the data of {entry.tag} at offset {entry.offset}"
+                    f" of {self.path}"
+                )
+            raw = _DataBlock(reader, self.compression == COMPRESSION_GZIP)
+            text = io.TextIOWrapper(
+                io.BufferedReader(raw, 1 << 20), encoding=self.encoding, newline="\n"
+            )
+            for line in text:
+                if line == "\\.\n":
+                    return
+                yield line[:-1] if line.endswith("\n") else line
+
+
+class _Reader:
+    """Reads the integers, strings and offsets pg_dump writes to an archive."""
+
+    def __init__(self, handle: typing.BinaryIO, int_size: int = 4) -> None:
+        self.handle = handle
+        self.int_size = int_size
+        self.offset_size = 8
+
+    def read_header(self) -> typing.Tuple[typing.Tuple[int, int, int], int]:
+        if self.handle.read(5) != MAGIC:
+            raise ValueError("Not a custom-format archive written by pg_dump -Fc")
+        version = (self.read_byte(), self.read_byte(), self.read_byte())
+        if not MIN_VERSION <= version <= MAX_VERSION:
+            raise ValueError(f"Unsupported archive version {version}")
+        self.int_size = self.read_byte()
+        self.offset_size = self.read_byte()
+        self.read_byte()  # Archive format, 1 for custom.
+        if version >= (1, 15, 0):
+            compression = self.read_byte()
+        else:
+            compression = COMPRESSION_GZIP if self.read_int() else COMPRESSION_NONE
+        if compression not in (COMPRESSION_NONE, COMPRESSION_GZIP):
+            raise ValueError(f"Unsupported archive compression {compression}")
+        for _ in range(7):  # Timestamp
+            self.read_int()
+        for _ in range(3):  # Database name, server and pg_dump versions
+            self.read_str()
+        return version, compression
+
+    def read_entries(self, version: typing.Tuple[int, int, int]) -> typing.List[Entry]:
+        entries = []
+        for _ in range(self.read_int()):
+            dump_id = self.read_int()
+            self.read_int()  # Had dumper
+            self.read_str()  # Table oid
+            self.read_str()  # Oid
+            tag, desc = self.read_str(), self.read_str()
+            self.read_int()  # Section
+            defn = self.read_str()
+            self.read_str()  # Drop statement
+            copy_stmt, namespace = self.read_str(), self.read_str()
+            self.read_str()  # Tablespace
+            if version >= (1, 14, 0):
+                self.read_str()  # Table access method
+            if version >= (1, 16, 0):
+                self.read_int()  # Relation kind
+            self.read_str()  # Owner
+            self.read_str()  # With oids
+            while self.read_str():  # Dependencies
+                pass
+            data_state, offset = self.read_offset()
+            entries.append(
+                Entry(
+                    dump_id, tag, desc, defn, copy_stmt, namespace, data_state, offset
+                )
+            )
+        return entries
+
+    def read_byte(self) -> int:
+        return self.handle.read(1)[0]
+
+    def read_int(self) -> int:
+        sign = self.read_byte()
+        value = int.from_bytes(self.handle.read(self.int_size), "little")
+        return -value if sign else value
+
+    def read_str(self) -> str:
+        length = self.read_int()
+        return self.handle.read(length).decode() if length > 0 else ""
+
+    def read_offset(self) -> typing.Tuple[int, int]:
+        data_state = self.read_byte()
+        return data_state, int.from_bytes(self.handle.read(self.offset_size), "little")
+
+
+class _DataBlock(io.RawIOBase):
+    """The chunks of one data block, inflated as they are read."""
+
+    def __init__(self, reader: _Reader, compressed: bool) -> None:
+        self._reader = reader
+        self._inflate = zlib.decompressobj() if compressed else None
+        self._pending = b""
+        self._done = False
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, buffer: typing.Any) -> int:
+        while not self._pending and not self._done:
+            self._pending = self._next_chunk()
+        size = min(len(buffer), len(self._pending))
+        buffer[:size] = self._pending[:size]
+        self._pending = self._pending[size:]
+        return size
+
+    def _next_chunk(self) -> bytes:
+        length = self._reader.read_int()
+        if length <= 0:
+            self._done = True
+            return self._inflate.flush() if self._inflate else b""
+        chunk = self._reader.handle.read(length)
+        return self._inflate.decompress(chunk) if self._inflate else chunk
@@ -22,8 +22,17 @@ import zipfile as zip
 
 import pandas as pd
 import requests
-from google.cloud import bigquery, storage
-from google.cloud.exceptions import NotFound
+
+from transform_runtime import metrics
+from transform_runtime.bq import (
+    LoadJobManager,
+    LoadStateIndex,
+    create_dest_table,
+    load_data_from_gcs,
+)
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.gcs import gcs_uri, upload_file_to_gcs
+from transform_runtime.parsers import iter_csv
 
 
 def main(
@@ -45,6 +54,7 @@ def main(
     rename_headers_list: dict,
     output_headers: typing.List[str],
     drop_dest_table: str,
+    max_load_jobs: str = "2",
 ) -> None:
     logging.info(f"{pipeline_name} process started")
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
@@ -68,6 +78,7 @@ def main(
         chunksize=chunksize,
         field_delimiter="|",
         drop_dest_table=drop_dest_table,
+        max_load_jobs=int(max_load_jobs),
     )
     logging.info(f"{pipeline_name} process completed")
 
@@ -91,6 +102,7 @@ def execute_pipeline(
     chunksize: str,
     field_delimiter: str,
     drop_dest_table: str = "N",
+    max_load_jobs: int = 2,
 ) -> None:
     create_dest_table(
         project_id=project_id,
@@ -100,57 +112,64 @@ def execute_pipeline(
         bucket_name=target_gcs_bucket,
         drop_table=(drop_dest_table == "Y"),
     )
-    end_year = datetime.datetime.today().year - 2
-    for yr in range(start_year, end_year + 1, 1):
-        process_year_data(
-            project_id=project_id,
-            dataset_id=dataset_id,
-            table_name=table_name,
-            year_field_name=year_field_name,
-            year_field_type=year_field_type,
-            year=yr,
-            continue_on_error=False,
-            source_url=source_url,
-            dest_path=dest_path,
-            input_headers=input_headers,
-            output_headers=output_headers,
-            data_dtypes=data_dtypes,
-            rename_headers_list=rename_headers_list,
-            chunksize=chunksize,
-            field_delimiter=field_delimiter,
-            target_gcs_bucket=target_gcs_bucket,
-            target_gcs_path=target_gcs_path,
-        )
-    st_year = datetime.datetime.today().year - 1
-    end_year = datetime.datetime.today().year
-    for yr in range(st_year, end_year + 1, 1):
-        process_year_data(
-            project_id=project_id,
-            dataset_id=dataset_id,
-            table_name=table_name,
-            year_field_name=year_field_name,
-            year_field_type=year_field_type,
-            year=yr,
-            continue_on_error=True,
-            source_url=source_url,
-            dest_path=dest_path,
-            input_headers=input_headers,
-            output_headers=output_headers,
-            data_dtypes=data_dtypes,
-            rename_headers_list=rename_headers_list,
-            chunksize=chunksize,
-            field_delimiter=field_delimiter,
-            target_gcs_bucket=target_gcs_bucket,
-            target_gcs_path=target_gcs_path,
-        )
+    year_expressions = {}
+    if year_field_type == "DATE":
+        year_expressions[year_field_name] = f"FORMAT_DATE('%Y', {year_field_name})"
+    load_state = LoadStateIndex(
+        project_id, dataset_id, [year_field_name], year_expressions
+    )
+    with LoadJobManager(max_in_flight=max_load_jobs) as load_jobs:
+        end_year = datetime.datetime.today().year - 2
+        for yr in range(start_year, end_year + 1, 1):
+            process_year_data(
+                load_state=load_state,
+                load_jobs=load_jobs,
+                project_id=project_id,
+                dataset_id=dataset_id,
+                table_name=table_name,
+                year=yr,
+                continue_on_error=False,
+                source_url=source_url,
+                dest_path=dest_path,
+                input_headers=input_headers,
+                output_headers=output_headers,
+                data_dtypes=data_dtypes,
+                rename_headers_list=rename_headers_list,
+                chunksize=chunksize,
+                field_delimiter=field_delimiter,
+                target_gcs_bucket=target_gcs_bucket,
+                target_gcs_path=target_gcs_path,
+            )
+        st_year = datetime.datetime.today().year - 1
+        end_year = datetime.datetime.today().year
+        for yr in range(st_year, end_year + 1, 1):
+            process_year_data(
+                load_state=load_state,
+                load_jobs=load_jobs,
+                project_id=project_id,
+                dataset_id=dataset_id,
+                table_name=table_name,
+                year=yr,
+                continue_on_error=True,
+                source_url=source_url,
+                dest_path=dest_path,
+                input_headers=input_headers,
+                output_headers=output_headers,
+                data_dtypes=data_dtypes,
+                rename_headers_list=rename_headers_list,
+                chunksize=chunksize,
+                field_delimiter=field_delimiter,
+                target_gcs_bucket=target_gcs_bucket,
+                target_gcs_path=target_gcs_path,
+            )
 
 
 def process_year_data(
+    load_state: LoadStateIndex,
+    load_jobs: LoadJobManager,
     project_id: str,
     dataset_id: str,
     table_name: str,
-    year_field_name: str,
-    year_field_type: str,
     year: str,
     continue_on_error: bool,
     source_url: str,
@@ -166,9 +185,7 @@ def process_year_data(
     remove_file: bool = True,
 ):
     logging.info(f"Processing year {year} data.")
-    table_has_data = table_has_year_data(
-        project_id, dataset_id, table_name, year_field_name, year_field_type, year
-    )
+    table_has_data = load_state.is_loaded(table_name, year)
     if table_has_data or table_has_data is None:
         logging.info(
             f"Table {project_id}.{dataset_id}.{table_name} has data.  Skipping load process for year {year}"
@@ -201,112 +218,62 @@ def process_year_data(
                 field_delimiter=field_delimiter,
                 rename_headers_list=rename_headers_list,
             )
-            load_data_to_bq(
+            if remove_file:
+                os.remove(source_file)
+                os.remove(source_csv_file)
+            load_jobs.submit(
+                str(year),
+                load_year_data,
                 project_id=project_id,
                 dataset_id=dataset_id,
-                table_id=table_name,
-                file_path=target_file,
+                table_name=table_name,
+                year=year,
+                target_file=target_file,
                 field_delimiter=field_delimiter,
-                truncate_table=False,
+                target_gcs_bucket=target_gcs_bucket,
+                target_gcs_path=target_gcs_path,
+                remove_file=remove_file,
             )
-            if os.path.exists(target_file):
-                upload_file_to_gcs(
-                    file_path=target_file,
-                    target_gcs_bucket=target_gcs_bucket,
-                    target_gcs_path=target_gcs_path,
-                )
-            if remove_file:
-                os.remove(source_file)
-                os.remove(source_csv_file)
-                os.remove(target_file)
-            else:
-                pass
         else:
-            pass
-    logging.info(f"Processing year {year} data completed.")
+            logging.info(f"Processing year {year} data completed.")
 
 
-def rename_files_lowercase(dir: str = "files") -> None:
-    for file in os.listdir(dir):
-        new_filename = file.lower()
-        logging.info(f"{dir}  {file}  {new_filename}")
-        os.rename(f"{dir}/{file}", f"{dir}/{new_filename}")
-
-
-def table_has_year_data(
+def load_year_data(
     project_id: str,
     dataset_id: str,
     table_name: str,
-    year_field_name: str,
-    year_field_type: str,
     year: str,
-) -> bool:
-    number_rows = number_rows_in_table(
-        project_id, dataset_id, table_name, year_field_name, year_field_type, year
+    target_file: str,
+    field_delimiter: str,
+    target_gcs_bucket: str,
+    target_gcs_path: str,
+    remove_file: bool,
+) -> None:
+    # Years load in parallel, so each gets its own object to load from.
+    target_gcs_path_year = target_gcs_path.replace(".csv", f"_{year}.csv")
+    upload_file_to_gcs(
+        file_path=target_file,
+        target_gcs_bucket=target_gcs_bucket,
+        target_gcs_path=target_gcs_path_year,
     )
-    if number_rows > 0:
-        return True
-    elif number_rows == -1:
-        return None
-    else:
-        return False
-
-
-def table_exists(project_id: str, dataset_id: str, table_name: str) -> bool:
-    client = bigquery.Client(project=project_id)
-    tables = client.list_tables(dataset_id)
-    found_table = False
-    for tbl in tables:
-        if tbl.table_id == table_name:
-            found_table = True
-    return found_table
-
-
-def field_exists(
-    project_id: str, dataset_id: str, table_name: str, field_name: str
-) -> bool:
-    if table_exists(project_id, dataset_id, table_name):
-        client = bigquery.Client(project=project_id)
-        table_ref = f"{dataset_id}.{table_name}"
-        tbl_schema = client.get_table(table_ref).schema
-        found_field = False
-        for field in tbl_schema:
-            if field.name == field_name:
-                found_field = True
-        return found_field
-    else:
-        return False
+    load_data_from_gcs(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=table_name,
+        source_uris=gcs_uri(target_gcs_bucket, target_gcs_path_year),
+        field_delimiter=field_delimiter,
+        truncate_table=False,
+    )
+    if remove_file:
+        os.remove(target_file)
+    logging.info(f"Processing year {year} data completed.")
 
 
-def number_rows_in_table(
-    project_id: str,
-    dataset_id: str,
-    table_name: str,
-    year_field_name: str,
-    year_field_type: str,
-    year: str,
-) -> int:
-    check_field_exists = field_exists(
-        project_id, dataset_id, table_name, year_field_name
-    )
-    if check_field_exists:
-        client = bigquery.Client(project=project_id)
-        query = f"""
-            SELECT count(1) AS number_of_rows
-            FROM {dataset_id}.{table_name}
-            WHERE
-        """
-        if year_field_type == "DATE":
-            query = query + f" FORMAT_DATE('%Y', {year_field_name}) = '{year}'"
-        else:
-            query = query + f" {year_field_name} = {year}"
-        job_config = bigquery.QueryJobConfig()
-        query_job = client.query(query, job_config=job_config)
-        for row in query_job.result():
-            count_rows = row.number_of_rows
-        return int(count_rows)
-    else:
-        return -1
+def rename_files_lowercase(dir: str = "files") -> None:
+    for file in os.listdir(dir):
+        new_filename = file.lower()
+        logging.info(f"{dir}  {file}  {new_filename}")
+        os.rename(f"{dir}/{file}", f"{dir}/{new_filename}")
 
 
 def process_source_file(
@@ -320,9 +287,8 @@ def process_source_file(
     rename_headers_list: dict,
 ) -> None:
     logging.info(f"Opening batch file {source_file}")
-    with pd.read_csv(
+    chunks = iter_csv(
         source_file,  # path to main source file to load in batches
-        engine="python",
         encoding="utf-8",
         quotechar='"',  # string separator, typically double-quotes
         chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -332,20 +298,12 @@ def process_source_file(
         dtype=dtypes,
         keep_default_na=True,
         na_values=[" "],
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
+    )
+    with CsvChunkSink(target_file, sep=field_delimiter) as sink:
+        for df in chunks:
             process_chunk(
                 df=df,
-                target_file_batch=target_file_batch,
-                target_file=target_file,
-                include_header=(chunk_number == 0),
-                truncate_file=(chunk_number == 0),
-                field_delimiter=field_delimiter,
+                sink=sink,
                 output_headers=output_headers,
                 rename_headers_list=rename_headers_list,
             )
@@ -398,140 +356,10 @@ def unpack_file(infile: str, dest_path: str, compression_type: str = "zip") -> N
         logging.info(f"{infile} not unpacked because it does not exist.")
 
 
-def load_data_to_bq(
-    project_id: str,
-    dataset_id: str,
-    table_id: str,
-    file_path: str,
-    truncate_table: bool,
-    field_delimiter: str = "|",
-) -> None:
-    logging.info(
-        f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} started"
-    )
-    client = bigquery.Client(project=project_id)
-    table_ref = client.dataset(dataset_id).table(table_id)
-    job_config = bigquery.LoadJobConfig()
-    job_config.source_format = bigquery.SourceFormat.CSV
-    job_config.field_delimiter = field_delimiter
-    if truncate_table:
-        job_config.write_disposition = "WRITE_TRUNCATE"
-    else:
-        job_config.write_disposition = "WRITE_APPEND"
-    job_config.skip_leading_rows = 1  # ignore the header
-    job_config.autodetect = False
-    with open(file_path, "rb") as source_file:
-        job = client.load_table_from_file(source_file, table_ref, job_config=job_config)
-    job.result()
-    logging.info(
-        f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} completed"
-    )
-
-
-def create_dest_table(
-    project_id: str,
-    dataset_id: str,
-    table_id: str,
-    schema_filepath: list,
-    bucket_name: str,
-    drop_table: bool = False,
-    table_clustering_field_list: typing.List[str] = [],
-    table_description: str = "",
-    table_partition_field: str = "",
-    table_partition_field_type: str = "",
-) -> bool:
-    table_ref = f"{project_id}.{dataset_id}.{table_id}"
-    logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
-    client = bigquery.Client()
-    table_exists = False
-    try:
-        table = client.get_table(table_ref)
-        table_exists_id = table.table_id
-        logging.info(f"Table {table_exists_id} currently exists.")
-        if drop_table:
-            logging.info("Dropping existing table")
-            client.delete_table(table)
-            table = None
-    except NotFound:
-        table = None
-    if not table:
-        logging.info(
-            (
-                f"Table {table_ref} currently does not exist.  Attempting to create table."
-            )
-        )
-        if check_gcs_file_exists(schema_filepath, bucket_name):
-            schema = create_table_schema([], bucket_name, schema_filepath)
-            table = bigquery.Table(table_ref, schema=schema)
-            table.description = table_description
-            if table_clustering_field_list:
-                logging.info(
-                    f"Creating cluster on table ({table_clustering_field_list})"
-                )
-                table.clustering_fields = table_clustering_field_list
-            if table_partition_field:
-                logging.info(
-                    f"Creating partition on table ({table_partition_field}, {table_partition_field_type})"
-                )
-                table.partitioning_type = table_partition_field_type
-                table.time_partitioning.field = table_partition_field
-            client.create_table(table)
-            print(f"Table {table_ref} was created".format(table_id))
-            table_exists = True
-        else:
-            file_name = os.path.split(schema_filepath)[1]
-            file_path = os.path.split(schema_filepath)[0]
-            logging.info(
-                f"Error: Unable to create table {table_ref} because schema file {file_name} does not exist in location {file_path} in bucket {bucket_name}"
-            )
-            table_exists = False
-    else:
-        table_exists = True
-    return table_exists
-
-
-def check_gcs_file_exists(file_path: str, bucket_name: str) -> bool:
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(bucket_name)
-    exists = storage.Blob(bucket=bucket, name=file_path).exists(storage_client)
-    return exists
-
-
-def create_table_schema(
-    schema_structure: list, bucket_name: str = "", schema_filepath: str = ""
-) -> list:
-    logging.info(f"Defining table schema... {bucket_name} ... {schema_filepath}")
-    schema = []
-    if not (schema_filepath):
-        schema_struct = schema_structure
-    else:
-        storage_client = storage.Client()
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(schema_filepath)
-        schema_struct = json.loads(blob.download_as_string(client=None))
-    for schema_field in schema_struct:
-        fld_name = schema_field["name"]
-        fld_type = schema_field["type"]
-        try:
-            fld_descr = schema_field["description"]
-        except KeyError:
-            fld_descr = ""
-        fld_mode = schema_field["mode"]
-        schema.append(
-            bigquery.SchemaField(
-                name=fld_name, field_type=fld_type, mode=fld_mode, description=fld_descr
-            )
-        )
-    return schema
-
-
+@metrics.timed("transform")
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
-    include_header: bool,
-    truncate_file: bool,
-    field_delimiter: str,
+    sink: CsvChunkSink,
     output_headers: typing.List[str],
     rename_headers_list: dict,
 ) -> None:
@@ -550,14 +378,7 @@ def process_chunk(
     ]
     df = resolve_date_format(df, date_fields, "%Y-%m-%d %H:%M")
     df = reorder_headers(df, output_headers)
-    save_to_new_file(df=df, file_path=str(target_file_batch), sep=field_delimiter)
-    append_batch_file(
-        batch_file_path=target_file_batch,
-        target_file_path=target_file,
-        include_header=include_header,
-        truncate_target_file=truncate_file,
-    )
-    logging.info(f"Processing Batch {target_file_batch} completed")
+    sink.write(df)
 
 
 def reorder_headers(df: pd.DataFrame, output_headers: typing.List[str]) -> pd.DataFrame:
@@ -629,57 +450,6 @@ def convert_dt_format(dt_str: str, from_format: str, include_time: bool = True)
     return rtnval
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving to file {file_path} separator='{sep}'")
-    df.to_csv(file_path, sep=sep, index=False)
-
-
-def append_batch_file(
-    batch_file_path: str,
-    target_file_path: str,
-    include_header: bool,
-    truncate_target_file: bool,
-) -> None:
-    logging.info(
-        f"Appending file {batch_file_path} to file {target_file_path} with include_header={include_header} and truncate_target_file={truncate_target_file}"
-    )
-    with open(batch_file_path, "r") as data_file:
-        if truncate_target_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if not include_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} without header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with header"
-                )
-            target_file.write(data_file.read())
-            data_file.close()
-            target_file.close()
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
-
-
-def upload_file_to_gcs(
-    file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
-) -> None:
-    if os.path.exists(file_path):
-        logging.info(
-            f"Uploading output file {file_path} to gs://{target_gcs_bucket}/{target_gcs_path}"
-        )
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(target_gcs_bucket)
-        blob = bucket.blob(target_gcs_path)
-        blob.upload_from_filename(file_path)
-    else:
-        logging.info(
-            f"Cannot upload file to gs://{target_gcs_bucket}/{target_gcs_path} as it does not exist."
-        )
-
-
 if __name__ == "__main__":
     logging.getLogger().setLevel(logging.INFO)
 
@@ -702,4 +472,5 @@ if __name__ == "__main__":
         rename_headers_list=json.loads(os.environ.get("RENAME_HEADERS_LIST", r"{}")),
         output_headers=json.loads(os.environ.get("OUTPUT_CSV_HEADERS", r"[]")),
         drop_dest_table=os.environ.get("DROP_DEST_TABLE", "N"),
+        max_load_jobs=os.environ.get("MAX_LOAD_JOBS", "2"),
     )
@@ -24,6 +24,9 @@ import pandas as pd
 import requests
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     source_url: str,
@@ -55,25 +58,18 @@ def main(
     convert_json_file_to_csv(source_file_unzipped, source_file)
 
     logging.info(f"Opening batch file {source_file}")
-    with pd.read_csv(
+    chunks = iter_csv(
         source_file,  # path to main source file to load in batches
-        engine="python",
         encoding="utf-8",
         quotechar='"',  # string separator, typically double-quotes
         chunksize=int(chunksize),  # size of batch data, in no. of records
         sep=",",  # data column separator, typically ","
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
+    )
+    with CsvChunkSink(target_file, sep=",") as sink:
+        for df in chunks:
             process_chunk(
                 df,
-                target_file_batch,
-                target_file,
-                (not chunk_number == 0),
+                sink,
                 transform_list=transform_list,
                 rename_headers_list=rename_headers_list,
                 regex_list=regex_list,
@@ -122,9 +118,7 @@ def normalize_column_data(df: pd.DataFrame, flatten_column: str) -> pd.DataFrame
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
-    skip_header: bool,
+    sink: CsvChunkSink,
     transform_list: list,
     rename_headers_list: dict,
     regex_list: dict,
@@ -145,8 +139,7 @@ def process_chunk(
             df = trim_whitespace(df)
         elif transform == "reorder_headers":
             df = reorder_headers(df, reorder_headers_list)
-    save_to_new_file(df, file_path=str(target_file_batch))
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
+    sink.write(df)
 
 
 def rename_headers(df: pd.DataFrame, header_list: dict) -> pd.DataFrame:
@@ -224,31 +217,6 @@ def trim_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def save_to_new_file(df: pd.DataFrame, file_path) -> None:
-    df.to_csv(file_path, index=False)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    data_file = open(batch_file_path, "r")
-    if truncate_file:
-        target_file = open(target_file_path, "w+").close()
-    target_file = open(target_file_path, "a+")
-    if skip_header:
-        logging.info(
-            f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-        )
-        next(data_file)
-    else:
-        logging.info(f"Appending batch file {batch_file_path} to {target_file_path}")
-    target_file.write(data_file.read())
-    data_file.close()
-    target_file.close()
-    if os.path.exists(batch_file_path):
-        os.remove(batch_file_path)
-
-
 def upload_file_to_gcs(file_path: pathlib.Path, gcs_bucket: str, gcs_path: str) -> None:
     storage_client = storage.Client()
     bucket = storage_client.bucket(gcs_bucket)
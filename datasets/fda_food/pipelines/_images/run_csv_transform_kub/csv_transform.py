@@ -25,6 +25,9 @@ import pandas as pd
 import requests
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     pipeline: str,
@@ -82,9 +85,8 @@ def process_source_file(
     reorder_headers_list: list,
 ) -> None:
     logging.info(f"Opening batch file {source_file}")
-    with pd.read_csv(
+    chunks = iter_csv(
         source_file,  # path to main source file to load in batches
-        engine="python",
         encoding="utf-8",
         quotechar='"',  # string separator, typically double-quotes
         chunksize=chunksize,  # size of batch data, in no. of records
@@ -95,32 +97,24 @@ def process_source_file(
         dtype=dtypes,
         keep_default_na=True,
         na_values=[" "],
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
+    )
+    with CsvChunkSink(target_file, sep=",") as sink:
+        for df in chunks:
             process_chunk(
                 df=df,
-                target_file_batch=target_file_batch,
-                target_file=target_file,
+                sink=sink,
                 rename_mappings=rename_mappings,
                 reorder_headers_list=reorder_headers_list,
                 pipeline=pipeline,
-                skip_header=(not chunk_number == 0),
             )
 
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
+    sink: CsvChunkSink,
     rename_mappings: dict,
     reorder_headers_list: list,
     pipeline: str,
-    skip_header: bool = False,
 ) -> None:
     if pipeline == "food events":
         df = process_food_events(df, rename_mappings, reorder_headers_list)
@@ -128,8 +122,7 @@ def process_chunk(
         df = process_food_enforcement(df, reorder_headers_list)
     else:
         logging.info("pipeline was not specified")
-    save_to_new_file(df, file_path=str(target_file_batch))
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
+    sink.write(df)
 
 
 def process_food_events(
@@ -254,31 +247,6 @@ def trim_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def save_to_new_file(df, file_path) -> None:
-    df.to_csv(file_path, index=False)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    data_file = open(batch_file_path, "r")
-    if truncate_file:
-        target_file = open(target_file_path, "w+").close()
-    target_file = open(target_file_path, "a+")
-    if skip_header:
-        logging.info(
-            f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-        )
-        next(data_file)
-    else:
-        logging.info(f"Appending batch file {batch_file_path} to {target_file_path}")
-    target_file.write(data_file.read())
-    data_file.close()
-    target_file.close()
-    if os.path.exists(batch_file_path):
-        os.remove(batch_file_path)
-
-
 def download_file_http(
     source_url: str, source_file: pathlib.Path, continue_on_error: bool = False
 ) -> None:
@@ -26,6 +26,8 @@ import pandas as pd
 import requests
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink, save_to_new_file
+
 
 def main(
     source_bucket: str,
@@ -91,7 +93,7 @@ def main(
         else:
             df.columns = csv_headers
             pass
-        save_to_new_file(df, file_path=str(target_file))
+        save_to_new_file(df, file_path=str(target_file), sep=",")
         upload_file_to_gcs(target_file, target_gcs_bucket, target_gcs_path)
         logging.info(f"FEC {pipeline_name} process completed")
     else:
@@ -114,7 +116,7 @@ def process_source_file(
     csv.register_dialect("TabDialect", quotechar='"', delimiter="\t", strict=True)
     with open(
         source_file,
-    ) as reader:
+    ) as reader, CsvChunkSink(target_file, sep=",") as sink:
         data = []
         chunk_number = 1
         for index, line in enumerate(csv.reader(reader, "TabDialect"), 0):
@@ -122,7 +124,7 @@ def process_source_file(
             if int(index) % int(chunksize) == 0 and int(index) > 0:
                 process_dataframe_chunk(
                     data,
-                    target_file,
+                    sink,
                     chunk_number,
                     pipeline_name,
                     csv_headers,
@@ -132,7 +134,7 @@ def process_source_file(
         if data:
             process_dataframe_chunk(
                 data,
-                target_file,
+                sink,
                 chunk_number,
                 pipeline_name,
                 csv_headers,
@@ -141,33 +143,22 @@ def process_source_file(
 
 def process_dataframe_chunk(
     data: typing.List[str],
-    target_file: str,
+    sink: CsvChunkSink,
     chunk_number: int,
     pipeline_name: str,
     csv_headers: typing.List[str],
 ) -> None:
     data = list([char.split("|") for item in data for char in item])
     df = pd.DataFrame(data, columns=csv_headers)
-    target_file_batch = str(target_file).replace(
-        ".csv", "-" + str(chunk_number) + ".csv"
-    )
-    process_chunk(
-        df=df,
-        target_file_batch=target_file_batch,
-        target_file=target_file,
-        pipeline_name=pipeline_name,
-        skip_header=(not chunk_number == 1),
-    )
+    logging.info(f"Processing chunk #{chunk_number}")
+    process_chunk(df=df, sink=sink, pipeline_name=pipeline_name)
 
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
+    sink: CsvChunkSink,
     pipeline_name: str,
-    skip_header: bool,
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
     df["image_num"] = df["image_num"].astype(str)
     df["transaction_dt"] = df["transaction_dt"].astype(str)
     df["image_num"] = (
@@ -180,33 +171,7 @@ def process_chunk(
     date_for_length(df, "transaction_dt")
     df = resolve_date_format(df, "transaction_dt", pipeline_name)
     df = df.rename(columns=lambda x: x.strip())
-    save_to_new_file(df, file_path=str(target_file_batch), sep=",")
-    append_batch_file(target_file_batch, target_file, skip_header)
-    logging.info(f"Processing batch file {target_file_batch} completed")
-
-
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = ",") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=",")
-
-
-def append_batch_file(
-    target_file_batch: str, target_file: str, skip_header: bool
-) -> None:
-    with open(target_file_batch, "r") as data_file:
-        with open(target_file, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {target_file_batch} to {target_file} with skipheader..."
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {target_file_batch} to {target_file}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(target_file_batch):
-                os.remove(target_file_batch)
+    sink.write(df)
 
 
 def download_blob(bucket, object, target_file) -> None:
@@ -24,6 +24,8 @@ import typing
 import pandas as pd
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink
+
 
 def main(
     source_bucket: str,
@@ -68,7 +70,7 @@ def process_source_file(
     csv.register_dialect("TabDialect", quotechar='"', delimiter="\t", strict=True)
     with open(source_file, newline="") as f_input, open(
         source_storage_file, "w", newline=""
-    ) as f_output:
+    ) as f_output, CsvChunkSink(target_file, sep=",") as sink:
         csv_input = csv.reader(f_input, skipinitialspace=True)
         csv_output = csv.writer(f_output, quoting=csv.QUOTE_NONNUMERIC)
         index = 0
@@ -88,7 +90,7 @@ def process_source_file(
             if int(index) % int(chunksize) == 0 and int(index) > 0:
                 process_dataframe_chunk(
                     source_storage_file,
-                    target_file,
+                    sink,
                     chunk_number,
                     pipeline_name,
                     csv_headers,
@@ -100,7 +102,7 @@ def process_source_file(
         if index:
             process_dataframe_chunk(
                 source_storage_file,
-                target_file,
+                sink,
                 chunk_number,
                 pipeline_name,
                 csv_headers,
@@ -109,7 +111,7 @@ def process_source_file(
 
 def process_dataframe_chunk(
     source_storage_file: str,
-    target_file: str,
+    sink: CsvChunkSink,
     chunk_number: int,
     pipeline_name: str,
     csv_headers: typing.List[str],
@@ -119,53 +121,16 @@ def process_dataframe_chunk(
     )
     df = df.replace("\n", "", regex=True)
     df = df.replace("\r", "", regex=True)
-    target_file_batch = str(target_file).replace(
-        ".csv", "-" + str(chunk_number) + ".csv"
-    )
-    process_chunk(
-        df=df,
-        target_file_batch=target_file_batch,
-        target_file=target_file,
-        pipeline_name=pipeline_name,
-        skip_header=(not chunk_number == 1),
-    )
+    logging.info(f"Processing chunk #{chunk_number}")
+    process_chunk(df=df, sink=sink, pipeline_name=pipeline_name)
 
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
+    sink: CsvChunkSink,
     pipeline_name: str,
-    skip_header: bool,
-) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
-    save_to_new_file(df, file_path=str(target_file_batch), sep=",")
-    append_batch_file(target_file_batch, target_file, skip_header)
-    logging.info(f"Processing batch file {target_file_batch} completed")
-
-
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = ",") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=",")
-
-
-def append_batch_file(
-    target_file_batch: str, target_file: str, skip_header: bool
 ) -> None:
-    with open(target_file_batch, "r") as data_file:
-        with open(target_file, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {target_file_batch} to {target_file} with skipheader..."
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {target_file_batch} to {target_file}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(target_file_batch):
-                os.remove(target_file_batch)
+    sink.write(df)
 
 
 def download_blob(bucket, object, target_file) -> None:
@@ -13,26 +13,35 @@
 # limitations under the License.
 
 import datetime
-import glob
 import json
 import logging
-import math
 import os
 import pathlib
+import re
 import tarfile
 import typing
 
-import numpy as np
 import pandas as pd
 import requests
 from google.cloud import storage
 
+from transform_runtime.parsers import iter_csv
+from transform_runtime.resources import chunk_sizer
+
 TEST_TRAIN = ["test", "train"]
 NEG_POS_UNSUP = ["neg", "pos", "unsup"]
 REVIEW_COLS = ["review", "split", "label", "id_tag", "path", "reviewer_rating"]
+SPLIT_LABELS = [
+    (split, label)
+    for split in TEST_TRAIN
+    for label in NEG_POS_UNSUP
+    if (split, label) != ("test", "unsup")
+]
+REVIEW_MEMBER = re.compile(r"^aclImdb/(test|train)/(neg|pos|unsup)/(\d+)_(\d+)\.txt$")
+URLS_MEMBER = re.compile(r"^aclImdb/(test|train)/urls_(neg|pos|unsup)\.txt$")
 LABEL_DICT = {"neg": "Negative", "pos": "Positive", "unsup": "Unsupervised"}
-REPLACE_DICT = {"\\N": np.nan}
-REPLACE_BINARY_DICT = {"0": 0, "1": 1, "0.0": 0, "1.0": 1, 0.0: 0, 1.0: 1}
+NULL = ["\\N"]
+IS_ADULT_VALUES = {"0": 0, "1": 1, "0.0": 0, "1.0": 1, "\\N": None}
 
 
 def main(
@@ -48,7 +57,7 @@ def main(
     rename_mappings: dict,
     pipeline_name: str,
     table_name: str,
-    chunk_size: int,
+    chunk_size: str,
 ) -> None:
     logging.info(
         f"IMDb Dataset {pipeline_name} pipeline process started at "
@@ -61,35 +70,22 @@ def main(
         df = get_reviews(
             source_gcs_bucket, source_gcs_object, source_url, source_file, extract_here
         )
-    elif pipeline_name == "interfaces":
-        download_gzfile(source_url.get("url", ""), source_file.get("url_data", ""))
-
-    if table_name == "name_basics":
-        df = get_name_basics(source_file)
-    elif table_name == "title_akas":
-        df = get_title_akas(
-            source_file, chunk_size, rename_mappings, target_csv_file, headers
-        )
-    elif table_name == "title_basics":
-        df = get_title_basics(source_file)
-    elif table_name == "title_crew":
-        df = get_title_crew(source_file)
-    elif table_name == "title_episode":
-        df = get_title_episode(source_file)
-    elif table_name == "title_principals":
-        df = get_title_principals(
-            source_file, chunk_size, rename_mappings, target_csv_file, headers
-        )
-    elif table_name == "title_ratings":
-        df = get_title_ratings(source_file)
-
-    if table_name not in ("title_akas", "title_principals"):
         rename_headers(df, rename_mappings)
         try:
             save_to_newfile(df, target_csv_file, headers)
 
         except Exception as e:
             logging.error(f"Error saving output file: {e}.")
+    elif pipeline_name == "interfaces":
+        download_gzfile(source_url.get("url", ""), source_file.get("url_data", ""))
+        write_table(
+            source_file.get("url_data", ""),
+            table_name,
+            chunk_size,
+            rename_mappings,
+            target_csv_file,
+            headers,
+        )
 
     upload_file_to_gcs(target_csv_file, target_gcs_bucket, target_gcs_path)
 
@@ -110,130 +106,62 @@ def get_reviews(
     download_blob(
         source_gcs_bucket, source_gcs_object, source_file.get("user_review_data", "")
     )
-    extract_tar(source_file.get("user_review_data", ""), extract_here)
-    df_reviews = create_dataframe(extract_here)
+    df_reviews = create_dataframe(source_file.get("user_review_data", ""), extract_here)
     df = add_movie_title(df_reviews, source_file.get("title_data", ""))
     clean_html_tags(df, "review")
     coldata_replace(df, "label", LABEL_DICT)
     return df
 
 
-def get_name_basics(source_file: dict) -> pd.DataFrame:
-    logging.info(f'Reading data from  {source_file.get("url_data", "")}')
-    df = pd.read_csv(source_file.get("url_data", ""), sep="\t", compression="gzip")
-    for col in df:
-        if col in ("birthYear", "deathYear"):
-            coldata_replace(df, col, REPLACE_DICT)
-            convert_int(df, col, "Int64")
-            continue
-        elif col in ("knownForTitles"):
-            coldata_replace(df, col, REPLACE_DICT)
-    return df
-
-
-def get_title_akas(
-    source_file: dict,
-    chunk_size: int,
+def write_table(
+    source_file: str,
+    table_name: str,
+    chunk_size: str,
     rename_mappings: dict,
     target_csv_file: pathlib.Path,
-    headers: list,
+    headers: typing.List[str],
 ) -> None:
-    logging.info(f'Reading data from  {source_file.get("url_data", "")} in chunks')
-    df_chunk = pd.read_csv(
-        source_file.get("url_data", ""),
+    """Cleans an IMDb interface table chunk by chunk into the output CSV file.
+
+    Only one chunk of the gzipped TSV is held in memory at a time. Every chunk
+    is read with the table's options from `TABLE_READERS`, which fix the column
+    types, so all chunks are written the same way.
+    """
+    clean_chunk, read_options = TABLE_READERS[table_name]
+    logging.info(f"Reading data from  {source_file} in chunks")
+    chunks = iter_csv(
+        source_file,
+        chunk_sizer(chunk_size),
         sep="\t",
         compression="gzip",
-        chunksize=chunk_size,
+        **read_options,
     )
-    for idx, chunk in enumerate(df_chunk):
-        logging.info(f"\t\tStarted cleaning chunk {idx}.")
-        chunk_cleaned = chunk_clean_akas(chunk)
-        if idx == 0:
+    logging.info(f"csv headers are {headers}")
+    logging.info(f"Writing data to {target_csv_file}.")
+    with open(target_csv_file, "w", newline="") as fb:
+        pd.DataFrame(columns=headers).to_csv(fb, index=False)
+        for idx, chunk in enumerate(chunks):
+            chunk_cleaned = clean_chunk(chunk)
             rename_headers(chunk_cleaned, rename_mappings)
-            logging.info(f"csv headers are {headers}")
-            logging.info(f"Writing data to {target_csv_file}.")
-            chunk_cleaned.to_csv(str(target_csv_file), index=False, columns=headers)
-        else:
-            logging.info(f"Appending data to {target_csv_file}.")
-            chunk_cleaned.to_csv(
-                str(target_csv_file), index=False, mode="a", header=False
-            )
-        logging.info(f"{idx} chunk shape {chunk_cleaned.shape}")
+            chunk_cleaned.to_csv(fb, index=False, header=False, columns=headers)
+            logging.info(f"{idx} chunk shape {chunk_cleaned.shape}")
     logging.info(f"Successfully created {target_csv_file} file")
 
 
-def get_title_basics(source_file: dict) -> pd.DataFrame:
-    logging.info(f'Reading data from  {source_file.get("url_data", "")}')
-    df = pd.read_csv(source_file.get("url_data", ""), sep="\t", compression="gzip")
-    df = df[df.isAdult.isin([0, "0", "0.0", 0.0, 1, "1", "1.0", 1.0, "\\N"])]
-    for col in df:
-        if col in ("isAdult"):
-            coldata_replace(df, col, {**REPLACE_BINARY_DICT, **REPLACE_DICT})
-            convert_int(df, col, "Int64")
-            continue
-        elif col in ("startYear", "endYear", "runtimeMinutes"):
-            convert_digit(df, col)
-            convert_int(df, col, "Int64")
-            continue
-        elif col in ("genres"):
-            coldata_replace(df, col, REPLACE_DICT)
-
-    return df
-
-
-def get_title_crew(source_file: dict) -> pd.DataFrame:
-    logging.info(f'Reading data from  {source_file.get("url_data", "")}')
-    df = pd.read_csv(source_file.get("url_data", ""), sep="\t", compression="gzip")
-    for col in df:
-        coldata_replace(df, col, REPLACE_DICT)
-    return df
-
-
-def get_title_episode(source_file: dict) -> pd.DataFrame:
-    logging.info(f'Reading data from  {source_file.get("url_data", "")}')
-    df = pd.read_csv(source_file.get("url_data", ""), sep="\t", compression="gzip")
-    for col in df:
-        if col in ("seasonNumber", "episodeNumber"):
-            convert_digit(df, col)
-            convert_int(df, col, "Int64")
-    return df
-
-
-def get_title_principals(
-    source_file: dict,
-    chunk_size: int,
-    rename_mappings: dict,
-    target_csv_file: pathlib.Path,
-    headers: list,
-) -> None:
-    logging.info(f'Reading data from  {source_file.get("url_data", "")} in chunks')
-    df_chunk = pd.read_csv(
-        source_file.get("url_data", ""),
-        sep="\t",
-        compression="gzip",
-        chunksize=chunk_size,
-    )
-    for idx, chunk in enumerate(df_chunk):
-        logging.info(f"\t\tStarted cleaning chunk {idx}.")
-        chunk_cleaned = chunk_clean_principals(chunk)
-        if idx == 0:
-            rename_headers(chunk_cleaned, rename_mappings)
-            logging.info(f"csv headers are {headers}")
-            logging.info(f"Writing data to {target_csv_file}.")
-            chunk_cleaned.to_csv(str(target_csv_file), index=False, columns=headers)
-        else:
-            logging.info(f"Appending data to {target_csv_file}.")
-            chunk_cleaned.to_csv(
-                str(target_csv_file), index=False, mode="a", header=False
-            )
-        logging.info(f"{idx} chunk shape {chunk_cleaned.shape}")
-    logging.info(f"Successfully created {target_csv_file} file")
+def clean_title_basics(chunk: pd.DataFrame) -> pd.DataFrame:
+    chunk = chunk[chunk["isAdult"].isin(IS_ADULT_VALUES.keys())].copy()
+    chunk["isAdult"] = chunk["isAdult"].map(IS_ADULT_VALUES).astype("Int64")
+    for col in ("startYear", "endYear", "runtimeMinutes"):
+        convert_digit(chunk, col)
+        convert_int(chunk, col, "Int64")
+    return chunk
 
 
-def get_title_ratings(source_file: dict) -> pd.DataFrame:
-    logging.info(f'Reading data from  {source_file.get("url_data", "")}')
-    df = pd.read_csv(source_file.get("url_data", ""), sep="\t", compression="gzip")
-    return df
+def clean_title_episode(chunk: pd.DataFrame) -> pd.DataFrame:
+    for col in ("seasonNumber", "episodeNumber"):
+        convert_digit(chunk, col)
+        convert_int(chunk, col, "Int64")
+    return chunk
 
 
 def download_gzfile(source_url: str, source_file: str):
@@ -260,71 +188,82 @@ def download_blob(source_gcs_bucket: str, source_gcs_object: str, target_file: s
     logging.info("Downloading Completed.")
 
 
-def extract_tar(source_file: pathlib.Path, extract_here: pathlib.Path):
-    logging.info(f"Extracting tar.gz file to -> {extract_here}.")
-    if "tar.gz" in source_file:
-        with tarfile.open(str(source_file), "r") as tar_fb:
-            tar_fb.extractall(extract_here)
-    logging.info(f"Successfully extracted tar file to -> {extract_here}.")
-
-
-def get_id_rating(file: str, index: int):
-    if "unsup" in file and index == 1:
-        return math.nan
-    return int(file.split("/")[-1].split(".")[0].split("_")[index])
-
-
-def allign_data(file: str):
-    review = open(file).read()
-    split = str(file).split("/")[2]
-    label = file.split("/")[-2]
-    review_path = file
-    id_tag = get_id_rating(file, 0)
-    reviewer_rating = get_id_rating(file, 1)
-    return [review, split, label, id_tag, review_path, reviewer_rating]
-
-
-def add_movie_url(parent: str, child: str, df: pd.DataFrame, id_tag: str):
-    urls = []
-    try:
-        with open(f"./files/aclImdb/{parent}/urls_{child}.txt") as fb:
-            urls.extend(fb.read().splitlines())
-        urls = [url.replace("usercomments", "") for url in urls]
-        movie_title_dict = dict(enumerate(urls))
-        return df[id_tag].map(movie_title_dict, na_action=None)
-    except FileNotFoundError as e:
-        logging.info(f"\t\t{e}.")
-
-
-def add_movie_id(df: pd.DataFrame, column: str, index: int):
-    return df[column].apply(lambda row: row.split("/")[index])
-
-
-def create_dataframe(extract_here: pathlib.Path):
+def read_review_archive(
+    source_file: str, extract_here: pathlib.Path
+) -> typing.Tuple[typing.List[tuple], typing.Dict[tuple, typing.List[str]]]:
+    """Streams the reviews and movie URL lists out of the tar.gz archive.
+
+    Members are read in archive order without extracting them to disk, and
+    each review is parsed as soon as it is read, so only its decoded row is
+    kept.
+    """
+    logging.info(f"Streaming reviews from {source_file}.")
+    rows, urls = [], {}
+    with tarfile.open(str(source_file), "r|gz") as tar_fb:
+        for member in tar_fb:
+            url_member = URLS_MEMBER.match(member.name)
+            review_member = REVIEW_MEMBER.match(member.name)
+            if url_member:
+                urls[url_member.groups()] = (
+                    tar_fb.extractfile(member).read().decode().splitlines()
+                )
+            elif review_member and member.isfile():
+                data = tar_fb.extractfile(member).read()
+                rows.append(parse_review(review_member, data, extract_here))
+    logging.info(f"Read {len(rows)} reviews from {source_file}.")
+    return rows, urls
+
+
+def parse_review(
+    review_member: re.Match, data: bytes, extract_here: pathlib.Path
+) -> tuple:
+    split, label, id_tag, rating = review_member.groups()
+    reviewer_rating = None if label == "unsup" else int(rating)
+    review_path = f"{extract_here}/{review_member.string}"
+    return (data.decode(), split, label, int(id_tag), review_path, reviewer_rating)
+
+
+def movie_urls(
+    urls: typing.Dict[tuple, typing.List[str]]
+) -> typing.Dict[tuple, typing.Dict[int, str]]:
+    """Maps each review id of a split and label to the movie URL on its line."""
+    return {
+        key: dict(enumerate(url.replace("usercomments", "") for url in lines))
+        for key, lines in urls.items()
+    }
+
+
+def create_dataframe(source_file: str, extract_here: pathlib.Path) -> pd.DataFrame:
     logging.info("Started creating Dataframe for reviews(data).")
-    df_reviews = pd.DataFrame(columns=REVIEW_COLS)
-    for parent in TEST_TRAIN:
-        for child in NEG_POS_UNSUP:
-            if parent == "test" and child == "unsup":
-                break
-            path = f"{extract_here}/aclImdb/{parent}/{child}/"
-            csv_files = list(glob.glob(path + "*.txt"))
-            csv_files.sort()
-            logging.info(
-                f"\tCreating Dataframe by reading files from {parent}-->{child}."
-            )
-            df_child = pd.DataFrame(
-                [allign_data(file) for file in csv_files], columns=REVIEW_COLS
-            )
-            logging.info("\tAdding movie_url column")
-            df_child["movie_url"] = add_movie_url(parent, child, df_child, "id_tag")
-            logging.info("\tAdding movie_id column")
-            df_child["movie_id"] = add_movie_id(df_child, "movie_url", -2)
-            logging.info(
-                f"\tTrying to concatenating main dataframe & child dataframe for {parent}-->{child} (folder)."
-            )
-            df_reviews = pd.concat([df_reviews, df_child], ignore_index=True)
-            logging.info("\tChild Dataframe concatenated with main Dataframe df")
+    rows, urls = read_review_archive(source_file, extract_here)
+    urls_by_id = movie_urls(urls)
+    # Reviews keep the order of the extracted folders: by split and label, then
+    # by file path.
+    order = {key: idx for idx, key in enumerate(SPLIT_LABELS)}
+    rows.sort(key=lambda row: (order[(row[1], row[2])], row[4]))
+    df_splits = []
+    for split in TEST_TRAIN:
+        split_rows = [row for row in rows if row[1] == split]
+        logging.info(
+            f"\tCreating Dataframe for {split} from {len(split_rows)} reviews."
+        )
+        # Built column by column so that a split without reviews still has
+        # every column.
+        columns = {
+            col: [row[idx] for row in split_rows] for idx, col in enumerate(REVIEW_COLS)
+        }
+        columns["movie_url"] = [
+            urls_by_id.get((split, label), {}).get(id_tag)
+            for label, id_tag in zip(columns["label"], columns["id_tag"])
+        ]
+        columns["movie_id"] = [
+            url.split("/")[-2] if url else None for url in columns["movie_url"]
+        ]
+        df_split = pd.DataFrame(columns)
+        df_split["id_tag"] = df_split["id_tag"].astype("int64")
+        df_split["reviewer_rating"] = df_split["reviewer_rating"].astype("Int64")
+        df_splits.append(df_split)
+    df_reviews = pd.concat(df_splits, ignore_index=True)
     logging.info("Successfully Created Dataframe and assigned to variable df_reviews.")
     return df_reviews
 
@@ -378,7 +317,8 @@ def convert_int(df: pd.DataFrame, col: str, dtype: str) -> None:
 
 def convert_digit(df: pd.DataFrame, col: str) -> None:
     logging.info(f"Converting '{col}' data from string(value) to integer(value).")
-    df[col] = df[col].apply(lambda data: int(data) if str(data).isdigit() else np.nan)
+    digits = df[col].astype(str).str.isdigit()
+    df[col] = pd.to_numeric(df[col].where(digits), errors="coerce")
 
 
 def rename_headers(df: pd.DataFrame, rename_mappings: dict) -> None:
@@ -452,6 +392,86 @@ def upload_file_to_gcs(
     logging.info("Successfully uploaded file to gcs bucket.")
 
 
+# The chunk cleaner and read options of each interface table. IMDb writes
+# missing values as "\N", which is read as null only in the columns listed
+# under na_values; other columns keep it as written.
+TABLE_READERS = {
+    "name_basics": (
+        lambda chunk: chunk,
+        {
+            "dtype": {
+                **dict.fromkeys(
+                    ("nconst", "primaryName", "primaryProfession", "knownForTitles"),
+                    str,
+                ),
+                "birthYear": "Int64",
+                "deathYear": "Int64",
+            },
+            "na_values": {
+                col: NULL for col in ("birthYear", "deathYear", "knownForTitles")
+            },
+        },
+    ),
+    "title_akas": (
+        chunk_clean_akas,
+        {
+            "dtype": {
+                **dict.fromkeys(
+                    (
+                        "titleId",
+                        "title",
+                        "region",
+                        "language",
+                        "types",
+                        "attributes",
+                        "isOriginalTitle",
+                    ),
+                    str,
+                ),
+                "ordering": "int64",
+            }
+        },
+    ),
+    "title_basics": (
+        clean_title_basics,
+        {
+            "dtype": {
+                **dict.fromkeys(
+                    (
+                        "tconst",
+                        "primaryTitle",
+                        "originalTitle",
+                        "isAdult",
+                        "startYear",
+                        "endYear",
+                        "runtimeMinutes",
+                        "genres",
+                    ),
+                    str,
+                ),
+                "titleType": "category",
+            },
+            "na_values": {"genres": NULL},
+        },
+    ),
+    "title_crew": (lambda chunk: chunk, {"dtype": str, "na_values": NULL}),
+    "title_episode": (clean_title_episode, {"dtype": str}),
+    "title_principals": (
+        chunk_clean_principals,
+        {
+            "dtype": {
+                **dict.fromkeys(("tconst", "nconst", "job", "characters"), str),
+                "ordering": "int64",
+                "category": "category",
+            }
+        },
+    ),
+    "title_ratings": (
+        lambda chunk: chunk,
+        {"dtype": {"tconst": str, "averageRating": "float64", "numVotes": "int64"}},
+    ),
+}
+
 if __name__ == "__main__":
     logging.getLogger().setLevel(logging.INFO)
     main(
@@ -467,5 +487,5 @@ if __name__ == "__main__":
         rename_mappings=json.loads(os.environ.get("RENAME_MAPPINGS")),
         pipeline_name=os.environ.get("PIPELINE_NAME", ""),
         table_name=os.environ.get("TABLE_NAME", ""),
-        chunk_size=int(os.environ.get("CHUNK_SIZE", "1000000")),
+        chunk_size=os.environ.get("CHUNK_SIZE", "auto"),
     )
@@ -53,7 +53,7 @@ with DAG(
             "CSV_HEADERS": '["nconst", "primary_name", "birth_year", "death_year", "primary_profession", "known_for_titles"]',
             "RENAME_MAPPINGS": '{"nconst": "nconst", "primaryName": "primary_name", "birthYear": "birth_year", "deathYear": "death_year",\n "primaryProfession": "primary_profession", "knownForTitles": "known_for_titles"}',
         },
-        resources={"request_memory": "4G", "request_cpu": "1"},
+        resources={"request_memory": "1G", "request_cpu": "1", "limit_memory": "2G"},
     )
 
     # Task to load CSV data to a BigQuery table
@@ -117,7 +117,6 @@ with DAG(
         env_vars={
             "SOURCE_URL": '{"url": "https://datasets.imdbws.com/title.akas.tsv.gz"}',
             "SOURCE_FILE": '{"url_data": "./files/title_akas.tsv.gz"}',
-            "CHUNK_SIZE": "300000",
             "TARGET_CSV_FILE": "./files/data_output.csv",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
             "TARGET_GCS_PATH": "data/imdb/interfaces/title_akas_data_output.csv",
@@ -127,9 +126,10 @@ with DAG(
             "RENAME_MAPPINGS": '{"titleId": "title_id", "ordering": "ordering", "title": "title", "region": "region", "language": "language", "types": "types", "attributes": "attributes", "isOriginalTitle": "is_original_title"}',
         },
         resources={
-            "request_memory": "8G",
+            "request_memory": "2G",
             "request_cpu": "3",
             "request_ephemeral_storage": "10G",
+            "limit_memory": "4G",
         },
     )
 
@@ -214,7 +214,7 @@ with DAG(
             "CSV_HEADERS": '["tconst", "title_type", "primary_title", "original_title", "is_adult", "start_year", "end_year", "runtime_minutes", "genres"]',
             "RENAME_MAPPINGS": '{"tconst": "tconst", "titleType": "title_type", "primaryTitle": "primary_title", "originalTitle": "original_title",\n "isAdult": "is_adult", "startYear": "start_year", "endYear": "end_year", "runtimeMinutes": "runtime_minutes", "genres": "genres"}',
         },
-        resources={"request_memory": "4G", "request_cpu": "1"},
+        resources={"request_memory": "1G", "request_cpu": "1", "limit_memory": "2G"},
     )
 
     # Task to load CSV data to a BigQuery table
@@ -304,7 +304,7 @@ with DAG(
             "CSV_HEADERS": '["tconst", "directors", "writers"]',
             "RENAME_MAPPINGS": '{"tconst": "tconst", "directors": "directors", "writers": "writers"}',
         },
-        resources={"request_memory": "4G", "request_cpu": "1"},
+        resources={"request_memory": "1G", "request_cpu": "1", "limit_memory": "2G"},
     )
 
     # Task to load CSV data to a BigQuery table
@@ -358,7 +358,7 @@ with DAG(
             "CSV_HEADERS": '["tconst", "parent_tconst", "season_number", "episode_number"]',
             "RENAME_MAPPINGS": '{"tconst": "tconst", "parentTconst": "parent_tconst", "seasonNumber": "season_number", "episodeNumber": "episode_number"}',
         },
-        resources={"request_memory": "4G", "request_cpu": "1"},
+        resources={"request_memory": "1G", "request_cpu": "1", "limit_memory": "2G"},
     )
 
     # Task to load CSV data to a BigQuery table
@@ -410,7 +410,6 @@ with DAG(
         env_vars={
             "SOURCE_URL": '{"url": "https://datasets.imdbws.com/title.principals.tsv.gz"}',
             "SOURCE_FILE": '{"url_data": "./files/title_principals.tsv.gz"}',
-            "CHUNK_SIZE": "300000",
             "TARGET_CSV_FILE": "./files/data_output.csv",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
             "TARGET_GCS_PATH": "data/imdb/interfaces/title_principals_data_output.csv",
@@ -420,9 +419,10 @@ with DAG(
             "RENAME_MAPPINGS": '{"tconst": "tconst", "ordering": "ordering", "nconst": "nconst", "category": "category",\n "job": "job", "characters": "characters"}',
         },
         resources={
-            "request_memory": "8G",
+            "request_memory": "2G",
             "request_cpu": "3",
             "request_ephemeral_storage": "10G",
+            "limit_memory": "4G",
         },
     )
 
@@ -495,7 +495,7 @@ with DAG(
             "CSV_HEADERS": '["tconst", "average_rating", "num_votes"]',
             "RENAME_MAPPINGS": '{"tconst": "tconst", "averageRating": "average_rating", "numVotes": "num_votes"}',
         },
-        resources={"request_memory": "4G", "request_cpu": "1"},
+        resources={"request_memory": "1G", "request_cpu": "1", "limit_memory": "2G"},
     )
 
     # Task to load CSV data to a BigQuery table
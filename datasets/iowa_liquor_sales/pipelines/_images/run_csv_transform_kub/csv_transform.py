@@ -23,6 +23,9 @@ from datetime import datetime
 import pandas as pd
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     source_url: str,
@@ -48,32 +51,16 @@ def main(
         target_file = target_file + "_" + str(file_number) + ".csv"
         logging.info("Reading csv file")
         csvfile = download_location + source_file
-        with pd.read_csv(
+        chunks = iter_csv(
             csvfile,
-            engine="python",
             encoding="utf-8",
             quotechar='"',
             chunksize=chunksz,
-        ) as reader:
-            for chunk_number, chunk in enumerate(reader):
+        )
+        with CsvChunkSink(target_file, sep=",") as sink:
+            for chunk_number, df in enumerate(chunks):
                 logging.info(f"Processing batch {chunk_number}")
-                target_file_batch = str(target_file).replace(
-                    ".csv", "-" + str(chunk_number) + ".csv"
-                )
-                df = pd.DataFrame()
-                df = pd.concat([df, chunk])
-                processChunk(df, target_file_batch, headers, rename_mappings)
-                logging.info(f"Appending batch {chunk_number} to {target_file}")
-                if chunk_number == 0:
-                    subprocess.run(["cp", target_file_batch, target_file])
-                else:
-                    subprocess.check_call(
-                        f"sed -i '1d' {target_file_batch}", shell=True
-                    )
-                    subprocess.check_call(
-                        f"cat {target_file_batch} >> {target_file}", shell=True
-                    )
-                subprocess.run(["rm", target_file_batch])
+                processChunk(df, sink, headers, rename_mappings)
         upload_file_to_gcs(
             target_file, target_gcs_bucket, target_gcs_path, str(file_number)
         )
@@ -94,7 +81,7 @@ def list_files(source_bucket, source_gcs_path):
 
 
 def processChunk(
-    df: pd.DataFrame, target_file_batch: str, headers, rename_mappings
+    df: pd.DataFrame, sink: CsvChunkSink, headers, rename_mappings
 ) -> None:
     rename_headers_(df, rename_mappings)
     logging.info("Convert Date Format")
@@ -103,7 +90,7 @@ def processChunk(
     df = df[headers]
     df["county_number"] = df["county_number"].astype("Int64")
     try:
-        save_to_new_file(df, file_path=str(target_file_batch))
+        sink.write(df)
     except Exception as e:
         logging.error(f"Error saving output file: {e}.")
     logging.info("..Done!")
@@ -122,11 +109,6 @@ def convert_dt_format(dt_str: str) -> str:
             return datetime.strptime(dt_str, "%m/%d/%Y").strftime("%Y-%m-%d")
 
 
-def save_to_new_file(df, file_path) -> None:
-    logging.info(f"Saving to output file.. {file_path}")
-    df.to_csv(file_path, index=False)
-
-
 def download_file(source_url: str, download_location: str, source_bucket: str) -> None:
     logging.info(f"Downloading {source_url} into {download_location}")
     client = storage.Client()
@@ -25,6 +25,8 @@ import typing
 import pandas as pd
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink
+
 
 def main(
     source_bucket: str,
@@ -64,7 +66,7 @@ def process_source_file(
     csv.register_dialect("TabDialect", quotechar='"', delimiter="\t", strict=True)
     with open(
         source_file,
-    ) as reader:
+    ) as reader, CsvChunkSink(target_file, sep=",") as sink:
         data = []
         chunk_number = 1
         for index, line in enumerate(csv.reader(reader), 0):
@@ -72,7 +74,7 @@ def process_source_file(
             if int(index) % int(chunksize) == 0 and int(index) > 0:
                 process_dataframe_chunk(
                     data,
-                    target_file,
+                    sink,
                     chunk_number,
                     pipeline_name,
                     rename_mappings,
@@ -83,7 +85,7 @@ def process_source_file(
         if data:
             process_dataframe_chunk(
                 data,
-                target_file,
+                sink,
                 chunk_number,
                 pipeline_name,
                 rename_mappings,
@@ -93,7 +95,7 @@ def process_source_file(
 
 def process_dataframe_chunk(
     data: typing.List[str],
-    target_file: str,
+    sink: CsvChunkSink,
     chunk_number: int,
     pipeline_name: str,
     rename_mappings: dict,
@@ -101,38 +103,20 @@ def process_dataframe_chunk(
 ) -> None:
     df = pd.DataFrame(data, columns=csv_headers)
     rename_headers(df, rename_mappings)
-    target_file_batch = str(target_file).replace(
-        ".csv", "-" + str(chunk_number) + ".csv"
-    )
-    process_chunk(
-        df=df,
-        target_file_batch=target_file_batch,
-        target_file=target_file,
-        pipeline_name=pipeline_name,
-        skip_header=(not chunk_number == 1),
-    )
+    logging.info(f"Processing chunk #{chunk_number}")
+    process_chunk(df=df, sink=sink, pipeline_name=pipeline_name)
 
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
+    sink: CsvChunkSink,
     pipeline_name: str,
-    skip_header: bool,
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
     if "repository_dependencies" in pipeline_name:
         df = df[df["id"] != 218061700]
     elif "versions" in pipeline_name:
         fix_timestamp(df, "created_timestamp")
-    save_to_new_file(df, file_path=str(target_file_batch), sep=",")
-    append_batch_file(target_file_batch, target_file, skip_header)
-    logging.info(f"Processing batch file {target_file_batch} completed")
-
-
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = ",") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=",")
+    sink.write(df)
 
 
 def fix_timestamp(df: pd.DataFrame, column: str) -> None:
@@ -153,25 +137,6 @@ def rename_headers(df: pd.DataFrame, rename_mappings: dict) -> None:
     df.rename(columns=rename_mappings, inplace=True)
 
 
-def append_batch_file(
-    target_file_batch: str, target_file: str, skip_header: bool
-) -> None:
-    with open(target_file_batch, "r") as data_file:
-        with open(target_file, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {target_file_batch} to {target_file} with skipheader..."
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {target_file_batch} to {target_file}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(target_file_batch):
-                os.remove(target_file_batch)
-
-
 def download_blob(bucket, object, target_file) -> None:
     logging.info(f"Downloading file gs://{bucket}/{target_file}")
     """Downloads a blob from the bucket."""
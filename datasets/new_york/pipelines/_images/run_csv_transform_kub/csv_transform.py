@@ -24,6 +24,9 @@ import requests
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
+from transform_runtime.files import CsvChunkSink, save_to_new_file
+from transform_runtime.parsers import iter_csv, read_csv
+
 
 def main(
     pipeline_name: str,
@@ -216,12 +219,8 @@ def download_and_merge_source_files(
     download_file_json(
         source_url_status_json, source_file_status_json, source_file_status_csv
     )
-    df_stations = pd.read_csv(
-        source_file_stations_csv, engine="python", encoding="utf-8", quotechar='"'
-    )
-    df_status = pd.read_csv(
-        source_file_status_csv, engine="python", encoding="utf-8", quotechar='"'
-    )
+    df_stations = read_csv(source_file_stations_csv, encoding="utf-8", quotechar='"')
+    df_status = read_csv(source_file_status_csv, encoding="utf-8", quotechar='"')
     logging.info("Merging files")
     df = df_stations.merge(df_status, left_on="station_id", right_on="station_id")
     df = clean_data_points(
@@ -302,29 +301,22 @@ def process_source_file(
     sep: str = ",",
 ) -> None:
     logging.info(f"Processing file {source_file}")
-    with pd.read_csv(
+    chunks = iter_csv(
         source_file,
-        engine="python",
         encoding="utf-8",
         quotechar='"',
         chunksize=int(chunksize),
         dtype=data_dtypes,
         parse_dates=parse_dates_list,
         sep=sep,
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
+    )
+    with CsvChunkSink(target_file, sep="|") as sink:
+        for chunk_number, df in enumerate(chunks):
             logging.info(f"Processing batch {chunk_number}")
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
             process_chunk(
                 df=df,
-                target_file_batch=target_file_batch,
-                target_file=target_file,
+                sink=sink,
                 destination_table=destination_table,
-                skip_header=(not chunk_number == 0),
                 rename_headers_list=rename_headers_list,
                 null_rows_list=null_rows_list,
                 parse_dates_list=parse_dates_list,
@@ -445,33 +437,10 @@ def create_table_schema(
     return schema
 
 
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
-
-
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
+    sink: CsvChunkSink,
     destination_table: str,
-    skip_header: bool,
     transform_list: typing.List[str],
     rename_headers_list: dict,
     output_headers_list: typing.List[str],
@@ -485,7 +454,7 @@ def process_chunk(
     crash_field_list: typing.List[typing.List],
     date_format_list: typing.List[typing.List],
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
+    logging.info(f"Processing batch of {len(df)} rows")
     if destination_table == "311_service_requests":
         df = parse_date_formats(df, parse_dates_list)
         df = rename_headers(df, rename_headers_list)
@@ -521,14 +490,7 @@ def process_chunk(
         df = remove_whitespace(df, remove_whitespace_list)
         df = reorder_headers(df, reorder_headers_list)
     if not df.empty:
-        save_to_new_file(df, file_path=str(target_file_batch))
-        append_batch_file(
-            batch_file_path=target_file_batch,
-            target_file_path=target_file,
-            skip_header=skip_header,
-            truncate_file=not (skip_header),
-        )
-    logging.info(f"Processing batch file {target_file_batch} completed")
+        sink.write(df)
 
 
 def add_crash_timestamp(
@@ -680,11 +642,6 @@ def rename_headers(df: pd.DataFrame, header_names: dict) -> pd.DataFrame:
     return df
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep)
-
-
 def download_file(source_url: str, source_file: pathlib.Path) -> None:
     logging.info(f"Downloading {source_url} to {source_file}")
     r = requests.get(source_url, stream=True)
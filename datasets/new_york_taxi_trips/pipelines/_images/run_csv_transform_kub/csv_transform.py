@@ -19,10 +19,30 @@ import pathlib
 import typing
 from datetime import datetime
 
+import numpy as np
 import pandas as pd
-import requests
-from google.cloud import bigquery, storage
-from google.cloud.exceptions import NotFound
+import pyarrow as pa
+import pyarrow.compute as pc
+from google.cloud import bigquery
+
+from transform_runtime import columnar, metrics
+from transform_runtime.bq import (
+    LoadJobManager,
+    LoadStateIndex,
+    get_table_schema,
+    load_data_from_gcs,
+)
+from transform_runtime.download import download_file as download_url
+from transform_runtime.formats import (
+    ChunkSink,
+    chunk_sink,
+    output_file_path,
+    source_format,
+)
+from transform_runtime.gcs import gcs_uri, upload_file_to_gcs
+from transform_runtime.parsers import iter_csv
+
+NO_SUCH_KEY_MAX_SIZE = 64 * 1024
 
 
 def main(
@@ -43,6 +63,8 @@ def main(
     input_headers: typing.List[str],
     data_dtypes: dict,
     output_headers: typing.List[str],
+    output_format: str = "csv",
+    max_load_jobs: str = "2",
 ) -> None:
     logging.info(f"New York taxi trips - {pipeline_name} process started")
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
@@ -64,6 +86,8 @@ def main(
         input_headers,
         data_dtypes,
         output_headers,
+        output_format,
+        int(max_load_jobs),
     )
     logging.info(f"New York taxi trips - {pipeline_name} process completed")
 
@@ -86,30 +110,39 @@ def execute_pipeline(
     input_headers: typing.List[str],
     data_dtypes: dict,
     output_headers: typing.List[str],
+    output_format: str = "csv",
+    max_load_jobs: int = 2,
 ) -> None:
-    for year_number in range(datetime.now().year, (start_year - 1), -1):
-        process_year_data(
-            source_url=source_url,
-            year_number=int(year_number),
-            source_file=source_file,
-            target_file=target_file,
-            project_id=project_id,
-            dataset_id=dataset_id,
-            table_id=table_id,
-            data_file_year_field=data_file_year_field,
-            data_file_month_field=data_file_month_field,
-            schema_path=schema_path,
-            chunksize=chunksize,
-            target_gcs_bucket=target_gcs_bucket,
-            target_gcs_path=target_gcs_path,
-            pipeline_name=pipeline_name,
-            input_headers=input_headers,
-            data_dtypes=data_dtypes,
-            output_headers=output_headers,
-        )
+    load_state = LoadStateIndex(
+        project_id, dataset_id, [data_file_year_field, data_file_month_field]
+    )
+    with LoadJobManager(max_in_flight=max_load_jobs) as load_jobs:
+        for year_number in range(datetime.now().year, (start_year - 1), -1):
+            process_year_data(
+                load_state=load_state,
+                load_jobs=load_jobs,
+                source_url=source_url,
+                year_number=int(year_number),
+                source_file=source_file,
+                target_file=target_file,
+                project_id=project_id,
+                dataset_id=dataset_id,
+                table_id=table_id,
+                schema_path=schema_path,
+                chunksize=chunksize,
+                target_gcs_bucket=target_gcs_bucket,
+                target_gcs_path=target_gcs_path,
+                pipeline_name=pipeline_name,
+                input_headers=input_headers,
+                data_dtypes=data_dtypes,
+                output_headers=output_headers,
+                output_format=output_format,
+            )
 
 
 def process_year_data(
+    load_state: LoadStateIndex,
+    load_jobs: LoadJobManager,
     source_url: str,
     year_number: int,
     source_file: str,
@@ -117,8 +150,6 @@ def process_year_data(
     project_id: str,
     dataset_id: str,
     table_id: str,
-    data_file_year_field: str,
-    data_file_month_field: str,
     schema_path: str,
     chunksize: str,
     target_gcs_bucket: str,
@@ -127,6 +158,7 @@ def process_year_data(
     input_headers: typing.List[str],
     data_dtypes: dict,
     output_headers: typing.List[str],
+    output_format: str = "csv",
 ) -> None:
     logging.info(f"Processing year {year_number}")
     destination_table = f"{table_id}_{year_number}"
@@ -134,22 +166,40 @@ def process_year_data(
         padded_month = str(month_number).zfill(2)
         process_year_month = f"{year_number}-{padded_month}"
         logging.info(f"Processing month {process_year_month}")
-        month_data_already_loaded = table_has_month_data(
-            project_id=project_id,
-            dataset_id=dataset_id,
-            table_name=destination_table,
-            data_file_year_field=data_file_year_field,
-            year_number=year_number,
-            data_file_month_field=data_file_month_field,
-            month_number=month_number,
+        month_data_already_loaded = load_state.is_loaded(
+            destination_table, year_number, month_number
         )
         if month_data_already_loaded:
             logging.info(f"{process_year_month} data is already loaded. Skipping.")
         else:
-            target_file_name = str.replace(
-                target_file, ".csv", f"_{year_number}-{month_number}.csv"
+            target_file_name = output_file_path(
+                str.replace(target_file, ".csv", f"_{year_number}-{month_number}.csv"),
+                output_format,
             )
+            if output_format == "parquet":
+                process_month_columnar(
+                    load_state=load_state,
+                    load_jobs=load_jobs,
+                    source_url=source_url,
+                    year_number=year_number,
+                    month_number=month_number,
+                    source_file=source_file,
+                    project_id=project_id,
+                    dataset_id=dataset_id,
+                    table_id=destination_table,
+                    target_file_name=target_file_name,
+                    schema_path=schema_path,
+                    chunksize=chunksize,
+                    target_gcs_bucket=target_gcs_bucket,
+                    target_gcs_path=target_gcs_path,
+                    input_headers=input_headers,
+                    output_headers=output_headers,
+                    pipeline_name=pipeline_name,
+                )
+                continue
             process_month(
+                load_state=load_state,
+                load_jobs=load_jobs,
                 source_url=source_url,
                 year_number=year_number,
                 month_number=month_number,
@@ -167,147 +217,14 @@ def process_year_data(
                 data_dtypes=data_dtypes,
                 output_headers=output_headers,
                 pipeline_name=pipeline_name,
+                output_format=output_format,
             )
     logging.info(f"Processing year {year_number} completed")
 
 
-def table_has_month_data(
-    project_id: str,
-    dataset_id: str,
-    table_name: str,
-    data_file_year_field: str,
-    year_number: int,
-    data_file_month_field: str,
-    month_number: int,
-) -> bool:
-    check_field_exists = field_exists(
-        project_id, dataset_id, table_name, data_file_month_field
-    )
-    if check_field_exists:
-        client = bigquery.Client(project=project_id)
-        query = f"""
-            SELECT count(1) AS number_of_rows
-            FROM {dataset_id}.{table_name}
-            WHERE {data_file_year_field} = {year_number}
-              AND {data_file_month_field} = {month_number}
-        """
-        job_config = bigquery.QueryJobConfig()
-        query_job = client.query(query, job_config=job_config)
-        for row in query_job.result():
-            count_rows = row.number_of_rows
-        if int(count_rows) > 0:
-            return True
-        else:
-            return False
-    else:
-        return None
-
-
-def table_exists(project_id: str, dataset_id: str, table_name: str) -> bool:
-    client = bigquery.Client(project=project_id)
-    tables = client.list_tables(dataset_id)
-    found_table = False
-    for tbl in tables:
-        if tbl.table_id == table_name:
-            found_table = True
-    return found_table
-
-
-def field_exists(
-    project_id: str, dataset_id: str, table_name: str, field_name: str
-) -> bool:
-    if table_exists(project_id, dataset_id, table_name):
-        client = bigquery.Client(project=project_id)
-        table_ref = f"{dataset_id}.{table_name}"
-        tbl_schema = client.get_table(table_ref).schema
-        found_field = False
-        for field in tbl_schema:
-            if field.name == field_name:
-                found_field = True
-        return found_field
-    else:
-        return False
-
-
-def load_data_to_bq(
-    project_id: str,
-    dataset_id: str,
-    table_id: str,
-    file_path: str,
-    field_delimiter: str,
-) -> None:
-    logging.info(
-        f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} started"
-    )
-    client = bigquery.Client(project=project_id)
-    table_ref = client.dataset(dataset_id).table(table_id)
-    job_config = bigquery.LoadJobConfig()
-    job_config.source_format = bigquery.SourceFormat.CSV
-    job_config.field_delimiter = field_delimiter
-    job_config.skip_leading_rows = 1  # ignore the header
-    job_config.autodetect = False
-    with open(file_path, "rb") as source_file:
-        job = client.load_table_from_file(source_file, table_ref, job_config=job_config)
-    job.result()
-    logging.info(
-        f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} completed"
-    )
-
-
-def create_dest_table(
-    project_id: str,
-    dataset_id: str,
-    table_id: str,
-    schema_filepath: list,
-    bucket_name: str,
-) -> None:
-    table_ref = f"{project_id}.{dataset_id}.{table_id}"
-    logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
-    client = bigquery.Client()
-    try:
-        table_exists_id = client.get_table(table_ref).table_id
-        logging.info(f"Table {table_exists_id} currently exists.")
-    except NotFound:
-        logging.info(
-            (
-                f"Table {table_ref} currently does not exist.  Attempting to create table."
-            )
-        )
-        schema = create_table_schema([], bucket_name, schema_filepath)
-        table = bigquery.Table(table_ref, schema=schema)
-        client.create_table(table)
-        print(f"Table {table_ref} was created".format(table_id))
-
-
-def create_table_schema(
-    schema_structure: list, bucket_name: str = "", schema_filepath: str = ""
-) -> list:
-    logging.info(f"Defining table schema... {bucket_name} ... {schema_filepath}")
-    schema = []
-    if not (schema_filepath):
-        schema_struct = schema_structure
-    else:
-        storage_client = storage.Client()
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(schema_filepath)
-        schema_struct = json.loads(blob.download_as_string(client=None))
-    for schema_field in schema_struct:
-        fld_name = schema_field["name"]
-        fld_type = schema_field["type"]
-        try:
-            fld_descr = schema_field["description"]
-        except KeyError:
-            fld_descr = ""
-        fld_mode = schema_field["mode"]
-        schema.append(
-            bigquery.SchemaField(
-                name=fld_name, field_type=fld_type, mode=fld_mode, description=fld_descr
-            )
-        )
-    return schema
-
-
 def process_month(
+    load_state: LoadStateIndex,
+    load_jobs: LoadJobManager,
     source_url: str,
     year_number: int,
     month_number: int,
@@ -325,6 +242,7 @@ def process_month(
     data_dtypes: dict,
     output_headers: typing.List[str],
     pipeline_name: str,
+    output_format: str = "csv",
 ) -> None:
     padded_month = str(month_number).zfill(2)
     process_year_month = f"{year_number}-{padded_month}"
@@ -344,32 +262,32 @@ def process_month(
             logging.info(f"Processing {process_year_month} failed")
         else:
             df_parquet.to_csv(source_file_to_process, sep="|", index=False)
-            with pd.read_csv(
-                source_file_to_process,
-                engine="python",
-                encoding="utf-8",
-                quotechar='"',
-                chunksize=int(chunksize),
-                sep="|",
-                names=input_headers,
-                skiprows=1,
-                dtype=data_dtypes,
-            ) as reader:
-                for chunk_number, chunk in enumerate(reader):
+            load_state.ensure_table(table_id, schema_path, target_gcs_bucket)
+            output_schema = None
+            if output_format == "avro":
+                table_schema = {
+                    field.name: field
+                    for field in get_table_schema(project_id, dataset_id, table_id)
+                }
+                output_schema = [table_schema[name] for name in output_headers]
+            with chunk_sink(target_file_name, output_format, output_schema) as sink:
+                chunks = iter_csv(
+                    source_file_to_process,
+                    int(chunksize),
+                    encoding="utf-8",
+                    quotechar='"',
+                    sep="|",
+                    names=input_headers,
+                    skiprows=1,
+                    dtype=data_dtypes,
+                )
+                for chunk_number, chunk in enumerate(chunks):
                     logging.info(
                         f"Processing chunk #{chunk_number} of file {process_year_month} started"
                     )
-                    target_file_batch = str(target_file).replace(
-                        ".csv", f"-{process_year_month}-{chunk_number}.csv"
-                    )
-                    df = pd.DataFrame()
-                    df = pd.concat([df, chunk])
                     process_chunk(
-                        df,
-                        target_file_batch,
-                        target_file_name,
-                        month_number == 1 and chunk_number == 0,
-                        month_number == 1 and chunk_number == 0,
+                        chunk,
+                        sink,
                         output_headers,
                         pipeline_name,
                         year_number,
@@ -378,30 +296,23 @@ def process_month(
                     logging.info(
                         f"Processing chunk #{chunk_number} of file {process_year_month} completed"
                     )
-            if not table_exists(project_id, dataset_id, table_id):
-                # Destination able doesn't exist
-                create_dest_table(
-                    project_id=project_id,
-                    dataset_id=dataset_id,
-                    table_id=table_id,
-                    schema_filepath=schema_path,
-                    bucket_name=target_gcs_bucket,
-                )
-            load_data_to_bq(
+            os.remove(source_parquet_file)
+            os.remove(source_file_to_process)
+            load_jobs.submit(
+                process_year_month,
+                load_month,
                 project_id=project_id,
                 dataset_id=dataset_id,
                 table_id=table_id,
-                file_path=target_file_name,
-                field_delimiter="|",
-            )
-            upload_file_to_gcs(
-                file_path=target_file_name,
+                target_file_name=target_file_name,
                 target_gcs_bucket=target_gcs_bucket,
-                target_gcs_path=str(target_gcs_path).replace(
-                    ".csv", f"_{process_year_month}.csv"
+                target_gcs_path=output_file_path(
+                    str(target_gcs_path).replace(".csv", f"_{process_year_month}.csv"),
+                    output_format,
                 ),
+                process_year_month=process_year_month,
+                source_format=source_format(output_format),
             )
-            logging.info(f"Processing {process_year_month} completed")
     else:
         logging.info(
             f"Informational: The data file {target_file_name} was not generated because no data was available for year {year_number}.  Continuing."
@@ -409,16 +320,13 @@ def process_month(
 
 
 def download_file(source_url: str, source_file: pathlib.Path) -> bool:
-    logging.info(f"Downloading {source_url} into {source_file}")
-    success = True
-    r = requests.get(source_url, stream=True)
-    with open(source_file, "wb") as f:
-        for chunk in r:
-            f.write(chunk)
+    success = download_url(source_url, source_file)
     # if the file contains the string "<Code>NoSuchKey</Code>" then the url returned
-    # that it could not locate the respective file
-    if open(source_file, "rb").read().find(b"<Code>NoSuchKey</Code>") > -1:
-        success = False
+    # that it could not locate the respective file. Such responses are tiny, so
+    # only small files need to be checked.
+    if success and os.path.getsize(source_file) < NO_SUCH_KEY_MAX_SIZE:
+        with open(source_file, "rb") as f:
+            success = f.read().find(b"<Code>NoSuchKey</Code>") == -1
     if success:
         logging.info(f"Download {source_url} to {source_file} complete.")
     else:
@@ -428,12 +336,151 @@ def download_file(source_url: str, source_file: pathlib.Path) -> bool:
     return success
 
 
+def process_month_columnar(
+    load_state: LoadStateIndex,
+    load_jobs: LoadJobManager,
+    source_url: str,
+    year_number: int,
+    month_number: int,
+    source_file: str,
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    target_file_name: str,
+    schema_path: str,
+    chunksize: str,
+    target_gcs_bucket: str,
+    target_gcs_path: str,
+    input_headers: typing.List[str],
+    output_headers: typing.List[str],
+    pipeline_name: str,
+) -> None:
+    padded_month = str(month_number).zfill(2)
+    process_year_month = f"{year_number}-{padded_month}"
+    source_url_to_process = f"{source_url}{process_year_month}.parquet"
+    source_parquet_file = str(source_file).replace(
+        ".csv", f"_{process_year_month}.parquet"
+    )
+    if not download_file(source_url_to_process, source_parquet_file):
+        logging.info(
+            f"Informational: The data file {target_file_name} was not generated because no data was available for year {year_number}.  Continuing."
+        )
+        return
+    if not load_state.ensure_table(table_id, schema_path, target_gcs_bucket):
+        raise ValueError(
+            f"Destination table {project_id}.{dataset_id}.{table_id} does not exist and could not be created."
+        )
+    table_schema = {
+        field.name: field
+        for field in get_table_schema(project_id, dataset_id, table_id)
+    }
+    output_schema = columnar.arrow_schema(
+        [table_schema[name] for name in output_headers]
+    )
+    with columnar.ParquetSink(target_file_name, output_schema) as sink:
+        for chunk_number, batch in enumerate(
+            columnar.iter_parquet_batches(source_parquet_file, int(chunksize))
+        ):
+            logging.info(
+                f"Processing chunk #{chunk_number} of file {process_year_month}"
+            )
+            sink.write(
+                process_chunk_columnar(
+                    table=pa.Table.from_batches([batch]),
+                    input_headers=input_headers,
+                    output_schema=output_schema,
+                    year_number=year_number,
+                    month_number=month_number,
+                )
+            )
+    os.remove(source_parquet_file)
+    load_jobs.submit(
+        process_year_month,
+        load_month,
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=table_id,
+        target_file_name=target_file_name,
+        target_gcs_bucket=target_gcs_bucket,
+        target_gcs_path=str(target_gcs_path).replace(
+            ".csv", f"_{process_year_month}.parquet"
+        ),
+        process_year_month=process_year_month,
+        source_format=bigquery.SourceFormat.PARQUET,
+    )
+
+
+def load_month(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    target_file_name: str,
+    target_gcs_bucket: str,
+    target_gcs_path: str,
+    process_year_month: str,
+    source_format: str = bigquery.SourceFormat.CSV,
+) -> None:
+    upload_file_to_gcs(
+        file_path=target_file_name,
+        target_gcs_bucket=target_gcs_bucket,
+        target_gcs_path=target_gcs_path,
+    )
+    load_data_from_gcs(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=table_id,
+        source_uris=gcs_uri(target_gcs_bucket, target_gcs_path),
+        truncate_table=False,
+        field_delimiter="|",
+        source_format=source_format,
+    )
+    os.remove(target_file_name)
+    logging.info(f"Processing {process_year_month} completed")
+
+
+@metrics.timed("transform")
+def process_chunk_columnar(
+    table: pa.Table,
+    input_headers: typing.List[str],
+    output_schema: pa.Schema,
+    year_number: int,
+    month_number: int,
+) -> pa.Table:
+    """Arrow equivalent of `process_chunk`.
+
+    Timestamps stay timestamps instead of being formatted as strings, and
+    columns that are not in the source file, such as the green trips
+    `distance_between_service`, come out as nulls.
+    """
+    table = columnar.rename_columns_by_position(table, input_headers)
+    table = table.append_column(
+        "data_file_year", pa.array(np.full(table.num_rows, year_number))
+    )
+    table = table.append_column(
+        "data_file_month", pa.array(np.full(table.num_rows, month_number))
+    )
+    passenger_count = pc.cast(table.column("passenger_count"), pa.float64())
+    valid_count = pc.and_(
+        pc.invert(pc.is_nan(passenger_count)),
+        pc.greater_equal(passenger_count, 0),
+    )
+    table = table.set_column(
+        table.column_names.index("passenger_count"),
+        "passenger_count",
+        pc.if_else(
+            valid_count,
+            pc.cast(passenger_count, pa.int64(), safe=False),
+            pa.scalar(None, pa.int64()),
+        ),
+    )
+    table = table.filter(pc.is_valid(table.column("vendor_id")))
+    return columnar.conform_to_schema(table, output_schema)
+
+
+@metrics.timed("transform")
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
-    include_header: bool,
-    truncate_file: bool,
+    sink: ChunkSink,
     output_headers: typing.List[str],
     pipeline_name: str,
     year_number: int,
@@ -453,9 +500,7 @@ def process_chunk(
     )
     df = remove_null_rows(df)
     df = df[output_headers]
-    save_to_new_file(df, file_path=str(target_file_batch))
-    append_batch_file(target_file_batch, target_file, include_header, truncate_file)
-    logging.info(f"Processing Batch {target_file_batch} completed")
+    sink.write(df)
 
 
 def remove_null_rows(df: pd.DataFrame) -> pd.DataFrame:
@@ -480,57 +525,6 @@ def format_date_time(
     return df
 
 
-def save_to_new_file(df, file_path, sep="|") -> None:
-    logging.info(f"Saving to file {file_path} separator='{sep}'")
-    df.to_csv(file_path, sep=sep, index=False)
-
-
-def append_batch_file(
-    batch_file_path: str,
-    target_file_path: str,
-    include_header: bool,
-    truncate_target_file: bool,
-) -> None:
-    logging.info(
-        f"Appending file {batch_file_path} to file {target_file_path} with include_header={include_header} and truncate_target_file={truncate_target_file}"
-    )
-    data_file = open(batch_file_path, "r")
-    if truncate_target_file:
-        target_file = open(target_file_path, "w+").close()
-    target_file = open(target_file_path, "a+")
-    if not include_header:
-        logging.info(
-            f"Appending batch file {batch_file_path} to {target_file_path} without header"
-        )
-        next(data_file)
-    else:
-        logging.info(
-            f"Appending batch file {batch_file_path} to {target_file_path} with header"
-        )
-    target_file.write(data_file.read())
-    data_file.close()
-    target_file.close()
-    if os.path.exists(batch_file_path):
-        os.remove(batch_file_path)
-
-
-def upload_file_to_gcs(
-    file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
-) -> None:
-    if os.path.exists(file_path):
-        logging.info(
-            f"Uploading output file {file_path} to gs://{target_gcs_bucket}/{target_gcs_path}"
-        )
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(target_gcs_bucket)
-        blob = bucket.blob(target_gcs_path)
-        blob.upload_from_filename(file_path)
-    else:
-        logging.info(
-            f"Cannot upload file {file_path} to gs://{target_gcs_bucket}/{target_gcs_path} as it does not exist."
-        )
-
-
 if __name__ == "__main__":
     logging.getLogger().setLevel(logging.INFO)
 
@@ -552,4 +546,6 @@ if __name__ == "__main__":
         input_headers=json.loads(os.environ.get("INPUT_CSV_HEADERS", "")),
         data_dtypes=json.loads(os.environ.get("DATA_DTYPES", "")),
         output_headers=json.loads(os.environ.get("OUTPUT_CSV_HEADERS", "")),
+        output_format=os.environ.get("OUTPUT_FORMAT", "csv"),
+        max_load_jobs=os.environ.get("MAX_LOAD_JOBS", "2"),
     )
@@ -25,6 +25,8 @@ import requests
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
+from transform_runtime.files import CsvChunkSink
+
 
 def main(
     pipeline_name: str,
@@ -180,7 +182,9 @@ def process_source_file(
     csv.register_dialect(
         "TabDialect", quotechar='"', delimiter=field_separator, strict=True
     )
-    with open(source_file_extracted, encoding="cp1252") as reader:
+    with open(source_file_extracted, encoding="cp1252") as reader, CsvChunkSink(
+        target_file, sep="|", float_format="%.0f"
+    ) as sink:
         data = []
         chunk_number = 1
         next(reader)
@@ -191,7 +195,7 @@ def process_source_file(
                     data=data,
                     input_csv_headers=input_csv_headers,
                     input_dtypes=input_dtypes,
-                    target_file=target_file,
+                    sink=sink,
                     chunk_number=chunk_number,
                     rename_mappings_list=rename_mappings_list,
                     pipeline_name=pipeline_name,
@@ -204,7 +208,7 @@ def process_source_file(
                 data=data,
                 input_csv_headers=input_csv_headers,
                 input_dtypes=input_dtypes,
-                target_file=target_file,
+                sink=sink,
                 chunk_number=chunk_number,
                 rename_mappings_list=rename_mappings_list,
                 pipeline_name=pipeline_name,
@@ -216,7 +220,7 @@ def process_dataframe_chunk(
     data: typing.List[str],
     input_csv_headers: typing.List[str],
     input_dtypes: dict,
-    target_file: str,
+    sink: CsvChunkSink,
     chunk_number: int,
     rename_mappings_list: dict,
     pipeline_name: str,
@@ -224,14 +228,10 @@ def process_dataframe_chunk(
 ) -> None:
     df = pd.DataFrame(data, columns=input_csv_headers)
     set_df_datatypes(df, input_dtypes)
-    target_file_batch = str(target_file).replace(
-        ".csv", "-" + str(chunk_number) + ".csv"
-    )
+    logging.info(f"Processing chunk #{chunk_number}")
     process_chunk(
         df=df,
-        target_file_batch=target_file_batch,
-        target_file=target_file,
-        skip_header=(not chunk_number == 1),
+        sink=sink,
         rename_headers_list=rename_mappings_list,
         pipeline_name=pipeline_name,
         process_year=process_year,
@@ -247,30 +247,20 @@ def set_df_datatypes(df: pd.DataFrame, data_dtypes: dict) -> pd.DataFrame:
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
-    skip_header: bool,
+    sink: CsvChunkSink,
     rename_headers_list: dict,
     pipeline_name: str,
     process_year: int,
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
     df = rename_headers(df, rename_headers_list)
     new_pipeline_name = (pipeline_name.split("-")[1]).lower().strip()
     if new_pipeline_name in ["accident"]:
         create_new_timestamp_column(df, new_pipeline_name, process_year)
-        save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-        append_batch_file(
-            target_file_batch, target_file, skip_header, not (skip_header)
-        )
+        sink.write(df)
     elif new_pipeline_name in ["person", "vehicle"]:
         create_new_timestamp_column(df, new_pipeline_name, process_year)
     else:
-        save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-        append_batch_file(
-            target_file_batch, target_file, skip_header, not (skip_header)
-        )
-    logging.info(f"Processing batch file {target_file_batch} completed")
+        sink.write(df)
 
 
 def create_new_timestamp_column(
@@ -475,11 +465,6 @@ def rename_headers(df: pd.DataFrame, rename_mappings: dict) -> None:
     return df
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, float_format="%.0f", index=False, sep=sep)
-
-
 def download_file(source_url: str, source_file: pathlib.Path) -> None:
     logging.info(f"Downloading {source_url} into {source_file}")
     r = requests.get(source_url, stream=True)
@@ -491,27 +476,6 @@ def download_file(source_url: str, source_file: pathlib.Path) -> None:
         logging.error(f"Couldn't download {source_url}: {r.text}")
 
 
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
-
-
 def upload_file_to_gcs(
     file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
 ) -> None:
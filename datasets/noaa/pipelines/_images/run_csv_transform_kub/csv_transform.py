@@ -12,19 +12,17 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+import concurrent.futures
 import csv
 import datetime
-import ftplib
+import functools
 import glob
-import gzip
 import json
 import logging
-import math
 import os
 import pathlib
 import re
 import shutil
-import sys
 import time
 import typing
 import zipfile
@@ -35,9 +33,33 @@ import numpy as np
 import pandas as pd
 import requests
 from bs4 import BeautifulSoup
-from google.api_core.exceptions import NotFound
-from google.cloud import bigquery, storage
-from sh import sed
+
+from transform_runtime import compression, ftp, metrics, parallel
+from transform_runtime.bq import (
+    create_dest_table,
+    delete_source_file_data_from_bq,
+    load_data_from_gcs,
+)
+from transform_runtime.download import concatenate_urls, download_file_gs
+from transform_runtime.files import CsvChunkSink, read_csv_chunks, save_to_new_file
+from transform_runtime.gcs import gcs_uri, upload_file_to_gcs
+from transform_runtime.lines import LineFilter
+from transform_runtime.parsers import read_csv
+from transform_runtime.resources import chunk_sizer
+from transform_runtime.transforms import (
+    add_metadata_cols,
+    apply_regex,
+    convert_cols_to_integer,
+    convert_date_from_int,
+    filter_null_rows,
+    generate_location,
+    rename_headers,
+    reorder_headers,
+    slice_column,
+    source_convert_date_formats,
+    trim_whitespace,
+    zero_pad,
+)
 
 
 def main(
@@ -57,8 +79,8 @@ def main(
     schema_path: str,
     drop_dest_table: str,
     input_field_delimiter: str,
-    ftp_batch_size: str,
-    ftp_batch_sleep_time: str,
+    max_workers: str,
+    ftp_max_connections_per_host: str,
     full_data_load: str,
     start_year: str,
     input_csv_headers: typing.List[str],
@@ -80,44 +102,47 @@ def main(
 ) -> None:
     logging.info(f"{pipeline_name} process started")
     pathlib.Path("./files").mkdir(parents=True, exist_ok=True)
-    execute_pipeline(
-        pipeline_name=pipeline_name,
-        source_url=source_url,
-        source_file=source_file,
-        target_file=target_file,
-        shape_file=shape_file,
-        chunksize=chunksize,
-        ftp_host=ftp_host,
-        ftp_dir=ftp_dir,
-        project_id=project_id,
-        dataset_id=dataset_id,
-        destination_table=table_id,
-        target_gcs_bucket=target_gcs_bucket,
-        target_gcs_path=target_gcs_path,
-        schema_path=schema_path,
-        drop_dest_table=drop_dest_table,
-        input_field_delimiter=input_field_delimiter,
-        ftp_batch_size=ftp_batch_size,
-        ftp_batch_sleep_time=ftp_batch_sleep_time,
-        full_data_load=full_data_load,
-        start_year=start_year,
-        input_csv_headers=input_csv_headers,
-        data_dtypes=data_dtypes,
-        reorder_headers_list=reorder_headers_list,
-        convert_int_list=convert_int_list,
-        null_rows_list=null_rows_list,
-        date_format_list=date_format_list,
-        slice_column_list=slice_column_list,
-        regex_list=regex_list,
-        trim_whitespace_list=trim_whitespace_list,
-        rename_headers_list=rename_headers_list,
-        remove_source_file=(remove_source_file == "Y"),
-        delete_target_file=(delete_target_file == "Y"),
-        input_csv_field_pos=input_csv_field_pos,
-        number_of_header_rows=int(number_of_header_rows),
-        int_date_list=int_date_list,
-        gen_location_list=gen_location_list,
-    )
+    with ftp.FtpSessionPool(
+        max_connections_per_host=int(ftp_max_connections_per_host)
+    ) as ftp_sessions:
+        execute_pipeline(
+            pipeline_name=pipeline_name,
+            source_url=source_url,
+            source_file=source_file,
+            target_file=target_file,
+            shape_file=shape_file,
+            chunksize=chunksize,
+            ftp_host=ftp_host,
+            ftp_dir=ftp_dir,
+            project_id=project_id,
+            dataset_id=dataset_id,
+            destination_table=table_id,
+            target_gcs_bucket=target_gcs_bucket,
+            target_gcs_path=target_gcs_path,
+            schema_path=schema_path,
+            drop_dest_table=drop_dest_table,
+            input_field_delimiter=input_field_delimiter,
+            max_workers=int(max_workers),
+            ftp_sessions=ftp_sessions,
+            full_data_load=full_data_load,
+            start_year=start_year,
+            input_csv_headers=input_csv_headers,
+            data_dtypes=data_dtypes,
+            reorder_headers_list=reorder_headers_list,
+            convert_int_list=convert_int_list,
+            null_rows_list=null_rows_list,
+            date_format_list=date_format_list,
+            slice_column_list=slice_column_list,
+            regex_list=regex_list,
+            trim_whitespace_list=trim_whitespace_list,
+            rename_headers_list=rename_headers_list,
+            remove_source_file=(remove_source_file == "Y"),
+            delete_target_file=(delete_target_file == "Y"),
+            input_csv_field_pos=input_csv_field_pos,
+            number_of_header_rows=int(number_of_header_rows),
+            int_date_list=int_date_list,
+            gen_location_list=gen_location_list,
+        )
     logging.info(f"{pipeline_name} process completed")
 
 
@@ -138,8 +163,8 @@ def execute_pipeline(
     schema_path: str,
     drop_dest_table: str,
     input_field_delimiter: str,
-    ftp_batch_size: str,
-    ftp_batch_sleep_time: str,
+    max_workers: int,
+    ftp_sessions: ftp.FtpSessionPool,
     full_data_load: str,
     start_year: str,
     input_csv_headers: typing.List[str],
@@ -164,62 +189,43 @@ def execute_pipeline(
             start = str(datetime.datetime.now().year - 6)
         else:
             start = start_year
-        ftp_batch = 1
-        for yr in range(int(start), datetime.datetime.now().year + 1):
-            yr_str = str(yr)
-            source_zipfile = str.replace(str(source_file), ".csv", f"_{yr_str}.csv.gz")
-            source_file_unzipped = str.replace(str(source_zipfile), ".csv.gz", ".csv")
-            target_file_year = str.replace(str(target_file), ".csv", f"_{yr_str}.csv")
-            destination_table_year = f"{destination_table}_{yr_str}"
-            source_url_year = str.replace(
-                source_url["ghcnd_by_year"], ".csv.gz", f"{yr_str}.csv.gz"
-            )
-            target_gcs_path_year = str.replace(
-                target_gcs_path, ".csv", f"_{yr_str}.csv"
-            )
-            if ftp_batch == int(ftp_batch_size):
-                logging.info("Sleeping...")
-                time.sleep(int(ftp_batch_sleep_time))
-                ftp_batch = 1
-            else:
-                ftp_batch += 1
-            download_file_ftp(
-                ftp_host=ftp_host,
-                ftp_dir=ftp_dir,
-                ftp_filename=f"{yr_str}.csv.gz",
-                local_file=source_zipfile,
-                source_url=source_url_year,
-            )
-            gz_decompress(
-                infile=source_zipfile, tofile=source_file_unzipped, delete_zipfile=True
-            )
-            process_and_load_table(
-                source_file=source_file_unzipped,
-                target_file=target_file_year,
-                pipeline_name=pipeline_name,
-                source_url=source_url_year,
-                chunksize=chunksize,
-                project_id=project_id,
-                dataset_id=dataset_id,
-                destination_table=destination_table_year,
-                target_gcs_bucket=target_gcs_bucket,
-                target_gcs_path=target_gcs_path_year,
-                schema_path=schema_path,
-                drop_dest_table=drop_dest_table,
-                input_field_delimiter=input_field_delimiter,
-                input_csv_headers=input_csv_headers,
-                data_dtypes=data_dtypes,
-                reorder_headers_list=reorder_headers_list,
-                null_rows_list=null_rows_list,
-                date_format_list=date_format_list,
-                slice_column_list=slice_column_list,
-                regex_list=regex_list,
-                trim_whitespace_list=trim_whitespace_list,
-                rename_headers_list=rename_headers_list,
-                remove_source_file=remove_source_file,
-                delete_target_file=delete_target_file,
-                int_date_list=int_date_list,
-                gen_location_list=gen_location_list,
+        with parallel.process_pool(max_workers) as transform_pool:
+            parallel.run_in_threads(
+                functools.partial(
+                    process_ghcnd_year,
+                    source_url=source_url["ghcnd_by_year"],
+                    source_file=source_file,
+                    target_file=target_file,
+                    chunksize=chunksize,
+                    ftp_host=ftp_host,
+                    ftp_dir=ftp_dir,
+                    project_id=project_id,
+                    dataset_id=dataset_id,
+                    destination_table=destination_table,
+                    target_gcs_bucket=target_gcs_bucket,
+                    target_gcs_path=target_gcs_path,
+                    schema_path=schema_path,
+                    drop_dest_table=drop_dest_table,
+                    input_field_delimiter=input_field_delimiter,
+                    input_csv_headers=input_csv_headers,
+                    data_dtypes=data_dtypes,
+                    reorder_headers_list=reorder_headers_list,
+                    null_rows_list=null_rows_list,
+                    date_format_list=date_format_list,
+                    slice_column_list=slice_column_list,
+                    regex_list=regex_list,
+                    trim_whitespace_list=trim_whitespace_list,
+                    rename_headers_list=rename_headers_list,
+                    remove_source_file=remove_source_file,
+                    delete_target_file=delete_target_file,
+                    int_date_list=int_date_list,
+                    gen_location_list=gen_location_list,
+                    pipeline_name=pipeline_name,
+                    ftp_sessions=ftp_sessions,
+                    transform_pool=transform_pool,
+                ),
+                range(int(start), datetime.datetime.now().year + 1),
+                max_workers=max_workers,
             )
         return None
     if pipeline_name in ["NOAA GHCN-M"]:
@@ -238,6 +244,7 @@ def execute_pipeline(
                 ftp_filename=src_zip_file_name,
                 local_file=source_zip_file,
                 source_url=src_url,
+                ftp_sessions=ftp_sessions,
             )
             logging.info(f"Unzipping source file {source_zip_file}")
             shutil.unpack_archive(filename=source_zip_file, extract_dir=src_file_path)
@@ -255,7 +262,7 @@ def execute_pipeline(
                     df = strip_dataframe_whitespace(df)
                     df = convert_cols_to_integer(
                         df=df,
-                        convert_int_list_section=convert_int_list[file_content_type],
+                        convert_int_list=convert_int_list[file_content_type],
                     )
                     targ_file_path = str(target_file).replace(
                         ".csv", f"_{file_id}_{file_content_type}.csv"
@@ -288,7 +295,7 @@ def execute_pipeline(
     if pipeline_name in ["NOAA SPC Hail", "NOAA SPC Wind", "NOAA SPC Tornado"]:
         src_url = source_url[pipeline_name.replace(" ", "_").lower()]
         download_file_http(source_url=src_url, source_file=source_file)
-        sed(["-i", "1d", source_file])
+        remove_header_rows(source_file, number_of_header_rows=1)
         process_and_load_table(
             source_file=source_file,
             target_file=target_file,
@@ -366,29 +373,14 @@ def execute_pipeline(
     if pipeline_name in ["NOAA GSOD 2020", "NOAA GSOD 2022"]:
         src_url_root = source_url[pipeline_name.replace(" ", "_").lower()]
         files = url_directory_list(source_url_path=src_url_root, file_pattern=".csv")
-        file_cnt = len(files)
-        file_ptr = 1
-        for file_name in files:
-            if file_name == files[0]:
-                logging.info(f"Writing file {file_name} to {source_file} with header")
-                download_file_http(file_name, source_file, True, True)
-            else:
-                url_filename = os.path.basename(file_name).replace(".csv", "")
-                source_file_tmpname = str(source_file).replace(
-                    ".csv", f"_{url_filename}.csv"
-                )
-                download_file_http(file_name, source_file_tmpname, True, True)
-                os.system(f"sed -i 1d {source_file_tmpname} 2> /dev/null")
-                os.system(f"cat {source_file_tmpname} >> {source_file}")
-                os.system(f"rm {source_file_tmpname}")
-                time.sleep(0.5)
-            if ((file_ptr % 100) == 0) or (file_ptr == file_cnt):
-                logging.info(f"Appended {file_ptr} files of total {file_cnt} files")
-            file_ptr += 1
-        if number_of_header_rows > 0:
-            remove_header_rows(source_file, number_of_header_rows=number_of_header_rows)
-        else:
-            pass
+        # Station files each start with the header. It is dropped as they stream
+        # in, so the combined file needs no remove_header_rows pass afterwards.
+        concatenate_urls(
+            files,
+            source_file,
+            max_workers=max_workers,
+            keep_header=(number_of_header_rows == 0),
+        )
         process_and_load_table(
             source_file=source_file,
             target_file=target_file,
@@ -470,7 +462,9 @@ def execute_pipeline(
     ]:
         src_url = source_url[pipeline_name.replace(" ", "_").lower()]
         ftp_filename = os.path.split(src_url)[1]
-        download_file_ftp(ftp_host, ftp_dir, ftp_filename, source_file, src_url)
+        download_file_ftp(
+            ftp_host, ftp_dir, ftp_filename, source_file, src_url, ftp_sessions
+        )
         if number_of_header_rows > 0:
             remove_header_rows(source_file, number_of_header_rows=number_of_header_rows)
         else:
@@ -572,6 +566,7 @@ def execute_pipeline(
             number_of_header_rows=number_of_header_rows,
             int_date_list=int_date_list,
             gen_location_list=gen_location_list,
+            max_workers=max_workers,
         )
         return None
     if pipeline_name == "NOAA Storms database by year":
@@ -591,10 +586,90 @@ def execute_pipeline(
             date_format_list=date_format_list,
             rename_headers_list=rename_headers_list,
             gen_location_list=gen_location_list,
+            max_workers=max_workers,
+            ftp_sessions=ftp_sessions,
         )
         return None
 
 
+def process_ghcnd_year(
+    yr: int,
+    source_url: str,
+    source_file: pathlib.Path,
+    target_file: pathlib.Path,
+    chunksize: str,
+    ftp_host: str,
+    ftp_dir: str,
+    project_id: str,
+    dataset_id: str,
+    destination_table: str,
+    target_gcs_bucket: str,
+    target_gcs_path: str,
+    schema_path: str,
+    drop_dest_table: str,
+    input_field_delimiter: str,
+    input_csv_headers: typing.List[str],
+    data_dtypes: dict,
+    reorder_headers_list: typing.List[str],
+    null_rows_list: typing.List[str],
+    date_format_list: typing.List[typing.List[str]],
+    slice_column_list: dict,
+    regex_list: dict,
+    trim_whitespace_list: typing.List[str],
+    rename_headers_list: dict,
+    remove_source_file: bool,
+    delete_target_file: bool,
+    int_date_list: typing.List[str],
+    gen_location_list: dict,
+    pipeline_name: str,
+    ftp_sessions: ftp.FtpSessionPool,
+    transform_pool: concurrent.futures.Executor,
+) -> None:
+    yr_str = str(yr)
+    source_zipfile = str.replace(str(source_file), ".csv", f"_{yr_str}.csv.gz")
+    target_file_year = str.replace(str(target_file), ".csv", f"_{yr_str}.csv")
+    destination_table_year = f"{destination_table}_{yr_str}"
+    source_url_year = str.replace(source_url, ".csv.gz", f"{yr_str}.csv.gz")
+    target_gcs_path_year = str.replace(target_gcs_path, ".csv", f"_{yr_str}.csv")
+    download_file_ftp(
+        ftp_host=ftp_host,
+        ftp_dir=ftp_dir,
+        ftp_filename=f"{yr_str}.csv.gz",
+        local_file=source_zipfile,
+        source_url=source_url_year,
+        ftp_sessions=ftp_sessions,
+    )
+    process_and_load_table(
+        source_file=source_zipfile,
+        target_file=target_file_year,
+        pipeline_name=pipeline_name,
+        source_url=source_url_year,
+        chunksize=chunksize,
+        project_id=project_id,
+        dataset_id=dataset_id,
+        destination_table=destination_table_year,
+        target_gcs_bucket=target_gcs_bucket,
+        target_gcs_path=target_gcs_path_year,
+        schema_path=schema_path,
+        drop_dest_table=drop_dest_table,
+        input_field_delimiter=input_field_delimiter,
+        input_csv_headers=input_csv_headers,
+        data_dtypes=data_dtypes,
+        reorder_headers_list=reorder_headers_list,
+        null_rows_list=null_rows_list,
+        date_format_list=date_format_list,
+        slice_column_list=slice_column_list,
+        regex_list=regex_list,
+        trim_whitespace_list=trim_whitespace_list,
+        rename_headers_list=rename_headers_list,
+        remove_source_file=remove_source_file,
+        delete_target_file=delete_target_file,
+        int_date_list=int_date_list,
+        gen_location_list=gen_location_list,
+        transform_pool=transform_pool,
+    )
+
+
 def strip_dataframe_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     logging.info("Stripping Whitespace in Columns")
     for col in df.columns:
@@ -606,25 +681,6 @@ def strip_dataframe_whitespace(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def convert_cols_to_integer(
-    df: pd.DataFrame, convert_int_list_section: typing.List[str]
-) -> pd.DataFrame:
-    logging.info("Converting Respective Columns To Integer")
-    for col in convert_int_list_section:
-        print(f"    column: {col}")
-        df[col] = df[col].apply(lambda x: convert_to_integer_string(x))
-    return df
-
-
-def convert_to_integer_string(input: typing.Union[str, float]) -> str:
-    str_val = ""
-    if not input or (math.isnan(input)):
-        str_val = ""
-    else:
-        str_val = str(int(round(input, 0)))
-    return str_val
-
-
 def process_ghcn_m_file(
     source_file_name: str,
     file_content_type: str,
@@ -643,12 +699,6 @@ def process_ghcn_m_file(
     return df
 
 
-def download_file_gs(source_url: str, source_file: pathlib.Path) -> None:
-    logging.info(f"Downloading {source_url} to {source_file}")
-    with open(source_file, "wb+") as file_obj:
-        storage.Client().download_blob_to_file(source_url, file_obj)
-
-
 def process_storms_database_by_year(
     source_url: dict,
     source_file: pathlib.Path,
@@ -665,246 +715,300 @@ def process_storms_database_by_year(
     date_format_list: typing.List[typing.List[str]],
     rename_headers_list: dict,
     gen_location_list: dict,
+    max_workers: int,
+    ftp_sessions: ftp.FtpSessionPool,
 ) -> None:
     host = source_url["root"].split("ftp://")[1].split("/")[0]
     cwd = source_url["root"].split("ftp://")[1][len(host) :]
     list_of_details_files = sorted(
-        ftp_list_of_files(host=host, cwd=cwd, filter_expr="StormEvents_details")
+        ftp_list_of_files(
+            host=host,
+            cwd=cwd,
+            filter_expr="StormEvents_details",
+            ftp_sessions=ftp_sessions,
+        )
     )
     list_of_locations_files = sorted(
-        ftp_list_of_files(host=host, cwd=cwd, filter_expr="StormEvents_locations")
-    )
-    for year_to_process in range(int(start_year), datetime.date.today().year + 1):
-        locations_file = list(
-            filter(
-                lambda x: x.startswith(
-                    f"StormEvents_locations-ftp_v1.0_d{str(year_to_process)}"
-                ),
-                list_of_locations_files,
-            )
-        )
-        details_file = list(
-            filter(
-                lambda x: x.startswith(
-                    f"StormEvents_details-ftp_v1.0_d{str(year_to_process)}"
-                ),
-                list_of_details_files,
-            )
+        ftp_list_of_files(
+            host=host,
+            cwd=cwd,
+            filter_expr="StormEvents_locations",
+            ftp_sessions=ftp_sessions,
         )
-        if locations_file:
-            ftp_filename = locations_file[0]
-            local_file = str(source_file).replace(
-                ".csv", f"_{str(year_to_process)}_locations.csv"
-            )
-            local_zipfile = f"{os.path.dirname(local_file)}/{ftp_filename}"
-            ftp_zipfile_path = f'{source_url["root"]}/{ftp_filename}'
-            logging.info("Processing Storms Locations File  ...")
-            logging.info(
-                f"     host={host} cwd={cwd} ftp_filename={ftp_filename} local_file={local_file} local_zipfile={local_zipfile} source_url={ftp_zipfile_path} "
-            )
-            df_locations = FTP_to_DF(
+    )
+    with parallel.process_pool(max_workers) as transform_pool:
+        parallel.run_in_threads(
+            functools.partial(
+                process_storms_year,
+                source_url=source_url,
                 host=host,
                 cwd=cwd,
-                ftp_filename=ftp_filename,
-                local_file=local_zipfile,
-                source_url=ftp_zipfile_path,
-            )
-        else:
-            logging.info("Storms Locations File does not exist!")
-            df_locations = create_storms_locations_df()
-        ftp_filename = details_file[0]
+                list_of_details_files=list_of_details_files,
+                list_of_locations_files=list_of_locations_files,
+                source_file=source_file,
+                target_file=target_file,
+                project_id=project_id,
+                dataset_id=dataset_id,
+                destination_table=destination_table,
+                target_gcs_bucket=target_gcs_bucket,
+                target_gcs_path=target_gcs_path,
+                schema_path=schema_path,
+                drop_dest_table=drop_dest_table,
+                reorder_headers_list=reorder_headers_list,
+                date_format_list=date_format_list,
+                rename_headers_list=rename_headers_list,
+                gen_location_list=gen_location_list,
+                ftp_sessions=ftp_sessions,
+                transform_pool=transform_pool,
+            ),
+            range(int(start_year), datetime.date.today().year + 1),
+            max_workers=max_workers,
+        )
+
+
+def process_storms_year(
+    year_to_process: int,
+    source_url: dict,
+    host: str,
+    cwd: str,
+    list_of_details_files: typing.List[str],
+    list_of_locations_files: typing.List[str],
+    source_file: pathlib.Path,
+    target_file: pathlib.Path,
+    project_id: str,
+    dataset_id: str,
+    destination_table: str,
+    target_gcs_bucket: str,
+    target_gcs_path: str,
+    schema_path: str,
+    drop_dest_table: str,
+    reorder_headers_list: typing.List[str],
+    date_format_list: typing.List[typing.List[str]],
+    rename_headers_list: dict,
+    gen_location_list: dict,
+    ftp_sessions: ftp.FtpSessionPool,
+    transform_pool: concurrent.futures.Executor,
+) -> None:
+    locations_file = list(
+        filter(
+            lambda x: x.startswith(
+                f"StormEvents_locations-ftp_v1.0_d{str(year_to_process)}"
+            ),
+            list_of_locations_files,
+        )
+    )
+    details_file = list(
+        filter(
+            lambda x: x.startswith(
+                f"StormEvents_details-ftp_v1.0_d{str(year_to_process)}"
+            ),
+            list_of_details_files,
+        )
+    )
+    if locations_file:
+        ftp_filename = locations_file[0]
         local_file = str(source_file).replace(
-            ".csv", f"_{str(year_to_process)}_detail.csv"
+            ".csv", f"_{str(year_to_process)}_locations.csv"
         )
-        local_zipfile = f"{os.path.dirname(local_file)}/{ftp_filename}"
+        local_locations_zipfile = f"{os.path.dirname(local_file)}/{ftp_filename}"
         ftp_zipfile_path = f'{source_url["root"]}/{ftp_filename}'
-        logging.info("Processing Storms Detail File ...")
+        logging.info("Downloading Storms Locations File  ...")
         logging.info(
-            f"     host={host} cwd={cwd} ftp_filename={ftp_filename} local_file={local_file} local_zipfile={local_zipfile} source_url={ftp_zipfile_path} "
+            f"     host={host} cwd={cwd} ftp_filename={ftp_filename} local_file={local_file} local_zipfile={local_locations_zipfile} source_url={ftp_zipfile_path} "
         )
-        df_details = FTP_to_DF(
-            host=host,
-            cwd=cwd,
+        download_file_ftp(
+            ftp_host=host,
+            ftp_dir=cwd,
             ftp_filename=ftp_filename,
-            local_file=local_zipfile,
+            local_file=local_locations_zipfile,
             source_url=ftp_zipfile_path,
+            ftp_sessions=ftp_sessions,
         )
-        logging.info("Merging Details and Locations files")
-        df = pd.merge(
-            df_details,
-            df_locations,
-            left_on="EVENT_ID",
-            right_on="EVENT_ID",
-            how="left",
-        )
-        df = rename_headers(df=df, rename_headers_list=rename_headers_list)
-        df["event_latitude"] = df["event_latitude"].apply(
-            lambda x: x - 60 if x > 90 else x
-        )
-        df = generate_location(df, gen_location_list)
-        df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
-        for dt_fld in date_format_list:
-            logging.info(f"Resolving date formats in field {dt_fld}")
-            df[dt_fld[0]] = df[dt_fld[0]].apply(
-                lambda x: pd.to_datetime(str(x), format="%d-%b-%y %H:%M:%S")
-            )
-            df[dt_fld[0]] = df[dt_fld[0]].apply(
-                lambda x: f"{year_to_process}-{str(x)[5:]}"
-            )
-        df = fix_data_anomolies_storms(df)
-        targ_file_yr = str.replace(str(target_file), ".csv", f"_{year_to_process}.csv")
-        save_to_new_file(df=df, file_path=targ_file_yr, sep="|", quotechar="^")
-        sed(["-i", "s/|nan|/||/g", targ_file_yr])
-        sed(["-i", "s/|<NA>/|/g", targ_file_yr])
-        upload_file_to_gcs(
-            file_path=targ_file_yr,
-            target_gcs_bucket=target_gcs_bucket,
-            target_gcs_path=target_gcs_path,
-        )
-        drop_table = drop_dest_table == "Y"
-        table_exists = create_dest_table(
-            project_id=project_id,
-            dataset_id=dataset_id,
-            table_id=f"{destination_table}_{str(year_to_process)}",
-            schema_filepath=schema_path,
-            bucket_name=target_gcs_bucket,
-            drop_table=drop_table,
+    else:
+        logging.info("Storms Locations File does not exist!")
+        local_locations_zipfile = ""
+    ftp_filename = details_file[0]
+    local_file = str(source_file).replace(".csv", f"_{str(year_to_process)}_detail.csv")
+    local_details_zipfile = f"{os.path.dirname(local_file)}/{ftp_filename}"
+    ftp_zipfile_path = f'{source_url["root"]}/{ftp_filename}'
+    logging.info("Downloading Storms Detail File ...")
+    logging.info(
+        f"     host={host} cwd={cwd} ftp_filename={ftp_filename} local_file={local_file} local_zipfile={local_details_zipfile} source_url={ftp_zipfile_path} "
+    )
+    download_file_ftp(
+        ftp_host=host,
+        ftp_dir=cwd,
+        ftp_filename=ftp_filename,
+        local_file=local_details_zipfile,
+        source_url=ftp_zipfile_path,
+        ftp_sessions=ftp_sessions,
+    )
+    targ_file_yr = transform_pool.submit(
+        transform_storms_year,
+        year_to_process=year_to_process,
+        details_zipfile=local_details_zipfile,
+        locations_zipfile=local_locations_zipfile,
+        target_file=target_file,
+        reorder_headers_list=reorder_headers_list,
+        date_format_list=date_format_list,
+        rename_headers_list=rename_headers_list,
+        gen_location_list=gen_location_list,
+    ).result()
+    # Years run in parallel, so each gets its own object to load from.
+    target_gcs_path_year = target_gcs_path.replace(".csv", f"_{year_to_process}.csv")
+    upload_file_to_gcs(
+        file_path=targ_file_yr,
+        target_gcs_bucket=target_gcs_bucket,
+        target_gcs_path=target_gcs_path_year,
+    )
+    drop_table = drop_dest_table == "Y"
+    table_exists = create_dest_table(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=f"{destination_table}_{str(year_to_process)}",
+        schema_filepath=schema_path,
+        bucket_name=target_gcs_bucket,
+        drop_table=drop_table,
+    )
+    if table_exists:
+        load_data_from_gcs(
+            project_id=project_id,
+            dataset_id=dataset_id,
+            table_id=f"{destination_table}_{str(year_to_process)}",
+            source_uris=gcs_uri(target_gcs_bucket, target_gcs_path_year),
+            truncate_table=True,
+            field_delimiter="|",
+            quotechar="^",
         )
-        if table_exists:
-            load_data_to_bq(
-                project_id=project_id,
-                dataset_id=dataset_id,
-                table_id=f"{destination_table}_{str(year_to_process)}",
-                file_path=targ_file_yr,
-                truncate_table=True,
-                field_delimiter="|",
-                quotechar="^",
-            )
 
 
-def clean_source_file(source_file: str) -> None:
-    logging.info("Cleaning source file")
-    sed(["-i", 's/,\\"\\"\\"/,\\"\\|\\\'\\|\\\'/g;', source_file])
-    sed(["-i", "s/\\\"\\\" /\\|\\'\\|\\' /g;", source_file])
-    sed(["-i", "s/ \\\"\\\"/ \\|\\'\\|\\'/g;", source_file])
-    sed(["-i", "s/ \\\"/ \\|\\'/g;", source_file])
-    sed(["-i", "s/\\\" /\\|\\' /g;", source_file])
+def transform_storms_year(
+    year_to_process: int,
+    details_zipfile: str,
+    locations_zipfile: str,
+    target_file: pathlib.Path,
+    reorder_headers_list: typing.List[str],
+    date_format_list: typing.List[typing.List[str]],
+    rename_headers_list: dict,
+    gen_location_list: dict,
+) -> str:
+    if locations_zipfile:
+        logging.info("Processing Storms Locations File  ...")
+        df_locations = storms_file_to_df(locations_zipfile)
+    else:
+        df_locations = create_storms_locations_df()
+    logging.info("Processing Storms Detail File ...")
+    df_details = storms_file_to_df(details_zipfile)
+    logging.info("Merging Details and Locations files")
+    df = pd.merge(
+        df_details,
+        df_locations,
+        left_on="EVENT_ID",
+        right_on="EVENT_ID",
+        how="left",
+    )
+    df = rename_headers(df=df, rename_headers_list=rename_headers_list)
+    df["event_latitude"] = df["event_latitude"].mask(
+        df["event_latitude"] > 90, df["event_latitude"] - 60
+    )
+    df = generate_location(df, gen_location_list)
+    df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
+    for dt_fld in date_format_list:
+        logging.info(f"Resolving date formats in field {dt_fld}")
+        df[dt_fld[0]] = pd.to_datetime(
+            df[dt_fld[0]].astype(str), format="%d-%b-%y %H:%M:%S"
+        ).dt.strftime(f"{year_to_process}-%m-%d %H:%M:%S")
+    df = fix_data_anomolies_storms(df)
+    targ_file_yr = str.replace(str(target_file), ".csv", f"_{year_to_process}.csv")
+    logging.info(f"Saving to output file.. {targ_file_yr}")
+    with open(targ_file_yr, "w") as targ_file, STORMS_OUTPUT_FILTER.writer(
+        targ_file
+    ) as output:
+        df.to_csv(output, sep="|", quotechar="^", index=False)
+    return targ_file_yr
 
 
 def fix_data_anomolies_storms(df: pd.DataFrame) -> pd.DataFrame:
     logging.info("Cleansing data")
     df["damage_property"] = (
-        df["damage_property"]
-        .apply(lambda x: shorthand_to_number(x))
-        .fillna(0)
-        .astype(np.int64)
+        shorthand_to_number(df["damage_property"]).fillna(0).astype(np.int64)
     )
     df["damage_crops"] = (
-        df["damage_crops"]
-        .apply(lambda x: shorthand_to_number(x))
-        .fillna(0)
-        .astype(np.int64)
+        shorthand_to_number(df["damage_crops"]).fillna(0).astype(np.int64)
     )
-    df["event_type"] = df["event_type"].apply(lambda x: str(x).lower())
-    df["state"] = df["state"].apply(
-        lambda x: f"{str.capitalize(x)[0]}{str.lower(x)[1]}"
-    )
-    df["event_point"] = df["event_point"].apply(
-        lambda x: str(x).replace("POINT(nan nan)", "")
+    df["event_type"] = df["event_type"].astype(str).str.lower()
+    df["state"] = df["state"].str.slice(0, 2).str.capitalize()
+    df["event_point"] = (
+        df["event_point"].astype(str).str.replace("POINT(nan nan)", "", regex=False)
     )
     return df
 
 
-def shorthand_to_number(x) -> float:
-    if type(x) == float or type(x) == int:
-        return x
-    if "K" in x:
-        if len(x) > 1:
-            return float(x.replace("K", "")) * 10**3
-        return 10**3
-    if "M" in x:
-        if len(x) > 1:
-            return float(x.replace("M", "")) * 10**6
-        return 10**6
-    if "B" in x:
-        if len(x) > 1:
-            return float(x.replace("B", "")) * 10**9
-        return 10**9
-    if "T" in x:
-        if len(x) > 1:
-            return float(x.replace("T", "")) * 10**12
-        return 10**12
-    if "Q" in x:
-        if len(x) > 1:
-            return float(x.replace("Q", "")) * 10**15
-        return 10**15
-    return 0.0
-
+SHORTHAND_MULTIPLIERS = {
+    "K": 10**3,
+    "M": 10**6,
+    "B": 10**9,
+    "T": 10**12,
+    "Q": 10**15,
+}
 
-def generate_location(df: pd.DataFrame, gen_location_list: dict) -> pd.DataFrame:
-    logging.info("Generating location data")
-    for key, values in gen_location_list.items():
-        logging.info(f"Generating location data for field {key}")
-        df[key] = (
-            "POINT("
-            + df[values[0]][:].astype("string")
-            + " "
-            + df[values[1]][:].astype("string")
-            + ")"
-        )
-    return df
 
+def shorthand_to_number(values: pd.Series) -> pd.Series:
+    """Expands amounts such as "10.5K" or "2M"; a bare suffix counts as 1 unit.
 
-def FTP_to_DF(
-    host: str,
-    cwd: str,
-    ftp_filename: str,
-    local_file: str,
-    source_url: str,
-    sep: str = ",",
-) -> pd.DataFrame:
-    download_file_ftp(
-        ftp_host=host,
-        ftp_dir=cwd,
-        ftp_filename=ftp_filename,
-        local_file=local_file,
-        source_url=source_url,
-    )
+    Strings without a known suffix become 0, numbers are passed through.
+    """
+    if pd.api.types.is_numeric_dtype(values):
+        return values
+    text = values.astype("string")
+    suffix = text.str.extract(r"([KMBTQ])", expand=False)
+    digits = text.str.replace(r"[KMBTQ]", "", regex=True).str.strip()
+    number = pd.to_numeric(digits, errors="coerce").mask(digits == "", 1)
+    result = number.astype(float) * suffix.map(SHORTHAND_MULTIPLIERS).astype(float)
+    return result.mask(text.notna() & suffix.isna(), 0.0)
+
+
+# Quotes that open or close a value inside a quoted field are escaped as |'
+# so the field survives read_csv; the escape is reverted once loaded.
+STORMS_DETAILS_FILTER = LineFilter(
+    substitutions=[
+        (',"""', ",\"|'|'"),
+        ('"" ', "|'|' "),
+        (' ""', " |'|'"),
+        (' "', " |'"),
+        ('" ', "|' "),
+    ]
+)
+STORMS_OUTPUT_FILTER = LineFilter(substitutions=[("|nan|", "||"), ("|<NA>", "|")])
+
+
+def storms_file_to_df(local_file: str, sep: str = ",") -> pd.DataFrame:
     logging.info(f"Loading file {local_file} into DataFrame")
-    decompressed_source_file = local_file.replace(".gz", "")
-    gz_decompress(
-        infile=local_file,
-        tofile=decompressed_source_file,
-        delete_zipfile=False,
-    )
-    if "locations" in decompressed_source_file:
-        df = pd.read_csv(
-            decompressed_source_file,
-            engine="python",
-            encoding="utf-8",
-            quotechar='"',
-            sep=sep,
-            quoting=csv.QUOTE_ALL,
-            header=0,
-            keep_default_na=True,
-            na_values=[" "],
-        )
+    if "locations" in local_file:
+        with compression.open_text(local_file) as source:
+            df = read_csv(
+                source,
+                quotechar='"',
+                sep=sep,
+                quoting=csv.QUOTE_ALL,
+                header=0,
+                keep_default_na=True,
+                na_values=[" "],
+            )
     else:
-        clean_source_file(decompressed_source_file)
-        df = pd.read_csv(
-            decompressed_source_file,
-            engine="python",
-            encoding="utf-8",
-            quotechar='"',
-            sep=sep,
-            header=0,
-            keep_default_na=True,
-            na_values=[" "],
-        )
+        with compression.open_text(local_file) as source:
+            df = read_csv(
+                STORMS_DETAILS_FILTER.reader(source),
+                quotechar='"',
+                sep=sep,
+                header=0,
+                keep_default_na=True,
+                na_values=[" "],
+            )
         for col in df:
             if str(df[col].dtype) == "object":
                 logging.info(f"Replacing values in column {col}")
-                df[col] = df[col].apply(lambda x: str(x).replace("|'", '"'))
+                df[col] = df[col].astype(str).str.replace("|'", '"', regex=False)
             else:
                 pass
     return df
@@ -929,27 +1033,14 @@ def create_storms_locations_df() -> pd.DataFrame:
     return df_loc
 
 
-def ftp_list_of_files(host: str, cwd: str, filter_expr: str = "") -> typing.List[str]:
-    try_count = 0
-    while True:
-        try:
-            ftp = ftplib.FTP(host)
-            ftp.login()
-            ftp.cwd(cwd)
-            file_list = ftp.nlst()
-            if filter != "":
-                file_list = list(
-                    filter(lambda x: str(x).find(filter_expr) >= 0, file_list)
-                )
-            ftp.quit()
-            return file_list
-        except TimeoutError as e:
-            try_count += 1
-            if try_count > 3:
-                raise e
-            else:
-                logging.info(f"{e}, Retrying ...")
-                time.sleep(try_count * 30)
+def ftp_list_of_files(
+    host: str, cwd: str, filter_expr: str, ftp_sessions: ftp.FtpSessionPool
+) -> typing.List[str]:
+    return [
+        file_name
+        for file_name in ftp_sessions.list_files(host, cwd)
+        if filter_expr in file_name
+    ]
 
 
 def process_lightning_strikes_by_year(
@@ -982,6 +1073,7 @@ def process_lightning_strikes_by_year(
     number_of_header_rows: int,
     int_date_list: typing.List[str],
     gen_location_list: dict,
+    max_workers: int,
 ) -> None:
     url_path = os.path.split(source_url)[0]
     file_pattern = str.split(os.path.split(source_url)[1], "*")[0]
@@ -990,63 +1082,138 @@ def process_lightning_strikes_by_year(
         start = datetime.datetime.now().year - 6
     else:
         start = int(start_year)
-    for yr in range(start, datetime.datetime.now().year):
-        for url in url_list:
-            url_file_name = os.path.split(url)[1]
-            if str(url_file_name).find(f"{file_pattern}{yr}") >= 0:
-                source_file_path = os.path.split(source_file)[0]
-                source_file_zipped = f"{source_file_path}/{url_file_name}"
-                source_file_year = str.replace(str(source_file), ".csv", f"_{yr}.csv")
-                target_file_year = str.replace(str(target_file), ".csv", f"_{yr}.csv")
-                download_file_http(url, source_file_zipped)
-                gz_decompress(
-                    infile=source_file_zipped,
-                    tofile=source_file_year,
-                    delete_zipfile=True,
-                )
-                if number_of_header_rows > 0:
-                    remove_header_rows(
-                        source_file_year,
-                        number_of_header_rows=number_of_header_rows,
-                    )
-                else:
-                    pass
-                if not full_data_load:
-                    delete_source_file_data_from_bq(
-                        project_id=project_id,
-                        dataset_id=dataset_id,
-                        table_id=destination_table,
-                        source_url=url,
-                    )
-                process_and_load_table(
-                    source_file=source_file_year,
-                    target_file=target_file_year,
-                    pipeline_name=pipeline_name,
-                    source_url=url,
-                    chunksize=chunksize,
+    # Every year loads into the same table, so it is (re)created once up front
+    # rather than by each year running concurrently.
+    create_dest_table(
+        project_id=project_id,
+        dataset_id=dataset_id,
+        table_id=destination_table,
+        schema_filepath=schema_path,
+        bucket_name=target_gcs_bucket,
+        drop_table=(drop_dest_table == "Y"),
+    )
+    with parallel.process_pool(max_workers) as transform_pool:
+        parallel.run_in_threads(
+            functools.partial(
+                process_lightning_strikes_year,
+                url_list=url_list,
+                file_pattern=file_pattern,
+                source_file=source_file,
+                target_file=target_file,
+                pipeline_name=pipeline_name,
+                chunksize=chunksize,
+                project_id=project_id,
+                dataset_id=dataset_id,
+                destination_table=destination_table,
+                target_gcs_bucket=target_gcs_bucket,
+                target_gcs_path=target_gcs_path,
+                schema_path=schema_path,
+                input_field_delimiter=input_field_delimiter,
+                full_data_load=full_data_load,
+                input_csv_headers=input_csv_headers,
+                data_dtypes=data_dtypes,
+                reorder_headers_list=reorder_headers_list,
+                null_rows_list=null_rows_list,
+                date_format_list=date_format_list,
+                slice_column_list=slice_column_list,
+                regex_list=regex_list,
+                rename_headers_list=rename_headers_list,
+                trim_whitespace_list=trim_whitespace_list,
+                remove_source_file=remove_source_file,
+                delete_target_file=delete_target_file,
+                number_of_header_rows=number_of_header_rows,
+                int_date_list=int_date_list,
+                gen_location_list=gen_location_list,
+                transform_pool=transform_pool,
+            ),
+            range(start, datetime.datetime.now().year),
+            max_workers=max_workers,
+        )
+
+
+def process_lightning_strikes_year(
+    yr: int,
+    url_list: typing.List[str],
+    file_pattern: str,
+    source_file: pathlib.Path,
+    target_file: pathlib.Path,
+    pipeline_name: str,
+    chunksize: str,
+    project_id: str,
+    dataset_id: str,
+    destination_table: str,
+    target_gcs_bucket: str,
+    target_gcs_path: str,
+    schema_path: str,
+    input_field_delimiter: str,
+    full_data_load: str,
+    input_csv_headers: typing.List[str],
+    data_dtypes: dict,
+    reorder_headers_list: typing.List[str],
+    null_rows_list: typing.List[str],
+    date_format_list: typing.List[typing.List[str]],
+    slice_column_list: dict,
+    regex_list: dict,
+    rename_headers_list: dict,
+    trim_whitespace_list: typing.List[str],
+    remove_source_file: bool,
+    delete_target_file: bool,
+    number_of_header_rows: int,
+    int_date_list: typing.List[str],
+    gen_location_list: dict,
+    transform_pool: concurrent.futures.Executor,
+) -> None:
+    for url in url_list:
+        url_file_name = os.path.split(url)[1]
+        if str(url_file_name).find(f"{file_pattern}{yr}") >= 0:
+            source_file_path = os.path.split(source_file)[0]
+            source_file_zipped = f"{source_file_path}/{url_file_name}"
+            source_file_year = str.replace(str(source_file), ".csv", f"_{yr}.csv")
+            target_file_year = str.replace(str(target_file), ".csv", f"_{yr}.csv")
+            target_gcs_path_year = target_gcs_path.replace(".csv", f"_{yr}.csv")
+            download_file_http(url, source_file_zipped)
+            # Decompresses and drops the header rows in one pass.
+            LineFilter(header_rows=number_of_header_rows).filter_file(
+                source_file_zipped, source_file_year
+            )
+            os.remove(source_file_zipped)
+            if not full_data_load:
+                delete_source_file_data_from_bq(
                     project_id=project_id,
                     dataset_id=dataset_id,
-                    destination_table=destination_table,
-                    target_gcs_bucket=target_gcs_bucket,
-                    target_gcs_path=target_gcs_path,
-                    schema_path=schema_path,
-                    drop_dest_table=drop_dest_table,
-                    input_field_delimiter=input_field_delimiter,
-                    input_csv_headers=input_csv_headers,
-                    data_dtypes=data_dtypes,
-                    reorder_headers_list=reorder_headers_list,
-                    null_rows_list=null_rows_list,
-                    date_format_list=date_format_list,
-                    slice_column_list=slice_column_list,
-                    regex_list=regex_list,
-                    rename_headers_list=rename_headers_list,
-                    trim_whitespace_list=trim_whitespace_list,
-                    remove_source_file=remove_source_file,
-                    delete_target_file=delete_target_file,
-                    int_date_list=int_date_list,
-                    gen_location_list=gen_location_list,
-                    truncate_table=False,
+                    table_id=destination_table,
+                    source_url=url,
                 )
+            process_and_load_table(
+                source_file=source_file_year,
+                target_file=target_file_year,
+                pipeline_name=pipeline_name,
+                source_url=url,
+                chunksize=chunksize,
+                project_id=project_id,
+                dataset_id=dataset_id,
+                destination_table=destination_table,
+                target_gcs_bucket=target_gcs_bucket,
+                target_gcs_path=target_gcs_path_year,
+                schema_path=schema_path,
+                drop_dest_table="N",
+                input_field_delimiter=input_field_delimiter,
+                input_csv_headers=input_csv_headers,
+                data_dtypes=data_dtypes,
+                reorder_headers_list=reorder_headers_list,
+                null_rows_list=null_rows_list,
+                date_format_list=date_format_list,
+                slice_column_list=slice_column_list,
+                regex_list=regex_list,
+                rename_headers_list=rename_headers_list,
+                trim_whitespace_list=trim_whitespace_list,
+                remove_source_file=remove_source_file,
+                delete_target_file=delete_target_file,
+                int_date_list=int_date_list,
+                gen_location_list=gen_location_list,
+                truncate_table=False,
+                transform_pool=transform_pool,
+            )
 
 
 def process_and_load_table(
@@ -1078,8 +1245,10 @@ def process_and_load_table(
     gen_location_list: dict,
     truncate_table: bool = True,
     encoding: str = "utf-8",
+    transform_pool: typing.Optional[concurrent.futures.Executor] = None,
 ) -> None:
-    process_source_file(
+    transform = functools.partial(
+        process_source_file,
         source_url=source_url,
         source_file=source_file,
         pipeline_name=pipeline_name,
@@ -1100,6 +1269,10 @@ def process_and_load_table(
         gen_location_list=gen_location_list,
         encoding=encoding,
     )
+    if transform_pool:
+        transform_pool.submit(transform).result()
+    else:
+        transform()
     post_processing(
         target_file=target_file,
         source_url=source_url,
@@ -1147,13 +1320,19 @@ def post_processing(
             drop_table=drop_table,
         )
         if table_exists:
-            load_data_to_bq(
+            if not truncate_table and source_url:
+                delete_source_file_data_from_bq(
+                    project_id=project_id,
+                    dataset_id=dataset_id,
+                    table_id=destination_table,
+                    source_url=source_url,
+                )
+            load_data_from_gcs(
                 project_id=project_id,
                 dataset_id=dataset_id,
                 table_id=destination_table,
-                file_path=target_file,
+                source_uris=gcs_uri(target_gcs_bucket, target_gcs_path),
                 truncate_table=truncate_table,
-                source_url=source_url,
                 field_delimiter="|",
             )
         else:
@@ -1168,6 +1347,10 @@ def post_processing(
         )
 
 
+# Some source files carry NUL bytes, which the CSV parser cannot handle.
+NUL_FILTER = LineFilter(substitutions=[("\0", "")])
+
+
 def process_source_file(
     source_file: str,
     chunksize: str,
@@ -1190,52 +1373,23 @@ def process_source_file(
     remove_source_file: bool = False,
 ) -> None:
     logging.info(f"Opening source file {source_file}")
-    csv.field_size_limit(sys.maxsize)
-    csv.register_dialect(
-        "TabDialect", quotechar='"', delimiter=input_field_delimiter, strict=True
-    )
-    with open(
-        source_file,
-        encoding=encoding,
-        mode="r",
-    ) as reader:
-        data = []
-        chunk_number = 1
-        for index, line in enumerate(
-            csv.reader((line.replace("\0", "") for line in reader), "TabDialect"), 0
-        ):
-            data.append(line)
-            if index % int(chunksize) == 0 and index > 0:
-                process_dataframe_chunk(
-                    data=data,
-                    pipeline_name=pipeline_name,
-                    input_csv_headers=input_csv_headers,
-                    data_dtypes=data_dtypes,
-                    source_url=source_url,
-                    target_file=target_file,
-                    chunk_number=chunk_number,
-                    reorder_headers_list=reorder_headers_list,
-                    date_format_list=date_format_list,
-                    null_rows_list=null_rows_list,
-                    slice_column_list=slice_column_list,
-                    regex_list=regex_list,
-                    trim_whitespace_list=trim_whitespace_list,
-                    rename_headers_list=rename_headers_list,
-                    int_date_list=int_date_list,
-                    gen_location_list=gen_location_list,
-                )
-                data = []
-                chunk_number += 1
-
-        if data:
-            process_dataframe_chunk(
-                data=data,
-                pipeline_name=pipeline_name,
-                input_csv_headers=input_csv_headers,
-                data_dtypes=data_dtypes,
+    with compression.open_text(source_file, encoding=encoding) as source, CsvChunkSink(
+        target_file
+    ) as sink:
+        chunks = read_csv_chunks(
+            NUL_FILTER.reader(source),
+            names=input_csv_headers,
+            chunksize=chunk_sizer(chunksize),
+            dtypes=data_dtypes,
+            sep=input_field_delimiter,
+        )
+        for chunk_number, df in enumerate(chunks, 1):
+            logging.info(f"Processing chunk #{chunk_number}")
+            process_chunk(
+                df=df,
                 source_url=source_url,
-                target_file=target_file,
-                chunk_number=chunk_number,
+                sink=sink,
+                pipeline_name=pipeline_name,
                 reorder_headers_list=reorder_headers_list,
                 date_format_list=date_format_list,
                 null_rows_list=null_rows_list,
@@ -1246,66 +1400,15 @@ def process_source_file(
                 int_date_list=int_date_list,
                 gen_location_list=gen_location_list,
             )
-        if remove_source_file:
-            os.remove(source_file)
-
-
-def process_dataframe_chunk(
-    data: typing.List[str],
-    pipeline_name: str,
-    input_csv_headers: typing.List[str],
-    data_dtypes: dict,
-    source_url: str,
-    target_file: str,
-    chunk_number: int,
-    reorder_headers_list: typing.List[str],
-    date_format_list: typing.List[typing.List[str]],
-    null_rows_list: typing.List[str],
-    slice_column_list: dict,
-    regex_list: dict,
-    trim_whitespace_list: typing.List[str],
-    rename_headers_list: dict,
-    int_date_list: typing.List[str],
-    gen_location_list: dict,
-) -> None:
-    logging.info(f"Processing chunk #{chunk_number}")
-    df = pd.DataFrame(data, columns=input_csv_headers)
-    set_df_datatypes(df, data_dtypes)
-    target_file_batch = str(target_file).replace(
-        ".csv", "-" + str(chunk_number) + ".csv"
-    )
-    process_chunk(
-        df=df,
-        source_url=source_url,
-        target_file_batch=target_file_batch,
-        target_file=target_file,
-        skip_header=(not chunk_number == 1),
-        pipeline_name=pipeline_name,
-        reorder_headers_list=reorder_headers_list,
-        date_format_list=date_format_list,
-        null_rows_list=null_rows_list,
-        slice_column_list=slice_column_list,
-        regex_list=regex_list,
-        trim_whitespace_list=trim_whitespace_list,
-        rename_headers_list=rename_headers_list,
-        int_date_list=int_date_list,
-        gen_location_list=gen_location_list,
-    )
-
-
-def set_df_datatypes(df: pd.DataFrame, data_dtypes: dict) -> pd.DataFrame:
-    logging.info("Setting data types")
-    for key, item in data_dtypes.items():
-        df[key] = df[key].astype(item)
-    return df
+    if remove_source_file:
+        os.remove(source_file)
 
 
+@metrics.timed("transform")
 def process_chunk(
     df: pd.DataFrame,
     source_url: str,
-    target_file_batch: str,
-    target_file: str,
-    skip_header: bool,
+    sink: CsvChunkSink,
     pipeline_name: str,
     reorder_headers_list: dict,
     null_rows_list: typing.List[str],
@@ -1324,37 +1427,52 @@ def process_chunk(
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
     if pipeline_name == "NOAA SPC Hail":
         df = rename_headers(df, rename_headers_list=rename_headers_list)
-        df["time"] = df["time"].apply(lambda x: str.zfill(x, 4))
-        df["month"] = df["month"].apply(lambda x: str.zfill(x, 2))
-        df["day"] = df["day"].apply(lambda x: str.zfill(x, 2))
+        df = zero_pad(df, {"time": 4, "month": 2, "day": 2})
         logging.info("Creating Timestamp Column")
-        df["timestamp"] = df.apply(
-            lambda x: f"{x.year}-{x.month}-{x.day} {x.time}00", axis=1
+        df["timestamp"] = (
+            df["year"].astype(str)
+            + "-"
+            + df["month"]
+            + "-"
+            + df["day"]
+            + " "
+            + df["time"]
+            + "00"
         )
         df = source_convert_date_formats(df, date_format_list=date_format_list)
         df = generate_location(df, gen_location_list=gen_location_list)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
     if pipeline_name == "NOAA SPC Wind":
         df = rename_headers(df, rename_headers_list=rename_headers_list)
-        df["speed"] = df["speed"].apply(lambda x: re.sub(r"^UNK$", "", x))
-        df["time"] = df["time"].apply(lambda x: str.zfill(x, 4))
-        df["month"] = df["month"].apply(lambda x: str.zfill(x, 2))
-        df["day"] = df["day"].apply(lambda x: str.zfill(x, 2))
+        df["speed"] = df["speed"].replace("UNK", "")
+        df = zero_pad(df, {"time": 4, "month": 2, "day": 2})
         logging.info("Creating Timestamp Column")
-        df["timestamp"] = df.apply(
-            lambda x: f"{x.year}-{x.month}-{x.day} {x.time}00", axis=1
+        df["timestamp"] = (
+            df["year"].astype(str)
+            + "-"
+            + df["month"]
+            + "-"
+            + df["day"]
+            + " "
+            + df["time"]
+            + "00"
         )
         df = source_convert_date_formats(df, date_format_list=date_format_list)
         df = generate_location(df, gen_location_list=gen_location_list)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
     if pipeline_name == "NOAA SPC Tornado":
         df = rename_headers(df, rename_headers_list=rename_headers_list)
-        df["time"] = df["time"].apply(lambda x: str.zfill(x, 4))
-        df["month"] = df["month"].apply(lambda x: str.zfill(x, 2))
-        df["day"] = df["day"].apply(lambda x: str.zfill(x, 2))
+        df = zero_pad(df, {"time": 4, "month": 2, "day": 2})
         logging.info("Creating Timestamp Column")
-        df["timestamp"] = df.apply(
-            lambda x: f"{x.year}-{x.month}-{x.day} {x.time}00", axis=1
+        df["timestamp"] = (
+            df["year"].astype(str)
+            + "-"
+            + df["month"]
+            + "-"
+            + df["day"]
+            + " "
+            + df["time"]
+            + "00"
         )
         df = source_convert_date_formats(df, date_format_list=date_format_list)
         df = generate_location(df, gen_location_list=gen_location_list)
@@ -1372,19 +1490,17 @@ def process_chunk(
         df = rename_headers(df, rename_headers_list=rename_headers_list)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
     if pipeline_name in ["NOAA GSOD 2020", "NOAA GSOD 2022"]:
-        df["stn"] = df["STATION"].apply(lambda x: "" if x == "" else x[0:6])
-        df["wban"] = df["STATION"].apply(lambda x: "" if x == "" else x[6:11])
-        df["year"] = df["DATE"].apply(lambda x: "" if x == "" else x[0:4])
-        df["mo"] = df["DATE"].apply(lambda x: "" if x == "" else x[5:7])
-        df["da"] = df["DATE"].apply(lambda x: "" if x == "" else x[8:10])
-        df["fog"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[0:1])
-        df["rain_drizzle"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[1:2])
-        df["snow_ice_pellets"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[2:3])
-        df["hail"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[3:4])
-        df["thunder"] = df["FRSHTT"].apply(lambda x: "" if x == "" else x[4:5])
-        df["tornado_funnel_cloud"] = df["FRSHTT"].apply(
-            lambda x: "" if x == "" else x[5:6]
-        )
+        df["stn"] = df["STATION"].str.slice(0, 6)
+        df["wban"] = df["STATION"].str.slice(6, 11)
+        df["year"] = df["DATE"].str.slice(0, 4)
+        df["mo"] = df["DATE"].str.slice(5, 7)
+        df["da"] = df["DATE"].str.slice(8, 10)
+        df["fog"] = df["FRSHTT"].str.slice(0, 1)
+        df["rain_drizzle"] = df["FRSHTT"].str.slice(1, 2)
+        df["snow_ice_pellets"] = df["FRSHTT"].str.slice(2, 3)
+        df["hail"] = df["FRSHTT"].str.slice(3, 4)
+        df["thunder"] = df["FRSHTT"].str.slice(4, 5)
+        df["tornado_funnel_cloud"] = df["FRSHTT"].str.slice(5, 6)
         df = rename_headers(df, rename_headers_list=rename_headers_list)
         df = trim_whitespace(df, trim_whitespace_list=trim_whitespace_list)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
@@ -1419,32 +1535,7 @@ def process_chunk(
         df = generate_location(df, gen_location_list=gen_location_list)
         df = add_metadata_cols(df, source_url=source_url)
         df = reorder_headers(df, reorder_headers_list=reorder_headers_list)
-    save_to_new_file(df, file_path=str(target_file_batch))
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
-
-
-def trim_whitespace(
-    df: pd.DataFrame, trim_whitespace_list: typing.List[str]
-) -> pd.DataFrame:
-    logging.info("Trimming whitespace ...")
-    for col in trim_whitespace_list:
-        logging.info(f"    on {col} ...")
-        df[col] = df[col].apply(lambda x: str(x).strip())
-    return df
-
-
-def convert_date_from_int(df: pd.DataFrame, int_date_list: dict) -> pd.DataFrame:
-    logging.info("Converting dates from integers")
-    for key, values in int_date_list.items():
-        dt_col = key
-        dt_int_col = values
-        df[dt_col] = (
-            pd.to_datetime(
-                (df[dt_int_col][:].astype("string") + "000000"), "raise", False, True
-            ).astype("string")
-            + " 00:00:00"
-        )
-    return df
+    sink.write(df)
 
 
 def url_directory_list(
@@ -1470,308 +1561,9 @@ def url_directory_list(
     return rtn_list
 
 
-def rename_headers(df: pd.DataFrame, rename_headers_list: dict) -> pd.DataFrame:
-    df.rename(columns=rename_headers_list, inplace=True)
-    return df
-
-
 def remove_header_rows(source_file: str, number_of_header_rows: int) -> None:
     logging.info(f"Removing header from {source_file}")
-    os.system(f"sed -i '1,{number_of_header_rows}d' {source_file} ")
-
-
-def add_metadata_cols(df: pd.DataFrame, source_url: str) -> pd.DataFrame:
-    logging.info("Adding metadata columns")
-    df["source_url"] = source_url
-    df["etl_timestamp"] = pd.to_datetime(
-        datetime.datetime.now(), format="%Y-%m-%d %H:%M:%S", infer_datetime_format=True
-    )
-    return df
-
-
-def reorder_headers(
-    df: pd.DataFrame, reorder_headers_list: typing.List[str]
-) -> pd.DataFrame:
-    logging.info("Reordering headers..")
-    return df[reorder_headers_list]
-
-
-def gz_decompress(infile: str, tofile: str, delete_zipfile: bool = False) -> None:
-    logging.info(f"Decompressing {infile}")
-    with open(infile, "rb") as inf, open(tofile, "w", encoding="utf8") as tof:
-        decom_str = gzip.decompress(inf.read()).decode("utf-8")
-        tof.write(decom_str)
-    if delete_zipfile:
-        os.remove(infile)
-
-
-def filter_null_rows(
-    df: pd.DataFrame, null_rows_list: typing.List[str]
-) -> pd.DataFrame:
-    logging.info("Removing rows with blank id's..")
-    for fld in null_rows_list:
-        df = df[df[fld] != ""]
-    return df
-
-
-def convert_dt_format(
-    dt_str: str, from_format: str = "%Y%m%d", to_format: str = "%Y-%m-%d"
-) -> str:
-    if not dt_str or dt_str.lower() == "nan":
-        return dt_str
-    else:
-        return str(datetime.datetime.strptime(dt_str, from_format).strftime(to_format))
-
-
-def source_convert_date_formats(
-    df: pd.DataFrame,
-    date_format_list: typing.List[typing.List[str]],
-) -> pd.DataFrame:
-    logging.info("Converting Date Format..")
-    for fld, from_format, to_format in date_format_list:
-        df[fld] = df[fld].apply(
-            lambda x, from_format, to_format: convert_dt_format(
-                x, from_format, to_format
-            ),
-            args=(from_format, to_format),
-        )
-    return df
-
-
-def slice_column(
-    df: pd.DataFrame, slice_column_list: dict, pipeline_name: str = ""
-) -> pd.DataFrame:
-    logging.info("Extracting column data..")
-    for key, values in slice_column_list.items():
-        src_col = values[0]
-        dest_col = key
-        start_pos = values[1]
-        end_pos = values[2]
-        if pipeline_name == "GHCND states":
-            if dest_col == "name":
-                # Work-around for Alabama - bad data
-                df[dest_col] = df[src_col].apply(
-                    lambda x: "ALABAMA"
-                    if str(x)[0:2] == "AL"
-                    else str(x)[int(start_pos) :].strip()
-                )
-            else:
-                if end_pos == "":
-                    df[dest_col] = df[src_col].apply(
-                        lambda x: str(x)[int(start_pos) :].strip()
-                    )
-                else:
-                    df[dest_col] = df[src_col].apply(
-                        lambda x: str(x)[int(start_pos) : int(end_pos)].strip()
-                    )
-        else:
-            if end_pos == "":
-                df[dest_col] = df[src_col].apply(
-                    lambda x: str(x)[int(start_pos) :].strip()
-                )
-            else:
-                df[dest_col] = df[src_col].apply(
-                    lambda x: str(x)[int(start_pos) : int(end_pos)].strip()
-                )
-    return df
-
-
-def get_column_country_code(col_val: str) -> str:
-    return col_val.strip().split(" ")[0]
-
-
-def get_column_country_name(col_val: str) -> str:
-    len_code = len(str.split(str.strip(col_val), " ")[0])
-    strmain1 = str.strip(col_val)
-    len_main = len(str.strip(col_val))
-    len_out = len_main - len_code
-    return str.strip((strmain1[::-1])[0:(len_out)][::-1])
-
-
-def apply_regex(df: pd.DataFrame, regex_list: dict) -> pd.DataFrame:
-    logging.info("Applying RegEx")
-    for key, values in regex_list.items():
-        regex_expr = values[0]
-        replace_expr = values[1]
-        isregex = values[2] == "True"
-        df[key][:].replace(regex_expr, replace_expr, regex=isregex, inplace=True)
-    return df
-
-
-def load_data_to_bq(
-    project_id: str,
-    dataset_id: str,
-    table_id: str,
-    file_path: str,
-    truncate_table: bool,
-    source_url: str = "",
-    field_delimiter: str = "|",
-    quotechar: str = '"',
-) -> None:
-    logging.info(
-        f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} started"
-    )
-    client = bigquery.Client(project=project_id)
-    table_ref = client.dataset(dataset_id).table(table_id)
-    job_config = bigquery.LoadJobConfig()
-    job_config.source_format = bigquery.SourceFormat.CSV
-    job_config.field_delimiter = field_delimiter
-    if truncate_table:
-        job_config.write_disposition = "WRITE_TRUNCATE"
-    else:
-        if source_url == "":
-            pass
-        else:
-            delete_source_file_data_from_bq(
-                project_id=project_id,
-                dataset_id=dataset_id,
-                table_id=table_id,
-                source_url=source_url,
-            )
-        job_config.write_disposition = "WRITE_APPEND"
-    job_config.skip_leading_rows = 1  # ignore the header
-    job_config.autodetect = False
-    job_config.allow_quoted_newlines = True
-    job_config.quote_character = quotechar
-    with open(file_path, "rb") as source_file:
-        job = client.load_table_from_file(source_file, table_ref, job_config=job_config)
-    job.result()
-    logging.info(
-        f"Loading data from {file_path} into {project_id}.{dataset_id}.{table_id} completed"
-    )
-
-
-def create_dest_table(
-    project_id: str,
-    dataset_id: str,
-    table_id: str,
-    schema_filepath: list,
-    bucket_name: str,
-    drop_table: bool = False,
-) -> bool:
-    table_ref = f"{project_id}.{dataset_id}.{table_id}"
-    logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
-    client = bigquery.Client()
-    table_exists = False
-    try:
-        table = client.get_table(table_ref)
-        table_exists_id = table.table_id
-        logging.info(f"Table {table_exists_id} currently exists.")
-        if drop_table:
-            logging.info("Dropping existing table")
-            client.delete_table(table)
-            table = None
-    except NotFound:
-        table = None
-    if not table:
-        logging.info(
-            (
-                f"Table {table_ref} currently does not exist.  Attempting to create table."
-            )
-        )
-        if check_gcs_file_exists(schema_filepath, bucket_name):
-            schema = create_table_schema([], bucket_name, schema_filepath)
-            table = bigquery.Table(table_ref, schema=schema)
-            client.create_table(table)
-            print(f"Table {table_ref} was created".format(table_id))
-            table_exists = True
-        else:
-            file_name = os.path.split(schema_filepath)[1]
-            file_path = os.path.split(schema_filepath)[0]
-            logging.info(
-                f"Error: Unable to create table {table_ref} because schema file {file_name} does not exist in location {file_path} in bucket {bucket_name}"
-            )
-            table_exists = False
-    else:
-        table_exists = True
-    return table_exists
-
-
-def check_gcs_file_exists(file_path: str, bucket_name: str) -> bool:
-    storage_client = storage.Client()
-    bucket = storage_client.bucket(bucket_name)
-    exists = storage.Blob(bucket=bucket, name=file_path).exists(storage_client)
-    return exists
-
-
-def delete_source_file_data_from_bq(
-    project_id: str, dataset_id: str, table_id: str, source_url: str
-) -> None:
-    logging.info(
-        f"Deleting data from {project_id}.{dataset_id}.{table_id} where source_url = '{source_url}'"
-    )
-    client = bigquery.Client()
-    query = f"""
-        DELETE
-        FROM {project_id}.{dataset_id}.{table_id}
-        WHERE source_url = '@source_url'
-    """
-    job_config = bigquery.QueryJobConfig(
-        query_parameters=[
-            bigquery.ScalarQueryParameter("project_id", "STRING", project_id),
-            bigquery.ScalarQueryParameter("dataset_id", "STRING", dataset_id),
-            bigquery.ScalarQueryParameter("table_id", "STRING", table_id),
-            bigquery.ScalarQueryParameter("source_url", "STRING", source_url),
-        ]
-    )
-    query_job = client.query(query, job_config=job_config)  # Make an API request.
-    query_job.result()
-
-
-def create_table_schema(
-    schema_structure: list, bucket_name: str = "", schema_filepath: str = ""
-) -> list:
-    logging.info(f"Defining table schema... {bucket_name} ... {schema_filepath}")
-    schema = []
-    if not (schema_filepath):
-        schema_struct = schema_structure
-    else:
-        storage_client = storage.Client()
-        bucket = storage_client.get_bucket(bucket_name)
-        blob = bucket.blob(schema_filepath)
-        schema_struct = json.loads(blob.download_as_bytes(client=None))
-    for schema_field in schema_struct:
-        fld_name = schema_field["name"]
-        fld_type = schema_field["type"]
-        try:
-            fld_descr = schema_field["description"]
-        except KeyError:
-            fld_descr = ""
-        fld_mode = schema_field["mode"]
-        schema.append(
-            bigquery.SchemaField(
-                name=fld_name, field_type=fld_type, mode=fld_mode, description=fld_descr
-            )
-        )
-    return schema
-
-
-def save_to_new_file(
-    df: pd.DataFrame, file_path: str, sep: str = "|", quotechar: str = '"'
-) -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep, quotechar=quotechar)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
+    LineFilter(header_rows=number_of_header_rows).filter_file(source_file)
 
 
 def download_file_ftp(
@@ -1780,39 +1572,10 @@ def download_file_ftp(
     ftp_filename: str,
     local_file: pathlib.Path,
     source_url: str,
+    ftp_sessions: ftp.FtpSessionPool,
 ) -> None:
     logging.info(f"Downloading {source_url} into {local_file}")
-    for retry in range(1, 3):
-        if not download_file_ftp_single_try(
-            ftp_host, ftp_dir, ftp_filename, local_file
-        ):
-            logging.info(f"FTP file download failed.  Retrying #{retry} in 60 seconds")
-            time.sleep(60)
-        else:
-            break
-
-
-def download_file_ftp_single_try(
-    ftp_host: str, ftp_dir: str, ftp_filename: str, local_file: pathlib.Path
-) -> bool:
-    try_count = 0
-    while True:
-        try:
-            with ftplib.FTP(ftp_host, timeout=60) as ftp_conn:
-                ftp_conn.login("", "")
-                ftp_conn.cwd(ftp_dir)
-                ftp_conn.encoding = "utf-8"
-                with open(local_file, "wb") as dest_file:
-                    ftp_conn.retrbinary("RETR %s" % ftp_filename, dest_file.write)
-                ftp_conn.quit()
-                return True
-        except TimeoutError as e:
-            try_count += 1
-            if try_count > 3:
-                raise e
-            else:
-                logging.info(f"{e}, Retrying ...")
-                time.sleep(try_count * 30)
+    ftp_sessions.download(ftp_host, ftp_dir, ftp_filename, local_file)
 
 
 def download_file_http(
@@ -1874,23 +1637,6 @@ def download_file_http_exec(
         return False
 
 
-def upload_file_to_gcs(
-    file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
-) -> None:
-    if os.path.exists(file_path):
-        logging.info(
-            f"Uploading output file to gs://{target_gcs_bucket}/{target_gcs_path}"
-        )
-        storage_client = storage.Client()
-        bucket = storage_client.bucket(target_gcs_bucket)
-        blob = bucket.blob(target_gcs_path)
-        blob.upload_from_filename(file_path)
-    else:
-        logging.info(
-            f"Cannot upload file to gs://{target_gcs_bucket}/{target_gcs_path} as it does not exist."
-        )
-
-
 if __name__ == "__main__":
     logging.getLogger().setLevel(logging.INFO)
 
@@ -1911,8 +1657,10 @@ if __name__ == "__main__":
         target_gcs_bucket=os.environ.get("TARGET_GCS_BUCKET", ""),
         target_gcs_path=os.environ.get("TARGET_GCS_PATH", ""),
         input_field_delimiter=os.environ.get("INPUT_FIELD_DELIMITER", "N"),
-        ftp_batch_size=os.environ.get("FTP_BATCH_SIZE", "20"),
-        ftp_batch_sleep_time=os.environ.get("FTP_BATCH_SLEEP_TIME", "30"),
+        max_workers=os.environ.get("MAX_WORKERS", "4"),
+        ftp_max_connections_per_host=os.environ.get(
+            "FTP_MAX_CONNECTIONS_PER_HOST", "4"
+        ),
         full_data_load=os.environ.get("FULL_DATA_LOAD", "N"),
         start_year=os.environ.get("START_YEAR", ""),
         input_csv_headers=json.loads(os.environ.get("INPUT_CSV_HEADERS", r"[]")),
@@ -64,7 +64,7 @@ with DAG(
             "SOURCE_URL": '{\n  "ghcnd_by_year": "ftp://ftp.ncei.noaa.gov/pub/data/ghcn/daily/by_year/.csv.gz"\n}',
             "SOURCE_FILE": "files/data_ghcnd_by_year.csv",
             "TARGET_FILE": "files/data_output_ghcnd_by_year.csv",
-            "CHUNKSIZE": "750000",
+            "CHUNKSIZE": "auto",
             "FTP_HOST": "ftp.ncdc.noaa.gov",
             "FTP_DIR": "pub/data/ghcn/daily/by_year",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
@@ -75,8 +75,8 @@ with DAG(
             "SCHEMA_PATH": "data/noaa/schema/ghcnd_by_year_schema.json",
             "DROP_DEST_TABLE": "N",
             "INPUT_FIELD_DELIMITER": ",",
-            "FTP_BATCH_SIZE": "10",
-            "FTP_BATCH_SLEEP_TIME": "60",
+            "MAX_WORKERS": "3",
+            "FTP_MAX_CONNECTIONS_PER_HOST": "4",
             "FULL_DATA_LOAD": "N",
             "START_YEAR": "1763",
             "REMOVE_SOURCE_FILE": "Y",
@@ -105,7 +105,7 @@ with DAG(
             "SOURCE_URL": '{\n  "tmin": "ftp://ftp.ncdc.noaa.gov/pub/data/ghcn/v3/ghcnm.tmin.latest.qca.tar.gz",\n  "tavg": "ftp://ftp.ncdc.noaa.gov/pub/data/ghcn/v3/ghcnm.tavg.latest.qca.tar.gz",\n  "tmax": "ftp://ftp.ncdc.noaa.gov/pub/data/ghcn/v3/ghcnm.tmax.latest.qca.tar.gz"\n}',
             "SOURCE_FILE": "files/data_ghcn_m.csv",
             "TARGET_FILE": "files/data_output_ghcn_m.csv",
-            "CHUNKSIZE": "100000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "ghcn_m",
             "TABLE_ID": "ghcnm_",
@@ -138,7 +138,7 @@ with DAG(
             "SOURCE_URL": '{\n  "ghcnd_countries": "ftp://ftp.ncdc.noaa.gov/pub/data/ghcn/daily/ghcnd-countries.txt"\n}',
             "SOURCE_FILE": "files/data_ghcnd_countries.csv",
             "TARGET_FILE": "files/data_output_ghcnd_countries.csv",
-            "CHUNKSIZE": "750000",
+            "CHUNKSIZE": "auto",
             "FTP_HOST": "ftp.ncdc.noaa.gov",
             "FTP_DIR": "pub/data/ghcn/daily",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
@@ -174,7 +174,7 @@ with DAG(
             "SOURCE_URL": '{\n  "ghcnd_inventory": "ftp://ftp.ncdc.noaa.gov/pub/data/ghcn/daily/ghcnd-inventory.txt"\n}',
             "SOURCE_FILE": "files/data_ghcnd_inventory.csv",
             "TARGET_FILE": "files/data_output_ghcnd_inventory.csv",
-            "CHUNKSIZE": "750000",
+            "CHUNKSIZE": "auto",
             "FTP_HOST": "ftp.ncdc.noaa.gov",
             "FTP_DIR": "pub/data/ghcn/daily",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
@@ -210,7 +210,7 @@ with DAG(
             "SOURCE_URL": '{\n  "ghcnd_states": "ftp://ftp.ncdc.noaa.gov/pub/data/ghcn/daily/ghcnd-states.txt"\n}',
             "SOURCE_FILE": "files/data_ghcnd_states.csv",
             "TARGET_FILE": "files/data_output_ghcnd_states.csv",
-            "CHUNKSIZE": "750000",
+            "CHUNKSIZE": "auto",
             "FTP_HOST": "ftp.ncdc.noaa.gov",
             "FTP_DIR": "pub/data/ghcn/daily",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
@@ -246,7 +246,7 @@ with DAG(
             "SOURCE_URL": '{\n  "ghcnd_stations": "ftp://ftp.ncdc.noaa.gov/pub/data/ghcn/daily/ghcnd-stations.txt"\n}',
             "SOURCE_FILE": "files/data_ghcnd_stations.csv",
             "TARGET_FILE": "files/data_output_ghcnd_stations.csv",
-            "CHUNKSIZE": "750000",
+            "CHUNKSIZE": "auto",
             "FTP_HOST": "ftp.ncdc.noaa.gov",
             "FTP_DIR": "pub/data/ghcn/daily",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
@@ -282,7 +282,7 @@ with DAG(
             "SOURCE_URL": '{\n  "gsod_stations": "ftp://ftp.ncdc.noaa.gov/pub/data/noaa/isd-history.txt"\n}',
             "SOURCE_FILE": "files/data_gsod_stations.csv",
             "TARGET_FILE": "files/data_output_gsod_stations.csv",
-            "CHUNKSIZE": "750000",
+            "CHUNKSIZE": "auto",
             "FTP_HOST": "ftp.ncdc.noaa.gov",
             "FTP_DIR": "pub/data/noaa",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
@@ -321,7 +321,7 @@ with DAG(
             "SOURCE_URL": '{\n  "ghcnd_hurricanes": "https://www.ncei.noaa.gov/data/international-best-track-archive-for-climate-stewardship-ibtracs/v04r00/access/csv/ibtracs.ALL.list.v04r00.csv"\n}',
             "SOURCE_FILE": "files/data_ghcnd_hurricanes.csv",
             "TARGET_FILE": "files/data_output_ghcnd_hurricanes.csv",
-            "CHUNKSIZE": "750000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_hurricanes",
             "TABLE_ID": "hurricanes",
@@ -355,7 +355,7 @@ with DAG(
             "SOURCE_URL": '{\n  "lightning_strikes_by_year": "https://www1.ncdc.noaa.gov/pub/data/swdi/database-csv/v2/nldn-tiles-*.csv.gz"\n}',
             "SOURCE_FILE": "files/data_lightning_strikes.csv",
             "TARGET_FILE": "files/data_output_lightning_strikes.csv",
-            "CHUNKSIZE": "1000000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_lightning",
             "TABLE_ID": "lightning_strikes",
@@ -364,8 +364,7 @@ with DAG(
             "SCHEMA_PATH": "data/noaa/schema/noaa_lightning_strikes_schema.json",
             "DROP_DEST_TABLE": "N",
             "INPUT_FIELD_DELIMITER": ",",
-            "HTTP_BATCH_SIZE": "10",
-            "HTTP_BATCH_SLEEP_TIME": "60",
+            "MAX_WORKERS": "3",
             "FULL_DATA_LOAD": "Y",
             "REMOVE_SOURCE_FILE": "Y",
             "DELETE_TARGET_FILE": "Y",
@@ -396,7 +395,7 @@ with DAG(
             "SOURCE_URL": '{\n    "root": "ftp://ftp.ncdc.noaa.gov/pub/data/swdi/stormevents/csvfiles",\n    "storms_details": "StormEvents_details-ftp_v1.0_d",\n    "storms_locations": "StormEvents_locations-ftp_v1.0_d"\n}',
             "SOURCE_FILE": "files/data_storms_database.csv",
             "TARGET_FILE": "files/data_output_storms_database.csv",
-            "CHUNKSIZE": "500000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_historic_severe_storms",
             "TABLE_ID": "storms",
@@ -405,6 +404,8 @@ with DAG(
             "SCHEMA_PATH": "data/noaa/schema/noaa_historic_severe_storms_schema.json",
             "DROP_DEST_TABLE": "N",
             "INPUT_FIELD_DELIMITER": ",",
+            "MAX_WORKERS": "3",
+            "FTP_MAX_CONNECTIONS_PER_HOST": "4",
             "FULL_DATA_LOAD": "N",
             "REMOVE_SOURCE_FILE": "Y",
             "DELETE_TARGET_FILE": "Y",
@@ -432,7 +433,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_spc_hail": "https://www.spc.noaa.gov/wcm/newdata/2021-hail-prelim-reports-ytd.csv"\n}',
             "SOURCE_FILE": "files/data_spc_hail.csv",
             "TARGET_FILE": "files/data_output_spc_hail.csv",
-            "CHUNKSIZE": "500000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_historic_severe_storms",
             "TABLE_ID": "hail_reports",
@@ -468,7 +469,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_spc_wind": "https://www.spc.noaa.gov/wcm/newdata/2019-wind-prelim-reports-ytd.csv"\n}',
             "SOURCE_FILE": "files/data_spc_wind.csv",
             "TARGET_FILE": "files/data_output_spc_wind.csv",
-            "CHUNKSIZE": "500000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_historic_severe_storms",
             "TABLE_ID": "wind_reports",
@@ -504,7 +505,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_spc_tornado": "https://www.spc.noaa.gov/wcm/newdata/2019-torn-prelim-reports-ytd.csv"\n}',
             "SOURCE_FILE": "files/data_spc_tornado.csv",
             "TARGET_FILE": "files/data_output_spc_tornado.csv",
-            "CHUNKSIZE": "500000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_historic_severe_storms",
             "TABLE_ID": "tornado_reports",
@@ -540,7 +541,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_goes_16_mcmip": "gs://pdp-feeds-staging/Cloud/goes16/abi_l2_mcmip.csv"\n}',
             "SOURCE_FILE": "files/data_goes16_mcmip.csv",
             "TARGET_FILE": "files/data_output_goes16_mcmip.csv",
-            "CHUNKSIZE": "1000000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_goes16",
             "TABLE_ID": "abi_l2_mcmip",
@@ -575,7 +576,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_goes_16_glm": "gs://pdp-feeds-staging/Cloud/goes16/glm_l2_lcfa.csv"\n}',
             "SOURCE_FILE": "files/data_goes16_glm.csv",
             "TARGET_FILE": "files/data_output_goes16_glm.csv",
-            "CHUNKSIZE": "1000000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_goes16",
             "TABLE_ID": "glm_l2_lcfa",
@@ -609,7 +610,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_goes_16_cmip": "gs://pdp-feeds-staging/Cloud/goes16/abi_l2_cmip.csv"\n}',
             "SOURCE_FILE": "files/data_goes16_cmip.csv",
             "TARGET_FILE": "files/data_output_goes16_cmip.csv",
-            "CHUNKSIZE": "1000000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_goes16",
             "TABLE_ID": "abi_l2_cmip",
@@ -643,7 +644,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_goes_16_radiance": "gs://pdp-feeds-staging/Cloud/goes16/abi_l1b_radiance.csv"\n}',
             "SOURCE_FILE": "files/data_goes16_radiance.csv",
             "TARGET_FILE": "files/data_output_goes16_radiance.csv",
-            "CHUNKSIZE": "1000000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_goes16",
             "TABLE_ID": "abi_l1b_radiance",
@@ -678,7 +679,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_goes_17_mcmip": "gs://pdp-feeds-staging/Cloud/goes17/abi_l2_mcmip.csv"\n}',
             "SOURCE_FILE": "files/data_goes17_mcmip.csv",
             "TARGET_FILE": "files/data_output_goes17_mcmip.csv",
-            "CHUNKSIZE": "1000000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_goes17",
             "TABLE_ID": "abi_l2_mcmip",
@@ -713,7 +714,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_goes_17_glm": "gs://pdp-feeds-staging/Cloud/goes17/glm_l2_lcfa.csv"\n}',
             "SOURCE_FILE": "files/data_goes17_glm.csv",
             "TARGET_FILE": "files/data_output_goes17_glm.csv",
-            "CHUNKSIZE": "1000000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_goes17",
             "TABLE_ID": "glm_l2_lcfa",
@@ -747,7 +748,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_goes_17_cmip": "gs://pdp-feeds-staging/Cloud/goes17/abi_l2_cmip.csv"\n}',
             "SOURCE_FILE": "files/data_goes17_cmip.csv",
             "TARGET_FILE": "files/data_output_goes17_cmip.csv",
-            "CHUNKSIZE": "1000000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_goes17",
             "TABLE_ID": "abi_l2_cmip",
@@ -781,7 +782,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_goes_17_radiance": "gs://pdp-feeds-staging/Cloud/goes17/abi_l1b_radiance.csv"\n}',
             "SOURCE_FILE": "files/data_goes17_radiance.csv",
             "TARGET_FILE": "files/data_output_goes17_radiance.csv",
-            "CHUNKSIZE": "1000000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_goes17",
             "TABLE_ID": "abi_l1b_radiance",
@@ -816,7 +817,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_gsod_2020": "https://www.ncei.noaa.gov/data/global-summary-of-the-day/access/2020/"\n}',
             "SOURCE_FILE": "files/data_gsod_2020.csv",
             "TARGET_FILE": "files/data_output_gsod_2020.csv",
-            "CHUNKSIZE": "100000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_gsod",
             "TABLE_ID": "gsod2020",
@@ -825,6 +826,7 @@ with DAG(
             "SCHEMA_PATH": "data/noaa/schema/noaa_gsod_2020_schema.json",
             "DROP_DEST_TABLE": "N",
             "INPUT_FIELD_DELIMITER": ",",
+            "MAX_WORKERS": "16",
             "FULL_DATA_LOAD": "N",
             "REMOVE_SOURCE_FILE": "N",
             "DELETE_TARGET_FILE": "Y",
@@ -851,7 +853,7 @@ with DAG(
             "SOURCE_URL": '{\n  "noaa_gsod_2022": "https://www.ncei.noaa.gov/data/global-summary-of-the-day/access/2022/"\n}',
             "SOURCE_FILE": "files/data_gsod_2022.csv",
             "TARGET_FILE": "files/data_output_gsod_2022.csv",
-            "CHUNKSIZE": "100000",
+            "CHUNKSIZE": "auto",
             "PROJECT_ID": "{{ var.value.gcp_project }}",
             "DATASET_ID": "noaa_gsod",
             "TABLE_ID": "gsod2022",
@@ -860,6 +862,7 @@ with DAG(
             "SCHEMA_PATH": "data/noaa/schema/noaa_gsod_2022_schema.json",
             "DROP_DEST_TABLE": "N",
             "INPUT_FIELD_DELIMITER": ",",
+            "MAX_WORKERS": "16",
             "FULL_DATA_LOAD": "N",
             "REMOVE_SOURCE_FILE": "N",
             "DELETE_TARGET_FILE": "Y",
@@ -29,6 +29,9 @@ import requests
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
+from transform_runtime.files import CsvChunkSink, save_to_new_file
+from transform_runtime.parsers import iter_csv, read_csv
+
 
 def main(
     source_url: str,
@@ -900,18 +903,16 @@ def handle_tripdata(
     logging.info("Compiling target file by merging source data")
     trip_data_filepath = str(target_file).replace(".csv", "_trip_data.csv")
     logging.info(f"Opening {trip_data_filepath}")
-    df_trip_data = pd.read_csv(
+    df_trip_data = read_csv(
         trip_data_filepath,
-        engine="python",
         encoding="utf-8",
         quotechar='"',  # string separator, typically double-quotes
         sep="|",  # data column separator, typically ","
     )
     tripdata_filepath = str(target_file).replace(".csv", "_tripdata.csv")
     logging.info(f"Opening {tripdata_filepath}")
-    df_tripdata = pd.read_csv(
+    df_tripdata = read_csv(
         tripdata_filepath,
-        engine="python",
         encoding="utf-8",
         quotechar='"',  # string separator, typically double-quotes
         sep="|",  # data column separator, typically ","
@@ -1052,9 +1053,8 @@ def process_source_file(
 ) -> None:
     logging.info(f"Opening source file {source_file}")
     if header_row_ordinal is None or header_row_ordinal == "None":
-        with pd.read_csv(
+        chunks = iter_csv(
             source_file,
-            engine="python",
             encoding="utf-8",
             quotechar='"',
             chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -1063,18 +1063,13 @@ def process_source_file(
             dtype=data_dtypes,
             keep_default_na=True,
             na_values=[" "],
-        ) as reader:
-            for chunk_number, chunk in enumerate(reader):
-                target_file_batch = str(target_file).replace(
-                    ".csv", "-" + str(chunk_number) + ".csv"
-                )
-                df = pd.DataFrame()
-                df = pd.concat([df, chunk])
+        )
+        with CsvChunkSink(target_file, sep="|") as sink:
+            for df in chunks:
                 process_chunk(
                     df=df,
-                    target_file_batch=target_file_batch,
+                    sink=sink,
                     target_file=target_file,
-                    skip_header=(not chunk_number == 0),
                     destination_table=destination_table,
                     rename_headers_list=rename_headers_list,
                     empty_key_list=empty_key_list,
@@ -1089,9 +1084,8 @@ def process_source_file(
     else:
         header = int(header_row_ordinal)
         if data_dtypes != "[]":
-            with pd.read_csv(
+            chunks = iter_csv(
                 source_file,
-                engine="python",
                 encoding="utf-8",
                 quotechar='"',
                 chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -1100,18 +1094,13 @@ def process_source_file(
                 dtype=data_dtypes,
                 keep_default_na=True,
                 na_values=[" "],
-            ) as reader:
-                for chunk_number, chunk in enumerate(reader):
-                    target_file_batch = str(target_file).replace(
-                        ".csv", "-" + str(chunk_number) + ".csv"
-                    )
-                    df = pd.DataFrame()
-                    df = pd.concat([df, chunk])
+            )
+            with CsvChunkSink(target_file, sep="|") as sink:
+                for df in chunks:
                     process_chunk(
                         df=df,
-                        target_file_batch=target_file_batch,
+                        sink=sink,
                         target_file=target_file,
-                        skip_header=(not chunk_number == 0),
                         destination_table=destination_table,
                         rename_headers_list=rename_headers_list,
                         empty_key_list=empty_key_list,
@@ -1124,9 +1113,8 @@ def process_source_file(
                         reorder_headers_list=reorder_headers_list,
                     )
         else:
-            with pd.read_csv(
+            chunks = iter_csv(
                 source_file,
-                engine="python",
                 encoding="utf-8",
                 quotechar='"',
                 chunksize=int(chunksize),  # size of batch data, in no. of records
@@ -1134,18 +1122,13 @@ def process_source_file(
                 header=header,  # use when the data file does not contain a header
                 keep_default_na=True,
                 na_values=[" "],
-            ) as reader:
-                for chunk_number, chunk in enumerate(reader):
-                    target_file_batch = str(target_file).replace(
-                        ".csv", "-" + str(chunk_number) + ".csv"
-                    )
-                    df = pd.DataFrame()
-                    df = pd.concat([df, chunk])
+            )
+            with CsvChunkSink(target_file, sep="|") as sink:
+                for df in chunks:
                     process_chunk(
                         df=df,
-                        target_file_batch=target_file_batch,
+                        sink=sink,
                         target_file=target_file,
-                        skip_header=(not chunk_number == 0),
                         destination_table=destination_table,
                         rename_headers_list=rename_headers_list,
                         empty_key_list=empty_key_list,
@@ -1161,9 +1144,8 @@ def process_source_file(
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
+    sink: CsvChunkSink,
     target_file: str,
-    skip_header: bool,
     destination_table: str,
     rename_headers_list: typing.List[str],
     empty_key_list: typing.List[str],
@@ -1175,7 +1157,7 @@ def process_chunk(
     date_format_list: dict,
     reorder_headers_list: typing.List[str],
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
+    logging.info(f"Processing batch of {len(df)} rows")
     if destination_table == "311_service_requests":
         df = rename_headers(df, rename_headers_list)
         df = remove_empty_key_rows(df, empty_key_list)
@@ -1236,9 +1218,7 @@ def process_chunk(
         df = reorder_headers(df, reorder_headers_list)
     else:
         pass
-    save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
-    logging.info(f"Processing batch file {target_file_batch} completed")
+    sink.write(df)
 
 
 def add_key(df: pd.DataFrame) -> pd.DataFrame:
@@ -1516,32 +1496,6 @@ def reorder_headers(
     return df[output_headers_list]
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
-
-
 def upload_file_to_gcs(
     file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
 ) -> None:
@@ -21,6 +21,9 @@ import pandas as pd
 import requests
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     source_url: str,
@@ -39,21 +42,16 @@ def main(
     chunksz = int(chunksize)
 
     logging.info(f"Opening source file {source_file}")
-    with pd.read_csv(
+    chunks = iter_csv(
         source_file,
-        engine="python",
         encoding="utf-8",
         quotechar='"',
         sep=",",
         chunksize=chunksz,
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
-            process_chunk(df, target_file_batch, target_file, (not chunk_number == 0))
+    )
+    with CsvChunkSink(target_file, sep=",") as sink:
+        for df in chunks:
+            process_chunk(df, sink)
 
     upload_file_to_gcs(target_file, target_gcs_bucket, target_gcs_path)
 
@@ -68,10 +66,8 @@ def download_file(source_url: str, source_file: pathlib.Path) -> None:
             f.write(chunk)
 
 
-def process_chunk(
-    df: pd.DataFrame, target_file_batch: str, target_file: str, skip_header: bool
-) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
+def process_chunk(df: pd.DataFrame, sink: CsvChunkSink) -> None:
+    logging.info(f"Processing batch of {len(df)} rows")
     df = rename_headers(df)
     df = remove_empty_key_rows(df, "unique_key")
     df = resolve_datatypes(df)
@@ -79,9 +75,7 @@ def process_chunk(
     df = strip_whitespace(df)
     df = resolve_date_format(df)
     df = reorder_headers(df)
-    save_to_new_file(df, file_path=str(target_file_batch))
-    append_batch_file(target_file_batch, target_file, skip_header)
-    logging.info(f"Processing batch file {target_file_batch} completed")
+    sink.write(df)
 
 
 def rename_headers(df: pd.DataFrame) -> pd.DataFrame:
@@ -202,32 +196,6 @@ def reorder_headers(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def save_to_new_file(df: pd.DataFrame, file_path) -> None:
-    df.to_csv(file_path, index=False)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool
-) -> None:
-    data_file = open(batch_file_path, "r")
-    if os.path.exists(target_file_path):
-        target_file = open(target_file_path, "a+")
-    else:
-        target_file = open(target_file_path, "w")
-    if skip_header:
-        logging.info(
-            f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-        )
-        next(data_file)
-    else:
-        logging.info(f"Appending batch file {batch_file_path} to {target_file_path}")
-    target_file.write(data_file.read())
-    data_file.close()
-    target_file.close()
-    if os.path.exists(batch_file_path):
-        os.remove(batch_file_path)
-
-
 def upload_file_to_gcs(file_path: pathlib.Path, gcs_bucket: str, gcs_path: str) -> None:
     storage_client = storage.Client()
     bucket = storage_client.bucket(gcs_bucket)
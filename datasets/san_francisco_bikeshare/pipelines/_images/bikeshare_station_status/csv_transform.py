@@ -21,6 +21,9 @@ import pandas as pd
 import requests
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     source_url_json: str,
@@ -44,35 +47,27 @@ def main(
     chunksz = int(chunksize)
 
     logging.info(f"Opening batch file {source_file}")
-    with pd.read_csv(
+    chunks = iter_csv(
         source_file,  # path to main source file to load in batches
-        engine="python",
         encoding="utf-8",
         quotechar='"',  # string separator, typically double-quotes
         chunksize=chunksz,  # size of batch data, in no. of records
         sep=",",  # data column separator, typically ","
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
-            process_chunk(df, target_file_batch, target_file, (not chunk_number == 0))
+    )
+    with CsvChunkSink(target_file, sep=",") as sink:
+        for df in chunks:
+            process_chunk(df, sink)
 
     upload_file_to_gcs(target_file, target_gcs_bucket, target_gcs_path)
 
     logging.info("San Francisco - Bikeshare Status process completed")
 
 
-def process_chunk(
-    df: pd.DataFrame, target_file_batch: str, target_file: str, skip_header: bool
-) -> None:
+def process_chunk(df: pd.DataFrame, sink: CsvChunkSink) -> None:
     df = rename_headers(df)
     df = filter_empty_data(df)
     df = reorder_headers(df)
-    save_to_new_file(df, file_path=str(target_file_batch))
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
+    sink.write(df)
 
 
 def rename_headers(df: pd.DataFrame) -> None:
@@ -129,31 +124,6 @@ def reorder_headers(df: pd.DataFrame) -> pd.DataFrame:
     return df
 
 
-def save_to_new_file(df, file_path) -> None:
-    df.to_csv(file_path, index=False)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    data_file = open(batch_file_path, "r")
-    if truncate_file:
-        target_file = open(target_file_path, "w+").close()
-    target_file = open(target_file_path, "a+")
-    if skip_header:
-        logging.info(
-            f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-        )
-        next(data_file)
-    else:
-        logging.info(f"Appending batch file {batch_file_path} to {target_file_path}")
-    target_file.write(data_file.read())
-    data_file.close()
-    target_file.close()
-    if os.path.exists(batch_file_path):
-        os.remove(batch_file_path)
-
-
 def download_file_json(
     source_url_json: str, source_file_json: str, source_file_csv: str
 ) -> None:
@@ -20,6 +20,9 @@ import pandas as pd
 import requests
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     source_url: str,
@@ -37,17 +40,11 @@ def main(
 
     chunksz = int(chunksize)
 
-    with pd.read_csv(
-        source_file, engine="python", encoding="utf-8", quotechar='"', chunksize=chunksz
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
+    chunks = iter_csv(source_file, encoding="utf-8", quotechar='"', chunksize=chunksz)
+    with CsvChunkSink(target_file, sep=",") as sink:
+        for chunk_number, df in enumerate(chunks):
             logging.info(f"Processing batch {chunk_number}")
-            target_file_batch = str(target_file).replace(
-                ".csv", "-" + str(chunk_number) + ".csv"
-            )
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
-            process_chunk(df, target_file_batch, target_file, (not chunk_number == 0))
+            process_chunk(df, sink)
 
     upload_file_to_gcs(target_file, target_gcs_bucket, target_gcs_path)
 
@@ -61,14 +58,11 @@ def download_file(source_url: str, source_file: pathlib.Path) -> None:
             f.write(chunk)
 
 
-def process_chunk(
-    df: pd.DataFrame, target_file_batch: str, target_file: str, skip_header: bool
-) -> None:
+def process_chunk(df: pd.DataFrame, sink: CsvChunkSink) -> None:
     df = rename_headers(df)
     df = trim_whitespace(df)
     df = reorder_headers(df)
-    save_to_new_file(df, file_path=str(target_file_batch))
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
+    sink.write(df)
 
 
 def rename_headers(df: pd.DataFrame) -> None:
@@ -122,31 +116,6 @@ def reorder_headers(df: pd.DataFrame) -> None:
     return df
 
 
-def save_to_new_file(df: pd.DataFrame, file_path) -> None:
-    df.to_csv(file_path, index=False)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    data_file = open(batch_file_path, "r")
-    if truncate_file:
-        target_file = open(target_file_path, "w+").close()
-    target_file = open(target_file_path, "a+")
-    if skip_header:
-        logging.info(
-            f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-        )
-        next(data_file)
-    else:
-        logging.info(f"Appending batch file {batch_file_path} to {target_file_path}")
-    target_file.write(data_file.read())
-    data_file.close()
-    target_file.close()
-    if os.path.exists(batch_file_path):
-        os.remove(batch_file_path)
-
-
 def upload_file_to_gcs(file_path: pathlib.Path, gcs_bucket: str, gcs_path: str) -> None:
     storage_client = storage.Client()
     bucket = storage_client.bucket(gcs_bucket)
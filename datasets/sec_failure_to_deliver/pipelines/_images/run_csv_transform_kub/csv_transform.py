@@ -24,6 +24,9 @@ from glob import glob
 import pandas as pd
 from google.cloud import storage
 
+from transform_runtime.files import CsvChunkSink, append_batch_file
+from transform_runtime.parsers import iter_csv
+
 
 def main(
     source_url: str,
@@ -48,10 +51,6 @@ def main(
     upload_file_to_gcs(target_file, target_gcs_bucket, target_gcs_path)
 
 
-def save_to_new_file(df, file_path):
-    df.to_csv(file_path, index=False)
-
-
 def download_file(source_url: str, source_file: pathlib.Path) -> None:
     logging.info(f"Downloading files at {source_url}")
     subprocess.check_call(
@@ -65,10 +64,12 @@ def concatenate_files(source_folder: str, source_file: str) -> None:
     for path, subdir, files in os.walk(source_folder + "/FTD"):
         for file in glob(os.path.join(path, "*.csv")):
             resolve_source_data_issues(path, file)
-            if file_number == 1:
-                append_file(file, source_file, True, True)
-            else:
-                append_file(file, source_file, False, False)
+            append_batch_file(
+                file,
+                source_file,
+                skip_header=(file_number > 1),
+                truncate_file=(file_number == 1),
+            )
             file_number = file_number + 1
 
 
@@ -99,9 +100,8 @@ def process_data(
     output_headers: typing.List[str],
 ) -> None:
     logging.info(f"Processing {source_file} started")
-    with pd.read_csv(
+    chunks = iter_csv(
         source_file,
-        engine="python",
         encoding="utf-8",
         quotechar='"',
         chunksize=int(chunksize),
@@ -109,22 +109,13 @@ def process_data(
         names=input_headers,
         skiprows=1,
         dtype=data_dtypes,
-    ) as reader:
-        for chunk_number, chunk in enumerate(reader):
+    )
+    with CsvChunkSink(target_file, sep=",") as sink:
+        for chunk_number, chunk in enumerate(chunks):
             logging.info(
                 f"Processing chunk #{chunk_number} of file {source_file} started"
             )
-            target_file_batch = str(target_file).replace(".csv", f"-{chunk_number}.csv")
-            df = pd.DataFrame()
-            df = pd.concat([df, chunk])
-            process_chunk(
-                df,
-                target_file_batch,
-                target_file,
-                chunk_number == 0,
-                chunk_number == 0,
-                output_headers,
-            )
+            process_chunk(chunk, sink, output_headers)
             logging.info(
                 f"Processing chunk #{chunk_number} of file {source_file} completed"
             )
@@ -132,48 +123,12 @@ def process_data(
 
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
-    include_header: bool,
-    truncate_file: bool,
+    sink: CsvChunkSink,
     output_headers: typing.List[str],
 ) -> None:
-    logging.info(f"Processing Batch {target_file_batch} started")
     df = search_and_replace_values(df)
     df = reorder_headers(df, output_headers)
-    save_to_new_file(df, file_path=str(target_file_batch))
-    append_file(target_file_batch, target_file, include_header, truncate_file, True)
-    logging.info(f"Processing Batch {target_file_batch} completed")
-
-
-def append_file(
-    batch_file_path: str,
-    target_file_path: str,
-    include_header: bool,
-    truncate_target_file: bool,
-    remove_source: bool = False,
-) -> None:
-    logging.info(
-        f"Appending file {batch_file_path} to file {target_file_path} with include_header={include_header} and truncate_target_file={truncate_target_file}"
-    )
-    with open(batch_file_path, "r") as data_file:
-        if truncate_target_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if not include_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} without header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with header"
-                )
-            target_file.write(data_file.read())
-            data_file.close()
-            target_file.close()
-            if os.path.exists(batch_file_path) and remove_source:
-                os.remove(batch_file_path)
+    sink.write(df)
 
 
 def search_and_replace_values(df: pd.DataFrame) -> pd.DataFrame:
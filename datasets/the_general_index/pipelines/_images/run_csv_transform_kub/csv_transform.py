@@ -12,13 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
-import csv
 import datetime
-import gzip
 import json
 import logging
 import os
 import pathlib
+import re
 import typing
 from urllib.parse import urlparse
 
@@ -27,6 +26,14 @@ import requests
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
+from transform_runtime import compression, metrics
+from transform_runtime.files import CsvChunkSink, read_csv_chunks
+from transform_runtime.lines import LineFilter
+from transform_runtime.resources import chunk_sizer
+
+# Characters outside the [:print:] class, other than tab, are stripped from rows.
+NON_PRINTABLE_CHARS = re.compile(r"[^\t\x20-\x7e\xa0-\U0010ffff]")
+
 
 def main(
     source_url: str,
@@ -93,15 +100,11 @@ def execute_pipeline(
     source_url_file = os.path.basename(urlparse(source_url).path)
     source_file_zipfile = f"{source_file_path}/{source_url_file}"
     download_file(source_url, source_file_zipfile)
-    gz_decompress(infile=source_file_zipfile, tofile=source_file, delete_zipfile=False)
-    remove_header_footer(
+    process_source_file(
+        source_zipfile=source_file_zipfile,
         source_file=source_file,
         header_rows=int(source_file_header_rows),
         footer_rows=int(source_file_footer_rows),
-    )
-    replace_double_quotes(source_file=source_file, replacement_char="'")
-    process_source_file(
-        source_file=source_file,
         target_file=target_file,
         chunksize=chunksize,
         input_headers=input_headers,
@@ -147,34 +150,11 @@ def execute_pipeline(
         )
 
 
-def gz_decompress(infile: str, tofile: str, delete_zipfile: bool = False) -> None:
-    logging.info(f"Decompressing {infile}")
-    with open(infile, "rb") as inf, open(tofile, "w", encoding="utf8") as tof:
-        decom_str = gzip.decompress(inf.read()).decode("utf-8")
-        tof.write(decom_str)
-    if delete_zipfile:
-        os.remove(infile)
-
-
-def remove_header_footer(source_file: str, header_rows: int, footer_rows: int) -> None:
-    logging.info(f"Cleansing data in {source_file}")
-    os.system(f"sed -i $'s/[^[:print:]\t]//g' {source_file} ")
-    logging.info(f"Removing header from {source_file}")
-    os.system(f"sed -i '1,{header_rows}d' {source_file} ")
-    logging.info(f"Removing trailer from {source_file}")
-    os.system(
-        f'sed -i "$(( $(wc -l <{source_file})-{footer_rows}+1 )),$ d" {source_file}'
-    )
-
-
-def replace_double_quotes(source_file: str, replacement_char: str) -> None:
-    cmd = f'sed -i "s/\\"/\'/g" {source_file} '
-    logging.info(cmd)
-    os.system(cmd)
-
-
 def process_source_file(
+    source_zipfile: str,
     source_file: str,
+    header_rows: int,
+    footer_rows: int,
     target_file: str,
     chunksize: str,
     input_headers: str,
@@ -183,97 +163,46 @@ def process_source_file(
     null_string_list: typing.List[str],
     source_url: str,
 ) -> None:
-    logging.info(f"Opening source file {source_file}")
-    csv.field_size_limit(512 << 10)
-    csv.register_dialect("TabDialect", quotechar='"', delimiter="\t", strict=True)
-    with open(
-        source_file,
-    ) as reader:
-        data = []
-        chunk_number = 1
-        for index, line in enumerate(csv.reader(reader, "TabDialect"), 0):
-            data.append(line)
-            if index % int(chunksize) == 0 and index > 0:
-                process_dataframe_chunk(
-                    data,
-                    input_headers,
-                    data_dtypes,
-                    target_file,
-                    chunk_number,
-                    datetime_list,
-                    null_string_list,
-                    source_file,
-                    source_url,
+    logging.info(f"Opening source file {source_zipfile}")
+    with compression.open_text(source_zipfile, newline="\n") as source:
+        lines = LineFilter(
+            header_rows=header_rows,
+            footer_rows=footer_rows,
+            substitutions=[(NON_PRINTABLE_CHARS, ""), ('"', "'")],
+        )
+        chunks = read_csv_chunks(
+            lines.reader(source),
+            names=input_headers,
+            chunksize=chunk_sizer(chunksize),
+            dtypes=data_dtypes,
+            sep="\t",
+        )
+        with CsvChunkSink(target_file, sep="|") as sink:
+            for df in chunks:
+                process_chunk(
+                    df=df,
+                    sink=sink,
+                    datetime_list=datetime_list,
+                    null_string_list=null_string_list,
+                    source_file=source_file,
+                    source_url=source_url,
                 )
-                data = []
-                chunk_number += 1
-
-        if data:
-            process_dataframe_chunk(
-                data,
-                input_headers,
-                data_dtypes,
-                target_file,
-                chunk_number,
-                datetime_list,
-                null_string_list,
-                source_file,
-                source_url,
-            )
-
-
-def process_dataframe_chunk(
-    data: typing.List[str],
-    input_headers: typing.List[str],
-    data_dtypes: dict,
-    target_file: str,
-    chunk_number: int,
-    datetime_list: typing.List[str],
-    null_string_list: typing.List[str],
-    source_file: str,
-    source_url: str,
-) -> None:
-    df = pd.DataFrame(data, columns=input_headers)
-    set_df_datatypes(df, data_dtypes)
-    target_file_batch = str(target_file).replace(
-        ".csv", "-" + str(chunk_number) + ".csv"
-    )
-    process_chunk(
-        df=df,
-        target_file_batch=target_file_batch,
-        target_file=target_file,
-        skip_header=(not chunk_number == 1),
-        datetime_list=datetime_list,
-        null_string_list=null_string_list,
-        source_file=source_file,
-        source_url=source_url,
-    )
-
-
-def set_df_datatypes(df: pd.DataFrame, data_dtypes: dict) -> pd.DataFrame:
-    logging.info("Setting data types")
-    for key, item in data_dtypes.items():
-        df[key] = df[key].astype(item)
-    return df
 
 
+@metrics.timed("transform")
 def process_chunk(
     df: pd.DataFrame,
-    target_file_batch: str,
-    target_file: str,
-    skip_header: bool,
+    sink: CsvChunkSink,
     datetime_list: typing.List[str],
     null_string_list: typing.List[str],
     source_file: str,
     source_url: str,
 ) -> None:
-    logging.info(f"Processing batch file {target_file_batch}")
+    logging.info(f"Processing batch of {len(df)} rows")
     df = remove_null_strings(df, null_string_list)
     df = add_metadata_columns(df, source_file, source_url)
     df = resolve_date_format(df, datetime_list)
-    save_to_new_file(df, file_path=str(target_file_batch), sep="|")
-    append_batch_file(target_file_batch, target_file, skip_header, not (skip_header))
-    logging.info(f"Processing batch file {target_file_batch} completed")
+    sink.write(df)
 
 
 def add_metadata_columns(
@@ -445,32 +374,6 @@ def create_table_schema(
     return schema
 
 
-def save_to_new_file(df: pd.DataFrame, file_path: str, sep: str = "|") -> None:
-    logging.info(f"Saving data to target file.. {file_path} ...")
-    df.to_csv(file_path, index=False, sep=sep)
-
-
-def append_batch_file(
-    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
-) -> None:
-    with open(batch_file_path, "r") as data_file:
-        if truncate_file:
-            target_file = open(target_file_path, "w+").close()
-        with open(target_file_path, "a+") as target_file:
-            if skip_header:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path} with skip header"
-                )
-                next(data_file)
-            else:
-                logging.info(
-                    f"Appending batch file {batch_file_path} to {target_file_path}"
-                )
-            target_file.write(data_file.read())
-            if os.path.exists(batch_file_path):
-                os.remove(batch_file_path)
-
-
 def upload_file_to_gcs(
     file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
 ) -> None:
@@ -11,6 +11,7 @@ import random
 import typing
 import uuid
 
+import fake_columnar
 import faker
 import numpy as np
 from google.cloud import storage
@@ -821,11 +822,25 @@ class GhostEvents(DataUtil):
 
 if __name__ == "__main__":
     logging.getLogger().setLevel(logging.INFO)
-    main(
-        num_of_users=int(os.environ["NUM_OF_USERS"]),
-        num_of_ghost_events=int(os.environ["NUM_OF_GHOST_EVENTS"]),
-        target_gcs_prefix=os.environ["TARGET_GCS_PREFIX"],
-        target_gcs_bucket=os.environ["TARGET_GCS_BUCKET"],
-        source_dir=os.environ["SOURCE_DIR"],
-        extraneous_headers=json.loads(os.environ["EXTRANEOUS_HEADERS"]),
-    )
+    # "columnar" draws whole columns with NumPy and writes parquet, see
+    # fake_columnar.py; "rows" builds one dataclass per row and writes CSV.
+    if os.environ.get("GENERATOR_MODE", "rows") == "columnar":
+        fake_columnar.main(
+            num_of_users=int(os.environ["NUM_OF_USERS"]),
+            num_of_ghost_events=int(os.environ["NUM_OF_GHOST_EVENTS"]),
+            target_gcs_prefix=os.environ["TARGET_GCS_PREFIX"],
+            target_gcs_bucket=os.environ["TARGET_GCS_BUCKET"],
+            source_dir=os.environ["SOURCE_DIR"],
+            shard_size=int(os.environ.get("SHARD_SIZE", "50000")),
+            num_of_workers=int(os.environ.get("NUM_OF_WORKERS", "1")),
+            seed=int(os.environ.get("RANDOM_SEED") or 0) or None,
+        )
+    else:
+        main(
+            num_of_users=int(os.environ["NUM_OF_USERS"]),
+            num_of_ghost_events=int(os.environ["NUM_OF_GHOST_EVENTS"]),
+            target_gcs_prefix=os.environ["TARGET_GCS_PREFIX"],
+            target_gcs_bucket=os.environ["TARGET_GCS_BUCKET"],
+            source_dir=os.environ["SOURCE_DIR"],
+            extraneous_headers=json.loads(os.environ["EXTRANEOUS_HEADERS"]),
+        )
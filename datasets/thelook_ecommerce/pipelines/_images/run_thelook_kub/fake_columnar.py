@@ -0,0 +1,878 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Columnar version of the generator in fake.py.
+
+Instead of building every user, order, order item and event as a dataclass,
+each batch of users is generated a column at a time with NumPy's `Generator`
+and assembled into Arrow tables. Categorical draws (names, locations,
+products, statuses, ...) go through cumulative weight tables that are built
+once, so each draw is a single `searchsorted` over the whole column. The
+distributions follow those of fake.py.
+
+Users are split into shards of a fixed size. Each shard is generated in a
+worker process from its own random streams, derived from the run seed and
+the shard index, and written as one parquet file per table. The files are
+uploaded from a thread pool while later shards are still being generated.
+Only a few shards are held at any time, so memory use does not grow with
+the number of users.
+"""
+
+import concurrent.futures
+import datetime
+import logging
+import os
+import tempfile
+import typing
+
+import numpy as np
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.csv as pv
+import pyarrow.parquet as pq
+from faker.providers.address.en_US import Provider as AddressProvider
+from faker.providers.internet import Provider as InternetProvider
+from faker.providers.person.en_US import Provider as PersonProvider
+from google.cloud import storage
+
+MICROSECONDS_IN_SECOND = 1000000
+MICROSECONDS_IN_MINUTE = 60 * MICROSECONDS_IN_SECOND
+MICROSECONDS_IN_DAY = 1440 * MICROSECONDS_IN_MINUTE
+MINUTES_IN_HOUR = 60
+MINUTES_IN_DAY = 1440
+MIN_AGE = 12
+MAX_AGE = 71
+
+TIMESTAMP = pa.timestamp("us", tz="UTC")
+# Shard files of the five tables uploaded at the same time.
+UPLOAD_THREADS = 8
+TABLE_NAMES = ["users", "orders", "order_items", "events", "inventory_items"]
+SCHEMAS = {
+    "users": pa.schema(
+        [
+            ("id", pa.int64()),
+            ("first_name", pa.string()),
+            ("last_name", pa.string()),
+            ("email", pa.string()),
+            ("age", pa.int64()),
+            ("gender", pa.string()),
+            ("state", pa.string()),
+            ("street_address", pa.string()),
+            ("postal_code", pa.string()),
+            ("city", pa.string()),
+            ("country", pa.string()),
+            ("latitude", pa.float64()),
+            ("longitude", pa.float64()),
+            ("traffic_source", pa.string()),
+            ("created_at", TIMESTAMP),
+        ]
+    ),
+    "orders": pa.schema(
+        [
+            ("order_id", pa.int64()),
+            ("user_id", pa.int64()),
+            ("status", pa.string()),
+            ("gender", pa.string()),
+            ("created_at", TIMESTAMP),
+            ("returned_at", TIMESTAMP),
+            ("shipped_at", TIMESTAMP),
+            ("delivered_at", TIMESTAMP),
+            ("num_of_item", pa.int64()),
+        ]
+    ),
+    "order_items": pa.schema(
+        [
+            ("id", pa.int64()),
+            ("order_id", pa.int64()),
+            ("user_id", pa.int64()),
+            ("product_id", pa.int64()),
+            ("inventory_item_id", pa.int64()),
+            ("status", pa.string()),
+            ("created_at", TIMESTAMP),
+            ("shipped_at", TIMESTAMP),
+            ("delivered_at", TIMESTAMP),
+            ("returned_at", TIMESTAMP),
+            ("sale_price", pa.float64()),
+        ]
+    ),
+    "events": pa.schema(
+        [
+            ("id", pa.int64()),
+            ("user_id", pa.int64()),
+            ("sequence_number", pa.int64()),
+            ("session_id", pa.string()),
+            ("created_at", TIMESTAMP),
+            ("ip_address", pa.string()),
+            ("city", pa.string()),
+            ("state", pa.string()),
+            ("postal_code", pa.string()),
+            ("browser", pa.string()),
+            ("traffic_source", pa.string()),
+            ("uri", pa.string()),
+            ("event_type", pa.string()),
+        ]
+    ),
+    "inventory_items": pa.schema(
+        [
+            ("id", pa.int64()),
+            ("product_id", pa.int64()),
+            ("created_at", TIMESTAMP),
+            ("sold_at", TIMESTAMP),
+            ("cost", pa.float64()),
+            ("product_category", pa.string()),
+            ("product_name", pa.string()),
+            ("product_brand", pa.string()),
+            ("product_retail_price", pa.float64()),
+            ("product_department", pa.string()),
+            ("product_sku", pa.string()),
+            ("product_distribution_center_id", pa.int64()),
+        ]
+    ),
+}
+
+EVENT_TYPES = ["home", "department", "product", "cart", "purchase", "cancel"]
+HOME, DEPARTMENT, PRODUCT, CART, PURCHASE, CANCEL = range(len(EVENT_TYPES))
+# Event flows of a ghost session: cancelled browsing, abandoned cart, viewed
+# product and viewed department. Unused slots are -1.
+GHOST_EVENT_FLOWS = np.array(
+    [
+        [PRODUCT, CART, CANCEL],
+        [DEPARTMENT, PRODUCT, CART],
+        [PRODUCT, -1, -1],
+        [DEPARTMENT, PRODUCT, -1],
+    ]
+)
+GHOST_EVENT_FLOW_LENGTHS = (GHOST_EVENT_FLOWS >= 0).sum(axis=1)
+
+
+class WeightTable:
+    """Cumulative weights of a population, for drawing a whole column at once."""
+
+    def __init__(
+        self,
+        population: typing.Sequence[typing.Any],
+        weights: typing.Optional[typing.Sequence[float]] = None,
+    ) -> None:
+        self.population = pa.array(population)
+        if weights is None:
+            weights = np.ones(len(population))
+        self.cumulative = np.cumsum(np.asarray(weights, dtype=np.float64))
+
+    def sample_index(self, rng: np.random.Generator, size: int) -> np.ndarray:
+        draws = rng.random(size) * self.cumulative[-1]
+        return np.searchsorted(self.cumulative, draws, side="right")
+
+    def sample(self, rng: np.random.Generator, size: int) -> pa.Array:
+        return self.population.take(self.sample_index(rng, size))
+
+
+def weight_table(elements: typing.Union[typing.Mapping, typing.Sequence]):
+    """Builds a table from a Faker provider list, weighted when it is a dict."""
+    if isinstance(elements, typing.Mapping):
+        return WeightTable(list(elements.keys()), list(elements.values()))
+    return WeightTable(list(elements))
+
+
+GENDERS = WeightTable(["M", "F"])
+USER_TRAFFIC_SOURCES = WeightTable(
+    ["Organic", "Facebook", "Search", "Email", "Display"],
+    [0.15, 0.06, 0.7, 0.05, 0.04],
+)
+RECENT_USERS = WeightTable([False, True], [0.975, 0.025])
+ORDERS_PER_USER = WeightTable([0, 1, 2, 3, 4], [0.2, 0.5, 0.2, 0.05, 0.05])
+ORDER_STATUSES = WeightTable(
+    ["Complete", "Cancelled", "Returned", "Processing", "Shipped"],
+    [0.25, 0.15, 0.1, 0.2, 0.3],
+)
+ITEMS_PER_ORDER = WeightTable([1, 2, 3, 4], [0.7, 0.2, 0.05, 0.05])
+UNSOLD_ITEMS_PER_ITEM = WeightTable([1, 2, 3], [0.5, 0.3, 0.2])
+BROWSERS = WeightTable(
+    ["IE", "Chrome", "Safari", "Firefox", "Other"], [0.05, 0.5, 0.2, 0.2, 0.05]
+)
+EVENT_TRAFFIC_SOURCES = WeightTable(
+    ["Email", "Adwords", "Organic", "YouTube", "Facebook"],
+    [0.45, 0.3, 0.05, 0.1, 0.1],
+)
+MALE_FIRST_NAMES = weight_table(PersonProvider.first_names_male)
+FEMALE_FIRST_NAMES = weight_table(PersonProvider.first_names_female)
+LAST_NAMES = weight_table(PersonProvider.last_names)
+STREET_SUFFIXES = weight_table(AddressProvider.street_suffixes)
+SECONDARY_ADDRESS_PREFIXES = WeightTable(["Apt. ", "Suite "])
+DOMAIN_NAMES = weight_table(InternetProvider.safe_domain_names)
+
+# Hex digits of every byte value, for formatting UUIDs without a Python loop.
+_HEX_PAIRS = np.array([list(f"{i:02x}".encode()) for i in range(256)], np.uint8)
+_UUID_DIGIT_COLUMNS = np.array(
+    [i for i in range(36) if i not in (8, 13, 18, 23)], dtype=np.intp
+)
+
+
+class Catalog:
+    """Locations and products, with the weight tables to draw them from."""
+
+    def __init__(self, source_dir: str) -> None:
+        self.locations = pv.read_csv(
+            f"{source_dir}/world_pop.csv",
+            convert_options=pv.ConvertOptions(
+                column_types={"postal_code": pa.string()}
+            ),
+        )
+        self.location_weights = WeightTable(
+            np.arange(self.locations.num_rows),
+            self.locations.column("population").to_numpy(),
+        )
+        self.products = pv.read_csv(
+            f"{source_dir}/products.csv",
+            convert_options=pv.ConvertOptions(
+                column_types={
+                    "id": pa.int64(),
+                    "cost": pa.float64(),
+                    "retail_price": pa.float64(),
+                    "distribution_center_id": pa.int64(),
+                    "sku": pa.string(),
+                }
+            ),
+        )
+        department = self.products.column("department").to_numpy(zero_copy_only=False)
+        self.products_by_gender = {
+            "M": WeightTable(np.flatnonzero(department == "Men")),
+            "F": WeightTable(np.flatnonzero(department == "Women")),
+        }
+        # One lookup array for every event URI: the fixed ones for each event
+        # type, then the product pages, then the department pages.
+        product_uris = pc.binary_join_element_wise(
+            "/product/", pc.cast(self.products.column("id"), pa.string()), ""
+        )
+        department_uris = pc.binary_join_element_wise(
+            "/department/",
+            pc.utf8_lower(self.products.column("department")),
+            "/category/",
+            _without_spaces(pc.utf8_lower(self.products.column("category"))),
+            "/brand/",
+            _without_spaces(pc.utf8_lower(self.products.column("brand"))),
+            "",
+        )
+        self.uris = pa.concat_arrays(
+            [pa.array([f"/{event}" for event in EVENT_TYPES])]
+            + product_uris.chunks
+            + department_uris.chunks
+        )
+
+    def sample_products(
+        self, rng: np.random.Generator, genders: pa.Array
+    ) -> np.ndarray:
+        is_male = pc.equal(genders, "M").to_numpy(zero_copy_only=False)
+        male = self.products_by_gender["M"].sample(rng, len(genders)).to_numpy()
+        female = self.products_by_gender["F"].sample(rng, len(genders)).to_numpy()
+        return np.where(is_male, male, female)
+
+    def event_uris(self, event_types: np.ndarray, products: np.ndarray) -> pa.Array:
+        num_products = self.products.num_rows
+        index = event_types.copy()
+        is_product = event_types == PRODUCT
+        is_department = event_types == DEPARTMENT
+        index[is_product] = len(EVENT_TYPES) + products[is_product]
+        index[is_department] = len(EVENT_TYPES) + num_products + products[is_department]
+        return self.uris.take(index)
+
+
+class Layout(typing.NamedTuple):
+    """The draws of a shard that decide how many rows each table gets.
+
+    They come from a random stream of their own, so the row counts of every
+    shard, and with them the first id of each, can be worked out up front
+    without generating the rows.
+    """
+
+    orders_per_user: np.ndarray
+    items_per_order: np.ndarray
+    unsold_items_per_item: np.ndarray
+    ghost_event_flows: np.ndarray
+
+    @classmethod
+    def draw(
+        cls, rng: np.random.Generator, num_of_users: int, num_of_ghost_events: int
+    ) -> "Layout":
+        orders_per_user = ORDERS_PER_USER.sample(rng, num_of_users).to_numpy()
+        items_per_order = ITEMS_PER_ORDER.sample(
+            rng, int(orders_per_user.sum())
+        ).to_numpy()
+        unsold_items_per_item = UNSOLD_ITEMS_PER_ITEM.sample(
+            rng, int(items_per_order.sum())
+        ).to_numpy()
+        ghost_event_flows = rng.integers(
+            0, len(GHOST_EVENT_FLOWS), num_of_users * num_of_ghost_events
+        )
+        return cls(
+            orders_per_user, items_per_order, unsold_items_per_item, ghost_event_flows
+        )
+
+    def events_per_item(self) -> np.ndarray:
+        # A single item order is browsed from the home page; otherwise every
+        # item of the order gets a department, product and cart event per item
+        # in the order, then one purchase.
+        items_in_order = np.repeat(self.items_per_order, self.items_per_order)
+        return np.where(items_in_order == 1, 5, 3 * items_in_order + 1)
+
+    def table_sizes(self) -> typing.Dict[str, int]:
+        return {
+            "users": len(self.orders_per_user),
+            "orders": int(self.orders_per_user.sum()),
+            "order_items": int(self.items_per_order.sum()),
+            "events": int(self.events_per_item().sum())
+            + int(GHOST_EVENT_FLOW_LENGTHS[self.ghost_event_flows].sum()),
+            "inventory_items": int((1 + self.unsold_items_per_item).sum()),
+        }
+
+
+class Shard(typing.NamedTuple):
+    """A range of users generated and written on its own."""
+
+    index: int
+    num_of_users: int
+    num_of_ghost_events: int
+    first_ids: typing.Dict[str, int]
+
+
+def shard_rngs(
+    seed: int, shard_index: int
+) -> typing.Tuple[np.random.Generator, np.random.Generator]:
+    """Returns the layout and value streams of a shard, derived from the run seed."""
+    return tuple(
+        np.random.default_rng(np.random.SeedSequence(seed, spawn_key=(shard_index, i)))
+        for i in range(2)
+    )
+
+
+def plan_shards(
+    seed: int, num_of_users: int, num_of_ghost_events: int, shard_size: int
+) -> typing.List[Shard]:
+    """Splits the users into shards and numbers each shard's rows after the last's."""
+    shards = []
+    next_ids = {name: 1 for name in TABLE_NAMES}
+    for index, first_user in enumerate(range(0, num_of_users, shard_size)):
+        size = min(shard_size, num_of_users - first_user)
+        shards.append(Shard(index, size, num_of_ghost_events, dict(next_ids)))
+        layout_rng, _ = shard_rngs(seed, index)
+        sizes = Layout.draw(layout_rng, size, num_of_ghost_events).table_sizes()
+        for name in TABLE_NAMES:
+            next_ids[name] += sizes[name]
+    return shards
+
+
+class Generator:
+    """Generates the five tables for one shard of users.
+
+    The shard's rows depend only on the run seed and the shard index, so
+    shards can be generated in any order and in separate processes.
+    """
+
+    def __init__(
+        self,
+        catalog: Catalog,
+        seed: int,
+        shard: Shard,
+        now: typing.Optional[datetime.datetime] = None,
+    ) -> None:
+        self.catalog = catalog
+        self.shard = shard
+        layout_rng, self.rng = shard_rngs(seed, shard.index)
+        self.layout = Layout.draw(
+            layout_rng, shard.num_of_users, shard.num_of_ghost_events
+        )
+        now = now or datetime.datetime.now(datetime.timezone.utc)
+        self.now = _to_microseconds(now)
+        self.next_ids = dict(shard.first_ids)
+
+    def generate(self) -> typing.Dict[str, pa.Table]:
+        users, user_created_at = self._users(self.shard.num_of_users)
+        orders, order_users, order_created_at = self._orders(users, user_created_at)
+        order_items, item_events, inventory_items = self._order_items(
+            users, orders, order_users, order_created_at
+        )
+        ghost_events = self._ghost_events(len(self.layout.ghost_event_flows))
+        return {
+            "users": users,
+            "orders": orders,
+            "order_items": order_items,
+            "events": self._number_events(
+                pa.concat_tables([item_events, ghost_events])
+            ),
+            "inventory_items": inventory_items,
+        }
+
+    def _users(self, size: int) -> typing.Tuple[pa.Table, np.ndarray]:
+        rng = self.rng
+        gender = GENDERS.sample(rng, size)
+        first_name = pc.if_else(
+            pc.equal(gender, "M"),
+            MALE_FIRST_NAMES.sample(rng, size),
+            FEMALE_FIRST_NAMES.sample(rng, size),
+        )
+        last_name = LAST_NAMES.sample(rng, size)
+        location = self._locations(size)
+        recent = RECENT_USERS.sample(rng, size).to_numpy(zero_copy_only=False)
+        start = np.where(
+            recent,
+            self.now - 7 * MICROSECONDS_IN_DAY,
+            _to_microseconds(datetime.datetime(2019, 1, 1)),
+        )
+        created_at = self._created_at(start)
+        columns = {
+            "id": self._ids("users", size),
+            "first_name": first_name,
+            "last_name": last_name,
+            "email": pc.binary_join_element_wise(
+                pc.utf8_lower(first_name),
+                pc.utf8_lower(last_name),
+                "@",
+                DOMAIN_NAMES.sample(rng, size),
+                "",
+            ),
+            "age": rng.integers(MIN_AGE, MAX_AGE, size),
+            "gender": gender,
+            "state": location.column("state"),
+            "street_address": self._street_addresses(size),
+            "postal_code": location.column("postal_code"),
+            "city": location.column("city"),
+            "country": location.column("country"),
+            "latitude": location.column("latitude"),
+            "longitude": location.column("longitude"),
+            "traffic_source": USER_TRAFFIC_SOURCES.sample(rng, size),
+            "created_at": _timestamps(created_at),
+        }
+        return _table("users", columns), created_at
+
+    def _orders(
+        self, users: pa.Table, user_created_at: np.ndarray
+    ) -> typing.Tuple[pa.Table, np.ndarray, np.ndarray]:
+        rng = self.rng
+        order_users, _ = _expand(self.layout.orders_per_user)
+        size = len(order_users)
+        status = ORDER_STATUSES.sample(rng, size)
+        status_values = status.to_numpy(zero_copy_only=False)
+        created_at = self._child_created_at(user_created_at[order_users])
+        # Shipped 0-3 days after the order, delivered 0-5 days after shipping
+        # and returned 0-3 days after delivery, depending on the status.
+        shipped_at = created_at + self._minutes(MINUTES_IN_DAY * 3, size)
+        delivered_at = shipped_at + self._minutes(MINUTES_IN_DAY * 5, size)
+        returned_at = delivered_at + self._minutes(MINUTES_IN_DAY * 3, size)
+        is_shipped = np.isin(status_values, ["Returned", "Complete", "Shipped"])
+        is_delivered = np.isin(status_values, ["Returned", "Complete"])
+        is_returned = status_values == "Returned"
+        columns = {
+            "order_id": self._ids("orders", size),
+            "user_id": users.column("id").take(order_users),
+            "status": status,
+            "gender": users.column("gender").take(order_users),
+            "created_at": _timestamps(created_at),
+            "returned_at": _timestamps(returned_at, is_returned),
+            "shipped_at": _timestamps(shipped_at, is_shipped),
+            "delivered_at": _timestamps(delivered_at, is_delivered),
+            "num_of_item": self.layout.items_per_order,
+        }
+        return _table("orders", columns), order_users, created_at
+
+    def _order_items(
+        self,
+        users: pa.Table,
+        orders: pa.Table,
+        order_users: np.ndarray,
+        order_created_at: np.ndarray,
+    ) -> typing.Tuple[pa.Table, pa.Table, pa.Table]:
+        rng = self.rng
+        num_of_item = orders.column("num_of_item").to_numpy()
+        item_orders, _ = _expand(num_of_item)
+        item_users = order_users[item_orders]
+        size = len(item_orders)
+        products = self.catalog.sample_products(
+            rng, orders.column("gender").take(item_orders)
+        )
+        # Each item was put in the cart within the 4 hours before the order.
+        cart_created_at = order_created_at[item_orders] - rng.integers(
+            0, 240 * MICROSECONDS_IN_MINUTE, size
+        )
+
+        items_in_order = num_of_item[item_orders]
+        single = items_in_order == 1
+        event_items, position = _expand(self.layout.events_per_item())
+        event_single = single[event_items]
+        is_purchase = position == np.where(
+            event_single, 4, 3 * items_in_order[event_items]
+        )
+        event_types = np.where(
+            event_single,
+            position,
+            np.where(is_purchase, PURCHASE, DEPARTMENT + position % 3),
+        )
+        increments = rng.integers(0, 180 * MICROSECONDS_IN_SECOND, len(event_items))
+        increments[position == 0] = 0
+        # Multiple item orders are purchased up to 4 days after the last cart event.
+        late_purchase = is_purchase & ~event_single
+        increments[late_purchase] += (
+            rng.integers(0, 5, late_purchase.sum()) * MICROSECONDS_IN_DAY
+        )
+        event_created_at = cart_created_at[event_items] + _running_total(
+            increments, event_items
+        )
+        # The order item is logged at the time of its purchase event.
+        created_at = event_created_at[is_purchase]
+
+        session_id = _uuids(rng, size)
+        ip_address = _ip_addresses(rng, size)
+        browser = BROWSERS.sample(rng, size)
+        traffic_source = EVENT_TRAFFIC_SOURCES.sample(rng, size)
+        event_users = item_users[event_items]
+        events = _table(
+            "events",
+            {
+                "id": np.zeros(len(event_items), dtype=np.int64),
+                "user_id": users.column("id").take(event_users),
+                "sequence_number": position + 1,
+                "session_id": session_id.take(event_items),
+                "created_at": _timestamps(event_created_at),
+                "ip_address": ip_address.take(event_items),
+                "city": users.column("city").take(event_users),
+                "state": users.column("state").take(event_users),
+                "postal_code": users.column("postal_code").take(event_users),
+                "browser": browser.take(event_items),
+                "traffic_source": traffic_source.take(event_items),
+                "uri": self.catalog.event_uris(event_types, products[event_items]),
+                "event_type": pa.array(EVENT_TYPES).take(event_types),
+            },
+        )
+
+        # Every sold item comes with one to three unsold items of the same
+        # product; the sold one takes the first id of the block.
+        block_sizes = 1 + self.layout.unsold_items_per_item
+        inventory_ids = self._ids("inventory_items", int(block_sizes.sum()))
+        inventory_items = self._inventory_items(
+            inventory_ids, block_sizes, products, created_at
+        )
+        item_inventory_ids = inventory_ids[np.cumsum(block_sizes) - block_sizes]
+
+        order_columns = {
+            name: orders.column(name).take(item_orders)
+            for name in ("status", "shipped_at", "delivered_at", "returned_at")
+        }
+        columns = {
+            "id": self._ids("order_items", size),
+            "order_id": orders.column("order_id").take(item_orders),
+            "user_id": orders.column("user_id").take(item_orders),
+            "product_id": self.catalog.products.column("id").take(products),
+            "inventory_item_id": item_inventory_ids,
+            "created_at": _timestamps(created_at),
+            "sale_price": self.catalog.products.column("retail_price").take(products),
+            **order_columns,
+        }
+        return _table("order_items", columns), events, inventory_items
+
+    def _inventory_items(
+        self,
+        inventory_ids: np.ndarray,
+        block_sizes: np.ndarray,
+        products: np.ndarray,
+        sold_at: np.ndarray,
+    ) -> pa.Table:
+        inventory_items, position = _expand(block_sizes)
+        size = len(inventory_items)
+        is_sold = position == 0
+        # Sold items were in stock up to 60 days before the sale; unsold ones
+        # arrived some time since 2020.
+        created_at = np.where(
+            is_sold,
+            sold_at[inventory_items] - self._minutes(86400, size),
+            self._created_at(
+                np.full(size, _to_microseconds(datetime.datetime(2020, 1, 1)))
+            ),
+        )
+        product_rows = self.catalog.products.take(products[inventory_items])
+        columns = {
+            "id": inventory_ids,
+            "product_id": product_rows.column("id"),
+            "created_at": _timestamps(created_at),
+            "sold_at": _timestamps(sold_at[inventory_items], is_sold),
+            "cost": product_rows.column("cost"),
+            "product_category": product_rows.column("category"),
+            "product_name": product_rows.column("name"),
+            "product_brand": product_rows.column("brand"),
+            "product_retail_price": product_rows.column("retail_price"),
+            "product_department": product_rows.column("department"),
+            "product_sku": product_rows.column("sku"),
+            "product_distribution_center_id": product_rows.column(
+                "distribution_center_id"
+            ),
+        }
+        return _table("inventory_items", columns)
+
+    def _ghost_events(self, size: int) -> pa.Table:
+        """Browsing sessions of visitors who never signed up."""
+        rng = self.rng
+        location = self._locations(size)
+        products = self.catalog.sample_products(rng, GENDERS.sample(rng, size))
+        flows = self.layout.ghost_event_flows
+        sessions, position = _expand(GHOST_EVENT_FLOW_LENGTHS[flows])
+        event_types = GHOST_EVENT_FLOWS[flows[sessions], position]
+        start = self._created_at(
+            np.full(size, _to_microseconds(datetime.datetime(2019, 1, 1)))
+        )
+        # Each event happens up to half an hour after the one before.
+        increments = self._minutes(int(MINUTES_IN_HOUR * 0.5), len(sessions))
+        created_at = start[sessions] + _running_total(increments, sessions)
+        columns = {
+            "id": np.zeros(len(sessions), dtype=np.int64),
+            "user_id": pa.nulls(len(sessions), pa.int64()),
+            "sequence_number": position + 1,
+            "session_id": _uuids(rng, size).take(sessions),
+            "created_at": _timestamps(created_at),
+            "ip_address": _ip_addresses(rng, size).take(sessions),
+            "city": location.column("city").take(sessions),
+            "state": location.column("state").take(sessions),
+            "postal_code": location.column("postal_code").take(sessions),
+            "browser": BROWSERS.sample(rng, size).take(sessions),
+            "traffic_source": EVENT_TRAFFIC_SOURCES.sample(rng, size).take(sessions),
+            "uri": self.catalog.event_uris(event_types, products[sessions]),
+            "event_type": pa.array(EVENT_TYPES).take(event_types),
+        }
+        return _table("events", columns)
+
+    def _number_events(self, events: pa.Table) -> pa.Table:
+        ids = pa.array(self._ids("events", events.num_rows))
+        return events.set_column(0, "id", ids)
+
+    def _ids(self, table_name: str, size: int) -> np.ndarray:
+        first = self.next_ids[table_name]
+        self.next_ids[table_name] = first + size
+        return np.arange(first, first + size, dtype=np.int64)
+
+    def _locations(self, size: int) -> pa.Table:
+        return self.catalog.locations.take(
+            self.catalog.location_weights.sample_index(self.rng, size)
+        )
+
+    def _street_addresses(self, size: int) -> pa.Array:
+        # "<building number> <first or last name> <suffix>", and half of the
+        # time an apartment or suite, as Faker's en_US street_address.
+        rng = self.rng
+        digits = rng.integers(3, 6, size)
+        building_number = pc.cast(
+            pa.array(rng.integers(10 ** (digits - 1), 10**digits)), pa.string()
+        )
+        street_name = pc.if_else(
+            pa.array(rng.random(size) < 0.5),
+            MALE_FIRST_NAMES.sample(rng, size),
+            LAST_NAMES.sample(rng, size),
+        )
+        street = pc.binary_join_element_wise(
+            building_number, street_name, STREET_SUFFIXES.sample(rng, size), " "
+        )
+        secondary = pc.binary_join_element_wise(
+            SECONDARY_ADDRESS_PREFIXES.sample(rng, size),
+            pc.cast(pa.array(rng.integers(100, 1000, size)), pa.string()),
+            "",
+        )
+        return pc.if_else(
+            pa.array(rng.random(size) < 0.5),
+            pc.binary_join_element_wise(street, secondary, " "),
+            street,
+        )
+
+    def _created_at(self, start: np.ndarray) -> np.ndarray:
+        """Random times between each start and now, as fake.created_at."""
+        days = self._random_days(start)
+        return start + days + self._minutes(MINUTES_IN_HOUR * 19, len(start))
+
+    def _child_created_at(self, parent_created_at: np.ndarray) -> np.ndarray:
+        """Random days after each parent, as DataUtil.child_created_at."""
+        return parent_created_at + self._random_days(parent_created_at)
+
+    def _random_days(self, start: np.ndarray) -> np.ndarray:
+        days_between = np.maximum((self.now - start) // MICROSECONDS_IN_DAY, 2)
+        return self.rng.integers(1, days_between) * MICROSECONDS_IN_DAY
+
+    def _minutes(self, upper: int, size: int) -> np.ndarray:
+        return self.rng.integers(0, upper, size) * MICROSECONDS_IN_MINUTE
+
+
+def main(
+    num_of_users: int,
+    num_of_ghost_events: int,
+    target_gcs_prefix: str,
+    target_gcs_bucket: str,
+    source_dir: str,
+    shard_size: int,
+    num_of_workers: int,
+    seed: typing.Optional[int] = None,
+) -> None:
+    if seed is None:
+        seed = np.random.SeedSequence().entropy
+    logging.info(
+        f"generating {num_of_users} users in shards of {shard_size} users with"
+        f" seed {seed}"
+    )
+    now = datetime.datetime.now(datetime.timezone.utc)
+    shards = plan_shards(seed, num_of_users, num_of_ghost_events, shard_size)
+    bucket = storage.Client().bucket(target_gcs_bucket)
+    for name in TABLE_NAMES:
+        # Drop the shards of earlier runs, which may have had more of them.
+        for blob in bucket.list_blobs(prefix=f"{target_gcs_prefix}/{name}/"):
+            blob.delete()
+
+    with tempfile.TemporaryDirectory() as output_dir:
+        workers = concurrent.futures.ProcessPoolExecutor(
+            num_of_workers, initializer=_start_worker, initargs=(source_dir, seed, now)
+        )
+        uploaders = concurrent.futures.ThreadPoolExecutor(UPLOAD_THREADS)
+        with workers, uploaders:
+
+            def upload(generated: concurrent.futures.Future) -> typing.Set:
+                return {
+                    uploaders.submit(
+                        upload_shard_file,
+                        bucket,
+                        f"{target_gcs_prefix}/{name}/{os.path.basename(path)}",
+                        path,
+                    )
+                    for name, path in generated.result().items()
+                }
+
+            # Shards that are being generated or still have files to upload
+            # are capped, which keeps memory and local disk use flat.
+            max_pending = 2 * num_of_workers
+            generating, uploading = set(), set()
+            for shard in shards:
+                while (
+                    len(generating) + len(uploading) / len(TABLE_NAMES) >= max_pending
+                ):
+                    done, _ = concurrent.futures.wait(
+                        generating | uploading,
+                        return_when=concurrent.futures.FIRST_COMPLETED,
+                    )
+                    for future in done & generating:
+                        uploading |= upload(future)
+                    for future in done & uploading:
+                        future.result()
+                    generating -= done
+                    uploading -= done
+                generating.add(workers.submit(write_shard, shard, output_dir))
+            for future in concurrent.futures.as_completed(generating):
+                uploading |= upload(future)
+            for future in concurrent.futures.as_completed(uploading):
+                future.result()
+
+    for file in ["products.csv", "distribution_centers.csv"]:
+        upload_to_bucket(
+            target_gcs_bucket, f"{target_gcs_prefix}/{file}", f"{source_dir}/{file}"
+        )
+
+
+def write_shard(shard: Shard, output_dir: str) -> typing.Dict[str, str]:
+    """Generates a shard in a worker process and writes one parquet file per table."""
+    logging.info(f"generating shard {shard.index}: {shard.num_of_users} users")
+    tables = Generator(_worker_catalog, _worker_seed, shard, _worker_now).generate()
+    files = {}
+    for name, table in tables.items():
+        files[name] = f"{output_dir}/{name}-{shard.index:05d}.parquet"
+        pq.write_table(table, files[name])
+    return files
+
+
+def upload_shard_file(bucket: storage.Bucket, target_object: str, path: str) -> None:
+    logging.info(f"uploading output file to... gs://{bucket.name}/{target_object}")
+    bucket.blob(target_object).upload_from_filename(path)
+    os.remove(path)
+
+
+def upload_to_bucket(target_bucket: str, target_object: str, source_file: str) -> None:
+    logging.info(f"uploading output file to... gs://{target_bucket}/{target_object}")
+    bucket = storage.Client().bucket(target_bucket)
+    bucket.blob(target_object).upload_from_filename(source_file)
+
+
+_worker_catalog: typing.Optional[Catalog] = None
+_worker_seed: typing.Optional[int] = None
+_worker_now: typing.Optional[datetime.datetime] = None
+
+
+def _start_worker(source_dir: str, seed: int, now: datetime.datetime) -> None:
+    global _worker_catalog, _worker_seed, _worker_now
+    logging.getLogger().setLevel(logging.INFO)
+    _worker_catalog = Catalog(source_dir)
+    _worker_seed = seed
+    _worker_now = now
+
+
+def _table(name: str, columns: typing.Dict[str, typing.Any]) -> pa.Table:
+    schema = SCHEMAS[name]
+    return pa.Table.from_arrays(
+        [_array(columns[field.name], field.type) for field in schema], schema=schema
+    )
+
+
+def _array(values: typing.Any, type: pa.DataType) -> pa.Array:
+    if isinstance(values, pa.ChunkedArray):
+        values = values.combine_chunks()
+    if isinstance(values, pa.Array):
+        return values if values.type == type else values.cast(type)
+    return pa.array(values, type=type)
+
+
+def _timestamps(
+    values: np.ndarray, valid: typing.Optional[np.ndarray] = None
+) -> pa.Array:
+    mask = None if valid is None else ~valid
+    return pa.array(values, type=TIMESTAMP, mask=mask)
+
+
+def _to_microseconds(value: datetime.datetime) -> int:
+    if value.tzinfo is None:
+        value = value.replace(tzinfo=datetime.timezone.utc)
+    return int(value.timestamp() * MICROSECONDS_IN_SECOND)
+
+
+def _expand(lengths: np.ndarray) -> typing.Tuple[np.ndarray, np.ndarray]:
+    """Returns the parent index and the position within it of every child row."""
+    lengths = np.asarray(lengths, dtype=np.int64)
+    parents = np.repeat(np.arange(len(lengths)), lengths)
+    starts = np.cumsum(lengths) - lengths
+    return parents, np.arange(len(parents)) - starts[parents]
+
+
+def _running_total(increments: np.ndarray, parents: np.ndarray) -> np.ndarray:
+    """Cumulative sum of `increments` restarting at each parent's first child."""
+    totals = np.cumsum(increments)
+    first = np.flatnonzero(np.r_[True, parents[1:] != parents[:-1]])
+    base = totals[first] - increments[first]
+    return totals - np.repeat(base, np.diff(np.r_[first, len(parents)]))
+
+
+def _uuids(rng: np.random.Generator, size: int) -> pa.Array:
+    """Random version 4 UUIDs, formatted in bulk from a block of random bytes."""
+    raw = rng.integers(0, 256, (size, 16), dtype=np.uint8)
+    raw[:, 6] = (raw[:, 6] & 0x0F) | 0x40
+    raw[:, 8] = (raw[:, 8] & 0x3F) | 0x80
+    text = np.full((size, 36), ord("-"), dtype=np.uint8)
+    text[:, _UUID_DIGIT_COLUMNS] = _HEX_PAIRS[raw].reshape(size, 32)
+    return pa.array(text.view("S36").ravel().astype(str))
+
+
+def _ip_addresses(rng: np.random.Generator, size: int) -> pa.Array:
+    octets = rng.integers(0, 256, (size, 4))
+    return pc.binary_join_element_wise(
+        *[pc.cast(pa.array(octets[:, i]), pa.string()) for i in range(4)], "."
+    )
+
+
+def _without_spaces(values: pa.ChunkedArray) -> pa.ChunkedArray:
+    return pc.replace_substring(values, " ", "")
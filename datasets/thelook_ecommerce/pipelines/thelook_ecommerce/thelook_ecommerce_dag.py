@@ -45,6 +45,9 @@ with DAG(
         env_vars={
             "NUM_OF_USERS": "100000",
             "NUM_OF_GHOST_EVENTS": "5",
+            "GENERATOR_MODE": "columnar",
+            "SHARD_SIZE": "50000",
+            "NUM_OF_WORKERS": "2",
             "TARGET_GCS_BUCKET": "{{ var.value.composer_bucket }}",
             "TARGET_GCS_PREFIX": "data/thelook_ecommerce",
             "SOURCE_DIR": "data",
@@ -83,10 +86,9 @@ with DAG(
     load_events_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_events_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/events.csv"],
-        source_format="CSV",
+        source_objects=["data/thelook_ecommerce/events/*.parquet"],
+        source_format="PARQUET",
         destination_project_dataset_table="thelook_ecommerce.events",
-        skip_leading_rows=1,
         write_disposition="WRITE_TRUNCATE",
         schema_fields=[
             {"name": "id", "type": "INTEGER", "mode": "NULLABLE"},
@@ -109,10 +111,9 @@ with DAG(
     load_inventory_items_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_inventory_items_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/inventory_items.csv"],
-        source_format="CSV",
+        source_objects=["data/thelook_ecommerce/inventory_items/*.parquet"],
+        source_format="PARQUET",
         destination_project_dataset_table="thelook_ecommerce.inventory_items",
-        skip_leading_rows=1,
         write_disposition="WRITE_TRUNCATE",
         schema_fields=[
             {"name": "id", "type": "INTEGER", "mode": "NULLABLE"},
@@ -138,10 +139,9 @@ with DAG(
     load_order_items_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_order_items_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/order_items.csv"],
-        source_format="CSV",
+        source_objects=["data/thelook_ecommerce/order_items/*.parquet"],
+        source_format="PARQUET",
         destination_project_dataset_table="thelook_ecommerce.order_items",
-        skip_leading_rows=1,
         write_disposition="WRITE_TRUNCATE",
         schema_fields=[
             {"name": "id", "type": "INTEGER", "mode": "NULLABLE"},
@@ -162,10 +162,9 @@ with DAG(
     load_orders_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_orders_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/orders.csv"],
-        source_format="CSV",
+        source_objects=["data/thelook_ecommerce/orders/*.parquet"],
+        source_format="PARQUET",
         destination_project_dataset_table="thelook_ecommerce.orders",
-        skip_leading_rows=1,
         write_disposition="WRITE_TRUNCATE",
         schema_fields=[
             {"name": "order_id", "type": "INTEGER", "mode": "NULLABLE"},
@@ -184,10 +183,9 @@ with DAG(
     load_users_to_bq = gcs_to_bigquery.GCSToBigQueryOperator(
         task_id="load_users_to_bq",
         bucket="{{ var.value.composer_bucket }}",
-        source_objects=["data/thelook_ecommerce/users.csv"],
-        source_format="CSV",
+        source_objects=["data/thelook_ecommerce/users/*.parquet"],
+        source_format="PARQUET",
         destination_project_dataset_table="thelook_ecommerce.users",
-        skip_leading_rows=1,
         write_disposition="WRITE_TRUNCATE",
         schema_fields=[
             {"name": "id", "type": "INTEGER", "mode": "NULLABLE"},
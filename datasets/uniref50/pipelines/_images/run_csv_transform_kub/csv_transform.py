@@ -22,6 +22,8 @@ from Bio import SeqIO
 from google.api_core.exceptions import NotFound
 from google.cloud import bigquery, storage
 
+from transform_runtime.files import append_batch_file
+
 
 def main(
     pipeline_name: str,
@@ -208,10 +210,7 @@ def process_chunk(
     batch_file: str,
     target_file: str,
 ) -> None:
-    logging.info("Processing batch file")
-    target_file_batch = batch_file
-    append_batch_file(target_file_batch, target_file)
-    logging.info(f"Processing batch file {target_file_batch} completed")
+    append_batch_file(batch_file, target_file, skip_header=False, truncate_file=False)
 
 
 def load_data_to_bq(
@@ -327,18 +326,6 @@ def create_table_schema(
     return schema
 
 
-def append_batch_file(target_file_batch: str, target_file: str) -> None:
-
-    with open(target_file_batch, "r") as data_file:
-        with open(target_file, "a+") as _target_file:
-            logging.info(f"Appending batch file {target_file_batch} to {target_file}")
-            logging.info(f"Size of target file is {os.path.getsize(target_file_batch)}")
-            logging.info(f"Size of target file is {os.path.getsize(target_file)}")
-            _target_file.write(data_file.read())
-            if os.path.exists(target_file_batch):
-                os.remove(target_file_batch)
-
-
 def upload_file_to_gcs(
     file_path: pathlib.Path, target_gcs_bucket: str, target_gcs_path: str
 ) -> None:
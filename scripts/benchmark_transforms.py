@@ -0,0 +1,881 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import argparse
+import ast
+import contextlib
+import importlib.util
+import inspect
+import json
+import os
+import pathlib
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+import typing
+import zipfile
+
+import numpy as np
+import pandas as pd
+from ruamel import yaml
+
+CURRENT_PATH = pathlib.Path(__file__).resolve().parent
+PROJECT_ROOT = CURRENT_PATH.parent
+DATASETS_PATH = PROJECT_ROOT / "datasets"
+DEFAULT_BASELINE_PATH = PROJECT_ROOT / "benchmarks" / "baseline.json"
+
+ENTRY_POINTS = ("process_source_file",)
+FIXTURE_BATCH_ROWS = 100000
+ROW_COUNT_SUFFIXES = {"k": 10**3, "m": 10**6}
+# Parameter names that carry the same setting under a different env var name.
+PARAMETER_ENV_ALIASES = {
+    "input_headers": ("INPUT_CSV_HEADERS", "CSV_HEADERS"),
+    "input_csv_headers": ("INPUT_CSV_HEADERS", "CSV_HEADERS"),
+    "csv_headers": ("CSV_HEADERS", "INPUT_CSV_HEADERS"),
+    "data_dtypes": ("DATA_DTYPES",),
+    "field_separator": ("INPUT_FIELD_DELIMITER",),
+    "input_field_delimiter": ("INPUT_FIELD_DELIMITER",),
+    "rename_headers_list": ("RENAME_HEADERS_LIST", "RENAME_MAPPINGS"),
+    "rename_mappings": ("RENAME_MAPPINGS", "RENAME_HEADERS_LIST"),
+    "reorder_headers_list": ("REORDER_HEADERS_LIST", "REORDER_HEADERS"),
+}
+# Entry point parameters that `main` takes under another name.
+PARAMETER_ALIASES = {
+    "dtypes": ("data_dtypes", "input_dtypes"),
+    "data_dtypes": ("input_dtypes",),
+    "input_headers": ("input_csv_headers",),
+    "input_csv_headers": ("input_headers",),
+    "output_headers": ("output_csv_headers", "output_headers_list"),
+    "output_headers_list": ("output_headers", "output_csv_headers"),
+    "rename_mappings": ("rename_mappings_list", "rename_headers_list"),
+    "rename_headers_list": ("rename_mappings_list", "rename_mappings"),
+    "destination_table": ("table_id",),
+    "table_id": ("destination_table",),
+}
+# Dates for fixture columns that the transforms parse as dates alone.
+FIXTURE_DATES = list(pd.date_range("2015-01-01", "2020-12-31").strftime("%Y-%m-%d"))
+# Bucket and dataset the local backend stands in for during a run.
+LOCAL_BUCKET = "benchmark"
+LOCAL_DATASET = "benchmark"
+
+
+def text_datetime_dtypes(
+    case: "BenchmarkCase", work_path: pathlib.Path
+) -> typing.Dict[str, str]:
+    """The case's dtypes with datetime64 columns read as text.
+
+    `pd.read_csv` rejects datetime64 dtypes; the fixture's timestamps are read
+    as text, which is what the transforms format.
+    """
+    return {
+        name: "str" if dtype.startswith("datetime64") else dtype
+        for name, dtype in case.dtypes.items()
+    }
+
+
+@contextlib.contextmanager
+def taxi_month_setup(
+    module: typing.Any, spec: typing.Dict
+) -> typing.Iterator[typing.Dict[str, typing.Any]]:
+    """Serves the fixture as the month's download and waits for its load job.
+
+    The table is created from the image's schema file, as the pipeline does
+    from the copy in its bucket.
+    """
+    from transform_runtime import bq, gcs
+
+    image_path = pathlib.Path(spec["script"]).parent
+    trips = spec["env_vars"]["PIPELINE_NAME"].replace("tlc_", "")
+    gcs.upload_file_to_gcs(
+        image_path / f"{trips}_schema.json", LOCAL_BUCKET, "schema.json"
+    )
+
+    def download_fixture(source_url: str, source_file: str) -> bool:
+        shutil.copyfile(spec["source_file"], source_file)
+        return True
+
+    module.download_url = download_fixture
+    with bq.LoadJobManager() as load_jobs:
+        yield {
+            "load_state": bq.LoadStateIndex(
+                "local", LOCAL_DATASET, ["data_file_year", "data_file_month"]
+            ),
+            "load_jobs": load_jobs,
+        }
+
+
+# What an image needs beyond its task's env vars, keyed by "<dataset>/<image>".
+#   entry_point: function to run instead of one of `ENTRY_POINTS`.
+#   uses_entry_point: callable of the case telling whether its task runs the
+#     entry point at all.
+#   fixture: how the synthetic source file is written; `format` is "csv",
+#     "zip" (holding a CSV called `name`) or "parquet", `delimiter`, `header`
+#     and `dtypes` replace what the env vars say, and `values` lists the
+#     values to draw some columns from.
+#   arguments: entry point arguments, or callables of the case and its work
+#     directory returning them, for settings that are Airflow templates or
+#     are worked out by `main` rather than read from the environment.
+#   setup: context manager of the loaded script and the case spec, entered
+#     around the timed call, yielding further arguments.
+IMAGE_OVERRIDES: typing.Dict[str, typing.Dict[str, typing.Any]] = {
+    "austin/run_csv_transform_kub": {
+        # Bikeshare trips join the checkout date and time before parsing them;
+        # service requests cast council districts, read as text, to integers.
+        "fixture": {
+            "values": {
+                "Council District": [str(district) for district in range(1, 11)],
+                "Checkout Date": list(
+                    pd.to_datetime(FIXTURE_DATES).strftime("%m/%d/%Y")
+                ),
+                "Checkout Time": [
+                    f"{hour:02d}:{minute:02d}:00"
+                    for hour in range(24)
+                    for minute in range(60)
+                ],
+            }
+        },
+        "arguments": {"dtypes": text_datetime_dtypes},
+    },
+    "census_bureau_acs/run_csv_transform_kub": {
+        "arguments": {
+            "group_id": lambda case, work_path: json.loads(
+                (case.image_path / "group_ids.json").read_text()
+            ),
+            "state_code": lambda case, work_path: json.loads(
+                (case.image_path / "state_codes.json").read_text()
+            ),
+        },
+    },
+    "epa_historical_air_quality/run_csv_transform_kub": {
+        # Dates come without a time, which the transform adds. Some source
+        # files name their columns as in the download, before renaming.
+        "fixture": {
+            "values": {
+                "date_local": FIXTURE_DATES,
+                "date_of_last_change": FIXTURE_DATES,
+                "Date Local": FIXTURE_DATES,
+                "Date of Last Change": FIXTURE_DATES,
+            }
+        },
+        "arguments": {
+            "field_delimiter": "|",
+            "dtypes": text_datetime_dtypes,
+        },
+    },
+    "fec/run_csv_transform_kub": {
+        # Other pipelines transform the file in `main` itself.
+        "uses_entry_point": lambda case: any(
+            name in case.env_vars.get("PIPELINE_NAME", "")
+            for name in ("individuals", "other_committee_tx_2020")
+        ),
+        # The bulk files are pipe separated, without a header row.
+        "fixture": {"delimiter": "|", "header": False},
+    },
+    "new_york_taxi_trips/run_csv_transform_kub": {
+        "entry_point": "process_month_columnar",
+        "fixture": {"format": "parquet", "dtypes": {"passenger_count": "float64"}},
+        "arguments": {
+            "project_id": "local",
+            "dataset_id": LOCAL_DATASET,
+            "table_id": "trips",
+            # The month's parquet file is downloaded next to this path.
+            "source_file": lambda case, work_path: str(work_path / "trips.csv"),
+            "year_number": 2022,
+            "month_number": 1,
+            "target_file_name": lambda case, work_path: str(
+                work_path / "target.parquet"
+            ),
+            "schema_path": "schema.json",
+            "target_gcs_bucket": LOCAL_BUCKET,
+            "target_gcs_path": "trips/data.csv",
+        },
+        "setup": taxi_month_setup,
+    },
+    "noaa/run_csv_transform_kub": {
+        # Header rows are removed before the transform reads the file.
+        "fixture": {
+            "header": False,
+            "dtypes": {
+                name: "float64" for name in ("lat", "lon", "CENTERLAT", "CENTERLON")
+            },
+            "values": {
+                "date": [date.replace("-", "") for date in FIXTURE_DATES],
+                "ZDAY": [date.replace("-", "") for date in FIXTURE_DATES],
+                "year": range(2000, 2021),
+                "month": range(1, 13),
+                "day": range(1, 29),
+                "time": [
+                    hour * 100 + minute for hour in range(24) for minute in range(60)
+                ],
+            },
+        },
+    },
+    "nhtsa_traffic_fatalities/run_csv_transform_kub": {
+        "fixture": {
+            "format": "zip",
+            "name": lambda case: case.env_vars["SOURCE_ZIPFILE_EXTRACTED"],
+            # Crash times are checked for range before they are formatted.
+            "values": {"hour_of_crash": range(24), "minute_of_crash": range(60)},
+        },
+        "arguments": {
+            "source_file_unzip_dir": lambda case, work_path: str(work_path / "unzip"),
+            "source_file_extracted": lambda case, work_path: str(
+                work_path / "unzip" / case.env_vars["SOURCE_ZIPFILE_EXTRACTED"]
+            ),
+            "field_separator": ",",
+            # `process_chunk` picks its transform from the part after the dash.
+            "pipeline_name": lambda case, work_path: (
+                f"NHTSA Traffic Fatalities - {case.task_id.split('_')[0]}"
+            ),
+            "process_year": 2020,
+        },
+    },
+    "san_francisco/run_csv_transform_kub": {
+        # 311 service requests cast supervisor districts, read as text, to Int64.
+        "fixture": {
+            "values": {
+                "Supervisor District": [str(district) for district in range(1, 12)]
+            }
+        },
+    },
+}
+
+
+PANDAS_3_REMOVED_INFER_DATETIME_FORMAT = (
+    "calls pd.to_datetime with infer_datetime_format, which pandas 3 removed"
+)
+# Cases known to fail, by case name, with the reason. They fail in the image
+# code itself, not in the harness: the images leave pandas unpinned and these
+# transforms use arguments that pandas 3 removed. They are reported apart from
+# regressions, never enter the baseline, and are reported again once they pass
+# so that they can be taken off this list.
+EXPECTED_FAILURES: typing.Dict[str, str] = {
+    "city_health_dashboard/run_csv_transform_kub/chdb_data_city": (
+        PANDAS_3_REMOVED_INFER_DATETIME_FORMAT
+    ),
+    "city_health_dashboard/run_csv_transform_kub/chdb_data_tract": (
+        PANDAS_3_REMOVED_INFER_DATETIME_FORMAT
+    ),
+    "covid19_google_mobility/run_csv_transform_kub/mobility_report": (
+        PANDAS_3_REMOVED_INFER_DATETIME_FORMAT
+    ),
+    "new_york/run_csv_transform_kub/transform_csv_ny_citibike_stations": (
+        "passes a dict as parse_dates, which pandas 3 rejects"
+    ),
+    "san_francisco/run_csv_transform_kub/sf_311_service_requests": (
+        PANDAS_3_REMOVED_INFER_DATETIME_FORMAT
+    ),
+    "san_francisco/run_csv_transform_kub/sf_street_trees": (
+        PANDAS_3_REMOVED_INFER_DATETIME_FORMAT
+    ),
+    "san_francisco/run_csv_transform_kub/sffd_service_calls": (
+        PANDAS_3_REMOVED_INFER_DATETIME_FORMAT
+    ),
+}
+
+
+class BenchmarkCase:
+    """One KubernetesPodOperator task whose image can be benchmarked offline."""
+
+    def __init__(
+        self,
+        dataset_id: str,
+        pipeline_id: str,
+        task_id: str,
+        image_path: pathlib.Path,
+        env_vars: typing.Dict[str, str],
+    ) -> None:
+        self.dataset_id = dataset_id
+        self.pipeline_id = pipeline_id
+        self.task_id = task_id
+        self.image_path = image_path
+        self.env_vars = env_vars
+
+    @property
+    def name(self) -> str:
+        return f"{self.image}/{self.task_id}"
+
+    @property
+    def image(self) -> str:
+        return f"{self.dataset_id}/{self.image_path.name}"
+
+    @property
+    def overrides(self) -> typing.Dict[str, typing.Any]:
+        return IMAGE_OVERRIDES.get(self.image, {})
+
+    @property
+    def fixture(self) -> typing.Dict[str, typing.Any]:
+        return self.overrides.get("fixture", {})
+
+    @property
+    def entry_points(self) -> typing.Tuple[str, ...]:
+        entry_point = self.overrides.get("entry_point")
+        return (entry_point,) if entry_point else ENTRY_POINTS
+
+    @property
+    def headers(self) -> typing.List[str]:
+        return literal_env_value(self.env_vars, "INPUT_CSV_HEADERS", "CSV_HEADERS")
+
+    @property
+    def dtypes(self) -> typing.Dict[str, str]:
+        dtypes = literal_env_value(self.env_vars, "DATA_DTYPES", "INPUT_DTYPES") or {}
+        return {**dtypes, **self.fixture.get("dtypes", {})}
+
+    @property
+    def delimiter(self) -> str:
+        return (
+            self.fixture.get("delimiter")
+            or literal_env_value(self.env_vars, "INPUT_FIELD_DELIMITER")
+            or ","
+        )
+
+
+def main(
+    datasets: typing.List[str],
+    row_counts: typing.List[int],
+    chunksize: str,
+    baseline_path: pathlib.Path,
+    output_path: typing.Optional[pathlib.Path],
+    update_baseline: bool,
+    tolerance: float,
+) -> int:
+    results = {}
+    for case in discover_cases(datasets):
+        for rows in row_counts:
+            key = f"{case.name}/{rows}"
+            print(f"Benchmarking {key} ...", flush=True)
+            results[key] = run_case(case, rows, chunksize)
+            print(f"  {format_result(results[key])}", flush=True)
+
+    if output_path:
+        output_path.write_text(json.dumps(results, indent=2, sort_keys=True))
+    expected, unexpected_passes = find_expected_failures(results)
+    for key, reason in expected.items():
+        print(f"EXPECTED FAILURE {key}: {reason}")
+    for key in unexpected_passes:
+        print(f"UNEXPECTED PASS {key}: remove it from EXPECTED_FAILURES")
+    baseline = load_baseline(baseline_path)
+    regressions = find_regressions(results, baseline, tolerance)
+    for key, reason in regressions.items():
+        print(f"REGRESSION {key}: {reason}")
+    if update_baseline:
+        baseline.update(
+            {key: result for key, result in results.items() if result["ok"]}
+        )
+        baseline_path.parent.mkdir(parents=True, exist_ok=True)
+        baseline_path.write_text(json.dumps(baseline, indent=2, sort_keys=True))
+    return 1 if regressions or unexpected_passes else 0
+
+
+def discover_cases(datasets: typing.List[str]) -> typing.Iterator[BenchmarkCase]:
+    """Yields a case per pipeline task running an image with an entry point.
+
+    Only tasks whose headers are literal in `pipeline.yaml` can have fixtures
+    generated for them; the rest are left out. Tasks that run the same image on
+    the same columns, such as one per source file, are benchmarked once.
+    """
+    seen = set()
+    for pipeline_yaml in sorted(DATASETS_PATH.glob("*/pipelines/*/pipeline.yaml")):
+        dataset_id = pipeline_yaml.parents[2].name
+        if datasets and dataset_id not in datasets:
+            continue
+        images_path = pipeline_yaml.parents[1] / "_images"
+        config = load_pipeline_config(pipeline_yaml)
+        for task in (config.get("dag") or {}).get("tasks") or []:
+            args = task.get("args") or {}
+            image_name = str(args.get("image", "")).split(".")[-1].strip(" }")
+            script = images_path / image_name / "csv_transform.py"
+            env_vars = args.get("env_vars") or {}
+            if not script.exists():
+                continue
+            case = BenchmarkCase(
+                dataset_id,
+                pipeline_yaml.parent.name,
+                args.get("task_id", "task"),
+                script.parent,
+                {str(k): str(v) for k, v in env_vars.items()},
+            )
+            if not has_entry_point(script, case.entry_points):
+                continue
+            if not case.overrides.get("uses_entry_point", lambda case: True)(case):
+                continue
+            fingerprint = json.dumps(
+                [str(case.image_path), case.headers, case.dtypes, case.delimiter]
+            )
+            if case.headers and fingerprint not in seen:
+                seen.add(fingerprint)
+                yield case
+
+
+def load_pipeline_config(pipeline_yaml: pathlib.Path) -> typing.Dict:
+    loader = yaml.YAML(typ="safe")
+    # Image tags such as `!IMAGE run_thelook_kub` are read as the image name.
+    loader.constructor.add_constructor(
+        "!IMAGE", lambda constructor, node: constructor.construct_scalar(node)
+    )
+    return loader.load(pipeline_yaml.read_text())
+
+
+def has_entry_point(
+    script: pathlib.Path, entry_points: typing.Sequence[str] = ENTRY_POINTS
+) -> bool:
+    text = script.read_text()
+    return any(f"def {name}(" in text for name in entry_points)
+
+
+def literal_env_value(env_vars: typing.Dict[str, str], *names: str) -> typing.Any:
+    """Returns the first of `names` set to a literal, JSON-decoded where it can be."""
+    for name in names:
+        value = env_vars.get(name)
+        if value is None or "{{" in value:
+            continue
+        try:
+            return json.loads(value)
+        except ValueError:
+            return value
+    return None
+
+
+def parse_row_count(value: str) -> int:
+    value = value.strip().lower()
+    multiplier = ROW_COUNT_SUFFIXES.get(value[-1:], 1)
+    if value[-1:] in ROW_COUNT_SUFFIXES:
+        value = value[:-1]
+    return int(float(value) * multiplier)
+
+
+def generate_fixture(
+    file_path: pathlib.Path,
+    headers: typing.List[str],
+    dtypes: typing.Dict[str, str],
+    rows: int,
+    sep: str = ",",
+    seed: int = 0,
+    header: bool = True,
+    values: typing.Optional[typing.Dict[str, typing.Sequence]] = None,
+) -> None:
+    """Writes `rows` synthetic rows, typed from `dtypes`, after a header row
+    unless `header` is False.
+
+    Columns in `values` are drawn from the values given instead.
+    """
+    rng = np.random.default_rng(seed)
+    values = values or {}
+    written = 0
+    with open(file_path, "w", encoding="utf-8", newline="") as fixture:
+        while written < rows:
+            batch_rows = min(FIXTURE_BATCH_ROWS, rows - written)
+            df = pd.DataFrame(
+                {
+                    name: rng.choice(list(values[name]), batch_rows)
+                    if name in values
+                    else synthetic_column(
+                        name, dtypes.get(name, "str"), rng, batch_rows
+                    )
+                    for name in headers
+                }
+            )
+            df.to_csv(fixture, sep=sep, index=False, header=header and written == 0)
+            written += batch_rows
+
+
+def synthetic_column(
+    name: str, dtype: str, rng: np.random.Generator, rows: int
+) -> typing.Union[np.ndarray, pd.Series]:
+    dtype = str(dtype).lower()
+    if "int" in dtype:
+        return rng.integers(0, 100000, rows)
+    if "float" in dtype:
+        return np.round(rng.random(rows) * 1000, 3)
+    if "bool" in dtype:
+        return rng.integers(0, 2, rows).astype(bool)
+    if "datetime" in dtype or any(part in name.lower() for part in ("date", "time")):
+        seconds = rng.integers(1_500_000_000, 1_700_000_000, rows)
+        return pd.Series(pd.to_datetime(seconds, unit="s")).dt.strftime(
+            "%Y-%m-%d %H:%M:%S"
+        )
+    return pd.Series(rng.integers(0, 1000, rows)).astype(str).radd(f"{name}_")
+
+
+def run_case(
+    case: BenchmarkCase, rows: int, chunksize: str, timeout: int = 3600
+) -> typing.Dict:
+    """Generates the fixture and runs the entry point in a fresh interpreter.
+
+    A separate process per case keeps each image's modules apart and gives a
+    peak RSS that belongs to that image alone.
+    """
+    with tempfile.TemporaryDirectory(prefix="benchmark_") as work_dir:
+        work_path = pathlib.Path(work_dir)
+        source_file = work_path / "source.csv"
+        generate_fixture(
+            source_file,
+            case.headers,
+            case.dtypes,
+            rows,
+            case.delimiter,
+            header=case.fixture.get("header", True),
+            values=case.fixture.get("values"),
+        )
+        source_file = package_fixture(case, source_file)
+        spec = {
+            "script": str(case.image_path / "csv_transform.py"),
+            "image": case.image,
+            "entry_points": case.entry_points,
+            "env_vars": case.env_vars,
+            "arguments": {
+                name: value(case, work_path) if callable(value) else value
+                for name, value in case.overrides.get("arguments", {}).items()
+            },
+            "source_file": str(source_file),
+            "target_file": str(work_path / "target.csv"),
+            "chunksize": chunksize,
+            "rows": rows,
+            "source_bytes": source_file.stat().st_size,
+        }
+        result_file = work_path / "result.json"
+        try:
+            process = subprocess.run(
+                [
+                    sys.executable,
+                    __file__,
+                    "--run-case",
+                    json.dumps(spec),
+                    str(result_file),
+                ],
+                cwd=work_dir,
+                capture_output=True,
+                text=True,
+                timeout=timeout,
+            )
+        except subprocess.TimeoutExpired:
+            return {"ok": False, "error": f"Timed out after {timeout}s"}
+        if result_file.exists():
+            return json.loads(result_file.read_text())
+        stderr = process.stderr.strip().splitlines()
+        return {"ok": False, "error": stderr[-1] if stderr else "No result"}
+
+
+def package_fixture(case: BenchmarkCase, source_file: pathlib.Path) -> pathlib.Path:
+    """Converts the CSV fixture into the format the image downloads, if not CSV."""
+    fixture_format = case.fixture.get("format", "csv")
+    if fixture_format == "zip":
+        name = case.fixture.get("name", source_file.name)
+        packaged = source_file.with_suffix(".zip")
+        with zipfile.ZipFile(packaged, "w", zipfile.ZIP_DEFLATED) as archive:
+            archive.write(source_file, name(case) if callable(name) else name)
+    elif fixture_format == "parquet":
+        packaged = source_file.with_suffix(".parquet")
+        df = pd.read_csv(source_file, sep=case.delimiter, dtype=str)
+        df.astype(case.dtypes).to_parquet(packaged, index=False)
+    else:
+        return source_file
+    source_file.unlink()
+    return packaged
+
+
+def run_case_in_process(spec: typing.Dict, result_file: pathlib.Path) -> None:
+    sys.path[:0] = [str(PROJECT_ROOT), str(pathlib.Path(spec["script"]).parent)]
+    os.environ["STAGE_SUMMARY_FILE"] = ""
+    os.environ["TRANSFORM_BACKEND"] = "local"
+    os.environ["LOCAL_BACKEND_PATH"] = str(pathlib.Path("local_backend").resolve())
+    from transform_runtime import local, metrics
+
+    local.install()
+    result: typing.Dict[str, typing.Any] = {"ok": False, "rows": spec["rows"]}
+    try:
+        module = load_script(pathlib.Path(spec["script"]))
+        entry_point = next(
+            getattr(module, name)
+            for name in spec["entry_points"]
+            if hasattr(module, name)
+        )
+        main_args = main_arguments(pathlib.Path(spec["script"]))
+        setup = IMAGE_OVERRIDES.get(spec["image"], {}).get("setup")
+        pathlib.Path("files").mkdir(exist_ok=True)
+        started = time.perf_counter()
+        with setup(module, spec) if setup else contextlib.nullcontext({}) as extra:
+            spec["arguments"].update(extra)
+            entry_point(**resolve_arguments(entry_point, spec, main_args))
+        seconds = time.perf_counter() - started
+        target_file = pathlib.Path(spec["target_file"])
+        result.update(
+            ok=True,
+            seconds=round(seconds, 3),
+            rows_per_second=round(spec["rows"] / seconds, 1),
+            source_bytes=spec["source_bytes"],
+            target_bytes=target_file.stat().st_size if target_file.exists() else 0,
+            stages=metrics.summary()["stages"],
+        )
+    except Exception as e:
+        result["error"] = f"{type(e).__name__}: {e}"
+    result["peak_rss_bytes"] = metrics.peak_rss_bytes()
+    result_file.write_text(json.dumps(result))
+
+
+def load_script(script: pathlib.Path):
+    module_spec = importlib.util.spec_from_file_location("csv_transform", script)
+    module = importlib.util.module_from_spec(module_spec)
+    module_spec.loader.exec_module(module)
+    return module
+
+
+def main_arguments(
+    script: pathlib.Path,
+) -> typing.Dict[str, typing.Tuple[str, typing.Optional[str]]]:
+    """Maps the arguments the script's `main` call reads from env vars to them.
+
+    Each argument maps to its env var and the script's default for it, or None
+    where it has none.
+    """
+    arguments = {}
+    for node in ast.walk(ast.parse(script.read_text())):
+        if (
+            isinstance(node, ast.Call)
+            and isinstance(node.func, ast.Name)
+            and node.func.id == "main"
+        ):
+            for keyword in node.keywords:
+                lookup = _environ_lookup(keyword.value)
+                if keyword.arg and lookup:
+                    arguments[keyword.arg] = lookup
+    return arguments
+
+
+def _environ_lookup(
+    node: ast.AST,
+) -> typing.Optional[typing.Tuple[str, typing.Optional[str]]]:
+    for child in ast.walk(node):
+        if (
+            isinstance(child, ast.Call)
+            and isinstance(child.func, ast.Attribute)
+            and child.func.attr == "get"
+            and _is_environ(child.func.value)
+            and child.args
+            and isinstance(child.args[0], ast.Constant)
+        ):
+            default = child.args[1] if len(child.args) > 1 else None
+            return (
+                child.args[0].value,
+                default.value if isinstance(default, ast.Constant) else None,
+            )
+        if isinstance(child, ast.Subscript) and _is_environ(child.value):
+            key = child.slice
+            if not isinstance(key, ast.Constant):
+                key = getattr(key, "value", None)  # ast.Index before 3.9
+            if isinstance(key, ast.Constant):
+                return key.value, None
+    return None
+
+
+def _is_environ(node: ast.AST) -> bool:
+    return isinstance(node, ast.Attribute) and node.attr == "environ"
+
+
+def setting_value(
+    name: str,
+    env_vars: typing.Dict[str, str],
+    main_args: typing.Dict[str, typing.Tuple[str, typing.Optional[str]]],
+) -> typing.Any:
+    """Returns the value an entry point parameter gets in the task, if known.
+
+    The task's own env var wins. Where it is missing or an Airflow template,
+    such as `{{ var.json.dataset.chunksize }}`, the script's default is used.
+    """
+    names = (name,) + PARAMETER_ALIASES.get(name, ())
+    env_names = [main_args[alias][0] for alias in names if alias in main_args]
+    env_names += [name.upper(), *PARAMETER_ENV_ALIASES.get(name, ())]
+    value = literal_env_value(env_vars, *env_names)
+    if value is not None:
+        return value
+    for alias in names:
+        default = main_args.get(alias, (None, None))[1]
+        if default:
+            return literal_env_value({"DEFAULT": default}, "DEFAULT")
+    return None
+
+
+def resolve_arguments(
+    entry_point: typing.Callable,
+    spec: typing.Dict,
+    main_args: typing.Optional[
+        typing.Dict[str, typing.Tuple[str, typing.Optional[str]]]
+    ] = None,
+) -> typing.Dict[str, typing.Any]:
+    """Fills the entry point's parameters from the fixture and the task's env vars.
+
+    `main_args`, from `main_arguments`, names the env var behind each of the
+    script's settings. The image's `arguments` in `IMAGE_OVERRIDES`, carried
+    in `spec`, take precedence over both. Raises ValueError naming any
+    required parameter that could not be filled.
+    """
+    fixed = {
+        "source_file": spec["source_file"],
+        "source_zipfile": spec["source_file"],
+        "target_file": spec["target_file"],
+        "chunksize": spec["chunksize"],
+        # The fixture has one header row and no footer.
+        "header_rows": "1",
+        "footer_rows": "0",
+        "source_url": "https://example.com/source.csv",
+    }
+    kwargs = {}
+    missing = []
+    overrides = spec.get("arguments") or {}
+    for name, parameter in inspect.signature(entry_point).parameters.items():
+        if name in overrides:
+            value = overrides[name]
+        elif name in fixed:
+            value = fixed[name]
+        else:
+            value = setting_value(name, spec["env_vars"], main_args or {})
+        if value is not None:
+            # Env vars are strings; some entry points take numbers directly.
+            if parameter.annotation in (int, float) and isinstance(value, str):
+                value = parameter.annotation(value)
+            kwargs[name] = value
+        elif parameter.default is not inspect.Parameter.empty:
+            continue
+        else:
+            missing.append(name)
+    if missing:
+        raise ValueError(f"Cannot fill parameter(s) {', '.join(missing)}")
+    return kwargs
+
+
+def load_baseline(baseline_path: pathlib.Path) -> typing.Dict[str, typing.Dict]:
+    if not baseline_path.exists():
+        return {}
+    return json.loads(baseline_path.read_text())
+
+
+def case_name(key: str) -> str:
+    """The case a result key refers to, without its row count."""
+    return key.rsplit("/", 1)[0]
+
+
+def find_expected_failures(
+    results: typing.Dict[str, typing.Dict],
+    expected_failures: typing.Dict[str, str] = EXPECTED_FAILURES,
+) -> typing.Tuple[typing.Dict[str, str], typing.List[str]]:
+    """Splits the results of cases in `expected_failures` by outcome.
+
+    Returns the ones that still fail, with the listed reason and the error,
+    and the keys of the ones that now pass.
+    """
+    failing, passing = {}, []
+    for key, result in results.items():
+        reason = expected_failures.get(case_name(key))
+        if reason is None:
+            continue
+        if result["ok"]:
+            passing.append(key)
+        else:
+            failing[key] = f"{reason} ({result.get('error')})"
+    return failing, passing
+
+
+def find_regressions(
+    results: typing.Dict[str, typing.Dict],
+    baseline: typing.Dict[str, typing.Dict],
+    tolerance: float,
+    expected_failures: typing.Dict[str, str] = EXPECTED_FAILURES,
+) -> typing.Dict[str, str]:
+    """Compares throughput and peak memory with the baseline, case by case.
+
+    A case regresses when it fails without being in `expected_failures`, its
+    rows per second drop by more than `tolerance`, or its peak RSS grows by
+    more than `tolerance`.
+    """
+    regressions = {}
+    for key, result in results.items():
+        if not result["ok"]:
+            if case_name(key) not in expected_failures:
+                regressions[key] = f"failed: {result.get('error')}"
+            continue
+        before = baseline.get(key)
+        if not before:
+            continue
+        if result["rows_per_second"] < before["rows_per_second"] * (1 - tolerance):
+            regressions[key] = (
+                f"{result['rows_per_second']:.0f} rows/s,"
+                f" baseline {before['rows_per_second']:.0f} rows/s"
+            )
+        elif result["peak_rss_bytes"] > before["peak_rss_bytes"] * (1 + tolerance):
+            regressions[key] = (
+                f"peak RSS {result['peak_rss_bytes']} bytes,"
+                f" baseline {before['peak_rss_bytes']} bytes"
+            )
+    return regressions
+
+
+def format_result(result: typing.Dict) -> str:
+    if not result["ok"]:
+        return f"failed: {result.get('error')}"
+    return (
+        f"{result['rows_per_second']:.0f} rows/s, {result['seconds']}s,"
+        f" peak RSS {result['peak_rss_bytes'] / 2**20:.0f} MiB"
+    )
+
+
+if __name__ == "__main__":
+    if len(sys.argv) == 4 and sys.argv[1] == "--run-case":
+        run_case_in_process(json.loads(sys.argv[2]), pathlib.Path(sys.argv[3]))
+        sys.exit(0)
+
+    parser = argparse.ArgumentParser(
+        description="Benchmark transform images offline against synthetic fixtures"
+    )
+    parser.add_argument(
+        "-d",
+        "--dataset",
+        action="append",
+        default=[],
+        dest="datasets",
+        help="Dataset to benchmark; repeat for more. Defaults to all of them.",
+    )
+    parser.add_argument(
+        "-r",
+        "--rows",
+        action="append",
+        type=parse_row_count,
+        dest="row_counts",
+        help="Fixture size such as 10k, 1M or 10M; repeat for more.",
+    )
+    parser.add_argument("--chunksize", default="100000")
+    parser.add_argument("--baseline", type=pathlib.Path, default=DEFAULT_BASELINE_PATH)
+    parser.add_argument("--output", type=pathlib.Path)
+    parser.add_argument("--update-baseline", action="store_true")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Relative slowdown or memory growth reported as a regression.",
+    )
+
+    args = parser.parse_args()
+    sys.exit(
+        main(
+            datasets=args.datasets,
+            row_counts=args.row_counts or [10000],
+            chunksize=args.chunksize,
+            baseline_path=args.baseline,
+            output_path=args.output,
+            update_baseline=args.update_baseline,
+            tolerance=args.tolerance,
+        )
+    )
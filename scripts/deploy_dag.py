@@ -28,6 +28,7 @@ yaml = yaml.YAML(typ="safe")
 CURRENT_PATH = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = CURRENT_PATH.parent
 DATASETS_PATH = PROJECT_ROOT / "datasets"
+DAG_OPERATORS_PATH = PROJECT_ROOT / "dag_operators"
 DEFAULT_AIRFLOW_VERSION = 2
 
 
@@ -81,6 +82,13 @@ def main(
             composer_bucket,
         )
 
+        copy_dag_operators_to_airflow_dags_folder(
+            env_path,
+            dataset_id,
+            pipeline_path.name,
+            composer_bucket,
+        )
+
         copy_generated_dag_to_airflow_dags_folder(
             env_path,
             dataset_id,
@@ -416,6 +424,44 @@ def copy_custom_callables_to_airflow_dags_folder(
     run_gsutil_cmd(["-m", "cp", "-r", "custom", target], cwd=cwd)
 
 
+def copy_dag_operators_to_airflow_dags_folder(
+    env_path: pathlib.Path,
+    dataset_id: str,
+    pipeline_id: str,
+    composer_bucket: str,
+):
+    """
+    Runs the command
+
+        gsutil -m rsync -r -x ".*__pycache__.*" dag_operators gs://$COMPOSER_BUCKET/dags/dag_operators
+
+    inside the project root, when the pipeline's DAG imports from `dag_operators`.
+    """
+    pipeline_dir = env_path / "datasets" / dataset_id / "pipelines" / pipeline_id
+    dag_file = pipeline_dir / f"{pipeline_id}_dag.py"
+    if not dag_file.exists() or DAG_OPERATORS_PATH.name not in dag_file.read_text():
+        return
+
+    target = f"gs://{composer_bucket}/dags/{DAG_OPERATORS_PATH.name}"
+    print(
+        f"\nCopying shared operators for pipeline `{pipeline_id}` into Cloud Composer DAG folder\n\n"
+        f"  Source:\n  {DAG_OPERATORS_PATH}\n\n"
+        f"  Destination:\n  {target}\n"
+    )
+    run_gsutil_cmd(
+        [
+            "-m",
+            "rsync",
+            "-r",
+            "-x",
+            r".*__pycache__.*",
+            DAG_OPERATORS_PATH.name,
+            target,
+        ],
+        cwd=PROJECT_ROOT,
+    )
+
+
 def check_existence_of_variables_file(file_path: pathlib.Path):
     if not file_path:
         raise FileNotFoundError(f"Airflow variables file {file_path} does not exist.")
@@ -17,6 +17,7 @@ import argparse
 import json
 import pathlib
 import re
+import shutil
 import subprocess
 import typing
 
@@ -28,6 +29,7 @@ CURRENT_PATH = pathlib.Path(__file__).resolve().parent
 PROJECT_ROOT = CURRENT_PATH.parent
 DATASETS_PATH = PROJECT_ROOT / "datasets"
 AIRFLOW_TEMPLATES_PATH = PROJECT_ROOT / "templates" / "airflow"
+TRANSFORM_RUNTIME_PATH = PROJECT_ROOT / "transform_runtime"
 
 TEMPLATE_PATHS = {
     "dag": AIRFLOW_TEMPLATES_PATH / "dag.py.jinja2",
@@ -179,6 +181,10 @@ def validate_task(task: dict, airflow_version: str):
     if not task["args"].get("task_id"):
         raise KeyError(f"`args.task_id` key must exist in {task}")
 
+    is_batch_load = task["operator"] == "GoogleCloudStorageToBigQueryBatchOperator"
+    if is_batch_load and not task["args"].get("loads"):
+        raise KeyError(f"`args.loads` must list at least one load in {task}")
+
 
 def list_subdirs(path: pathlib.Path) -> typing.List[pathlib.Path]:
     """Returns a list of subdirectories"""
@@ -248,7 +254,27 @@ def copy_image_files_to_dot_dir(
         ["cp", "-rf", str(parent_dir), str(target_dir)], cwd=PROJECT_ROOT
     )
 
-    return list_subdirs(target_dir / "_images")
+    image_dirs = list_subdirs(target_dir / "_images")
+    for image_dir in image_dirs:
+        if uses_transform_runtime(image_dir):
+            copy_transform_runtime_to_image_dir(image_dir)
+    return image_dirs
+
+
+def uses_transform_runtime(image_dir: pathlib.Path) -> bool:
+    dockerfile = image_dir / "Dockerfile"
+    return dockerfile.exists() and "transform_runtime" in dockerfile.read_text()
+
+
+def copy_transform_runtime_to_image_dir(image_dir: pathlib.Path):
+    target_dir = image_dir / TRANSFORM_RUNTIME_PATH.name
+    if target_dir.exists():
+        shutil.rmtree(target_dir)
+    shutil.copytree(
+        TRANSFORM_RUNTIME_PATH,
+        target_dir,
+        ignore=shutil.ignore_patterns("__pycache__", "*.pyc"),
+    )
 
 
 def build_and_push_image(
@@ -0,0 +1,144 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pytest
+
+pytest.importorskip("airflow.providers.google.cloud.hooks.bigquery")
+
+from airflow.exceptions import AirflowException  # noqa: E402
+
+from dag_operators import gcs_to_bigquery_batch  # noqa: E402
+
+
+@pytest.fixture
+def client(mocker):
+    client = mocker.MagicMock()
+    hook = gcs_to_bigquery_batch.BigQueryHook
+    mocker.patch.object(hook, "get_client", return_value=client)
+    mocker.patch.object(
+        hook, "project_id", new_callable=mocker.PropertyMock, return_value="project"
+    )
+    return client
+
+
+def fake_job(mocker, table: str, error: Exception = None):
+    job = mocker.MagicMock(job_id=f"job_{table}", output_rows=10)
+    job.result.side_effect = error
+    return job
+
+
+def operator(loads, **kwargs) -> gcs_to_bigquery_batch.GCSToBigQueryBatchOperator:
+    return gcs_to_bigquery_batch.GCSToBigQueryBatchOperator(
+        task_id="load_to_bq", bucket="bucket", loads=loads, **kwargs
+    )
+
+
+def test_load_config_merges_defaults_with_load_overrides():
+    task = operator(
+        [],
+        skip_leading_rows=1,
+        write_disposition="WRITE_TRUNCATE",
+        allow_quoted_newlines=True,
+    )
+    schema = [{"name": "id", "type": "STRING", "mode": "REQUIRED"}]
+
+    config = task.load_config(
+        {
+            "source_objects": ["a.csv"],
+            "destination_project_dataset_table": "dataset.a",
+            "schema_fields": schema,
+            "skip_leading_rows": 0,
+            "field_delimiter": "|",
+            "null_marker": None,
+        }
+    )
+
+    assert config == {
+        "sourceFormat": "CSV",
+        "skipLeadingRows": 0,
+        "writeDisposition": "WRITE_TRUNCATE",
+        "createDisposition": "CREATE_IF_NEEDED",
+        "fieldDelimiter": "|",
+        "allowQuotedNewlines": True,
+        "schema": {"fields": schema},
+    }
+
+
+def test_loads_missing_required_args_are_rejected():
+    with pytest.raises(AirflowException, match="source_objects"):
+        operator([{"destination_project_dataset_table": "dataset.a"}])
+
+
+def test_execute_returns_the_status_of_every_table(client, mocker):
+    client.load_table_from_uri.side_effect = lambda uris, table, **_: fake_job(
+        mocker, table
+    )
+    task = operator(
+        [
+            {"source_objects": ["a.csv"], "destination_project_dataset_table": "ds.a"},
+            {
+                "source_objects": ["b_1.csv", "b_2.csv"],
+                "destination_project_dataset_table": "project:ds.b",
+            },
+        ]
+    )
+
+    results = task.execute(context={})
+
+    assert results == {
+        "ds.a": {
+            "job_id": "job_ds.a",
+            "state": "DONE",
+            "output_rows": 10,
+            "error": None,
+        },
+        "project:ds.b": {
+            "job_id": "job_project.ds.b",
+            "state": "DONE",
+            "output_rows": 10,
+            "error": None,
+        },
+    }
+    uris = sorted(call.args[0] for call in client.load_table_from_uri.call_args_list)
+    assert uris == [
+        ["gs://bucket/a.csv"],
+        ["gs://bucket/b_1.csv", "gs://bucket/b_2.csv"],
+    ]
+
+
+def test_execute_finishes_other_loads_before_failing(client, mocker):
+    jobs = {
+        "ds.a": fake_job(mocker, "ds.a"),
+        "ds.bad": fake_job(mocker, "ds.bad", RuntimeError("schema mismatch")),
+        "ds.c": fake_job(mocker, "ds.c"),
+    }
+    client.load_table_from_uri.side_effect = lambda uris, table, **_: jobs[table]
+    task = operator(
+        [
+            {
+                "source_objects": [f"{table}.csv"],
+                "destination_project_dataset_table": table,
+            }
+            for table in jobs
+        ],
+        max_concurrent_loads=1,
+    )
+
+    with pytest.raises(AirflowException, match=r"1 table\(s\) failed: \['ds.bad'\]"):
+        task.execute(context={})
+
+    assert client.load_table_from_uri.call_count == 3
+    for job in jobs.values():
+        job.result.assert_called_once_with()
@@ -0,0 +1,272 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pathlib
+import typing
+import zipfile
+
+import pandas as pd
+import pytest
+
+from scripts import benchmark_transforms
+
+
+def test_parse_row_count_understands_suffixes():
+    assert benchmark_transforms.parse_row_count("10k") == 10000
+    assert benchmark_transforms.parse_row_count("1M") == 1000000
+    assert benchmark_transforms.parse_row_count("2500") == 2500
+
+
+def test_generate_fixture_follows_headers_and_dtypes(tmp_path: pathlib.Path):
+    fixture = tmp_path / "source.csv"
+    headers = ["id", "amount", "created_date", "name"]
+    dtypes = {"id": "int64", "amount": "float64"}
+
+    benchmark_transforms.generate_fixture(fixture, headers, dtypes, rows=250, sep="|")
+
+    df = pd.read_csv(fixture, sep="|")
+    assert list(df.columns) == headers
+    assert len(df) == 250
+    assert df["id"].dtype == "int64"
+    assert df["amount"].dtype == "float64"
+    assert pd.to_datetime(df["created_date"]).notna().all()
+    assert df["name"].str.startswith("name_").all()
+
+
+def test_generate_fixture_draws_given_values_without_header(tmp_path: pathlib.Path):
+    fixture = tmp_path / "source.csv"
+
+    benchmark_transforms.generate_fixture(
+        fixture,
+        ["hour", "name"],
+        {},
+        rows=100,
+        header=False,
+        values={"hour": range(24)},
+    )
+
+    df = pd.read_csv(fixture, names=["hour", "name"])
+    assert len(df) == 100
+    assert df["hour"].between(0, 23).all()
+
+
+def test_package_fixture_zips_the_csv_under_its_source_name(
+    tmp_path: pathlib.Path, monkeypatch
+):
+    monkeypatch.setitem(
+        benchmark_transforms.IMAGE_OVERRIDES,
+        "dataset/image",
+        {"fixture": {"format": "zip", "name": lambda case: case.env_vars["NAME"]}},
+    )
+    case = benchmark_transforms.BenchmarkCase(
+        "dataset", "pipeline", "task", tmp_path / "image", {"NAME": "accident.csv"}
+    )
+    source_file = tmp_path / "source.csv"
+    source_file.write_text("a,b\n1,2\n")
+
+    packaged = benchmark_transforms.package_fixture(case, source_file)
+
+    assert not source_file.exists()
+    with zipfile.ZipFile(packaged) as archive:
+        assert archive.read("accident.csv") == b"a,b\n1,2\n"
+
+
+def test_discover_cases_covers_overridden_images():
+    cases = {
+        case.dataset_id: case
+        for case in benchmark_transforms.discover_cases(
+            ["epa_historical_air_quality", "new_york_taxi_trips", "noaa"]
+        )
+    }
+
+    assert sorted(cases) == [
+        "epa_historical_air_quality",
+        "new_york_taxi_trips",
+        "noaa",
+    ]
+    assert cases["new_york_taxi_trips"].entry_points == ("process_month_columnar",)
+    assert cases["new_york_taxi_trips"].fixture["format"] == "parquet"
+    assert cases["noaa"].fixture["header"] is False
+
+
+def test_literal_env_value_skips_templates():
+    env_vars = {
+        "INPUT_CSV_HEADERS": "{{ var.json.dataset.headers }}",
+        "CSV_HEADERS": '["a", "b"]',
+        "CHUNKSIZE": "1000",
+        "TABLE_ID": "trips",
+    }
+
+    assert benchmark_transforms.literal_env_value(
+        env_vars, "INPUT_CSV_HEADERS", "CSV_HEADERS"
+    ) == ["a", "b"]
+    assert benchmark_transforms.literal_env_value(env_vars, "TABLE_ID") == "trips"
+    assert benchmark_transforms.literal_env_value(env_vars, "MISSING") is None
+
+
+def test_resolve_arguments_fills_parameters_from_env_vars():
+    def process_source_file(
+        source_file: str,
+        target_file: str,
+        chunksize: str,
+        input_headers: typing.List[str],
+        header_rows: int,
+        pipeline_name: str,
+        sep: str = ",",
+    ) -> None:
+        pass
+
+    spec = {
+        "source_file": "source.csv",
+        "target_file": "target.csv",
+        "chunksize": "1000",
+        "env_vars": {"INPUT_CSV_HEADERS": '["a"]', "PIPELINE_NAME": "trips"},
+    }
+
+    assert benchmark_transforms.resolve_arguments(process_source_file, spec) == {
+        "source_file": "source.csv",
+        "target_file": "target.csv",
+        "chunksize": "1000",
+        "input_headers": ["a"],
+        "header_rows": 1,
+        "pipeline_name": "trips",
+    }
+
+
+def test_main_arguments_maps_parameters_to_env_vars(tmp_path: pathlib.Path):
+    script = tmp_path / "csv_transform.py"
+    script.write_text(
+        "import json, os\n"
+        "if __name__ == '__main__':\n"
+        "    main(\n"
+        "        chunksize=os.environ.get('CHUNKSIZE', '1500000'),\n"
+        "        output_headers=json.loads(os.environ['OUTPUT_CSV_HEADERS']),\n"
+        "        table_id=os.environ.get('TABLE_ID'),\n"
+        "        max_workers=4,\n"
+        "    )\n"
+    )
+
+    assert benchmark_transforms.main_arguments(script) == {
+        "chunksize": ("CHUNKSIZE", "1500000"),
+        "output_headers": ("OUTPUT_CSV_HEADERS", None),
+        "table_id": ("TABLE_ID", None),
+    }
+
+
+def test_resolve_arguments_falls_back_to_main_and_overrides():
+    def process_source_file(
+        source_file: str,
+        output_headers: typing.List[str],
+        dtypes: dict,
+        field_delimiter: str,
+        max_load_jobs: int,
+    ) -> None:
+        pass
+
+    spec = {
+        "source_file": "source.csv",
+        "target_file": "target.csv",
+        "chunksize": "1000",
+        "env_vars": {
+            "OUTPUT_CSV_HEADERS": '["a", "b"]',
+            "DATA_DTYPES": '{"a": "str"}',
+            "MAX_LOAD_JOBS": "{{ var.json.dataset.max_load_jobs }}",
+        },
+        "arguments": {"field_delimiter": "|"},
+    }
+    main_args = {
+        "output_headers": ("OUTPUT_CSV_HEADERS", None),
+        "data_dtypes": ("DATA_DTYPES", "{}"),
+        "max_load_jobs": ("MAX_LOAD_JOBS", "2"),
+    }
+
+    assert benchmark_transforms.resolve_arguments(
+        process_source_file, spec, main_args
+    ) == {
+        "source_file": "source.csv",
+        "output_headers": ["a", "b"],
+        "dtypes": {"a": "str"},
+        "field_delimiter": "|",
+        "max_load_jobs": 2,
+    }
+
+
+def test_resolve_arguments_names_unfilled_parameters():
+    def process_source_file(source_file: str, project_id: str) -> None:
+        pass
+
+    with pytest.raises(ValueError, match="project_id"):
+        benchmark_transforms.resolve_arguments(
+            process_source_file,
+            {"source_file": "a", "target_file": "b", "chunksize": "1", "env_vars": {}},
+        )
+
+
+def test_find_regressions_compares_with_baseline():
+    baseline = {
+        "slow": {"rows_per_second": 1000.0, "peak_rss_bytes": 100},
+        "fat": {"rows_per_second": 1000.0, "peak_rss_bytes": 100},
+        "fine": {"rows_per_second": 1000.0, "peak_rss_bytes": 100},
+        "broken": {"rows_per_second": 1000.0, "peak_rss_bytes": 100},
+    }
+    results = {
+        "slow": {"ok": True, "rows_per_second": 700.0, "peak_rss_bytes": 100},
+        "fat": {"ok": True, "rows_per_second": 1000.0, "peak_rss_bytes": 150},
+        "fine": {"ok": True, "rows_per_second": 900.0, "peak_rss_bytes": 110},
+        "broken": {"ok": False, "error": "ValueError: boom"},
+        "new": {"ok": True, "rows_per_second": 1.0, "peak_rss_bytes": 1},
+    }
+
+    regressions = benchmark_transforms.find_regressions(results, baseline, 0.2, {})
+
+    assert sorted(regressions) == ["broken", "fat", "slow"]
+
+
+def test_find_regressions_reports_failures_missing_from_baseline():
+    results = {
+        "image/task/1000": {"ok": False, "error": "ValueError: boom"},
+        "image/known/1000": {"ok": False, "error": "TypeError: old pandas"},
+    }
+
+    regressions = benchmark_transforms.find_regressions(
+        results, {}, 0.2, {"image/known": "needs an older pandas"}
+    )
+
+    assert regressions == {"image/task/1000": "failed: ValueError: boom"}
+
+
+def test_find_expected_failures_splits_failing_and_passing_cases():
+    results = {
+        "image/known/1000": {"ok": False, "error": "TypeError: old pandas"},
+        "image/fixed/1000": {"ok": True},
+        "image/other/1000": {"ok": False, "error": "ValueError: boom"},
+    }
+
+    failing, passing = benchmark_transforms.find_expected_failures(
+        results,
+        {"image/known": "needs an older pandas", "image/fixed": "was broken"},
+    )
+
+    assert failing == {
+        "image/known/1000": "needs an older pandas (TypeError: old pandas)"
+    }
+    assert passing == ["image/fixed/1000"]
+
+
+def test_expected_failures_name_discovered_cases():
+    datasets = {name.split("/")[0] for name in benchmark_transforms.EXPECTED_FAILURES}
+    names = {case.name for case in benchmark_transforms.discover_cases(list(datasets))}
+
+    assert set(benchmark_transforms.EXPECTED_FAILURES) <= names
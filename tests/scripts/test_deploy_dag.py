@@ -781,6 +781,29 @@ def test_script_copy_files_in_data_folder_to_composer_data_folder_without_folder
     deploy_dag.copy_data_folder_to_composer_bucket.assert_not_called()
 
 
+def test_dag_operators_are_copied_only_for_dags_that_import_them(
+    dataset_path: pathlib.Path, pipeline_path: pathlib.Path, mocker
+):
+    pipeline_dir = ENV_DATASETS_PATH / dataset_path.name / "pipelines"
+    pipeline_dir.joinpath(pipeline_path.name).mkdir(parents=True, exist_ok=True)
+    dag_file = pipeline_dir / pipeline_path.name / f"{pipeline_path.name}_dag.py"
+    mocker.patch("scripts.deploy_dag.run_gsutil_cmd")
+
+    dag_file.write_text("from airflow.operators import bash\n")
+    deploy_dag.copy_dag_operators_to_airflow_dags_folder(
+        ENV_PATH, dataset_path.name, pipeline_path.name, "test-bucket"
+    )
+    deploy_dag.run_gsutil_cmd.assert_not_called()
+
+    dag_file.write_text("from dag_operators import gcs_to_bigquery_batch\n")
+    deploy_dag.copy_dag_operators_to_airflow_dags_folder(
+        ENV_PATH, dataset_path.name, pipeline_path.name, "test-bucket"
+    )
+    args, kwargs = deploy_dag.run_gsutil_cmd.call_args
+    assert args[0][-2:] == ["dag_operators", "gs://test-bucket/dags/dag_operators"]
+    assert kwargs["cwd"] == deploy_dag.PROJECT_ROOT
+
+
 def test_script_without_composer_env_or_region_fails(env: str):
     with pytest.raises(subprocess.CalledProcessError):
         # No --composer-env parameter
@@ -272,6 +272,26 @@ def test_checks_for_task_operator_and_id():
             generate_dag.validate_task(non_existing_task_id, airflow_version)
 
 
+def test_checks_that_batch_load_tasks_list_their_loads():
+    batch_task = {
+        "operator": "GoogleCloudStorageToBigQueryBatchOperator",
+        "args": {
+            "task_id": "load_gcs_to_bq",
+            "loads": [
+                {
+                    "source_objects": ["data/table.csv"],
+                    "destination_project_dataset_table": "dataset.table",
+                }
+            ],
+        },
+    }
+    generate_dag.validate_task(batch_task, "2")
+
+    batch_task["args"]["loads"] = []
+    with pytest.raises(KeyError):
+        generate_dag.validate_task(batch_task, "2")
+
+
 def test_check_custom_yaml_loader(
     dataset_path: pathlib.Path, pipeline_path: pathlib.Path, env: str
 ):
@@ -399,6 +419,23 @@ def test_build_images_copies_image_files_to_env_dir(
         assert (copied_image_dir / "Dockerfile").exists()
 
 
+def test_build_images_copies_transform_runtime_only_into_images_using_it(
+    dataset_path: pathlib.Path, pipeline_path: pathlib.Path, env: str, mocker
+):
+    copy_config_files_and_set_tmp_folder_names_as_ids(dataset_path, pipeline_path)
+    generate_image_files(dataset_path, num_containers=2)
+    (dataset_path / "pipelines" / "_images" / "test_image_1" / "Dockerfile").write_text(
+        "COPY ./transform_runtime ./transform_runtime\n"
+    )
+
+    mocker.patch("scripts.generate_dag.build_and_push_image")
+    generate_dag.main(dataset_path.name, pipeline_path.name, env, format_code=False)
+
+    images_dir = ENV_DATASETS_PATH / dataset_path.name / "pipelines" / "_images"
+    assert (images_dir / "test_image_1" / "transform_runtime" / "bq.py").exists()
+    assert not (images_dir / "test_image_2" / "transform_runtime").exists()
+
+
 def test_build_images_called_when_dataset_has_images_dir(
     dataset_path: pathlib.Path, pipeline_path: pathlib.Path, env: str, mocker
 ):
@@ -0,0 +1,217 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import threading
+
+import pytest
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery
+
+from transform_runtime import bq
+
+
+@pytest.fixture
+def client(mocker):
+    bq.bigquery_client.cache_clear()
+    client = mocker.MagicMock()
+    mocker.patch("transform_runtime.bq.bigquery.Client", return_value=client)
+    yield client
+    bq.bigquery_client.cache_clear()
+
+
+def test_create_table_schema_from_gcs_file(mocker):
+    mocker.patch(
+        "transform_runtime.gcs.download_blob_as_bytes",
+        return_value=json.dumps(
+            [
+                {"name": "id", "type": "STRING", "mode": "REQUIRED"},
+                {"name": "value", "type": "FLOAT", "description": "A value"},
+            ]
+        ).encode(),
+    )
+
+    schema = bq.create_table_schema([], "bucket", "schema.json")
+
+    assert [(f.name, f.field_type, f.mode) for f in schema] == [
+        ("id", "STRING", "REQUIRED"),
+        ("value", "FLOAT", "NULLABLE"),
+    ]
+    assert schema[1].description == "A value"
+
+
+def test_create_dest_table_keeps_existing_table(client, mocker):
+    exists = mocker.patch("transform_runtime.gcs.check_gcs_file_exists")
+
+    assert bq.create_dest_table("project", "dataset", "table", "schema.json", "bucket")
+    assert not client.create_table.called
+    assert not exists.called
+
+
+def test_create_dest_table_creates_missing_table(client, mocker):
+    client.get_table.side_effect = NotFound("missing")
+    mocker.patch("transform_runtime.gcs.check_gcs_file_exists", return_value=True)
+    mocker.patch("transform_runtime.bq.create_table_schema", return_value=[])
+
+    assert bq.create_dest_table("project", "dataset", "table", "schema.json", "bucket")
+    client.create_table.assert_called_once()
+
+
+def test_create_dest_table_without_schema_file_returns_false(client, mocker):
+    client.get_table.side_effect = NotFound("missing")
+    mocker.patch("transform_runtime.gcs.check_gcs_file_exists", return_value=False)
+
+    assert not bq.create_dest_table(
+        "project", "dataset", "table", "schema.json", "bucket"
+    )
+    assert not client.create_table.called
+
+
+def test_load_data_to_bq_sets_write_disposition(client, tmp_path):
+    file_path = tmp_path / "data.csv"
+    file_path.write_text("a|b\n1|2\n")
+
+    bq.load_data_to_bq("project", "dataset", "table", file_path, truncate_table=False)
+
+    _, table_ref = client.load_table_from_file.call_args.args
+    job_config = client.load_table_from_file.call_args.kwargs["job_config"]
+    assert table_ref == "project.dataset.table"
+    assert job_config.write_disposition == "WRITE_APPEND"
+    assert job_config.field_delimiter == "|"
+    client.load_table_from_file.return_value.result.assert_called_once()
+
+
+def test_load_data_from_gcs_loads_uri_without_reading_local_file(client):
+    bq.load_data_from_gcs(
+        "project",
+        "dataset",
+        "table",
+        "gs://bucket/path/part-*.csv",
+        truncate_table=True,
+        quotechar="^",
+    )
+
+    source_uris, table_ref = client.load_table_from_uri.call_args.args
+    job_config = client.load_table_from_uri.call_args.kwargs["job_config"]
+    assert source_uris == "gs://bucket/path/part-*.csv"
+    assert table_ref == "project.dataset.table"
+    assert job_config.write_disposition == "WRITE_TRUNCATE"
+    assert job_config.quote_character == "^"
+    assert not client.load_table_from_file.called
+    client.load_table_from_uri.return_value.result.assert_called_once()
+
+
+def test_load_state_index_queries_each_table_once(client, mocker):
+    client.list_tables.return_value = [mocker.Mock(table_id="trips_2021")]
+    client.get_table.return_value.schema = [
+        bigquery.SchemaField("data_file_year", "INTEGER"),
+        bigquery.SchemaField("data_file_month", "INTEGER"),
+    ]
+    client.query.return_value.result.return_value = [
+        bigquery.Row(("2021", "1"), {"year": 0, "month": 1}),
+        bigquery.Row(("2021", "2"), {"year": 0, "month": 1}),
+    ]
+    index = bq.LoadStateIndex(
+        "project", "dataset", ["data_file_year", "data_file_month"]
+    )
+
+    assert [index.is_loaded("trips_2021", 2021, month) for month in (1, 2, 3)] == [
+        True,
+        True,
+        False,
+    ]
+    client.query.assert_called_once_with(
+        "SELECT DISTINCT CAST(data_file_year AS STRING), "
+        "CAST(data_file_month AS STRING) FROM `project.dataset.trips_2021`"
+    )
+    client.get_table.assert_called_once()
+
+
+def test_load_state_index_reports_missing_tables_and_fields(client, mocker):
+    client.list_tables.return_value = [mocker.Mock(table_id="air_quality")]
+    client.get_table.return_value.schema = [bigquery.SchemaField("value", "FLOAT")]
+    index = bq.LoadStateIndex(
+        "project", "dataset", ["date_local"], {"date_local": "FORMAT_DATE('%Y', x)"}
+    )
+
+    assert index.is_loaded("missing", 2020) is None
+    assert index.is_loaded("air_quality", 2020) is None
+    client.list_tables.assert_called_once_with("dataset")
+    assert not client.query.called
+
+
+def test_load_state_index_creates_each_missing_table_once(client, mocker):
+    client.list_tables.return_value = [mocker.Mock(table_id="trips_2021")]
+    create = mocker.patch(
+        "transform_runtime.bq.create_dest_table", side_effect=[False, True]
+    )
+    index = bq.LoadStateIndex("project", "dataset", ["data_file_year"])
+
+    assert index.ensure_table("trips_2021", "schema.json", "bucket")
+    assert not index.ensure_table("trips_2022", "schema.json", "bucket")
+    assert index.ensure_table("trips_2022", "schema.json", "bucket")
+    assert index.ensure_table("trips_2022", "schema.json", "bucket")
+
+    assert create.call_count == 2
+    create.assert_called_with(
+        project_id="project",
+        dataset_id="dataset",
+        table_id="trips_2022",
+        schema_filepath="schema.json",
+        bucket_name="bucket",
+    )
+    client.list_tables.assert_called_once_with("dataset")
+
+
+def test_load_job_manager_runs_jobs_in_background_and_waits():
+    release = threading.Event()
+    done = []
+
+    def load(key):
+        release.wait(5)
+        done.append(key)
+
+    with bq.LoadJobManager(max_in_flight=2) as load_jobs:
+        load_jobs.submit("2021-01", load, "2021-01")
+        load_jobs.submit("2021-02", load, "2021-02")
+        assert done == []
+        release.set()
+
+    assert sorted(done) == ["2021-01", "2021-02"]
+
+
+def test_load_job_manager_raises_failures_after_all_jobs_ran():
+    done = []
+
+    def load(key):
+        if key == "bad":
+            raise ValueError("load failed")
+        done.append(key)
+
+    load_jobs = bq.LoadJobManager(max_in_flight=1)
+    for key in ["bad", "good"]:
+        load_jobs.submit(key, load, key)
+
+    with pytest.raises(RuntimeError, match="1 of 2 load job.s. failed: bad") as error:
+        load_jobs.wait()
+    assert isinstance(error.value.__cause__, ValueError)
+    assert done == ["good"]
+
+
+def test_load_job_manager_rejects_duplicate_keys():
+    with bq.LoadJobManager() as load_jobs:
+        load_jobs.submit("2021", lambda: None)
+        with pytest.raises(ValueError):
+            load_jobs.submit("2021", lambda: None)
@@ -0,0 +1,133 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pathlib
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+import pytest
+from google.cloud import bigquery
+
+from transform_runtime import columnar
+
+
+def test_arrow_schema_maps_bigquery_types():
+    schema = columnar.arrow_schema(
+        [
+            bigquery.SchemaField("id", "STRING", mode="REQUIRED"),
+            bigquery.SchemaField("amount", "NUMERIC"),
+            bigquery.SchemaField("pickup", "TIMESTAMP"),
+        ]
+    )
+
+    assert schema.field("id").type == pa.string()
+    assert not schema.field("id").nullable
+    assert schema.field("amount").type == pa.decimal128(38, 9)
+    assert schema.field("pickup").type == pa.timestamp("us", tz="UTC")
+
+
+def test_rename_columns_by_position_keeps_extra_columns():
+    table = pa.table({"VendorID": [1], "PULocationID": [2], "extra": [3]})
+
+    table = columnar.rename_columns_by_position(table, ["vendor_id", "location"])
+
+    assert table.column_names == ["vendor_id", "location", "extra"]
+
+
+def test_conform_to_schema_casts_orders_and_fills_missing_columns():
+    table = pa.table({"b": [1.0, 2.5], "a": [1, 2]})
+    schema = pa.schema([("a", pa.string()), ("b", pa.string()), ("c", pa.int64())])
+
+    table = columnar.conform_to_schema(table, schema)
+
+    assert table.schema == schema
+    assert table.column("a").to_pylist() == ["1", "2"]
+    assert table.column("b").to_pylist() == ["1.0", "2.5"]
+    assert table.column("c").to_pylist() == [None, None]
+
+
+def test_parquet_sink_round_trips_batches(tmp_path: pathlib.Path):
+    source = tmp_path / "source.parquet"
+    pq.write_table(pa.table({"a": list(range(10))}), source, row_group_size=4)
+    target = tmp_path / "target.parquet"
+
+    batches = list(columnar.iter_parquet_batches(source, batch_size=3))
+    with columnar.ParquetSink(target, pa.schema([("a", pa.int64())])) as sink:
+        for batch in batches:
+            sink.write(pa.Table.from_batches([batch]))
+
+    assert all(batch.num_rows <= 3 for batch in batches)
+    assert sink.rows_written == 10
+    assert pq.read_table(target).column("a").to_pylist() == list(range(10))
+
+
+def test_dataframe_to_arrow_parses_text_columns():
+    df = pd.DataFrame(
+        {
+            "id": ["1", "2", ""],
+            "pickup": ["2022-01-01 10:00:00", "", "2022-01-02 11:30:00"],
+            "fare": [1.5, None, 3.0],
+        }
+    )
+    schema = columnar.arrow_schema(
+        [
+            bigquery.SchemaField("id", "INTEGER"),
+            bigquery.SchemaField("pickup", "TIMESTAMP"),
+            bigquery.SchemaField("fare", "FLOAT"),
+        ]
+    )
+
+    table = columnar.dataframe_to_arrow(df, schema)
+
+    assert table.schema == schema
+    assert table.column("id").to_pylist() == [1, 2, None]
+    assert table.column("pickup").to_pylist()[1] is None
+    assert str(table.column("pickup")[2]) == "2022-01-02 11:30:00+00:00"
+    assert table.column("fare").to_pylist() == [1.5, None, 3.0]
+
+
+def test_avro_schema_makes_nullable_fields_optional():
+    schema = columnar.avro_schema(
+        [
+            bigquery.SchemaField("id", "STRING", mode="REQUIRED"),
+            bigquery.SchemaField("day", "DATE"),
+        ]
+    )
+
+    assert schema["fields"] == [
+        {"name": "id", "type": "string"},
+        {
+            "name": "day",
+            "type": ["null", {"type": "int", "logicalType": "date"}],
+            "default": None,
+        },
+    ]
+
+
+def test_dataframe_sink_writes_avro(tmp_path: pathlib.Path):
+    fastavro = pytest.importorskip("fastavro")
+    target = tmp_path / "target.avro"
+    schema = [
+        bigquery.SchemaField("id", "INTEGER"),
+        bigquery.SchemaField("seen", "DATETIME"),
+    ]
+
+    with columnar.DataFrameSink(target, schema, "avro") as sink:
+        sink.write(pd.DataFrame({"id": ["1"], "seen": ["2022-01-01 10:00:00"]}))
+
+    with open(target, "rb") as avro_file:
+        records = list(fastavro.reader(avro_file))
+    assert records == [{"id": 1, "seen": "2022-01-01T10:00:00.000000"}]
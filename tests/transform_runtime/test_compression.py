@@ -0,0 +1,99 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import gzip
+import pathlib
+import shutil
+import zipfile
+
+import pytest
+
+from transform_runtime import compression
+
+CONTENT = "a,b\n1,é\n2,y\n"
+
+
+@pytest.fixture
+def no_pigz(mocker):
+    mocker.patch("transform_runtime.compression.shutil.which", return_value=None)
+
+
+def test_open_text_reads_gzip_files(tmp_path: pathlib.Path, no_pigz):
+    source = tmp_path / "data.csv.gz"
+    with gzip.open(source, "wt", encoding="utf-8") as f:
+        f.write(CONTENT)
+
+    with compression.open_text(source) as stream:
+        assert stream.read() == CONTENT
+
+
+def test_open_text_reads_multi_member_gzip_files(tmp_path: pathlib.Path, no_pigz):
+    source = tmp_path / "data.csv.gz"
+    source.write_bytes(gzip.compress(b"a,b\n") + gzip.compress(b"1,x\n"))
+
+    with compression.open_text(source) as stream:
+        assert stream.read() == "a,b\n1,x\n"
+
+
+@pytest.mark.skipif(shutil.which("pigz") is None, reason="pigz is not installed")
+def test_open_text_reads_gzip_files_through_pigz(tmp_path: pathlib.Path):
+    source = tmp_path / "data.csv.gz"
+    with gzip.open(source, "wt", encoding="utf-8") as f:
+        f.write(CONTENT)
+
+    with compression.open_text(source) as stream:
+        assert stream.read() == CONTENT
+
+
+def test_open_text_reads_single_member_zip_files(tmp_path: pathlib.Path):
+    source = tmp_path / "data.zip"
+    with zipfile.ZipFile(source, "w") as archive:
+        archive.writestr("data.csv", CONTENT)
+
+    with compression.open_text(source) as stream:
+        assert stream.read() == CONTENT
+
+
+def test_open_binary_rejects_zip_files_with_several_members(tmp_path: pathlib.Path):
+    source = tmp_path / "data.zip"
+    with zipfile.ZipFile(source, "w") as archive:
+        archive.writestr("a.csv", CONTENT)
+        archive.writestr("b.csv", CONTENT)
+
+    with pytest.raises(ValueError):
+        with compression.open_binary(source):
+            pass
+
+
+def test_open_text_passes_plain_files_through(tmp_path: pathlib.Path):
+    source = tmp_path / "data.csv"
+    source.write_text(CONTENT, encoding="utf-8")
+
+    with compression.open_text(source) as stream:
+        assert stream.read() == CONTENT
+
+
+def test_decompress_file_writes_target_and_removes_source(
+    tmp_path: pathlib.Path, no_pigz
+):
+    source = tmp_path / "data.csv.gz"
+    target = tmp_path / "data.csv"
+    with gzip.open(source, "wt", encoding="utf-8") as f:
+        f.write(CONTENT)
+
+    compression.decompress_file(source, target, delete_zipfile=True)
+
+    assert target.read_text(encoding="utf-8") == CONTENT
+    assert not source.exists()
@@ -0,0 +1,78 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pathlib
+
+from transform_runtime import download
+
+STATIONS = {
+    "https://host/1.csv": b'"STATION","TEMP"\n"1","10.5"\n"1","11.0"\n',
+    "https://host/2.csv": b'"STATION","TEMP"\n"2","9.0"',
+    "https://host/3.csv": b'"STATION","TEMP"\n"3","8.5"\n',
+}
+
+
+class FakeResponse:
+    def __init__(self, content: bytes, status_code: int = 200) -> None:
+        self.content = content
+        self.status_code = status_code
+
+    def iter_content(self, chunk_size: int):
+        # Uneven chunks so that headers are split across chunk boundaries.
+        for start in range(0, len(self.content), 7):
+            yield self.content[start : start + 7]
+
+    def __enter__(self) -> "FakeResponse":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        pass
+
+
+class FakeSession:
+    def get(self, url: str, stream: bool = False, timeout: int = 0) -> FakeResponse:
+        if url not in STATIONS:
+            return FakeResponse(b"", status_code=404)
+        return FakeResponse(STATIONS[url])
+
+
+def test_concatenate_urls_keeps_only_the_first_header(tmp_path: pathlib.Path):
+    target = tmp_path / "gsod.csv"
+
+    appended = download.concatenate_urls(
+        list(STATIONS), target, max_workers=3, session=FakeSession()
+    )
+
+    assert appended == 3
+    assert target.read_bytes() == (
+        b'"STATION","TEMP"\n"1","10.5"\n"1","11.0"\n"2","9.0"\n"3","8.5"\n'
+    )
+
+
+def test_concatenate_urls_can_drop_every_header_and_skips_missing_files(
+    tmp_path: pathlib.Path,
+):
+    target = tmp_path / "gsod.csv"
+
+    appended = download.concatenate_urls(
+        ["https://host/3.csv", "https://host/missing.csv", "https://host/1.csv"],
+        target,
+        max_workers=2,
+        keep_header=False,
+        session=FakeSession(),
+    )
+
+    assert appended == 2
+    assert target.read_bytes() == b'"3","8.5"\n"1","10.5"\n"1","11.0"\n'
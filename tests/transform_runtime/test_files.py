@@ -0,0 +1,135 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import gzip
+import pathlib
+
+import pandas as pd
+
+from transform_runtime import files, resources
+
+
+def test_save_to_new_file_writes_pipe_delimited_csv(tmp_path: pathlib.Path):
+    df = pd.DataFrame({"a": [1, 2], "b": ["x", "y"]})
+    target = tmp_path / "out.csv"
+
+    files.save_to_new_file(df, str(target))
+
+    assert target.read_text() == "a|b\n1|x\n2|y\n"
+
+
+def test_append_batch_file_skips_header_and_removes_batch_file(
+    tmp_path: pathlib.Path,
+):
+    target = tmp_path / "target.csv"
+    first = tmp_path / "batch-1.csv"
+    second = tmp_path / "batch-2.csv"
+    first.write_text("a|b\n1|x\n")
+    second.write_text("a|b\n2|y\n")
+
+    files.append_batch_file(str(first), str(target), False, True)
+    files.append_batch_file(str(second), str(target), True, False)
+
+    assert target.read_text() == "a|b\n1|x\n2|y\n"
+    assert not first.exists()
+    assert not second.exists()
+
+
+def test_append_batch_file_truncates_existing_target(tmp_path: pathlib.Path):
+    target = tmp_path / "target.csv"
+    target.write_text("stale\n")
+    batch = tmp_path / "batch.csv"
+    batch.write_text("a|b\n1|x\n")
+
+    files.append_batch_file(str(batch), str(target), False, True)
+
+    assert target.read_text() == "a|b\n1|x\n"
+
+
+def test_csv_chunk_sink_writes_header_once(tmp_path: pathlib.Path):
+    target = tmp_path / "out.csv"
+
+    with files.CsvChunkSink(str(target)) as sink:
+        sink.write(pd.DataFrame({"a": [1], "b": ["x"]}))
+        sink.write(pd.DataFrame({"a": [2], "b": ["y"]}))
+
+    assert target.read_text() == "a|b\n1|x\n2|y\n"
+    assert sink.rows_written == 2
+
+
+def test_csv_chunk_sink_does_not_create_file_without_chunks(tmp_path: pathlib.Path):
+    target = tmp_path / "out.csv"
+
+    with files.CsvChunkSink(str(target)):
+        pass
+
+    assert not target.exists()
+
+
+def test_csv_chunk_sink_applies_float_format(tmp_path: pathlib.Path):
+    target = tmp_path / "out.csv"
+
+    with files.CsvChunkSink(str(target), sep=",", float_format="%.0f") as sink:
+        sink.write(pd.DataFrame({"a": [1.0, None], "b": ["x", "y"]}))
+
+    assert target.read_text() == "a,b\n1,x\n,y\n"
+
+
+def test_csv_chunk_sink_compresses_gz_targets(tmp_path: pathlib.Path):
+    target = tmp_path / "out.csv.gz"
+
+    with files.CsvChunkSink(str(target)) as sink:
+        sink.write(pd.DataFrame({"a": [1, 2]}))
+
+    with gzip.open(target, "rt") as f:
+        assert f.read() == "a\n1\n2\n"
+
+
+def test_read_csv_chunks_splits_rows_evenly(tmp_path: pathlib.Path):
+    source = tmp_path / "source.csv"
+    source.write_text("skip me\n" + "".join(f"{i}|x{i}|\n" for i in range(5)))
+
+    chunks = list(
+        files.read_csv_chunks(
+            source, names=["id", "name", "note"], chunksize=2, sep="|", header_rows=1
+        )
+    )
+
+    assert [len(df) for df in chunks] == [2, 2, 1]
+    assert chunks[0]["id"].tolist() == ["0", "1"]
+    assert chunks[2]["note"].tolist() == [""]
+
+
+def test_read_csv_chunks_applies_dtypes(tmp_path: pathlib.Path):
+    source = tmp_path / "source.csv"
+    source.write_text('1,"a,b"\n2,c\n')
+
+    (df,) = files.read_csv_chunks(
+        source, names=["id", "name"], chunksize=10, dtypes={"id": "int64"}
+    )
+
+    assert df["id"].tolist() == [1, 2]
+    assert df["name"].tolist() == ["a,b", "c"]
+
+
+def test_read_csv_chunks_resizes_after_first_chunk(tmp_path: pathlib.Path):
+    source = tmp_path / "source.csv"
+    source.write_text("".join(f"{i}|x{i}\n" for i in range(20)))
+    sizer = resources.ChunkSizer(initial_rows=2, min_rows=1, memory_bytes=0)
+
+    chunks = list(files.read_csv_chunks(source, ["id", "name"], sizer, sep="|"))
+
+    assert [len(df) for df in chunks[:2]] == [2, 1]
+    assert sum(len(df) for df in chunks) == 20
@@ -0,0 +1,68 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import gzip
+import pathlib
+
+import pandas as pd
+import pyarrow.parquet as pq
+import pytest
+from google.cloud import bigquery
+
+from transform_runtime import formats
+
+
+def test_output_file_path_swaps_csv_extension():
+    assert formats.output_file_path("files/data_output.csv", "csv") == (
+        "files/data_output.csv"
+    )
+    assert formats.output_file_path("files/data_output.csv", "csv.gz") == (
+        "files/data_output.csv.gz"
+    )
+    assert formats.output_file_path("data/2022.csv", "PARQUET") == "data/2022.parquet"
+
+
+def test_source_format_rejects_unknown_formats():
+    assert formats.source_format("avro") == bigquery.SourceFormat.AVRO
+    assert formats.source_format("csv.gz") == bigquery.SourceFormat.CSV
+    with pytest.raises(ValueError):
+        formats.source_format("json")
+
+
+def test_chunk_sink_writes_gzip_csv(tmp_path: pathlib.Path):
+    target = tmp_path / "output.csv.gz"
+
+    with formats.chunk_sink(target, "csv.gz") as sink:
+        sink.write(pd.DataFrame({"a": [1], "b": ["x"]}))
+
+    with gzip.open(target, "rt") as target_file:
+        assert target_file.read() == "a|b\n1|x\n"
+
+
+def test_chunk_sink_types_parquet_from_table_schema(tmp_path: pathlib.Path):
+    target = tmp_path / "output.parquet"
+    schema = [bigquery.SchemaField("a", "INTEGER"), bigquery.SchemaField("b", "STRING")]
+
+    with formats.chunk_sink(target, "parquet", schema) as sink:
+        sink.write(pd.DataFrame({"b": ["x", "y"], "a": ["1", ""]}))
+
+    table = pq.read_table(target)
+    assert table.column_names == ["a", "b"]
+    assert table.column("a").to_pylist() == [1, None]
+
+
+def test_chunk_sink_needs_schema_for_columnar_formats(tmp_path: pathlib.Path):
+    with pytest.raises(ValueError):
+        formats.chunk_sink(tmp_path / "output.avro", "avro")
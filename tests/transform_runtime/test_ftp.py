@@ -0,0 +1,150 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import ftplib
+import pathlib
+
+import pytest
+
+from transform_runtime import ftp, metrics
+
+PAYLOAD = b"0123456789" * 10
+
+
+class FakeFtp:
+    connections = []
+    mlsd_supported = True
+    failures_before_success = 0
+
+    def __init__(self, host: str, timeout: int = 60) -> None:
+        self.host = host
+        self.commands = []
+        FakeFtp.connections.append(self)
+
+    def login(self, user: str = "", passwd: str = "") -> None:
+        self.commands.append("LOGIN")
+
+    def voidcmd(self, cmd: str) -> None:
+        self.commands.append(cmd)
+
+    def cwd(self, dirname: str) -> None:
+        self.commands.append(f"CWD {dirname}")
+
+    def mlsd(self, path: str = "", facts: list = []):
+        self.commands.append("MLSD")
+        if not FakeFtp.mlsd_supported:
+            raise ftplib.error_perm("500 Unknown command")
+        return iter([("a.csv.gz", {"type": "file"}), ("sub", {"type": "dir"})])
+
+    def nlst(self) -> list:
+        self.commands.append("NLST")
+        return ["a.csv.gz", "sub"]
+
+    def retrbinary(self, cmd, callback, blocksize=8192, rest=None) -> None:
+        self.commands.append((cmd, rest))
+        data = PAYLOAD[rest or 0 :]
+        if FakeFtp.failures_before_success:
+            FakeFtp.failures_before_success -= 1
+            callback(data[:25])
+            raise TimeoutError("timed out")
+        callback(data)
+
+    def quit(self) -> None:
+        self.commands.append("QUIT")
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture(autouse=True)
+def fake_ftp(mocker):
+    FakeFtp.connections = []
+    FakeFtp.mlsd_supported = True
+    FakeFtp.failures_before_success = 0
+    mocker.patch("transform_runtime.ftp.ftplib.FTP", FakeFtp)
+    mocker.patch("transform_runtime.ftp.time.sleep")
+
+
+def test_download_reuses_the_logged_in_connection(tmp_path: pathlib.Path):
+    with ftp.FtpSessionPool() as sessions:
+        sessions.download("host", "/pub", "a.csv.gz", tmp_path / "a.csv.gz")
+        sessions.download("host", "/pub", "b.csv.gz", tmp_path / "b.csv.gz")
+
+    assert len(FakeFtp.connections) == 1
+    assert FakeFtp.connections[0].commands.count("LOGIN") == 1
+    assert "NOOP" in FakeFtp.connections[0].commands
+    assert (tmp_path / "b.csv.gz").read_bytes() == PAYLOAD
+
+
+def test_download_resumes_partial_file_after_failure(tmp_path: pathlib.Path):
+    FakeFtp.failures_before_success = 2
+    local_file = tmp_path / "a.csv.gz"
+
+    with ftp.FtpSessionPool() as sessions:
+        sessions.download("host", "/pub", "a.csv.gz", local_file)
+
+    assert local_file.read_bytes() == PAYLOAD
+    retrieves = [
+        cmd
+        for conn in FakeFtp.connections
+        for cmd in conn.commands
+        if isinstance(cmd, tuple)
+    ]
+    assert retrieves == [
+        ("RETR a.csv.gz", None),
+        ("RETR a.csv.gz", 25),
+        ("RETR a.csv.gz", 50),
+    ]
+
+
+def test_download_records_a_download_stage(tmp_path: pathlib.Path):
+    FakeFtp.failures_before_success = 1
+    metrics.reset()
+
+    with ftp.FtpSessionPool() as sessions:
+        sessions.download("host", "/pub", "a.csv.gz", tmp_path / "a.csv.gz")
+
+    download = metrics.summary()["stages"]["download"]
+    metrics.reset()
+    assert download["calls"] == 1
+    assert download["bytes_written"] == len(PAYLOAD)
+
+
+def test_download_gives_up_after_max_attempts(tmp_path: pathlib.Path):
+    FakeFtp.failures_before_success = 3
+
+    with ftp.FtpSessionPool(max_attempts=3) as sessions:
+        with pytest.raises(TimeoutError):
+            sessions.download("host", "/pub", "a.csv.gz", tmp_path / "a.csv.gz")
+
+
+def test_list_files_is_cached_per_directory():
+    with ftp.FtpSessionPool() as sessions:
+        assert sessions.list_files("host", "/pub") == ["a.csv.gz"]
+        assert sessions.list_files("host", "/pub") == ["a.csv.gz"]
+
+    assert FakeFtp.connections[0].commands.count("MLSD") == 1
+
+
+def test_list_files_falls_back_to_nlst():
+    FakeFtp.mlsd_supported = False
+
+    with ftp.FtpSessionPool() as sessions:
+        assert sessions.list_files("host", "/pub") == ["a.csv.gz", "sub"]
+
+
+def test_backoff_delay_is_capped():
+    for attempt in range(10):
+        assert 0 <= ftp.backoff_delay(attempt, base_delay=2, max_delay=60) <= 60
@@ -0,0 +1,60 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pathlib
+
+import pytest
+
+from transform_runtime import gcs
+
+
+@pytest.fixture
+def blob(mocker):
+    gcs.storage_client.cache_clear()
+    client = mocker.MagicMock()
+    mocker.patch("transform_runtime.gcs.storage.Client", return_value=client)
+    yield client.bucket.return_value.blob.return_value
+    gcs.storage_client.cache_clear()
+
+
+def test_upload_file_to_gcs_sends_small_files_in_one_upload(
+    blob, mocker, tmp_path: pathlib.Path
+):
+    parallel = mocker.patch(
+        "transform_runtime.gcs.transfer_manager.upload_chunks_concurrently"
+    )
+    file_path = tmp_path / "data.csv"
+    file_path.write_text("a|b\n")
+
+    gcs.upload_file_to_gcs(file_path, "bucket", "path/data.csv")
+
+    blob.upload_from_filename.assert_called_once_with(str(file_path))
+    assert not parallel.called
+
+
+def test_upload_file_to_gcs_sends_large_files_in_parallel_parts(
+    blob, mocker, tmp_path: pathlib.Path
+):
+    mocker.patch("transform_runtime.gcs.PARALLEL_UPLOAD_THRESHOLD", 4)
+    parallel = mocker.patch(
+        "transform_runtime.gcs.transfer_manager.upload_chunks_concurrently"
+    )
+    file_path = tmp_path / "data.csv"
+    file_path.write_text("a|b\n")
+
+    gcs.upload_file_to_gcs(file_path, "bucket", "path/data.csv")
+
+    assert parallel.call_args.args == (str(file_path), blob)
+    assert not blob.upload_from_filename.called
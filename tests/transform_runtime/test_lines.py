@@ -0,0 +1,84 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import gzip
+import io
+import pathlib
+import re
+
+import pandas as pd
+
+from transform_runtime.lines import LineFilter
+
+LINES = ["title\n", 'a|"b"|nan|\n', "c|\x01d|<NA>\n", "total: 2\n"]
+
+
+def test_line_filter_skips_rows_and_substitutes_in_order():
+    line_filter = LineFilter(
+        header_rows=1,
+        footer_rows=1,
+        substitutions=[("|nan|", "||"), (re.compile(r"[\x00-\x08]"), ""), ('"', "'")],
+    )
+
+    assert list(line_filter(LINES)) == ["a|'b'||\n", "c|d|<NA>\n"]
+
+
+def test_line_filter_substitutions_do_not_touch_line_endings():
+    line_filter = LineFilter(substitutions=[(re.compile(r"\s"), "_")])
+
+    assert list(line_filter(["a b\r\n", "c"])) == ["a_b\r\n", "c"]
+
+
+def test_line_filter_file_rewrites_in_place(tmp_path: pathlib.Path):
+    source = tmp_path / "data.csv"
+    source.write_text("".join(LINES))
+
+    LineFilter(header_rows=1, substitutions=[("|<NA>", "|")]).filter_file(source)
+
+    assert source.read_text() == 'a|"b"|nan|\nc|\x01d|\ntotal: 2\n'
+
+
+def test_line_filter_file_decompresses_into_target(tmp_path: pathlib.Path):
+    source = tmp_path / "data.csv.gz"
+    target = tmp_path / "data.csv"
+    with gzip.open(source, "wt") as f:
+        f.write("".join(LINES))
+
+    LineFilter(header_rows=1, footer_rows=1).filter_file(source, target)
+
+    assert target.read_text() == "".join(LINES[1:3])
+
+
+def test_line_filter_reader_feeds_read_csv():
+    line_filter = LineFilter(header_rows=1, footer_rows=1)
+
+    df = pd.read_csv(
+        line_filter.reader(io.StringIO("".join(LINES))),
+        sep="|",
+        header=None,
+        keep_default_na=False,
+    )
+
+    assert df[0].tolist() == ["a", "c"]
+
+
+def test_line_filter_writer_filters_to_csv_output():
+    df = pd.DataFrame({"a": ["x", "y"], "b": [None, "z"], "c": [1, 2]})
+    output = io.StringIO()
+
+    with LineFilter(substitutions=[("|<NA>|", "||")]).writer(output) as writer:
+        df.astype({"b": "string"}).to_csv(writer, sep="|", index=False)
+
+    assert output.getvalue() == "a|b|c\nx||1\ny|z|2\n"
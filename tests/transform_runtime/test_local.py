@@ -0,0 +1,236 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import decimal
+import functools
+import http.server
+import json
+import os
+import pathlib
+import subprocess
+import sys
+import threading
+
+import pandas as pd
+import pytest
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery
+
+from transform_runtime import bq, gcs, local
+
+REPO_ROOT = pathlib.Path(__file__).resolve().parents[2]
+FILM_LOCATIONS_SCRIPT = (
+    REPO_ROOT
+    / "datasets/san_francisco_film_locations/pipelines/_images"
+    / "run_csv_transform_kub/csv_transform.py"
+)
+SCHEMA = [
+    {"name": "year", "type": "INTEGER", "mode": "REQUIRED"},
+    {"name": "name", "type": "STRING", "mode": "NULLABLE"},
+    {"name": "source_url", "type": "STRING", "mode": "NULLABLE"},
+]
+
+
+def clear_clients():
+    for cached in (
+        gcs.storage_client,
+        bq.bigquery_client,
+        local.storage_client,
+        local.bigquery_client,
+    ):
+        cached.cache_clear()
+
+
+@pytest.fixture(autouse=True)
+def local_backend(monkeypatch, tmp_path: pathlib.Path) -> pathlib.Path:
+    monkeypatch.setenv(local.BACKEND_ENV, "local")
+    monkeypatch.setenv(local.LOCAL_BACKEND_PATH_ENV, str(tmp_path / "backend"))
+    clear_clients()
+    yield tmp_path / "backend"
+    clear_clients()
+
+
+@pytest.fixture
+def table(tmp_path: pathlib.Path) -> str:
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(json.dumps(SCHEMA))
+    gcs.upload_file_to_gcs(schema_file, "bucket", "schemas/trips.json")
+    assert bq.create_dest_table("proj", "ds", "trips", "schemas/trips.json", "bucket")
+    return "trips"
+
+
+def test_storage_round_trips_through_the_file_system(local_backend, tmp_path):
+    source = tmp_path / "data.csv"
+    source.write_text("a|b\n")
+
+    gcs.upload_file_to_gcs(source, "bucket", "data/2022/data.csv")
+
+    assert (local_backend / "gcs" / "bucket" / "data" / "2022" / "data.csv").exists()
+    assert gcs.check_gcs_file_exists("data/2022/data.csv", "bucket")
+    assert not gcs.check_gcs_file_exists("data/2023/data.csv", "bucket")
+    assert gcs.download_blob_as_bytes("bucket", "data/2022/data.csv") == b"a|b\n"
+
+
+def test_create_dest_table_reads_schema_from_local_bucket(table):
+    schema = bq.get_table_schema("proj", "ds", table)
+
+    assert [(field.name, field.field_type, field.mode) for field in schema] == [
+        ("year", "INTEGER", "REQUIRED"),
+        ("name", "STRING", "NULLABLE"),
+        ("source_url", "STRING", "NULLABLE"),
+    ]
+
+
+def test_loads_from_uri_and_answers_queries(table, tmp_path):
+    for part, rows in enumerate(["2021|a|x\n2022||x\n", "2022|c|y\n"]):
+        target = tmp_path / f"part-{part}.csv"
+        target.write_text("year|name|source_url\n" + rows)
+        gcs.upload_file_to_gcs(target, "bucket", f"out/part-{part}.csv")
+
+    bq.load_data_from_gcs(
+        "proj", "ds", table, gcs.gcs_uri("bucket", "out/part-*.csv"), True
+    )
+
+    state = bq.LoadStateIndex("proj", "ds", ["year"])
+    assert state.is_loaded(table, 2022)
+    assert not state.is_loaded(table, 2020)
+    rows = bq.bigquery_client().query("SELECT * FROM `proj.ds.trips`").result()
+    assert [tuple(row.values()) for row in rows] == [
+        (2021, "a", "x"),
+        (2022, None, "x"),
+        (2022, "c", "y"),
+    ]
+
+    bq.delete_source_file_data_from_bq("proj", "ds", table, "x")
+    rows = bq.bigquery_client().query("SELECT year FROM `proj.ds.trips`").result()
+    assert [row["year"] for row in rows] == [2022]
+
+
+def test_loads_parquet_timestamps_and_decimals(tmp_path):
+    schema_file = tmp_path / "schema.json"
+    schema_file.write_text(
+        json.dumps(
+            [
+                {"name": "pickup_datetime", "type": "TIMESTAMP"},
+                {"name": "fare_amount", "type": "NUMERIC"},
+            ]
+        )
+    )
+    gcs.upload_file_to_gcs(schema_file, "bucket", "schemas/fares.json")
+    assert bq.create_dest_table("proj", "ds", "fares", "schemas/fares.json", "bucket")
+    target = tmp_path / "fares.parquet"
+    pd.DataFrame(
+        {
+            "pickup_datetime": pd.to_datetime(["2022-01-01 10:30:00", None]),
+            "fare_amount": [decimal.Decimal("12.50"), None],
+        }
+    ).to_parquet(target)
+    gcs.upload_file_to_gcs(target, "bucket", "out/fares.parquet")
+
+    bq.load_data_from_gcs(
+        "proj",
+        "ds",
+        "fares",
+        gcs.gcs_uri("bucket", "out/fares.parquet"),
+        False,
+        source_format=bigquery.SourceFormat.PARQUET,
+    )
+
+    rows = bq.bigquery_client().query("SELECT * FROM `proj.ds.fares`").result()
+    assert [tuple(row.values()) for row in rows] == [
+        ("2022-01-01 10:30:00", 12.5),
+        (None, None),
+    ]
+
+
+def test_load_data_to_bq_truncates(table, tmp_path):
+    target = tmp_path / "target.csv"
+    target.write_text("year|name|source_url\n2020|a|x\n")
+
+    bq.load_data_to_bq("proj", "ds", table, target, truncate_table=False)
+    bq.load_data_to_bq("proj", "ds", table, target, truncate_table=True)
+
+    rows = bq.bigquery_client().query("SELECT COUNT(*) AS n FROM `proj.ds.trips`")
+    assert rows.result()[0]["n"] == 1
+
+
+def test_missing_tables_raise_not_found():
+    with pytest.raises(NotFound):
+        bq.get_table_schema("proj", "ds", "missing")
+    assert bq.LoadStateIndex("proj", "ds", ["year"]).is_loaded("missing", 1) is None
+
+
+@pytest.fixture
+def http_dir(tmp_path: pathlib.Path) -> str:
+    serve_dir = tmp_path / "http"
+    serve_dir.mkdir()
+    handler = functools.partial(
+        http.server.SimpleHTTPRequestHandler, directory=str(serve_dir)
+    )
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield serve_dir, f"http://127.0.0.1:{server.server_port}"
+    server.shutdown()
+    server.server_close()
+
+
+def test_image_main_runs_against_local_backend_from_env_alone(
+    local_backend, http_dir, tmp_path
+):
+    # The image builds its own storage.Client(), so this only passes when
+    # importing transform_runtime installs the local stand-ins.
+    serve_dir, base_url = http_dir
+    (serve_dir / "film_locations.csv").write_text(
+        "Title,Release Year,Locations,Fun Facts,Production Company,Distributor,"
+        "Director,Writer,Actor 1,Actor 2,Actor 3\n"
+        "Vertigo,1958,Fort Point,,Paramount, Paramount , Alfred Hitchcock ,"
+        "Alec Coppel,James Stewart, Kim Novak ,\n"
+    )
+    env = {
+        key: value for key, value in os.environ.items() if not key.startswith("GOOGLE_")
+    }
+    env.update(
+        {
+            "PYTHONPATH": str(REPO_ROOT),
+            "NO_PROXY": "127.0.0.1",
+            local.BACKEND_ENV: "local",
+            local.LOCAL_BACKEND_PATH_ENV: str(local_backend),
+            "SOURCE_URL": f"{base_url}/film_locations.csv",
+            "SOURCE_FILE": "files/data.csv",
+            "TARGET_FILE": "files/data_output.csv",
+            "CHUNKSIZE": "1",
+            "TARGET_GCS_BUCKET": "bucket",
+            "TARGET_GCS_PATH": "data/film_locations/data_output.csv",
+        }
+    )
+
+    subprocess.run(
+        [sys.executable, str(FILM_LOCATIONS_SCRIPT)],
+        cwd=tmp_path,
+        env=env,
+        check=True,
+        timeout=120,
+    )
+
+    uploaded = gcs.download_blob_as_bytes(
+        "bucket", "data/film_locations/data_output.csv"
+    ).decode()
+    assert uploaded.splitlines() == [
+        "title,release_year,locations,fun_facts,production_company,distributor,"
+        "director,writer,actor_1,actor_2,actor_3",
+        "Vertigo,1958,Fort Point,,Paramount,Paramount,Alfred Hitchcock,"
+        "Alec Coppel,James Stewart,Kim Novak,",
+    ]
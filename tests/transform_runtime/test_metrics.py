@@ -0,0 +1,85 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import json
+import pathlib
+
+import pytest
+
+from transform_runtime import files, metrics
+
+
+@pytest.fixture(autouse=True)
+def reset_metrics():
+    metrics.reset()
+    yield
+    metrics.reset()
+
+
+def test_stage_adds_up_calls_by_name():
+    for rows in (3, 4):
+        with metrics.stage("parse") as stats:
+            stats.rows_in += rows
+            stats.bytes_read += 10
+
+    parse = metrics.summary()["stages"]["parse"]
+    assert parse["calls"] == 2
+    assert parse["rows_in"] == 7
+    assert parse["bytes_read"] == 20
+    assert parse["wall_seconds"] >= 0
+    assert parse["peak_rss_bytes"] > 0
+
+
+def test_stage_records_failed_calls():
+    with pytest.raises(ValueError):
+        with metrics.stage("load"):
+            raise ValueError("boom")
+
+    assert metrics.summary()["stages"]["load"]["calls"] == 1
+
+
+def test_timed_wraps_function():
+    @metrics.timed("transform")
+    def double(x: int) -> int:
+        return x * 2
+
+    assert double(2) == 4
+    assert double.__name__ == "double"
+    assert metrics.summary()["stages"]["transform"]["calls"] == 1
+
+
+def test_emit_summary_writes_json(tmp_path: pathlib.Path):
+    source = tmp_path / "source.csv"
+    source.write_text("1|a\n2|b\n3|c\n")
+    target = tmp_path / "target.csv"
+    summary_file = tmp_path / "summary.json"
+
+    with files.CsvChunkSink(target) as sink:
+        for df in files.read_csv_chunks(source, ["id", "name"], 2, sep="|"):
+            sink.write(df)
+    metrics.emit_summary(str(summary_file))
+
+    stages = json.loads(summary_file.read_text())["stages"]
+    assert stages["parse"]["rows_in"] == 3
+    assert stages["serialize"]["rows_out"] == 3
+    assert stages["serialize"]["bytes_written"] == target.stat().st_size
+
+
+def test_emit_summary_skips_when_nothing_was_recorded(tmp_path: pathlib.Path):
+    summary_file = tmp_path / "summary.json"
+
+    metrics.emit_summary(str(summary_file))
+
+    assert not summary_file.exists()
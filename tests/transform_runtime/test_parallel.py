@@ -0,0 +1,113 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import concurrent.futures
+import threading
+import time
+
+import pytest
+
+from transform_runtime import metrics, parallel
+
+
+def test_run_in_threads_returns_results_in_input_order():
+    def slow_square(value: int) -> int:
+        time.sleep(0.01 * (5 - value))
+        return value * value
+
+    assert parallel.run_in_threads(slow_square, range(5), max_workers=5) == [
+        0,
+        1,
+        4,
+        9,
+        16,
+    ]
+
+
+def test_run_in_threads_reraises_first_failure():
+    def fail_on_three(value: int) -> int:
+        if value == 3:
+            raise ValueError("bad year")
+        return value
+
+    with pytest.raises(ValueError, match="bad year"):
+        parallel.run_in_threads(fail_on_three, range(5), max_workers=2)
+
+
+def test_map_in_order_keeps_a_bounded_window_of_submitted_items():
+    submitted = []
+
+    def record(value: int) -> int:
+        submitted.append(value)
+        return value * 10
+
+    with concurrent.futures.ThreadPoolExecutor(max_workers=2) as executor:
+        results = parallel.map_in_order(executor, record, range(10), window=3)
+        consumed = []
+        for result in results:
+            consumed.append(result)
+            assert len(submitted) <= len(consumed) + 3
+
+    assert consumed == [value * 10 for value in range(10)]
+    assert sorted(submitted) == list(range(10))
+
+
+def test_host_connection_limiter_caps_connections_per_host():
+    limiter = parallel.HostConnectionLimiter(max_connections_per_host=2)
+    lock = threading.Lock()
+    open_connections = {"a": 0, "b": 0}
+    peak = {"a": 0, "b": 0}
+
+    def connect(host: str) -> None:
+        with limiter.connection(host):
+            with lock:
+                open_connections[host] += 1
+                peak[host] = max(peak[host], open_connections[host])
+            time.sleep(0.02)
+            with lock:
+                open_connections[host] -= 1
+
+    parallel.run_in_threads(connect, ["a", "b"] * 4, max_workers=8)
+
+    assert peak == {"a": 2, "b": 2}
+
+
+def count_rows(rows: int) -> int:
+    with metrics.stage("transform") as stats:
+        stats.rows_in += rows
+    return rows
+
+
+def fail() -> None:
+    raise ValueError("bad year")
+
+
+def test_process_pool_runs_work_in_other_processes():
+    with parallel.process_pool(max_workers=1) as pool:
+        assert pool.submit(abs, -3).result() == 3
+
+
+def test_process_pool_merges_stages_recorded_by_workers():
+    metrics.reset()
+    with parallel.process_pool(max_workers=2) as pool:
+        futures = [pool.submit(count_rows, rows) for rows in (3, 4, 5)]
+        assert [future.result() for future in futures] == [3, 4, 5]
+        with pytest.raises(ValueError, match="bad year"):
+            pool.submit(fail).result()
+
+    transform = metrics.summary()["stages"]["transform"]
+    metrics.reset()
+    assert transform["calls"] == 3
+    assert transform["rows_in"] == 12
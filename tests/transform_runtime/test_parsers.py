@@ -0,0 +1,115 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import io
+import pathlib
+
+import pandas as pd
+import pytest
+
+from transform_runtime import parsers
+
+
+def failing_engine(mocker, engine: str):
+    """Makes pd.read_csv raise a ParserError whenever `engine` is asked for."""
+    read_csv = pd.read_csv
+
+    def fake_read_csv(*args, **kwargs):
+        if kwargs.get("engine") == engine:
+            raise pd.errors.ParserError(f"{engine} error")
+        return read_csv(*args, **kwargs)
+
+    return mocker.patch.object(parsers.pd, "read_csv", side_effect=fake_read_csv)
+
+
+def test_csv_engine_keeps_python_for_dialects_only_it_supports():
+    assert parsers.csv_engine("f.csv", {"sep": ";|,"}, chunked=True) == "python"
+    assert parsers.csv_engine("f.csv", {"sep": None}, chunked=True) == "python"
+    assert parsers.csv_engine("f.csv", {"skipfooter": 1}, chunked=False) == "python"
+    assert parsers.csv_engine("f.csv", {"sep": "|"}, chunked=True) == "c"
+    assert parsers.csv_engine("f.csv", {"sep": r"\s+"}, chunked=True) == "c"
+
+
+def test_csv_engine_picks_pyarrow_only_when_every_type_is_fixed(mocker):
+    mocker.patch.object(parsers, "_pyarrow_available", return_value=True)
+    names = ["a", "b"]
+
+    assert (
+        parsers.csv_engine("f.csv", {"names": names, "dtype": str}, chunked=False)
+        == "pyarrow"
+    )
+    assert (
+        parsers.csv_engine("f.csv", {"names": names, "dtype": {"a": str}}, False) == "c"
+    )
+    assert parsers.csv_engine("f.csv", {"names": names}, chunked=False) == "c"
+    assert parsers.csv_engine("f.csv", {"dtype": str}, chunked=True) == "c"
+    assert parsers.csv_engine(io.StringIO(), {"dtype": str}, chunked=False) == "c"
+    assert (
+        parsers.csv_engine("f.csv", {"dtype": str, "quoting": 1}, chunked=False) == "c"
+    )
+
+
+def test_iter_csv_yields_reader_chunks_with_the_c_engine(
+    tmp_path: pathlib.Path, mocker
+):
+    source = tmp_path / "in.csv"
+    source.write_text("a,b\n1,x\n2,y\n3,z\n")
+    read_csv = mocker.spy(parsers.pd, "read_csv")
+
+    chunks = list(parsers.iter_csv(str(source), 2, dtype={"a": "int64"}))
+
+    assert read_csv.call_args.kwargs["engine"] == "c"
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert pd.concat(chunks)["a"].tolist() == [1, 2, 3]
+
+
+def test_iter_csv_falls_back_to_python_when_c_parser_fails(
+    tmp_path: pathlib.Path, mocker
+):
+    source = tmp_path / "in.csv"
+    source.write_text("a|b\n1|x\n2|y\n")
+    failing_engine(mocker, "c")
+
+    with open(source) as stream:
+        stream.readline()
+        chunks = list(parsers.iter_csv(stream, 10, sep="|", names=["a", "b"]))
+
+    assert chunks[0].to_dict("list") == {"a": [1, 2], "b": ["x", "y"]}
+
+
+def test_iter_csv_raises_when_stream_cannot_be_read_again(mocker):
+    failing_engine(mocker, "c")
+
+    class Unseekable(io.StringIO):
+        def seekable(self):
+            return False
+
+    with pytest.raises(pd.errors.ParserError):
+        list(parsers.iter_csv(Unseekable("a\n1\n"), 10))
+
+
+def test_read_csv_falls_back_from_pyarrow_to_c(tmp_path: pathlib.Path, mocker):
+    source = tmp_path / "in.csv"
+    source.write_text("a,b\n1,x\n")
+    mocker.patch.object(parsers, "_pyarrow_available", return_value=True)
+    read_csv = failing_engine(mocker, "pyarrow")
+
+    df = parsers.read_csv(str(source), dtype=str)
+
+    assert [call.kwargs["engine"] for call in read_csv.call_args_list] == [
+        "pyarrow",
+        "c",
+    ]
+    assert df.to_dict("list") == {"a": ["1"], "b": ["x"]}
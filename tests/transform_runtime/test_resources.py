@@ -0,0 +1,67 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import pathlib
+
+import pandas as pd
+
+from transform_runtime import resources
+
+
+def test_memory_limit_reads_cgroup_limit(mocker, tmp_path: pathlib.Path):
+    unlimited = tmp_path / "unlimited"
+    unlimited.write_text("max\n")
+    limited = tmp_path / "limited"
+    limited.write_text("1073741824\n")
+
+    mocker.patch.object(resources, "CGROUP_MEMORY_LIMIT_FILES", (str(limited),))
+    assert resources.memory_limit() == 1073741824
+
+    mocker.patch.object(
+        resources, "CGROUP_MEMORY_LIMIT_FILES", (str(tmp_path / "x"), str(unlimited))
+    )
+    assert resources.memory_limit() > 1073741824
+
+
+def test_chunk_sizer_targets_memory_fraction():
+    df = pd.DataFrame({"a": range(1000)}, dtype="int64")
+    bytes_per_row = df.memory_usage(index=True, deep=True).sum() / len(df)
+    sizer = resources.ChunkSizer(
+        initial_rows=1000,
+        memory_fraction=0.5,
+        min_rows=1,
+        max_rows=10**9,
+        memory_bytes=int(bytes_per_row * 100000),
+    )
+
+    assert sizer.observe(df) == 50000
+    assert sizer.observe(df.head(10)) == 50000
+    assert sizer.rows == 50000
+
+
+def test_chunk_sizer_clamps_rows():
+    df = pd.DataFrame({"a": ["x" * 100] * 10})
+
+    assert resources.ChunkSizer(memory_bytes=1, min_rows=500).observe(df) == 500
+    sizer = resources.ChunkSizer(memory_bytes=10**15, max_rows=2000)
+    assert sizer.observe(df) == 2000
+
+
+def test_chunk_sizer_from_setting():
+    assert resources.chunk_sizer("auto").adaptive
+    assert resources.chunk_sizer("").adaptive
+    fixed = resources.chunk_sizer("750000")
+    assert not fixed.adaptive
+    assert fixed.observe(pd.DataFrame({"a": [1]})) == 750000
@@ -0,0 +1,107 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from transform_runtime import transforms
+
+
+def test_convert_to_integer_string_blanks_nan_and_zero():
+    values = pd.Series([1.4, 2.6, np.nan, 0, "7"], dtype=object)
+
+    assert transforms.convert_to_integer_string(values).tolist() == [
+        "1",
+        "3",
+        "",
+        "",
+        "7",
+    ]
+
+
+def test_source_convert_date_formats_passes_blanks_through():
+    df = pd.DataFrame({"date": ["20200102", "", "nan"]})
+
+    df = transforms.source_convert_date_formats(df, [["date", "%Y%m%d", "%Y-%m-%d"]])
+
+    assert df["date"].tolist() == ["2020-01-02", "", "nan"]
+
+
+def test_slice_column_with_open_ended_slice():
+    df = pd.DataFrame({"textdata": ["AL ALABAMA  ", "US UNITED STATES"]})
+
+    df = transforms.slice_column(
+        df, {"code": ["textdata", "0", "2"], "name": ["textdata", "3", ""]}
+    )
+
+    assert df["code"].tolist() == ["AL", "US"]
+    assert df["name"].tolist() == ["ALABAMA", "UNITED STATES"]
+
+
+def test_apply_regex_supports_dollar_group_references():
+    df = pd.DataFrame({"lat": ["-00012.5", "3"]})
+
+    df = transforms.apply_regex(df, {"lat": ["^(-[0]+)(.*)", "-$2", "True"]})
+
+    assert df["lat"].tolist() == ["-12.5", "3"]
+
+
+def test_convert_date_from_int():
+    df = pd.DataFrame({"day_int": [20200101, 20211231]})
+
+    df = transforms.convert_date_from_int(df, {"date": "day_int"})
+
+    assert df["date"].tolist() == ["2020-01-01 00:00:00", "2021-12-31 00:00:00"]
+
+
+def test_generate_location():
+    df = pd.DataFrame({"lon": [1.5], "lat": [-2.25]})
+
+    df = transforms.generate_location(df, {"point": ["lon", "lat"]})
+
+    assert df["point"].tolist() == ["POINT(1.5 -2.25)"]
+
+
+def test_transform_plan_from_env_applies_steps_in_order():
+    environ = {
+        "NULL_ROWS_LIST": '["id"]',
+        "RENAME_HEADERS_LIST": '{"id": "station_id"}',
+        "REGEX_LIST": "{}",
+    }
+    plan = transforms.TransformPlan.from_env(
+        ["NULL_ROWS_LIST", "REGEX_LIST", "RENAME_HEADERS_LIST"], environ
+    )
+
+    df = plan(pd.DataFrame({"id": ["", "A1"], "value": ["1", "2"]}))
+
+    assert len(plan) == 2
+    assert df.columns.tolist() == ["station_id", "value"]
+    assert df["station_id"].tolist() == ["A1"]
+
+
+def test_transform_plan_accepts_callables():
+    plan = transforms.TransformPlan(
+        [("TRIM_WHITESPACE_LIST", ["a"]), lambda df: df.assign(b=df["a"] + "!")]
+    )
+
+    df = plan(pd.DataFrame({"a": [" x "]}))
+
+    assert df["b"].tolist() == ["x!"]
+
+
+def test_transform_plan_rejects_unknown_env_var():
+    with pytest.raises(ValueError):
+        transforms.TransformPlan([("UNKNOWN_LIST", ["a"])])
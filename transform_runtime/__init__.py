@@ -0,0 +1,27 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helpers for the container images under `datasets/*/pipelines/_images`.
+
+The package is copied into an image's build context by `scripts/generate_dag.py`
+whenever the image's Dockerfile refers to it.
+
+Importing the package with `TRANSFORM_BACKEND=local` set installs the local
+stand-ins, so images that still build their own Cloud clients run offline too.
+"""
+
+from transform_runtime import local
+
+if local.use_local_backend():
+    local.install()
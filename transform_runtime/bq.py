@@ -0,0 +1,375 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import functools
+import json
+import logging
+import pathlib
+import threading
+import typing
+
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery
+
+from transform_runtime import gcs, local, metrics
+
+
+@functools.lru_cache(maxsize=None)
+def bigquery_client(project_id: typing.Optional[str] = None) -> bigquery.Client:
+    if local.use_local_backend():
+        return local.bigquery_client()
+    return bigquery.Client(project=project_id)
+
+
+def create_table_schema(
+    schema_structure: list, bucket_name: str = "", schema_filepath: str = ""
+) -> typing.List[bigquery.SchemaField]:
+    logging.info(f"Defining table schema... {bucket_name} ... {schema_filepath}")
+    if not schema_filepath:
+        schema_struct = schema_structure
+    else:
+        schema_struct = json.loads(
+            gcs.download_blob_as_bytes(bucket_name, schema_filepath)
+        )
+    schema = []
+    for schema_field in schema_struct:
+        schema.append(
+            bigquery.SchemaField(
+                name=schema_field["name"],
+                field_type=schema_field["type"],
+                mode=schema_field.get("mode", "NULLABLE"),
+                description=schema_field.get("description", ""),
+            )
+        )
+    return schema
+
+
+def get_table_schema(
+    project_id: str, dataset_id: str, table_id: str
+) -> typing.List[bigquery.SchemaField]:
+    return (
+        bigquery_client(project_id)
+        .get_table(f"{project_id}.{dataset_id}.{table_id}")
+        .schema
+    )
+
+
+class LoadStateIndex:
+    """Answers "is this period already loaded?" without a query per period.
+
+    The first lookup against a table fetches every distinct combination of
+    `key_fields` in it with one grouped query, and later lookups are served
+    from memory for the rest of the run. `key_expressions` optionally maps a
+    key field to the SQL expression to group on, such as
+    `FORMAT_DATE('%Y', date_local)` for a year held in a DATE column. The
+    dataset's table list is also fetched once, and `ensure_table` uses it to
+    create missing tables without a lookup per period.
+    """
+
+    def __init__(
+        self,
+        project_id: str,
+        dataset_id: str,
+        key_fields: typing.Sequence[str],
+        key_expressions: typing.Optional[typing.Dict[str, str]] = None,
+    ) -> None:
+        self.project_id = project_id
+        self.dataset_id = dataset_id
+        self.key_fields = list(key_fields)
+        self.key_expressions = dict(key_expressions or {})
+        self._lock = threading.Lock()
+        self._table_ids: typing.Optional[typing.Set[str]] = None
+        self._loaded: typing.Dict[
+            str, typing.Optional[typing.Set[typing.Tuple[str, ...]]]
+        ] = {}
+
+    def is_loaded(self, table_id: str, *key: typing.Any) -> typing.Optional[bool]:
+        """Returns None when the table or one of its key fields does not exist."""
+        loaded = self.loaded_keys(table_id)
+        if loaded is None:
+            return None
+        return tuple(str(part) for part in key) in loaded
+
+    def loaded_keys(
+        self, table_id: str
+    ) -> typing.Optional[typing.Set[typing.Tuple[str, ...]]]:
+        with self._lock:
+            if table_id not in self._loaded:
+                self._loaded[table_id] = self._fetch_loaded_keys(table_id)
+            return self._loaded[table_id]
+
+    def ensure_table(
+        self, table_id: str, schema_filepath: str, bucket_name: str
+    ) -> bool:
+        """`create_dest_table`, skipped for tables this index knows exist."""
+        with self._lock:
+            if table_id in self._dataset_table_ids():
+                return True
+        created = create_dest_table(
+            project_id=self.project_id,
+            dataset_id=self.dataset_id,
+            table_id=table_id,
+            schema_filepath=schema_filepath,
+            bucket_name=bucket_name,
+        )
+        if created:
+            with self._lock:
+                self._table_ids.add(table_id)
+        return created
+
+    def _dataset_table_ids(self) -> typing.Set[str]:
+        if self._table_ids is None:
+            client = bigquery_client(self.project_id)
+            self._table_ids = {
+                table.table_id for table in client.list_tables(self.dataset_id)
+            }
+        return self._table_ids
+
+    def _fetch_loaded_keys(
+        self, table_id: str
+    ) -> typing.Optional[typing.Set[typing.Tuple[str, ...]]]:
+        client = bigquery_client(self.project_id)
+        table_ref = f"{self.project_id}.{self.dataset_id}.{table_id}"
+        if table_id not in self._dataset_table_ids():
+            logging.info(f"Table {table_ref} does not exist")
+            return None
+        field_names = {field.name for field in client.get_table(table_ref).schema}
+        missing_fields = [name for name in self.key_fields if name not in field_names]
+        if missing_fields:
+            logging.info(f"Table {table_ref} has no field(s) {missing_fields}")
+            return None
+        columns = ", ".join(
+            f"CAST({self.key_expressions.get(name, name)} AS STRING)"
+            for name in self.key_fields
+        )
+        query = f"SELECT DISTINCT {columns} FROM `{table_ref}`"
+        loaded = {tuple(row.values()) for row in client.query(query).result()}
+        logging.info(f"Table {table_ref} holds data for {len(loaded)} key(s)")
+        return loaded
+
+
+def create_dest_table(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    schema_filepath: str,
+    bucket_name: str,
+    drop_table: bool = False,
+    table_description: str = "",
+    table_clustering_field_list: typing.Optional[typing.List[str]] = None,
+    table_partition_field: str = "",
+    table_partition_field_type: str = "",
+) -> bool:
+    table_ref = f"{project_id}.{dataset_id}.{table_id}"
+    logging.info(f"Attempting to create table {table_ref} if it doesn't already exist")
+    client = bigquery_client(project_id)
+    try:
+        table = client.get_table(table_ref)
+        logging.info(f"Table {table.table_id} currently exists.")
+        if not drop_table:
+            return True
+        logging.info("Dropping existing table")
+        client.delete_table(table)
+    except NotFound:
+        logging.info(
+            f"Table {table_ref} currently does not exist.  Attempting to create table."
+        )
+    if not gcs.check_gcs_file_exists(schema_filepath, bucket_name):
+        logging.info(
+            f"Error: Unable to create table {table_ref} because schema file {schema_filepath} does not exist in bucket {bucket_name}"
+        )
+        return False
+    table = bigquery.Table(
+        table_ref, schema=create_table_schema([], bucket_name, schema_filepath)
+    )
+    table.description = table_description
+    if table_clustering_field_list:
+        logging.info(f"Creating cluster on table ({table_clustering_field_list})")
+        table.clustering_fields = table_clustering_field_list
+    if table_partition_field:
+        logging.info(
+            f"Creating partition on table ({table_partition_field}, {table_partition_field_type})"
+        )
+        table.time_partitioning = bigquery.TimePartitioning(
+            type_=table_partition_field_type, field=table_partition_field
+        )
+    client.create_table(table)
+    logging.info(f"Table {table_ref} was created")
+    return True
+
+
+def load_job_config(
+    truncate_table: bool,
+    field_delimiter: str = "|",
+    quotechar: str = '"',
+    skip_leading_rows: int = 1,
+    source_format: str = bigquery.SourceFormat.CSV,
+) -> bigquery.LoadJobConfig:
+    job_config = bigquery.LoadJobConfig(
+        source_format=source_format,
+        autodetect=False,
+        write_disposition=(
+            bigquery.WriteDisposition.WRITE_TRUNCATE
+            if truncate_table
+            else bigquery.WriteDisposition.WRITE_APPEND
+        ),
+    )
+    if source_format == bigquery.SourceFormat.CSV:
+        job_config.field_delimiter = field_delimiter
+        job_config.quote_character = quotechar
+        job_config.skip_leading_rows = skip_leading_rows
+        job_config.allow_quoted_newlines = True
+    elif source_format == bigquery.SourceFormat.AVRO:
+        # Read date and timestamp logical types as DATE and TIMESTAMP columns.
+        job_config.use_avro_logical_types = True
+    return job_config
+
+
+def load_data_to_bq(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    file_path: typing.Union[str, pathlib.Path],
+    truncate_table: bool,
+    field_delimiter: str = "|",
+    quotechar: str = '"',
+    skip_leading_rows: int = 1,
+    source_format: str = bigquery.SourceFormat.CSV,
+) -> None:
+    table_ref = f"{project_id}.{dataset_id}.{table_id}"
+    logging.info(f"Loading data from {file_path} into {table_ref} started")
+    job_config = load_job_config(
+        truncate_table, field_delimiter, quotechar, skip_leading_rows, source_format
+    )
+    with metrics.stage("load") as stats:
+        with open(file_path, "rb") as source_file:
+            job = bigquery_client(project_id).load_table_from_file(
+                source_file, table_ref, job_config=job_config
+            )
+        job.result()
+        _record_load_job(stats, job)
+    logging.info(f"Loading data from {file_path} into {table_ref} completed")
+
+
+def load_data_from_gcs(
+    project_id: str,
+    dataset_id: str,
+    table_id: str,
+    source_uris: typing.Union[str, typing.Sequence[str]],
+    truncate_table: bool,
+    field_delimiter: str = "|",
+    quotechar: str = '"',
+    skip_leading_rows: int = 1,
+    source_format: str = bigquery.SourceFormat.CSV,
+) -> None:
+    """Loads objects that are already in Cloud Storage.
+
+    BigQuery reads them directly, so a target file that has been uploaded is
+    not sent a second time. A URI may end in a wildcard, such as
+    `gs://bucket/path/part-*.csv`, to load every file of a multi-file output.
+    """
+    table_ref = f"{project_id}.{dataset_id}.{table_id}"
+    logging.info(f"Loading data from {source_uris} into {table_ref} started")
+    with metrics.stage("load") as stats:
+        job = bigquery_client(project_id).load_table_from_uri(
+            source_uris,
+            table_ref,
+            job_config=load_job_config(
+                truncate_table,
+                field_delimiter,
+                quotechar,
+                skip_leading_rows,
+                source_format,
+            ),
+        )
+        job.result()
+        _record_load_job(stats, job)
+    logging.info(f"Loading data from {source_uris} into {table_ref} completed")
+
+
+def _record_load_job(stats: metrics.StageStats, job: bigquery.LoadJob) -> None:
+    stats.bytes_read += int(job.input_file_bytes or 0)
+    stats.rows_out += int(job.output_rows or 0)
+
+
+class LoadJobManager:
+    """Runs each unit's load (and any upload or clean-up after it) in the
+    background, so the next unit can be downloaded and transformed meanwhile.
+
+    `submit` blocks while `max_in_flight` jobs are queued or running, which
+    also bounds how many finished target files wait on local disk. Failures
+    do not stop later jobs; they are logged by key and raised from `wait`.
+    """
+
+    def __init__(self, max_in_flight: int = 2) -> None:
+        self._slots = threading.BoundedSemaphore(max_in_flight)
+        self._executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_in_flight, thread_name_prefix="load-job"
+        )
+        self._jobs: typing.Dict[str, concurrent.futures.Future] = {}
+
+    def submit(
+        self, key: str, func: typing.Callable[..., typing.Any], *args, **kwargs
+    ) -> None:
+        if key in self._jobs:
+            raise ValueError(f"A load job for {key} was already submitted")
+        self._slots.acquire()
+        try:
+            future = self._executor.submit(func, *args, **kwargs)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        self._jobs[key] = future
+        logging.info(f"Submitted load job for {key}")
+
+    def wait(self) -> None:
+        self._executor.shutdown(wait=True)
+        failures = {}
+        for key, future in self._jobs.items():
+            error = future.exception()
+            if error is not None:
+                logging.error(f"Load job for {key} failed: {error!r}")
+                failures[key] = error
+        if failures:
+            raise RuntimeError(
+                f"{len(failures)} of {len(self._jobs)} load job(s) failed: "
+                f"{', '.join(failures)}"
+            ) from next(iter(failures.values()))
+        logging.info(f"All {len(self._jobs)} load job(s) completed")
+
+    def __enter__(self) -> "LoadJobManager":
+        return self
+
+    def __exit__(self, exc_type, *exc_info) -> None:
+        if exc_type is None:
+            self.wait()
+        else:
+            # Let running jobs finish, but keep the error that got us here.
+            self._executor.shutdown(wait=True)
+
+
+def delete_source_file_data_from_bq(
+    project_id: str, dataset_id: str, table_id: str, source_url: str
+) -> None:
+    table_ref = f"{project_id}.{dataset_id}.{table_id}"
+    logging.info(f"Deleting data from {table_ref} where source_url = '{source_url}'")
+    query = f"DELETE FROM `{table_ref}` WHERE source_url = @source_url"
+    job_config = bigquery.QueryJobConfig(
+        query_parameters=[
+            bigquery.ScalarQueryParameter("source_url", "STRING", source_url),
+        ]
+    )
+    bigquery_client(project_id).query(query, job_config=job_config).result()
@@ -0,0 +1,298 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Arrow helpers for pipelines that go from Parquet to BigQuery without CSV."""
+
+import logging
+import os
+import pathlib
+import typing
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
+from google.cloud import bigquery
+
+from transform_runtime import metrics
+
+BQ_TO_ARROW_TYPES = {
+    "STRING": pa.string(),
+    "BYTES": pa.binary(),
+    "INTEGER": pa.int64(),
+    "INT64": pa.int64(),
+    "FLOAT": pa.float64(),
+    "FLOAT64": pa.float64(),
+    "NUMERIC": pa.decimal128(38, 9),
+    "BIGNUMERIC": pa.decimal256(76, 38),
+    "BOOLEAN": pa.bool_(),
+    "BOOL": pa.bool_(),
+    "TIMESTAMP": pa.timestamp("us", tz="UTC"),
+    "DATETIME": pa.timestamp("us"),
+    "DATE": pa.date32(),
+    "TIME": pa.time64("us"),
+    "GEOGRAPHY": pa.string(),
+}
+
+
+# Avro types BigQuery reads back as each column type, with logical types on.
+BQ_TO_AVRO_TYPES = {
+    "STRING": "string",
+    "BYTES": "bytes",
+    "INTEGER": "long",
+    "INT64": "long",
+    "FLOAT": "double",
+    "FLOAT64": "double",
+    "NUMERIC": {"type": "bytes", "logicalType": "decimal", "precision": 38, "scale": 9},
+    "BIGNUMERIC": {
+        "type": "bytes",
+        "logicalType": "decimal",
+        "precision": 76,
+        "scale": 38,
+    },
+    "BOOLEAN": "boolean",
+    "BOOL": "boolean",
+    "TIMESTAMP": {"type": "long", "logicalType": "timestamp-micros"},
+    "DATETIME": {"type": "string", "logicalType": "datetime"},
+    "DATE": {"type": "int", "logicalType": "date"},
+    "TIME": {"type": "long", "logicalType": "time-micros"},
+    "GEOGRAPHY": {"type": "string", "sqlType": "GEOGRAPHY"},
+}
+
+
+def arrow_schema(schema: typing.Sequence[bigquery.SchemaField]) -> pa.Schema:
+    return pa.schema(
+        [
+            pa.field(
+                field.name,
+                BQ_TO_ARROW_TYPES[field.field_type.upper()],
+                nullable=(field.mode != "REQUIRED"),
+            )
+            for field in schema
+        ]
+    )
+
+
+def avro_schema(
+    schema: typing.Sequence[bigquery.SchemaField], name: str = "Row"
+) -> dict:
+    fields = []
+    for field in schema:
+        avro_type = BQ_TO_AVRO_TYPES[field.field_type.upper()]
+        if field.mode == "REQUIRED":
+            fields.append({"name": field.name, "type": avro_type})
+        else:
+            fields.append(
+                {"name": field.name, "type": ["null", avro_type], "default": None}
+            )
+    return {"type": "record", "name": name, "fields": fields}
+
+
+def iter_parquet_batches(
+    file_path: typing.Union[str, pathlib.Path], batch_size: int
+) -> typing.Iterator[pa.RecordBatch]:
+    """Yields record batches one row group slice at a time, never the whole file."""
+    batches = pq.ParquetFile(file_path).iter_batches(batch_size=batch_size)
+    while True:
+        with metrics.stage("parse") as stats:
+            batch = next(batches, None)
+            if batch is None:
+                return
+            stats.rows_in += batch.num_rows
+        yield batch
+
+
+def rename_columns_by_position(
+    table: pa.Table, names: typing.Sequence[str]
+) -> pa.Table:
+    """Renames the leading columns to `names`, like `read_csv(names=...)` does."""
+    new_names = list(names[: table.num_columns])
+    new_names += table.column_names[len(new_names) :]
+    return table.rename_columns(new_names)
+
+
+def cast_column(column: pa.ChunkedArray, target_type: pa.DataType) -> pa.ChunkedArray:
+    if column.type.equals(target_type):
+        return column
+    if pa.types.is_floating(column.type) and pa.types.is_string(target_type):
+        # Keep the "1.0" rendering pandas uses when writing floats to CSV.
+        text = pc.cast(column, pa.string())
+        whole = pc.match_substring_regex(text, r"^-?\d+$")
+        return pc.if_else(whole, pc.binary_join_element_wise(text, ".0", ""), text)
+    if pa.types.is_string(column.type) or pa.types.is_large_string(column.type):
+        # An empty CSV field loads as NULL, so an empty string means the same.
+        column = pc.if_else(pc.equal(column, ""), None, column)
+        if pa.types.is_timestamp(target_type) and target_type.tz:
+            # Text without a zone offset is taken to be UTC, as BigQuery does.
+            try:
+                return pc.cast(column, target_type, safe=False)
+            except pa.ArrowInvalid:
+                naive = pc.cast(column, pa.timestamp(target_type.unit), safe=False)
+                return pc.cast(naive, target_type)
+    return pc.cast(column, target_type, safe=False)
+
+
+def dataframe_to_arrow(df: pd.DataFrame, schema: pa.Schema) -> pa.Table:
+    """Converts a transformed chunk to `schema`, whatever dtypes it ended up with.
+
+    Object columns, which may mix strings, numbers and NaN, are read as text
+    first and then cast like any other column.
+    """
+    columns = {}
+    for name in df.columns:
+        values = df[name]
+        if values.dtype == object:
+            values = values.astype("string")
+        columns[str(name)] = pa.array(values, from_pandas=True)
+    return conform_to_schema(pa.table(columns), schema)
+
+
+def conform_to_schema(table: pa.Table, schema: pa.Schema) -> pa.Table:
+    """Selects, orders and casts columns to `schema`; missing columns become null."""
+    columns = []
+    for field in schema:
+        if field.name in table.column_names:
+            columns.append(cast_column(table.column(field.name), field.type))
+        else:
+            columns.append(pa.nulls(table.num_rows, field.type))
+    return pa.Table.from_arrays(columns, schema=schema)
+
+
+class ParquetSink:
+    """Appends Arrow tables to a single Parquet file as they are produced."""
+
+    def __init__(
+        self,
+        file_path: typing.Union[str, pathlib.Path],
+        schema: pa.Schema,
+        compression: str = "snappy",
+    ):
+        self.file_path = str(file_path)
+        self.schema = schema
+        self.rows_written = 0
+        self._writer = pq.ParquetWriter(self.file_path, schema, compression=compression)
+
+    def write(self, table: pa.Table) -> None:
+        with metrics.stage("serialize") as stats:
+            self._writer.write_table(table)
+            stats.rows_out += table.num_rows
+        self.rows_written += table.num_rows
+
+    def close(self) -> None:
+        with metrics.stage("serialize") as stats:
+            self._writer.close()
+            stats.bytes_written += os.path.getsize(self.file_path)
+
+    def __enter__(self) -> "ParquetSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class AvroSink:
+    """Appends Arrow tables to a single Avro object container file.
+
+    Needs `fastavro`, which only images that write Avro have to install.
+    """
+
+    def __init__(
+        self,
+        file_path: typing.Union[str, pathlib.Path],
+        schema: typing.Sequence[bigquery.SchemaField],
+        codec: str = "deflate",
+    ):
+        import fastavro
+
+        self.file_path = str(file_path)
+        self.rows_written = 0
+        self._datetime_fields = [
+            field.name for field in schema if field.field_type.upper() == "DATETIME"
+        ]
+        self._file = open(self.file_path, "wb")
+        self._writer = fastavro.write.Writer(
+            self._file, fastavro.parse_schema(avro_schema(schema)), codec=codec
+        )
+
+    def write(self, table: pa.Table) -> None:
+        with metrics.stage("serialize") as stats:
+            for name in self._datetime_fields:
+                table = table.set_column(
+                    table.schema.get_field_index(name),
+                    name,
+                    pc.strftime(table.column(name), format="%Y-%m-%dT%H:%M:%S"),
+                )
+            for record in table.to_pylist():
+                self._writer.write(record)
+            stats.rows_out += table.num_rows
+        self.rows_written += table.num_rows
+
+    def close(self) -> None:
+        with metrics.stage("serialize") as stats:
+            self._writer.flush()
+            self._file.close()
+            stats.bytes_written += os.path.getsize(self.file_path)
+
+    def __enter__(self) -> "AvroSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+class DataFrameSink:
+    """Writes DataFrame chunks to one Parquet or Avro file typed by `schema`.
+
+    Like `files.CsvChunkSink`, the file is only created when the first chunk
+    arrives.
+    """
+
+    def __init__(
+        self,
+        file_path: typing.Union[str, pathlib.Path],
+        schema: typing.Sequence[bigquery.SchemaField],
+        output_format: str = "parquet",
+    ):
+        if output_format not in ("parquet", "avro"):
+            raise ValueError(f"Unsupported columnar output format {output_format}")
+        self.file_path = str(file_path)
+        self.bq_schema = list(schema)
+        self.schema = arrow_schema(self.bq_schema)
+        self.output_format = output_format
+        self.rows_written = 0
+        self._sink: typing.Union[ParquetSink, AvroSink, None] = None
+
+    def write(self, df: pd.DataFrame) -> None:
+        with metrics.stage("convert"):
+            table = dataframe_to_arrow(df, self.schema)
+        if self._sink is None:
+            logging.info(f"Opening {self.output_format} target file {self.file_path}")
+            if self.output_format == "parquet":
+                self._sink = ParquetSink(self.file_path, self.schema)
+            else:
+                self._sink = AvroSink(self.file_path, self.bq_schema)
+        self._sink.write(table)
+        self.rows_written += table.num_rows
+
+    def close(self) -> None:
+        if self._sink is not None:
+            self._sink.close()
+            self._sink = None
+            logging.info(f"Wrote {self.rows_written} rows to {self.file_path}")
+
+    def __enter__(self) -> "DataFrameSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
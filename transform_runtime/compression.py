@@ -0,0 +1,101 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import contextlib
+import gzip
+import io
+import logging
+import os
+import pathlib
+import shutil
+import signal
+import subprocess
+import typing
+import zipfile
+
+from transform_runtime import metrics
+from transform_runtime.files import COPY_BUFFER_SIZE
+
+PathLike = typing.Union[str, pathlib.Path]
+
+
+@contextlib.contextmanager
+def open_binary(file_path: PathLike) -> typing.Iterator[typing.BinaryIO]:
+    """Streams the decompressed bytes of a plain, .gz or single-member .zip file."""
+    path = str(file_path)
+    if path.endswith(".gz"):
+        pigz = shutil.which("pigz")
+        if pigz:
+            with _pigz_stream(pigz, path) as stream:
+                yield stream
+        else:
+            with gzip.open(path, "rb") as stream:
+                yield stream
+    elif path.endswith(".zip"):
+        with zipfile.ZipFile(path) as archive:
+            members = [info for info in archive.infolist() if not info.is_dir()]
+            if len(members) != 1:
+                raise ValueError(
+                    f"Expected exactly one file in {path}, found {len(members)}"
+                )
+            with archive.open(members[0]) as stream:
+                yield stream
+    else:
+        with open(path, "rb") as stream:
+            yield stream
+
+
+@contextlib.contextmanager
+def open_text(
+    file_path: PathLike,
+    encoding: str = "utf-8",
+    errors: str = "strict",
+    newline: typing.Optional[str] = None,
+) -> typing.Iterator[typing.TextIO]:
+    with open_binary(file_path) as stream, io.TextIOWrapper(
+        stream, encoding=encoding, errors=errors, newline=newline
+    ) as text:
+        yield text
+
+
+def decompress_file(
+    infile: PathLike, tofile: PathLike, delete_zipfile: bool = False
+) -> None:
+    logging.info(f"Decompressing {infile} into {tofile}")
+    with metrics.stage("decompress") as stats:
+        with open_binary(infile) as source, open(tofile, "wb") as target:
+            shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
+        stats.bytes_read += os.path.getsize(infile)
+        stats.bytes_written += os.path.getsize(tofile)
+    if delete_zipfile:
+        os.remove(infile)
+
+
+@contextlib.contextmanager
+def _pigz_stream(pigz: str, path: str) -> typing.Iterator[typing.BinaryIO]:
+    # pigz inflates in a separate process with its own read, write and check
+    # threads, so decompression overlaps with whatever parses the output.
+    process = subprocess.Popen(
+        [pigz, "--decompress", "--stdout", path],
+        stdout=subprocess.PIPE,
+        bufsize=COPY_BUFFER_SIZE,
+    )
+    try:
+        yield process.stdout
+    finally:
+        process.stdout.close()
+        returncode = process.wait()
+    # SIGPIPE only means the reader stopped early and closed the pipe.
+    if returncode not in (0, -signal.SIGPIPE):
+        raise subprocess.CalledProcessError(returncode, process.args)
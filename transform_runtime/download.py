@@ -0,0 +1,149 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import concurrent.futures
+import functools
+import logging
+import pathlib
+import typing
+
+import requests
+from urllib3.util.retry import Retry
+
+from transform_runtime import gcs, metrics, parallel
+
+DOWNLOAD_CHUNK_SIZE = 1024 * 1024
+RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def http_session(pool_size: int = 10, retries: int = 5) -> requests.Session:
+    """Returns a keep-alive Session sized for `pool_size` concurrent requests.
+
+    Connection errors and the status codes in RETRY_STATUS_CODES are retried
+    with exponential backoff.
+    """
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(
+        pool_connections=pool_size,
+        pool_maxsize=pool_size,
+        max_retries=Retry(
+            total=retries, backoff_factor=1, status_forcelist=RETRY_STATUS_CODES
+        ),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def download_file(
+    source_url: str,
+    source_file: typing.Union[str, pathlib.Path],
+    session: typing.Optional[requests.Session] = None,
+    timeout: int = 300,
+) -> bool:
+    logging.info(f"Downloading {source_url} into {source_file}")
+    http = session or requests
+    with metrics.stage("download") as stats, http.get(
+        source_url, stream=True, timeout=timeout
+    ) as response:
+        if response.status_code != 200:
+            logging.error(
+                f"Couldn't download {source_url}: status code {response.status_code}"
+            )
+            return False
+        with open(source_file, "wb") as file_obj:
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                stats.bytes_written += file_obj.write(chunk)
+    return True
+
+
+def download_file_gs(source_url: str, source_file: typing.Union[str, pathlib.Path]):
+    logging.info(f"Downloading {source_url} to {source_file}")
+    with metrics.stage("download") as stats, open(source_file, "wb") as file_obj:
+        gcs.storage_client().download_blob_to_file(source_url, file_obj)
+        stats.bytes_written += file_obj.tell()
+
+
+def concatenate_urls(
+    urls: typing.List[str],
+    target_file: typing.Union[str, pathlib.Path],
+    max_workers: int,
+    header_rows: int = 1,
+    keep_header: bool = True,
+    session: typing.Optional[requests.Session] = None,
+    timeout: int = 300,
+) -> int:
+    """Downloads `urls` concurrently and appends them, in order, to one file.
+
+    The first `header_rows` lines of every file are dropped as it streams in;
+    those of the first file are written once if `keep_header` is set. Files that
+    cannot be downloaded are logged and skipped. Returns the number appended.
+
+    At most `2 * max_workers` downloads run or wait to be written at a time,
+    so a slow file holds back only that many bodies in memory.
+    """
+    http = session or http_session(pool_size=max_workers)
+    fetch = functools.partial(
+        _fetch_without_header, http, header_rows=header_rows, timeout=timeout
+    )
+    appended = 0
+    try:
+        with metrics.stage("download") as stats, concurrent.futures.ThreadPoolExecutor(
+            max_workers=max_workers
+        ) as executor, open(target_file, "wb") as target:
+            results = parallel.map_in_order(executor, fetch, urls, 2 * max_workers)
+            for header, body in filter(None, results):
+                if keep_header and not appended:
+                    stats.bytes_written += target.write(header)
+                stats.bytes_written += target.write(body)
+                appended += 1
+                if appended % 1000 == 0:
+                    logging.info(f"Appended {appended} of {len(urls)} files")
+    finally:
+        if session is None:
+            http.close()
+    logging.info(f"Appended {appended} of {len(urls)} files into {target_file}")
+    return appended
+
+
+def _fetch_without_header(
+    session: requests.Session, source_url: str, header_rows: int, timeout: int
+) -> typing.Optional[typing.Tuple[bytes, bytes]]:
+    header = bytearray()
+    body = bytearray()
+    lines_to_skip = header_rows
+    try:
+        with session.get(source_url, stream=True, timeout=timeout) as response:
+            if response.status_code != 200:
+                logging.error(
+                    f"Couldn't download {source_url}: status code {response.status_code}"
+                )
+                return None
+            for chunk in response.iter_content(chunk_size=DOWNLOAD_CHUNK_SIZE):
+                while lines_to_skip and chunk:
+                    line_end = chunk.find(b"\n") + 1
+                    if not line_end:
+                        header += chunk
+                        chunk = b""
+                        break
+                    header += chunk[:line_end]
+                    chunk = chunk[line_end:]
+                    lines_to_skip -= 1
+                body += chunk
+    except requests.exceptions.RequestException as e:
+        logging.error(f"Couldn't download {source_url}: {e}")
+        return None
+    if body and not body.endswith(b"\n"):
+        body += b"\n"
+    return bytes(header), bytes(body)
@@ -0,0 +1,204 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import gzip
+import logging
+import os
+import pathlib
+import shutil
+import typing
+
+import pandas as pd
+
+from transform_runtime import metrics
+from transform_runtime.resources import ChunkSizer
+
+COPY_BUFFER_SIZE = 16 * 1024 * 1024
+WRITE_BUFFER_SIZE = 1024 * 1024
+
+
+def save_to_new_file(
+    df: pd.DataFrame,
+    file_path: str,
+    sep: str = "|",
+    quotechar: str = '"',
+    include_header: bool = True,
+    mode: str = "w",
+) -> None:
+    logging.info(f"Saving data to target file.. {file_path} ...")
+    with metrics.stage("serialize") as stats:
+        df.to_csv(
+            file_path,
+            index=False,
+            sep=sep,
+            quotechar=quotechar,
+            header=include_header,
+            mode=mode,
+        )
+        stats.rows_out += len(df)
+
+
+class CsvChunkSink:
+    """Writes processed DataFrame chunks straight into one open CSV stream.
+
+    The header is written with the first chunk only. The file is not created
+    until the first chunk arrives, so callers can keep using the existence of
+    the target file to tell whether any data was produced. Paths ending in
+    ".gz" are gzip-compressed unless `compression` says otherwise.
+    """
+
+    def __init__(
+        self,
+        file_path: typing.Union[str, pathlib.Path],
+        sep: str = "|",
+        quotechar: str = '"',
+        include_header: bool = True,
+        append: bool = False,
+        compression: typing.Optional[str] = None,
+        float_format: typing.Optional[str] = None,
+    ):
+        self.file_path = str(file_path)
+        self.sep = sep
+        self.quotechar = quotechar
+        self.float_format = float_format
+        self.append = append
+        if compression is None and self.file_path.endswith(".gz"):
+            compression = "gzip"
+        self.compression = compression
+        self.rows_written = 0
+        self._write_header = include_header
+        self._stream: typing.Optional[typing.TextIO] = None
+
+    def _open(self) -> typing.TextIO:
+        mode = "a" if self.append else "w"
+        logging.info(f"Opening target file {self.file_path} (mode={mode})")
+        if self.compression == "gzip":
+            return gzip.open(self.file_path, f"{mode}t", encoding="utf-8", newline="")
+        return open(
+            self.file_path,
+            mode,
+            encoding="utf-8",
+            newline="",
+            buffering=WRITE_BUFFER_SIZE,
+        )
+
+    def write(self, df: pd.DataFrame) -> None:
+        with metrics.stage("serialize") as stats:
+            if self._stream is None:
+                self._stream = self._open()
+            df.to_csv(
+                self._stream,
+                index=False,
+                sep=self.sep,
+                quotechar=self.quotechar,
+                float_format=self.float_format,
+                header=self._write_header,
+            )
+            stats.rows_out += len(df)
+        self._write_header = False
+        self.rows_written += len(df)
+
+    def close(self) -> None:
+        if self._stream is not None:
+            with metrics.stage("serialize") as stats:
+                self._stream.close()
+                stats.bytes_written += os.path.getsize(self.file_path)
+            self._stream = None
+            logging.info(f"Wrote {self.rows_written} rows to {self.file_path}")
+
+    def __enter__(self) -> "CsvChunkSink":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+
+def read_csv_chunks(
+    source: typing.Union[str, pathlib.Path, typing.TextIO],
+    names: typing.List[str],
+    chunksize: typing.Union[int, ChunkSizer],
+    dtypes: typing.Optional[typing.Dict[str, str]] = None,
+    sep: str = ",",
+    quotechar: str = '"',
+    header_rows: int = 0,
+    encoding: str = "utf-8",
+) -> typing.Iterator[pd.DataFrame]:
+    """Parses a headerless delimited file into DataFrames of `chunksize` rows.
+
+    Rows go straight from the pandas C parser into typed columns. Columns not in
+    `dtypes` are read as strings and empty fields stay empty strings, as they
+    would be in rows from `csv.reader`. A `ChunkSizer` can be passed to size
+    chunks from the memory the first one takes.
+    """
+    if isinstance(chunksize, int):
+        chunksize = ChunkSizer(initial_rows=chunksize, adaptive=False)
+    dtype = {name: "str" for name in names}
+    dtype.update(dtypes or {})
+    with pd.read_csv(
+        source,
+        sep=sep,
+        quotechar=quotechar,
+        header=None,
+        names=names,
+        skiprows=header_rows,
+        dtype=dtype,
+        keep_default_na=False,
+        encoding=encoding,
+        engine="c",
+        iterator=True,
+    ) as reader:
+        while True:
+            with metrics.stage("parse") as stats:
+                try:
+                    df = reader.get_chunk(chunksize.rows)
+                except StopIteration:
+                    return
+                stats.rows_in += len(df)
+            chunksize.observe(df)
+            yield df
+
+
+def append_batch_file(
+    batch_file_path: str, target_file_path: str, skip_header: bool, truncate_file: bool
+) -> None:
+    logging.info(
+        f"Appending batch file {batch_file_path} to {target_file_path} with skip_header={skip_header}"
+    )
+    with open(batch_file_path, "rb") as data_file, open(
+        target_file_path, "wb" if truncate_file else "ab"
+    ) as target_file:
+        offset = len(data_file.readline()) if skip_header else 0
+        copy_file_contents(data_file, target_file, offset)
+    os.remove(batch_file_path)
+
+
+def copy_file_contents(
+    source: typing.BinaryIO, target: typing.BinaryIO, offset: int = 0
+) -> None:
+    """Copies `source` from `offset` to its end onto `target`.
+
+    Uses `os.sendfile` so the bytes never pass through Python, falling back to
+    `shutil.copyfileobj` where the platform or file system does not support it.
+    """
+    target.flush()
+    size = os.fstat(source.fileno()).st_size
+    try:
+        while offset < size:
+            sent = os.sendfile(target.fileno(), source.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except (AttributeError, OSError):
+        source.seek(offset)
+        shutil.copyfileobj(source, target, COPY_BUFFER_SIZE)
@@ -0,0 +1,99 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import pathlib
+import typing
+
+import pandas as pd
+from google.cloud import bigquery
+
+from transform_runtime.files import CsvChunkSink
+
+# Intermediate file formats a pipeline can write, load and upload, selected by
+# its OUTPUT_FORMAT setting.
+OUTPUT_FORMATS = ("csv", "csv.gz", "parquet", "avro")
+SOURCE_FORMATS = {
+    "csv": bigquery.SourceFormat.CSV,
+    "csv.gz": bigquery.SourceFormat.CSV,
+    "parquet": bigquery.SourceFormat.PARQUET,
+    "avro": bigquery.SourceFormat.AVRO,
+}
+
+
+class ChunkSink(typing.Protocol):
+    rows_written: int
+
+    def write(self, df: pd.DataFrame) -> None:
+        ...
+
+    def close(self) -> None:
+        ...
+
+    def __enter__(self) -> "ChunkSink":
+        ...
+
+    def __exit__(self, *exc_info) -> None:
+        ...
+
+
+def check_output_format(output_format: str) -> str:
+    output_format = (output_format or "csv").lower()
+    if output_format not in OUTPUT_FORMATS:
+        raise ValueError(
+            f"Unsupported output format {output_format}, expected one of {OUTPUT_FORMATS}"
+        )
+    return output_format
+
+
+def output_file_path(
+    file_path: typing.Union[str, pathlib.Path], output_format: str
+) -> str:
+    """Swaps the ".csv" extension of a configured path for the one of `output_format`."""
+    path = str(file_path)
+    output_format = check_output_format(output_format)
+    if path.endswith(".csv"):
+        path = path[: -len(".csv")]
+    return f"{path}.{output_format}"
+
+
+def source_format(output_format: str) -> str:
+    return SOURCE_FORMATS[check_output_format(output_format)]
+
+
+def chunk_sink(
+    file_path: typing.Union[str, pathlib.Path],
+    output_format: str,
+    schema: typing.Optional[typing.Sequence[bigquery.SchemaField]] = None,
+    sep: str = "|",
+    quotechar: str = '"',
+) -> ChunkSink:
+    """Returns a sink that writes DataFrame chunks to `file_path` as `output_format`.
+
+    CSV is written as is; Parquet and Avro columns are typed by the BigQuery
+    `schema` the file will be loaded into.
+    """
+    output_format = check_output_format(output_format)
+    if output_format in ("csv", "csv.gz"):
+        return CsvChunkSink(
+            file_path,
+            sep=sep,
+            quotechar=quotechar,
+            compression="gzip" if output_format == "csv.gz" else None,
+        )
+    if schema is None:
+        raise ValueError(f"A table schema is needed to write {output_format} files")
+    # pyarrow is only needed by images that write columnar files.
+    from transform_runtime import columnar
+
+    return columnar.DataFrameSink(file_path, schema, output_format)
@@ -0,0 +1,204 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import contextlib
+import ftplib
+import logging
+import os
+import pathlib
+import random
+import threading
+import time
+import typing
+
+from transform_runtime import metrics, parallel
+
+RETRYABLE_ERRORS = (ftplib.error_temp, ftplib.error_reply, OSError, EOFError)
+# Replies meaning the server does not implement a command (here REST or MLSD).
+UNSUPPORTED_COMMAND_REPLIES = ("500", "501", "502", "504")
+TRANSFER_BLOCK_SIZE = 1024 * 1024
+
+T = typing.TypeVar("T")
+
+
+def backoff_delay(attempt: int, base_delay: float, max_delay: float) -> float:
+    """Full-jitter exponential backoff: uniform in [0, base_delay * 2**attempt]."""
+    return random.uniform(0, min(max_delay, base_delay * 2**attempt))
+
+
+class FtpSessionPool:
+    """Keeps logged-in FTP connections open per host and reuses them across files.
+
+    At most `max_connections_per_host` connections are in use per host at once.
+    Directory listings are cached for the life of the pool. Failed transfers are
+    retried with jittered exponential backoff, resuming from the bytes already
+    on disk with REST when the server supports it.
+    """
+
+    def __init__(
+        self,
+        max_connections_per_host: int = 4,
+        timeout: int = 60,
+        max_attempts: int = 5,
+        base_delay: float = 2.0,
+        max_delay: float = 60.0,
+        user: str = "",
+        passwd: str = "",
+    ) -> None:
+        self.timeout = timeout
+        self.max_attempts = max_attempts
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.user = user
+        self.passwd = passwd
+        self._limiter = parallel.HostConnectionLimiter(max_connections_per_host)
+        self._lock = threading.Lock()
+        self._idle: typing.Dict[str, typing.List[ftplib.FTP]] = collections.defaultdict(
+            list
+        )
+        self._listings: typing.Dict[typing.Tuple[str, str], typing.List[str]] = {}
+
+    @contextlib.contextmanager
+    def session(self, host: str) -> typing.Iterator[ftplib.FTP]:
+        with self._limiter.connection(host):
+            conn = self._checkout(host)
+            try:
+                yield conn
+            except BaseException:
+                _close_quietly(conn)
+                raise
+            with self._lock:
+                self._idle[host].append(conn)
+
+    def list_files(self, host: str, cwd: str) -> typing.List[str]:
+        key = (host, cwd)
+        with self._lock:
+            cached = self._listings.get(key)
+        if cached is None:
+            cached = self._retry(
+                f"Listing ftp://{host}{cwd}", lambda: self._list(host, cwd)
+            )
+            with self._lock:
+                self._listings[key] = cached
+        return list(cached)
+
+    def download(
+        self,
+        host: str,
+        cwd: str,
+        filename: str,
+        local_file: typing.Union[str, pathlib.Path],
+    ) -> None:
+        # Only retries resume; the first attempt never trusts an existing file.
+        open(local_file, "wb").close()
+        with metrics.stage("download") as stats:
+            self._retry(
+                f"Downloading ftp://{host}{cwd}/{filename}",
+                lambda: self._retrieve(host, cwd, filename, local_file),
+            )
+            stats.bytes_written += os.path.getsize(local_file)
+
+    def close(self) -> None:
+        with self._lock:
+            idle = [conn for conns in self._idle.values() for conn in conns]
+            self._idle.clear()
+        for conn in idle:
+            _close_quietly(conn)
+
+    def __enter__(self) -> "FtpSessionPool":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def _checkout(self, host: str) -> ftplib.FTP:
+        while True:
+            with self._lock:
+                idle = self._idle[host]
+                conn = idle.pop() if idle else None
+            if conn is None:
+                return self._connect(host)
+            try:
+                conn.voidcmd("NOOP")
+                return conn
+            except ftplib.all_errors:
+                _close_quietly(conn)
+
+    def _connect(self, host: str) -> ftplib.FTP:
+        logging.info(f"Opening FTP connection to {host}")
+        conn = ftplib.FTP(host, timeout=self.timeout)
+        conn.encoding = "utf-8"
+        conn.login(self.user, self.passwd)
+        return conn
+
+    def _list(self, host: str, cwd: str) -> typing.List[str]:
+        with self.session(host) as conn:
+            try:
+                return [
+                    name
+                    for name, facts in conn.mlsd(cwd, facts=["type"])
+                    if facts.get("type") == "file"
+                ]
+            except ftplib.error_perm as e:
+                if not str(e).startswith(UNSUPPORTED_COMMAND_REPLIES):
+                    raise
+            conn.cwd(cwd)
+            return conn.nlst()
+
+    def _retrieve(
+        self,
+        host: str,
+        cwd: str,
+        filename: str,
+        local_file: typing.Union[str, pathlib.Path],
+    ) -> None:
+        offset = os.path.getsize(local_file)
+        with self.session(host) as conn:
+            conn.cwd(cwd)
+            try:
+                with open(local_file, "ab") as dest_file:
+                    conn.retrbinary(
+                        f"RETR {filename}",
+                        dest_file.write,
+                        blocksize=TRANSFER_BLOCK_SIZE,
+                        rest=offset or None,
+                    )
+                return
+            except ftplib.error_perm as e:
+                if not offset or not str(e).startswith(UNSUPPORTED_COMMAND_REPLIES):
+                    raise
+                logging.info(f"{host} does not support REST, restarting {filename}")
+            with open(local_file, "wb") as dest_file:
+                conn.retrbinary(
+                    f"RETR {filename}", dest_file.write, blocksize=TRANSFER_BLOCK_SIZE
+                )
+
+    def _retry(self, description: str, func: typing.Callable[[], T]) -> T:
+        for attempt in range(self.max_attempts):
+            try:
+                return func()
+            except RETRYABLE_ERRORS as e:
+                if attempt + 1 == self.max_attempts:
+                    raise
+                delay = backoff_delay(attempt, self.base_delay, self.max_delay)
+                logging.info(f"{description} failed ({e}), retrying in {delay:.1f}s")
+                time.sleep(delay)
+
+
+def _close_quietly(conn: ftplib.FTP) -> None:
+    try:
+        conn.quit()
+    except ftplib.all_errors:
+        conn.close()
@@ -0,0 +1,82 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import logging
+import os
+import pathlib
+import typing
+
+from google.cloud import storage
+from google.cloud.storage import transfer_manager
+
+from transform_runtime import local, metrics
+
+# Resumable uploads are sent in pieces of this size. It must be a multiple of
+# 256 KiB; larger pieces mean fewer round trips for multi-GB target files.
+UPLOAD_CHUNK_SIZE = 64 * 1024 * 1024
+# Files at least this large are sent as UPLOAD_CHUNK_SIZE parts in parallel
+# and assembled server side, instead of one sequential resumable upload.
+PARALLEL_UPLOAD_THRESHOLD = 4 * UPLOAD_CHUNK_SIZE
+PARALLEL_UPLOAD_WORKERS = 8
+
+
+@functools.lru_cache(maxsize=None)
+def storage_client() -> storage.Client:
+    if local.use_local_backend():
+        return local.storage_client()
+    return storage.Client()
+
+
+def upload_file_to_gcs(
+    file_path: typing.Union[str, pathlib.Path],
+    target_gcs_bucket: str,
+    target_gcs_path: str,
+) -> None:
+    if os.path.exists(file_path):
+        logging.info(
+            f"Uploading output file {file_path} to gs://{target_gcs_bucket}/{target_gcs_path}"
+        )
+        bucket = storage_client().bucket(target_gcs_bucket)
+        blob = bucket.blob(target_gcs_path, chunk_size=UPLOAD_CHUNK_SIZE)
+        file_size = os.path.getsize(file_path)
+        with metrics.stage("upload") as stats:
+            if file_size >= PARALLEL_UPLOAD_THRESHOLD and not local.use_local_backend():
+                transfer_manager.upload_chunks_concurrently(
+                    str(file_path),
+                    blob,
+                    chunk_size=UPLOAD_CHUNK_SIZE,
+                    worker_type=transfer_manager.THREAD,
+                    max_workers=PARALLEL_UPLOAD_WORKERS,
+                )
+            else:
+                blob.upload_from_filename(str(file_path))
+            stats.bytes_read += file_size
+    else:
+        logging.info(
+            f"Cannot upload file {file_path} to gs://{target_gcs_bucket}/{target_gcs_path} as it does not exist."
+        )
+
+
+def gcs_uri(bucket_name: str, blob_path: str) -> str:
+    return f"gs://{bucket_name}/{blob_path}"
+
+
+def check_gcs_file_exists(file_path: str, bucket_name: str) -> bool:
+    client = storage_client()
+    return client.bucket(bucket_name).blob(file_path).exists(client)
+
+
+def download_blob_as_bytes(bucket_name: str, blob_path: str) -> bytes:
+    return storage_client().bucket(bucket_name).blob(blob_path).download_as_bytes()
@@ -0,0 +1,169 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import io
+import logging
+import os
+import pathlib
+import tempfile
+import typing
+
+from transform_runtime import compression, metrics
+
+# A literal (str) or regular expression (re.Pattern) and its replacement.
+Substitution = typing.Tuple[typing.Union[str, typing.Pattern[str]], str]
+
+
+class LineFilter:
+    """Skips header/footer rows and rewrites text lines in a single pass.
+
+    Substitutions run in order on each line without its line ending, so a
+    pattern can never join or split lines. A filter can be applied to any
+    iterable of lines, wrapped around a stream being read (`reader`) or written
+    (`writer`), or used to rewrite a whole file (`filter_file`).
+    """
+
+    def __init__(
+        self,
+        header_rows: int = 0,
+        footer_rows: int = 0,
+        substitutions: typing.Sequence[Substitution] = (),
+    ) -> None:
+        self.header_rows = header_rows
+        self.footer_rows = footer_rows
+        self.substitutions = list(substitutions)
+
+    def __call__(self, lines: typing.Iterable[str]) -> typing.Iterator[str]:
+        state = _FilterState(self)
+        for line in lines:
+            line = state.push(line)
+            if line is not None:
+                yield line
+
+    def reader(self, stream: typing.Iterable[str]) -> typing.TextIO:
+        return _LineReader(self(stream))
+
+    def writer(self, stream: typing.TextIO) -> typing.TextIO:
+        return _LineWriter(_FilterState(self), stream)
+
+    def filter_file(
+        self,
+        source_file: typing.Union[str, pathlib.Path],
+        target_file: typing.Union[str, pathlib.Path, None] = None,
+        encoding: str = "utf-8",
+    ) -> None:
+        """Writes the filtered lines of `source_file` to `target_file`.
+
+        The source may be gzip or zip compressed. Without a target the source is
+        replaced, through a temporary file next to it.
+        """
+        target = target_file or source_file
+        logging.info(f"Filtering lines of {source_file} into {target}")
+        fd, temp_file = tempfile.mkstemp(dir=os.path.dirname(os.path.abspath(target)))
+        try:
+            with metrics.stage("filter") as stats:
+                stats.bytes_read += os.path.getsize(source_file)
+                with compression.open_text(
+                    source_file, encoding=encoding, newline=""
+                ) as source, open(fd, "w", encoding=encoding, newline="") as dest:
+                    dest.writelines(self(source))
+                stats.bytes_written += os.path.getsize(temp_file)
+            os.replace(temp_file, target)
+        except BaseException:
+            os.remove(temp_file)
+            raise
+
+    def substitute(self, line: str) -> str:
+        body = line.rstrip("\r\n") if self.substitutions else line
+        ending = line[len(body) :]
+        for old, new in self.substitutions:
+            if isinstance(old, str):
+                body = body.replace(old, new)
+            else:
+                body = old.sub(new, body)
+        return body + ending
+
+
+class _FilterState:
+    def __init__(self, line_filter: LineFilter) -> None:
+        self.line_filter = line_filter
+        self.rows_seen = 0
+        self.footer: typing.Deque[str] = collections.deque()
+
+    def push(self, line: str) -> typing.Optional[str]:
+        self.rows_seen += 1
+        if self.rows_seen <= self.line_filter.header_rows:
+            return None
+        if self.line_filter.footer_rows:
+            self.footer.append(line)
+            if len(self.footer) <= self.line_filter.footer_rows:
+                return None
+            line = self.footer.popleft()
+        return self.line_filter.substitute(line)
+
+
+class _LineReader(io.TextIOBase):
+    def __init__(self, lines: typing.Iterator[str]) -> None:
+        self._lines = lines
+        self._buffer = ""
+
+    def readable(self) -> bool:
+        return True
+
+    def readline(self, size: int = -1) -> str:
+        if self._buffer:
+            line, self._buffer = self._buffer, ""
+            return line
+        return next(self._lines, "")
+
+    def read(self, size: typing.Optional[int] = -1) -> str:
+        if size is None or size < 0:
+            data, self._buffer = self._buffer + "".join(self._lines), ""
+            return data
+        chunks = [self._buffer]
+        length = len(self._buffer)
+        while length < size:
+            line = next(self._lines, None)
+            if line is None:
+                break
+            chunks.append(line)
+            length += len(line)
+        data = "".join(chunks)
+        self._buffer = data[size:]
+        return data[:size]
+
+
+class _LineWriter(io.TextIOBase):
+    def __init__(self, state: _FilterState, stream: typing.TextIO) -> None:
+        self._state = state
+        self._stream = stream
+        self._pending = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, text: str) -> int:
+        *lines, self._pending = (self._pending + text).split("\n")
+        self._stream.writelines(self._push(line + "\n") for line in lines)
+        return len(text)
+
+    def close(self) -> None:
+        if not self.closed and self._pending:
+            self._stream.write(self._push(self._pending))
+            self._pending = ""
+        super().close()
+
+    def _push(self, line: str) -> str:
+        return self._state.push(line) or ""
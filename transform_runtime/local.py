@@ -0,0 +1,413 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import functools
+import gzip
+import io
+import json
+import logging
+import os
+import pathlib
+import re
+import shutil
+import sqlite3
+import threading
+import typing
+
+import pandas as pd
+from google.api_core.exceptions import NotFound
+from google.cloud import bigquery, storage
+
+# Set to "local" to run against the stand-ins below instead of Google Cloud.
+BACKEND_ENV = "TRANSFORM_BACKEND"
+# Directory holding the stand-ins' data: one folder per bucket under "gcs" and
+# the tables in "bigquery.sqlite".
+LOCAL_BACKEND_PATH_ENV = "LOCAL_BACKEND_PATH"
+
+BQ_TO_SQLITE_TYPES = {
+    "INTEGER": "INTEGER",
+    "INT64": "INTEGER",
+    "BOOLEAN": "INTEGER",
+    "BOOL": "INTEGER",
+    "FLOAT": "REAL",
+    "FLOAT64": "REAL",
+    "NUMERIC": "REAL",
+    "BIGNUMERIC": "REAL",
+    "BYTES": "BLOB",
+}
+# BigQuery SQL that SQLite spells differently, for the queries the runtime runs.
+SQL_REWRITES = (
+    (re.compile(r"`[^`.]+\.([^`.]+)\.([^`.]+)`"), r'"\1.\2"'),
+    (re.compile(r"\bAS STRING\)", re.I), "AS TEXT)"),
+    (re.compile(r"\bFORMAT_DATE\(", re.I), "strftime("),
+    (re.compile(r"@(\w+)"), r":\1"),
+)
+SCHEMA_TABLE = "_table_schemas"
+
+
+def use_local_backend() -> bool:
+    return os.environ.get(BACKEND_ENV, "").lower() == "local"
+
+
+def local_backend_path() -> pathlib.Path:
+    return pathlib.Path(os.environ.get(LOCAL_BACKEND_PATH_ENV, "local_backend"))
+
+
+@functools.lru_cache(maxsize=None)
+def storage_client() -> "LocalStorageClient":
+    return LocalStorageClient(local_backend_path() / "gcs")
+
+
+@functools.lru_cache(maxsize=None)
+def bigquery_client() -> "LocalBigQueryClient":
+    return LocalBigQueryClient(local_backend_path() / "bigquery.sqlite")
+
+
+def install() -> None:
+    """Makes `storage.Client()` and `bigquery.Client()` return the stand-ins.
+
+    The runtime's own helpers switch on the environment variable alone; this
+    covers scripts that still build clients themselves. Importing
+    `transform_runtime` calls it when the local backend is selected.
+    """
+    storage.Client = lambda *args, **kwargs: storage_client()
+    bigquery.Client = lambda *args, **kwargs: bigquery_client()
+
+
+class LocalBlob:
+    def __init__(self, bucket: "LocalBucket", name: str) -> None:
+        self.bucket = bucket
+        self.name = name
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self.bucket.path / self.name
+
+    @property
+    def size(self) -> typing.Optional[int]:
+        return self.path.stat().st_size if self.exists() else None
+
+    def exists(self, client: typing.Any = None) -> bool:
+        return self.path.is_file()
+
+    def upload_from_filename(self, filename: str, **kwargs) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        shutil.copyfile(filename, self.path)
+
+    def upload_from_string(self, data: typing.Union[str, bytes], **kwargs) -> None:
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self.path.write_bytes(data.encode("utf-8") if isinstance(data, str) else data)
+
+    def download_to_filename(self, filename: str, **kwargs) -> None:
+        self._check_exists()
+        shutil.copyfile(self.path, filename)
+
+    def download_to_file(self, file_obj: typing.BinaryIO, **kwargs) -> None:
+        self._check_exists()
+        with open(self.path, "rb") as source:
+            shutil.copyfileobj(source, file_obj)
+
+    def download_as_bytes(self, **kwargs) -> bytes:
+        self._check_exists()
+        return self.path.read_bytes()
+
+    def delete(self, **kwargs) -> None:
+        self._check_exists()
+        self.path.unlink()
+
+    def _check_exists(self) -> None:
+        if not self.exists():
+            raise NotFound(f"No such object: {self.bucket.name}/{self.name}")
+
+
+class LocalBucket:
+    def __init__(self, client: "LocalStorageClient", name: str) -> None:
+        self.client = client
+        self.name = name
+
+    @property
+    def path(self) -> pathlib.Path:
+        return self.client.root / self.name
+
+    def blob(self, blob_name: str, **kwargs) -> LocalBlob:
+        return LocalBlob(self, blob_name)
+
+    def list_blobs(self, prefix: str = "", **kwargs) -> typing.List[LocalBlob]:
+        if not self.path.exists():
+            return []
+        return [
+            LocalBlob(self, name)
+            for name in sorted(
+                path.relative_to(self.path).as_posix()
+                for path in self.path.rglob("*")
+                if path.is_file()
+            )
+            if name.startswith(prefix or "")
+        ]
+
+
+class LocalStorageClient:
+    """Cloud Storage on the local file system, one directory per bucket."""
+
+    def __init__(self, root: typing.Union[str, pathlib.Path]) -> None:
+        self.root = pathlib.Path(root)
+
+    def bucket(self, bucket_name: str) -> LocalBucket:
+        return LocalBucket(self, bucket_name)
+
+    def get_bucket(self, bucket_name: str) -> LocalBucket:
+        return self.bucket(bucket_name)
+
+    def list_blobs(self, bucket_name: str, prefix: str = "", **kwargs):
+        return self.bucket(bucket_name).list_blobs(prefix)
+
+    def blob_from_uri(self, uri: str) -> LocalBlob:
+        bucket_name, _, blob_name = uri[len("gs://") :].partition("/")
+        return self.bucket(bucket_name).blob(blob_name)
+
+    def download_blob_to_file(
+        self, blob_or_uri: typing.Union[str, LocalBlob], file_obj: typing.BinaryIO
+    ) -> None:
+        if isinstance(blob_or_uri, str):
+            blob_or_uri = self.blob_from_uri(blob_or_uri)
+        blob_or_uri.download_to_file(file_obj)
+
+    def paths_for_uri(self, uri: str) -> typing.List[pathlib.Path]:
+        """Returns the files behind a gs:// URI, which may end in a wildcard."""
+        blob = self.blob_from_uri(uri)
+        if "*" not in blob.name:
+            blob._check_exists()
+            return [blob.path]
+        prefix, _, suffix = blob.name.partition("*")
+        return [
+            match.path
+            for match in blob.bucket.list_blobs(prefix)
+            if match.name.endswith(suffix)
+        ]
+
+
+class LocalLoadJob:
+    def __init__(self, output_rows: int, input_file_bytes: int) -> None:
+        self.output_rows = output_rows
+        self.input_file_bytes = input_file_bytes
+
+    def result(self) -> "LocalLoadJob":
+        return self
+
+
+class LocalQueryJob:
+    def __init__(self, rows: typing.List[bigquery.Row]) -> None:
+        self._rows = rows
+
+    def result(self) -> typing.List[bigquery.Row]:
+        return self._rows
+
+
+class LocalBigQueryClient:
+    """The parts of BigQuery the runtime uses, on top of one SQLite database.
+
+    Each `project.dataset.table` is a SQLite table named "dataset.table". The
+    BigQuery schema it was created with is kept alongside, and loads read CSV,
+    Parquet and Avro files with the same options as the real load jobs.
+    """
+
+    def __init__(self, database: typing.Union[str, pathlib.Path]) -> None:
+        pathlib.Path(database).parent.mkdir(parents=True, exist_ok=True)
+        self._lock = threading.Lock()
+        self._connection = sqlite3.connect(str(database), check_same_thread=False)
+        self._execute(
+            f'CREATE TABLE IF NOT EXISTS "{SCHEMA_TABLE}"'
+            " (table_name TEXT PRIMARY KEY, schema TEXT)"
+        )
+
+    def get_table(self, table: typing.Union[str, bigquery.Table]) -> bigquery.Table:
+        table_ref = _table_ref(table)
+        rows = self._execute(
+            f'SELECT schema FROM "{SCHEMA_TABLE}" WHERE table_name = ?',
+            (_table_name(table_ref),),
+        )
+        if not rows:
+            raise NotFound(f"Not found: Table {table_ref}")
+        schema = [bigquery.SchemaField.from_api_repr(f) for f in json.loads(rows[0][0])]
+        return bigquery.Table(table_ref, schema=schema)
+
+    def list_tables(self, dataset: str) -> typing.List[bigquery.Table]:
+        dataset_id = str(dataset).split(".")[-1]
+        rows = self._execute(f'SELECT table_name FROM "{SCHEMA_TABLE}"')
+        return [
+            self.get_table(f"local.{name}")
+            for (name,) in sorted(rows)
+            if name.split(".")[0] == dataset_id
+        ]
+
+    def create_table(
+        self, table: bigquery.Table, exists_ok: bool = False
+    ) -> bigquery.Table:
+        table_ref = _table_ref(table)
+        name = _table_name(table_ref)
+        try:
+            self.get_table(table_ref)
+            if exists_ok:
+                return table
+            raise ValueError(f"Already exists: Table {table_ref}")
+        except NotFound:
+            pass
+        columns = ", ".join(
+            f'"{field.name}" {BQ_TO_SQLITE_TYPES.get(field.field_type.upper(), "TEXT")}'
+            for field in table.schema
+        )
+        schema = json.dumps([field.to_api_repr() for field in table.schema])
+        with self._lock, self._connection:
+            self._connection.execute(f'CREATE TABLE "{name}" ({columns})')
+            self._connection.execute(
+                f'INSERT INTO "{SCHEMA_TABLE}" VALUES (?, ?)', (name, schema)
+            )
+        logging.info(f"Created local table {name}")
+        return table
+
+    def delete_table(
+        self, table: typing.Union[str, bigquery.Table], not_found_ok: bool = False
+    ) -> None:
+        table_ref = _table_ref(table)
+        name = _table_name(table_ref)
+        try:
+            self.get_table(table_ref)
+        except NotFound:
+            if not_found_ok:
+                return
+            raise
+        with self._lock, self._connection:
+            self._connection.execute(f'DROP TABLE "{name}"')
+            self._connection.execute(
+                f'DELETE FROM "{SCHEMA_TABLE}" WHERE table_name = ?', (name,)
+            )
+
+    def query(
+        self, query: str, job_config: typing.Optional[bigquery.QueryJobConfig] = None
+    ) -> LocalQueryJob:
+        for pattern, replacement in SQL_REWRITES:
+            query = pattern.sub(replacement, query)
+        parameters = {
+            parameter.name: parameter.value
+            for parameter in (job_config.query_parameters if job_config else [])
+        }
+        with self._lock, self._connection:
+            cursor = self._connection.execute(query, parameters)
+            rows = cursor.fetchall()
+            names = [column[0] for column in cursor.description or []]
+        field_to_index = {name: index for index, name in enumerate(names)}
+        return LocalQueryJob([bigquery.Row(row, field_to_index) for row in rows])
+
+    def load_table_from_file(
+        self,
+        file_obj: typing.BinaryIO,
+        destination: typing.Union[str, bigquery.Table],
+        job_config: bigquery.LoadJobConfig,
+        **kwargs,
+    ) -> LocalLoadJob:
+        return self._load([file_obj.read()], _table_ref(destination), job_config)
+
+    def load_table_from_uri(
+        self,
+        source_uris: typing.Union[str, typing.Sequence[str]],
+        destination: typing.Union[str, bigquery.Table],
+        job_config: bigquery.LoadJobConfig,
+        **kwargs,
+    ) -> LocalLoadJob:
+        if isinstance(source_uris, str):
+            source_uris = [source_uris]
+        gcs_client = storage_client()
+        contents = [
+            path.read_bytes()
+            for uri in source_uris
+            for path in gcs_client.paths_for_uri(uri)
+        ]
+        return self._load(contents, _table_ref(destination), job_config)
+
+    def _load(
+        self,
+        contents: typing.List[bytes],
+        table_ref: str,
+        job_config: bigquery.LoadJobConfig,
+    ) -> LocalLoadJob:
+        schema = self.get_table(table_ref).schema
+        names = [field.name for field in schema]
+        frames = [
+            _read_source(data, names, job_config).reindex(columns=names)
+            for data in contents
+        ]
+        df = pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()
+        name = _table_name(table_ref)
+        with self._lock, self._connection:
+            if job_config.write_disposition == bigquery.WriteDisposition.WRITE_TRUNCATE:
+                self._connection.execute(f'DELETE FROM "{name}"')
+            if len(df):
+                self._connection.executemany(
+                    f'INSERT INTO "{name}" VALUES ({", ".join("?" * len(names))})',
+                    (
+                        tuple(_sqlite_value(value) for value in row)
+                        for row in df.astype(object)
+                        .where(df.notna(), None)
+                        .itertuples(index=False)
+                    ),
+                )
+        logging.info(f"Loaded {len(df)} rows into local table {name}")
+        return LocalLoadJob(len(df), sum(len(data) for data in contents))
+
+    def _execute(self, sql: str, parameters: typing.Sequence = ()) -> typing.List:
+        with self._lock, self._connection:
+            return self._connection.execute(sql, parameters).fetchall()
+
+
+def _read_source(
+    data: bytes, names: typing.List[str], job_config: bigquery.LoadJobConfig
+) -> pd.DataFrame:
+    if data[:2] == b"\x1f\x8b":
+        data = gzip.decompress(data)
+    source_format = job_config.source_format or bigquery.SourceFormat.CSV
+    if source_format == bigquery.SourceFormat.PARQUET:
+        return pd.read_parquet(io.BytesIO(data))
+    if source_format == bigquery.SourceFormat.AVRO:
+        import fastavro
+
+        return pd.DataFrame.from_records(list(fastavro.reader(io.BytesIO(data))))
+    # Empty fields load as NULL, everything else as text for SQLite to convert.
+    return pd.read_csv(
+        io.BytesIO(data),
+        sep=job_config.field_delimiter or ",",
+        quotechar=job_config.quote_character or '"',
+        skiprows=job_config.skip_leading_rows or 0,
+        header=None,
+        names=names,
+        dtype=str,
+        keep_default_na=False,
+        na_values=[""],
+    )
+
+
+def _sqlite_value(value: typing.Any) -> typing.Any:
+    # Parquet and Avro carry timestamps and decimals, which SQLite stores as text.
+    if value is None or isinstance(value, (int, float, str, bytes)):
+        return value
+    return str(value)
+
+
+def _table_ref(table: typing.Union[str, bigquery.Table]) -> str:
+    if isinstance(table, bigquery.Table):
+        return f"{table.project}.{table.dataset_id}.{table.table_id}"
+    return str(table)
+
+
+def _table_name(table_ref: str) -> str:
+    return ".".join(table_ref.split(".")[-2:])
@@ -0,0 +1,200 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import atexit
+import contextlib
+import functools
+import json
+import logging
+import multiprocessing
+import os
+import resource
+import threading
+import time
+import typing
+
+# When set, the summary is also written to this file as JSON at exit.
+SUMMARY_FILE_ENV = "STAGE_SUMMARY_FILE"
+
+F = typing.TypeVar("F", bound=typing.Callable[..., typing.Any])
+
+
+class StageStats:
+    """Time and volume counters for one stage, such as "download" or "load".
+
+    `stage` hands one of these to the caller for each call, to add the rows and
+    bytes it handled; calls are then added up per stage name.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.calls = 0
+        self.wall_seconds = 0.0
+        self.cpu_seconds = 0.0
+        self.rows_in = 0
+        self.rows_out = 0
+        self.bytes_read = 0
+        self.bytes_written = 0
+        self.peak_rss_bytes = 0
+
+    def add(self, other: "StageStats") -> None:
+        self.calls += other.calls
+        self.wall_seconds += other.wall_seconds
+        self.cpu_seconds += other.cpu_seconds
+        self.rows_in += other.rows_in
+        self.rows_out += other.rows_out
+        self.bytes_read += other.bytes_read
+        self.bytes_written += other.bytes_written
+        self.peak_rss_bytes = max(self.peak_rss_bytes, other.peak_rss_bytes)
+
+    def as_dict(self) -> typing.Dict[str, typing.Any]:
+        return {
+            "calls": self.calls,
+            "wall_seconds": round(self.wall_seconds, 3),
+            "cpu_seconds": round(self.cpu_seconds, 3),
+            "rows_in": self.rows_in,
+            "rows_out": self.rows_out,
+            "bytes_read": self.bytes_read,
+            "bytes_written": self.bytes_written,
+            "rows_per_second": _rate(
+                max(self.rows_in, self.rows_out), self.wall_seconds
+            ),
+            "bytes_per_second": _rate(
+                max(self.bytes_read, self.bytes_written), self.wall_seconds
+            ),
+            "peak_rss_bytes": self.peak_rss_bytes,
+        }
+
+
+_lock = threading.Lock()
+_stages: typing.Dict[str, StageStats] = {}
+_started = time.perf_counter()
+_exit_hook_registered = False
+
+
+@contextlib.contextmanager
+def stage(name: str) -> typing.Iterator[StageStats]:
+    """Times the block as one call of stage `name`.
+
+    CPU time is that of the calling thread, so stages running on worker
+    threads are not charged for each other.
+    """
+    call = StageStats(name)
+    wall_start = time.perf_counter()
+    cpu_start = time.thread_time()
+    try:
+        yield call
+    finally:
+        call.calls = 1
+        call.wall_seconds = time.perf_counter() - wall_start
+        call.cpu_seconds = time.thread_time() - cpu_start
+        call.peak_rss_bytes = peak_rss_bytes()
+        _record(call)
+
+
+def timed(name: str) -> typing.Callable[[F], F]:
+    """Decorator form of `stage`, for functions that only need timing."""
+
+    def decorator(func: F) -> F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            with stage(name):
+                return func(*args, **kwargs)
+
+        return typing.cast(F, wrapper)
+
+    return decorator
+
+
+def peak_rss_bytes() -> int:
+    # ru_maxrss survives exec, so a process started from a large parent would
+    # report the parent's peak; VmHWM belongs to this process image only.
+    try:
+        with open("/proc/self/status") as status:
+            for line in status:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    # ru_maxrss is in KiB on Linux.
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def summary() -> typing.Dict[str, typing.Any]:
+    with _lock:
+        stages = {name: stats.as_dict() for name, stats in _stages.items()}
+    return {
+        "pid": os.getpid(),
+        "wall_seconds": round(time.perf_counter() - _started, 3),
+        "cpu_seconds": round(time.process_time(), 3),
+        "peak_rss_bytes": peak_rss_bytes(),
+        "stages": stages,
+    }
+
+
+def take_stages() -> typing.List[StageStats]:
+    """Returns the stages recorded so far and starts over.
+
+    `parallel.process_pool` workers send these back with each result, to be
+    added to the parent's with `merge`.
+    """
+    with _lock:
+        stages = list(_stages.values())
+        _stages.clear()
+    return stages
+
+
+def merge(stages: typing.Iterable[StageStats]) -> None:
+    """Adds stages recorded elsewhere, such as in a worker process."""
+    for stats in stages:
+        _record(stats)
+
+
+def emit_summary(summary_file: typing.Optional[str] = None) -> None:
+    """Logs the summary as one JSON line and optionally writes it to a file.
+
+    Only the main process writes the file. Stages of `parallel.process_pool`
+    workers are merged into it; other child processes only log theirs.
+    """
+    with _lock:
+        if not _stages:
+            return
+    text = json.dumps(summary(), sort_keys=True)
+    logging.info(f"Stage summary: {text}")
+    summary_file = summary_file or os.environ.get(SUMMARY_FILE_ENV)
+    if summary_file and multiprocessing.parent_process() is None:
+        with open(summary_file, "w") as f:
+            f.write(text + "\n")
+
+
+def reset() -> None:
+    global _started
+    with _lock:
+        _stages.clear()
+        _started = time.perf_counter()
+
+
+def _record(call: StageStats) -> None:
+    global _exit_hook_registered
+    with _lock:
+        if call.name not in _stages:
+            _stages[call.name] = StageStats(call.name)
+        _stages[call.name].add(call)
+        if not _exit_hook_registered:
+            atexit.register(emit_summary)
+            _exit_hook_registered = True
+
+
+def _rate(amount: int, seconds: float) -> typing.Optional[float]:
+    return round(amount / seconds, 1) if seconds else None
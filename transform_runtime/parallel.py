@@ -0,0 +1,143 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import collections
+import concurrent.futures
+import contextlib
+import functools
+import itertools
+import logging
+import multiprocessing
+import threading
+import typing
+
+from transform_runtime import metrics
+
+T = typing.TypeVar("T")
+R = typing.TypeVar("R")
+
+
+class HostConnectionLimiter:
+    """Caps how many connections are open to each host at the same time."""
+
+    def __init__(self, max_connections_per_host: int) -> None:
+        self.max_connections_per_host = max_connections_per_host
+        self._lock = threading.Lock()
+        self._semaphores: typing.Dict[str, threading.BoundedSemaphore] = {}
+
+    @contextlib.contextmanager
+    def connection(self, host: str) -> typing.Iterator[None]:
+        with self._lock:
+            semaphore = self._semaphores.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.max_connections_per_host)
+                self._semaphores[host] = semaphore
+        with semaphore:
+            yield
+
+
+def run_in_threads(
+    func: typing.Callable[[T], R], items: typing.Iterable[T], max_workers: int
+) -> typing.List[R]:
+    """Calls `func` on every item with at most `max_workers` running at once.
+
+    Results come back in the order of `items`. The first failure cancels the
+    items that have not started yet and is re-raised once the running ones end.
+    """
+    with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = [executor.submit(func, item) for item in items]
+        try:
+            for future in concurrent.futures.as_completed(futures):
+                future.result()
+        except BaseException:
+            for future in futures:
+                future.cancel()
+            raise
+    return [future.result() for future in futures]
+
+
+def map_in_order(
+    executor: concurrent.futures.Executor,
+    func: typing.Callable[[T], R],
+    items: typing.Iterable[T],
+    window: int,
+) -> typing.Iterator[R]:
+    """`executor.map` that submits at most `window` items ahead of the caller.
+
+    `executor.map` submits every item up front, so results that finish early
+    are held until everything before them has been consumed. Here the next
+    item is only submitted as the oldest result is handed out, which bounds
+    how many finished results can wait in memory.
+    """
+    items = iter(items)
+    pending = collections.deque(
+        executor.submit(func, item) for item in itertools.islice(items, window)
+    )
+    while pending:
+        result = pending.popleft().result()
+        for item in itertools.islice(items, 1):
+            pending.append(executor.submit(func, item))
+        yield result
+
+
+class StageReportingPool(concurrent.futures.ProcessPoolExecutor):
+    """A process pool whose tasks send their `metrics` stages back.
+
+    Each task returns the stages it recorded along with its result, and they
+    are merged into this process's metrics when the task completes.
+    """
+
+    def submit(self, fn, *args, **kwargs) -> concurrent.futures.Future:
+        task = super().submit(_call_with_stages, fn, *args, **kwargs)
+        future: concurrent.futures.Future = concurrent.futures.Future()
+        future.add_done_callback(lambda done: done.cancelled() and task.cancel())
+        task.add_done_callback(functools.partial(_relay, future))
+        return future
+
+
+def process_pool(max_workers: int) -> StageReportingPool:
+    # Workers are spawned rather than forked because the pool is fed from
+    # threads that may be holding locks (logging, sockets) at fork time.
+    # Spawned workers start with default logging, so the level is carried over.
+    root_logger = logging.getLogger()
+    return StageReportingPool(
+        max_workers=max_workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=root_logger.setLevel,
+        initargs=(root_logger.level,),
+    )
+
+
+def _call_with_stages(
+    fn: typing.Callable[..., R], *args, **kwargs
+) -> typing.Tuple[R, typing.List[metrics.StageStats]]:
+    metrics.take_stages()
+    result = fn(*args, **kwargs)
+    return result, metrics.take_stages()
+
+
+def _relay(future: concurrent.futures.Future, task: concurrent.futures.Future) -> None:
+    if task.cancelled():
+        if future.cancel():
+            future.set_running_or_notify_cancel()
+        return
+    if future.done():
+        return
+    error = task.exception()
+    if error is not None:
+        future.set_exception(error)
+        return
+    result, stages = task.result()
+    metrics.merge(stages)
+    future.set_result(result)
@@ -0,0 +1,200 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import importlib.util
+import logging
+import os
+import typing
+
+import pandas as pd
+
+from transform_runtime import metrics
+from transform_runtime.resources import ChunkSizer
+
+Source = typing.Union[str, os.PathLike, typing.IO]
+
+# Engines from fastest to most lenient. A file a faster engine fails on is
+# read again with the next one.
+ENGINES = ("pyarrow", "c", "python")
+
+# Options that only the python engine implements, whatever their value.
+PYTHON_ONLY_OPTIONS = ("skipfooter",)
+# Options the pandas pyarrow engine accepts. Anything else, such as chunksize,
+# quoting or converters, keeps a read on the C engine.
+PYARROW_OPTIONS = (
+    "sep",
+    "delimiter",
+    "header",
+    "names",
+    "usecols",
+    "dtype",
+    "encoding",
+    "quotechar",
+    "escapechar",
+    "na_values",
+    "keep_default_na",
+    "true_values",
+    "false_values",
+    "skiprows",
+)
+
+
+def csv_engine(
+    source: Source, options: typing.Dict[str, typing.Any], chunked: bool
+) -> str:
+    """Returns the fastest pandas engine that can parse with `options`.
+
+    The python engine is only picked for dialects the C parser lacks: a
+    regular expression or sniffed separator, or a skipped footer. The pyarrow
+    engine is picked for whole-file reads of a path when it is installed,
+    supports every option given and `dtype` fixes every column's type, since
+    its type inference differs from the C parser's.
+    """
+    sep = options.get("sep", options.get("delimiter", ","))
+    if sep is None or (len(sep) > 1 and sep != r"\s+"):
+        return "python"
+    if any(options.get(name) for name in PYTHON_ONLY_OPTIONS):
+        return "python"
+    if callable(options.get("on_bad_lines")):
+        return "python"
+    if (
+        not chunked
+        and _pyarrow_available()
+        and isinstance(source, (str, os.PathLike))
+        and len(sep) == 1
+        and set(options) <= set(PYARROW_OPTIONS)
+        and isinstance(options.get("skiprows", 0), int)
+        and _fixes_all_types(options)
+    ):
+        return "pyarrow"
+    return "c"
+
+
+def read_csv(source: Source, **options) -> pd.DataFrame:
+    """Reads a whole delimited file with the engine from `csv_engine`.
+
+    `options` are those of `pd.read_csv`. When an engine rejects the file, it
+    is read again with the next engine in `ENGINES`, provided the source is a
+    path or a stream that can seek back.
+    """
+    engines = ENGINES[ENGINES.index(csv_engine(source, options, chunked=False)) :]
+    start = _tell(source)
+    with metrics.stage("parse") as stats:
+        for engine, next_engine in zip(engines, engines[1:] + (None,)):
+            try:
+                df = pd.read_csv(source, engine=engine, **options)
+                break
+            except _parser_errors(engine) as error:
+                if next_engine is None or not _rewind(source, start):
+                    raise
+                _log_fallback(source, engine, next_engine, error)
+        stats.rows_in += len(df)
+    return df
+
+
+def iter_csv(
+    source: Source, chunksize: typing.Union[int, ChunkSizer], **options
+) -> typing.Iterator[pd.DataFrame]:
+    """Yields a delimited file as DataFrames of `chunksize` rows.
+
+    Chunks come straight from the pandas reader, with no copy. Only the C and
+    python engines can read in chunks. If the C parser fails before the first
+    chunk, the file is read again with the python engine; later failures are
+    raised, as rows have already been handed out.
+    """
+    if not isinstance(chunksize, ChunkSizer):
+        chunksize = ChunkSizer(initial_rows=int(chunksize), adaptive=False)
+    engine = csv_engine(source, options, chunked=True)
+    start = _tell(source)
+    chunks = _iter_chunks(source, chunksize, engine, options)
+    try:
+        first = next(chunks, None)
+    except pd.errors.ParserError as error:
+        if engine == "python" or not _rewind(source, start):
+            raise
+        _log_fallback(source, engine, "python", error)
+        chunks = _iter_chunks(source, chunksize, "python", options)
+        first = next(chunks, None)
+    if first is None:
+        return
+    yield first
+    yield from chunks
+
+
+def _iter_chunks(
+    source: Source,
+    chunksize: ChunkSizer,
+    engine: str,
+    options: typing.Dict[str, typing.Any],
+) -> typing.Iterator[pd.DataFrame]:
+    with pd.read_csv(source, engine=engine, iterator=True, **options) as reader:
+        while True:
+            with metrics.stage("parse") as stats:
+                try:
+                    df = reader.get_chunk(chunksize.rows)
+                except StopIteration:
+                    return
+                stats.rows_in += len(df)
+            chunksize.observe(df)
+            yield df
+
+
+def _fixes_all_types(options: typing.Dict[str, typing.Any]) -> bool:
+    dtype = options.get("dtype")
+    if dtype is None:
+        return False
+    if not isinstance(dtype, dict):
+        return True
+    columns = options.get("usecols") or options.get("names")
+    return bool(columns) and all(column in dtype for column in columns)
+
+
+def _pyarrow_available() -> bool:
+    # The pyarrow engine arrived in pandas 1.4.
+    major, minor = (int(part) for part in pd.__version__.split(".")[:2])
+    return (major, minor) >= (1, 4) and importlib.util.find_spec("pyarrow") is not None
+
+
+def _tell(source: Source) -> typing.Optional[int]:
+    if isinstance(source, (str, os.PathLike)):
+        return 0
+    try:
+        return source.tell() if source.seekable() else None
+    except (AttributeError, OSError):
+        return None
+
+
+def _rewind(source: Source, start: typing.Optional[int]) -> bool:
+    if start is None:
+        return False
+    if not isinstance(source, (str, os.PathLike)):
+        source.seek(start)
+    return True
+
+
+def _parser_errors(engine: str) -> typing.Tuple[typing.Type[Exception], ...]:
+    # pyarrow reports unsupported input as ArrowInvalid, a ValueError, while
+    # the C parser's own failures are ParserErrors; its other ValueErrors,
+    # such as a bad dtype, would fail the same way on any engine.
+    return (ValueError,) if engine == "pyarrow" else (pd.errors.ParserError,)
+
+
+def _log_fallback(
+    source: Source, engine: str, next_engine: str, error: Exception
+) -> None:
+    name = source if isinstance(source, (str, os.PathLike)) else type(source).__name__
+    logging.warning(
+        f"The {engine} CSV parser could not read {name} ({error}); reading it with"
+        f" the {next_engine} engine"
+    )
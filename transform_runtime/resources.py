@@ -0,0 +1,94 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import logging
+import os
+import typing
+
+import pandas as pd
+
+# cgroup v2 and v1 files holding the memory limit of the container.
+CGROUP_MEMORY_LIMIT_FILES = (
+    "/sys/fs/cgroup/memory.max",
+    "/sys/fs/cgroup/memory/memory.limit_in_bytes",
+)
+# cgroup v1 reports "no limit" as a page-aligned value near 2**63.
+CGROUP_UNLIMITED = 2**60
+
+
+def memory_limit() -> int:
+    """Returns the bytes this process may use: the cgroup limit, else physical RAM."""
+    physical = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    for limit_file in CGROUP_MEMORY_LIMIT_FILES:
+        try:
+            with open(limit_file) as f:
+                value = f.read().strip()
+        except OSError:
+            continue
+        if value.isdigit() and int(value) < CGROUP_UNLIMITED:
+            return min(int(value), physical)
+        return physical
+    return physical
+
+
+class ChunkSizer:
+    """Picks how many rows each chunk of a source file should hold.
+
+    The first chunk is read with `initial_rows`. Its in-memory size then gives
+    the bytes per row, and every later chunk is sized to take
+    `memory_fraction` of the container's memory limit, within `min_rows` and
+    `max_rows`. The fraction leaves room for the copies a transform makes of
+    each chunk. A sizer with `adaptive=False` always returns `initial_rows`.
+    """
+
+    def __init__(
+        self,
+        initial_rows: int = 100000,
+        memory_fraction: float = 0.05,
+        min_rows: int = 10000,
+        max_rows: int = 5000000,
+        adaptive: bool = True,
+        memory_bytes: typing.Optional[int] = None,
+    ) -> None:
+        self.rows = initial_rows
+        self.memory_fraction = memory_fraction
+        self.min_rows = min_rows
+        self.max_rows = max_rows
+        self.adaptive = adaptive
+        self.memory_bytes = memory_bytes
+        self.bytes_per_row: typing.Optional[float] = None
+
+    def observe(self, df: pd.DataFrame) -> int:
+        """Measures the first non-empty chunk and returns the size for the next one."""
+        if not self.adaptive or self.bytes_per_row is not None or df.empty:
+            return self.rows
+        if self.memory_bytes is None:
+            self.memory_bytes = memory_limit()
+        self.bytes_per_row = df.memory_usage(index=True, deep=True).sum() / len(df)
+        target_bytes = self.memory_bytes * self.memory_fraction
+        self.rows = int(
+            min(self.max_rows, max(self.min_rows, target_bytes / self.bytes_per_row))
+        )
+        logging.info(
+            f"Chunk size set to {self.rows} rows: {self.bytes_per_row:.0f} bytes per"
+            f" row, {self.memory_fraction:.0%} of a {self.memory_bytes} byte memory limit"
+        )
+        return self.rows
+
+
+def chunk_sizer(chunksize: typing.Union[str, int, None]) -> ChunkSizer:
+    """Builds the sizer for a CHUNKSIZE setting: a fixed row count, or "auto"."""
+    if chunksize is None or str(chunksize).strip().lower() in ("", "auto"):
+        return ChunkSizer()
+    return ChunkSizer(initial_rows=int(chunksize), adaptive=False)
@@ -0,0 +1,249 @@
+# Copyright 2022 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#      http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Vectorized versions of the column transforms driven by `pipeline.yaml` env vars.
+
+Each transform takes a DataFrame and the decoded JSON value of its env var, for
+example `slice_column(df, json.loads(os.environ["SLICE_COLUMN_LIST"]))`, and
+works on whole columns through the pandas string, datetime and numeric
+accessors instead of calling `Series.apply` with a Python lambda per row.
+
+`TransformPlan` strings several of them together so a plan can be compiled once
+per run from the env var specs and then applied to every chunk.
+"""
+
+import datetime
+import json
+import logging
+import os
+import re
+import typing
+
+import numpy as np
+import pandas as pd
+
+Transform = typing.Callable[[pd.DataFrame], pd.DataFrame]
+
+
+def rename_headers(df: pd.DataFrame, rename_headers_list: dict) -> pd.DataFrame:
+    return df.rename(columns=rename_headers_list)
+
+
+def reorder_headers(
+    df: pd.DataFrame, reorder_headers_list: typing.List[str]
+) -> pd.DataFrame:
+    logging.info("Reordering headers..")
+    return df[reorder_headers_list]
+
+
+def filter_null_rows(
+    df: pd.DataFrame, null_rows_list: typing.List[str]
+) -> pd.DataFrame:
+    logging.info("Removing rows with blank id's..")
+    keep = np.ones(len(df), dtype=bool)
+    for fld in null_rows_list:
+        keep &= (df[fld] != "").to_numpy()
+    return df[keep]
+
+
+def add_metadata_cols(df: pd.DataFrame, source_url: str) -> pd.DataFrame:
+    logging.info("Adding metadata columns")
+    df["source_url"] = source_url
+    df["etl_timestamp"] = pd.Timestamp(datetime.datetime.now())
+    return df
+
+
+def trim_whitespace(
+    df: pd.DataFrame, trim_whitespace_list: typing.List[str]
+) -> pd.DataFrame:
+    logging.info("Trimming whitespace ...")
+    for col in trim_whitespace_list:
+        df[col] = df[col].astype(str).str.strip()
+    return df
+
+
+def convert_to_integer_string(series: pd.Series) -> pd.Series:
+    """Rounds numbers to integers and renders them as strings.
+
+    Blanks, NaN and zero become empty strings, which matches the row-wise
+    `convert_to_integer_string` helpers this replaces.
+    """
+    numbers = pd.to_numeric(series, errors="coerce")
+    keep = numbers.notna() & (numbers != 0)
+    result = pd.Series("", index=series.index, dtype=object)
+    result[keep] = numbers[keep].round().astype(np.int64).astype(str)
+    return result
+
+
+def convert_cols_to_integer(
+    df: pd.DataFrame, convert_int_list: typing.List[str]
+) -> pd.DataFrame:
+    logging.info("Converting Respective Columns To Integer")
+    for col in convert_int_list:
+        df[col] = convert_to_integer_string(df[col])
+    return df
+
+
+def source_convert_date_formats(
+    df: pd.DataFrame, date_format_list: typing.List[typing.List[str]]
+) -> pd.DataFrame:
+    """Reformats each `[column, from_format, to_format]` in `date_format_list`.
+
+    Blank and "nan" values are passed through untouched.
+    """
+    logging.info("Converting Date Format..")
+    for fld, from_format, to_format in date_format_list:
+        values = df[fld].astype(str)
+        has_value = (values != "") & (values.str.lower() != "nan")
+        result = values.copy()
+        result[has_value] = pd.to_datetime(
+            values[has_value], format=from_format
+        ).dt.strftime(to_format)
+        df[fld] = result
+    return df
+
+
+def convert_date_from_int(df: pd.DataFrame, int_date_list: dict) -> pd.DataFrame:
+    logging.info("Converting dates from integers")
+    for dt_col, dt_int_col in int_date_list.items():
+        df[dt_col] = (
+            pd.to_datetime(
+                df[dt_int_col].astype(str) + "000000", format="%Y%m%d%H%M%S"
+            ).dt.strftime("%Y-%m-%d")
+            + " 00:00:00"
+        )
+    return df
+
+
+def slice_column(df: pd.DataFrame, slice_column_list: dict) -> pd.DataFrame:
+    """Extracts `{dest: [source, start, end]}` substrings, stripped of whitespace.
+
+    An empty `end` slices to the end of the value.
+    """
+    logging.info("Extracting column data..")
+    for dest_col, (src_col, start_pos, end_pos) in slice_column_list.items():
+        stop = int(end_pos) if str(end_pos) != "" else None
+        df[dest_col] = (
+            df[src_col].astype(str).str.slice(int(start_pos), stop).str.strip()
+        )
+    return df
+
+
+def _python_replacement(replace_expr: str) -> str:
+    # Specs are written with `$1`-style group references; `re` expects `\1`.
+    return re.sub(r"\$(\d+)", r"\\\1", replace_expr)
+
+
+def apply_regex(df: pd.DataFrame, regex_list: dict) -> pd.DataFrame:
+    logging.info("Applying RegEx")
+    for key, (regex_expr, replace_expr, isregex) in regex_list.items():
+        if str(isregex) == "True":
+            df[key] = df[key].replace(
+                regex_expr, _python_replacement(replace_expr), regex=True
+            )
+        else:
+            df[key] = df[key].replace(regex_expr, replace_expr)
+    return df
+
+
+def generate_location(df: pd.DataFrame, gen_location_list: dict) -> pd.DataFrame:
+    logging.info("Generating location data")
+    for key, (longitude, latitude) in gen_location_list.items():
+        df[key] = (
+            "POINT("
+            + df[longitude].astype("string")
+            + " "
+            + df[latitude].astype("string")
+            + ")"
+        )
+    return df
+
+
+def zero_pad(df: pd.DataFrame, widths: typing.Dict[str, int]) -> pd.DataFrame:
+    for col, width in widths.items():
+        df[col] = df[col].astype(str).str.zfill(width)
+    return df
+
+
+# Env var name -> transform it configures.
+ENV_VAR_TRANSFORMS = {
+    "RENAME_HEADERS_LIST": rename_headers,
+    "NULL_ROWS_LIST": filter_null_rows,
+    "TRIM_WHITESPACE_LIST": trim_whitespace,
+    "CONVERT_INT_LIST": convert_cols_to_integer,
+    "SLICE_COLUMN_LIST": slice_column,
+    "DATE_FORMAT_LIST": source_convert_date_formats,
+    "INT_DATE_LIST": convert_date_from_int,
+    "REGEX_LIST": apply_regex,
+    "GEN_LOCATION_LIST": generate_location,
+    "REORDER_HEADERS_LIST": reorder_headers,
+}
+
+
+class TransformPlan:
+    """An ordered list of transforms applied to every chunk of a source file.
+
+    Steps are either `(env_var_name, spec)` pairs, where `spec` is the decoded
+    JSON value of that env var, or plain `DataFrame -> DataFrame` callables for
+    pipeline-specific logic. Steps with an empty spec are dropped when the
+    plan is compiled.
+    """
+
+    def __init__(
+        self,
+        steps: typing.Sequence[typing.Union[typing.Tuple[str, typing.Any], Transform]],
+    ):
+        self.steps: typing.List[typing.Tuple[str, Transform]] = []
+        for step in steps:
+            if callable(step):
+                self.steps.append((getattr(step, "__name__", "custom"), step))
+                continue
+            env_var, spec = step
+            if env_var not in ENV_VAR_TRANSFORMS:
+                raise ValueError(
+                    f"`{env_var}` must be one of {list(ENV_VAR_TRANSFORMS.keys())}"
+                )
+            if spec:
+                self.steps.append((env_var, _bind(ENV_VAR_TRANSFORMS[env_var], spec)))
+
+    @classmethod
+    def from_env(
+        cls,
+        env_vars: typing.Sequence[str],
+        environ: typing.Optional[typing.Mapping[str, str]] = None,
+    ) -> "TransformPlan":
+        """Compiles a plan from the named env vars, in the order given."""
+        environ = os.environ if environ is None else environ
+        return cls(
+            [
+                (name, json.loads(environ[name]))
+                for name in env_vars
+                if environ.get(name)
+            ]
+        )
+
+    def __call__(self, df: pd.DataFrame) -> pd.DataFrame:
+        for _, transform in self.steps:
+            df = transform(df)
+        return df
+
+    def __len__(self) -> int:
+        return len(self.steps)
+
+
+def _bind(transform: typing.Callable, spec: typing.Any) -> Transform:
+    def step(df: pd.DataFrame) -> pd.DataFrame:
+        return transform(df, spec)
+
+    return step